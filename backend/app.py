@@ -1,16 +1,34 @@
 from dotenv import load_dotenv
+from datetime import date
 import os
+import threading
 
-from flask import Flask
+from flask import Flask, jsonify
 from flask_cors import CORS
 
 from .database import Database
+from .database.migration_runner import MigrationRunner
+from .database.roster_cache import RosterCache, RosterChangeListener
+from .services.season_stats_repository import SeasonStatsRepository, CURRENT_SEASON
+from .services.season_stats_store import SeasonStatsStore
+from .services.stats_refresher import StatsRefresher
+from .services.stats_history import SeasonStatsHistory
+from .services.rolling_form import RollingFormTracker
+from .services.statcast_features import StatcastFeatures
+from .services.player_regrader import PlayerRegrader
+from .services.pitcher_grading_service import PitcherGradingService
+from .services.opponent_team_pool import OpponentTeamPool
+from .services.password_hasher import PasswordHasher
+from .services.result_cache import ResultCache
+from .services.scoring_profile_registry import ScoringProfileRegistry
 
 from .interactors import (
     SignupInteractor,
     SigninInteractor,
     AddPlayerInteractor,
-    RecommendLineupInteractor
+    RecommendLineupInteractor,
+    RecommendFreeAgentsInteractor,
+    ImportRosterInteractor
 )
 
 from .controller import (
@@ -21,13 +39,19 @@ from .controller import (
     TradeController,
     OpponentController,
     AddPlayerController,
-    RecommendLineupController
+    RecommendLineupController,
+    RecommendFreeAgentsController,
+    ScoringProfileController,
+    ImportRosterController
 )
 
 from .database.data_access_postgresql import (
     UserDataAccess,
     TeamDataAccess,
-    PlayerDataAccess
+    PlayerDataAccess,
+    ScoringProfileDataAccess,
+    PitcherStatsDataAccess,
+    TransactionManager
 )
 
 from .blueprint import (
@@ -48,39 +72,151 @@ CORS(app)
 app.config["SECRET_KEY"] = os.getenv("SECRET_KEY")
 
 
-# Initialize database
+# Initialize database (pooled; sizes and timeouts can be tuned per deployment)
 DSN = os.getenv("DSN")
-db = Database(DSN)
+db = Database(
+    DSN,
+    min_size=int(os.getenv("DB_POOL_MIN_SIZE", "1")),
+    max_size=int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+    timeout=float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "10")),
+    max_lifetime=float(os.getenv("DB_POOL_MAX_LIFETIME_SECONDS", "3600")),
+    max_idle=float(os.getenv("DB_POOL_MAX_IDLE_SECONDS", "600")),
+)
+
+
+# Apply pending schema migrations at startup when asked to (AUTO_MIGRATE=1)
+if os.getenv("AUTO_MIGRATE") == "1":
+    MigrationRunner(db).migrate()
+    PlayerDataAccess(db).backfill_keys()
+
+
+# Shared season stats, loaded once per process and warm-started from disk
+STATS_DATA_DIR = os.getenv("STATS_DATA_DIR", os.path.join(os.path.dirname(__file__), "data"))
+season_stats_repository = SeasonStatsRepository(store=SeasonStatsStore(STATS_DATA_DIR))
+
+# Day-by-day stats history (keyframes plus per-day deltas) behind as_of= requests;
+# the refresher records a day on every tick
+STATS_HISTORY_DIR = os.getenv("STATS_HISTORY_DIR", os.path.join(STATS_DATA_DIR, "history"))
+stats_history = SeasonStatsHistory(
+    STATS_HISTORY_DIR,
+    season_stats_repository,
+    keyframe_interval_days=int(os.getenv("STATS_HISTORY_KEYFRAME_DAYS", "28")),
+)
+
+# Rolling 7/14/30-day form behind form= lineups. Warmed up from the recorded
+# history in the background (the refresher thread, or a one-off thread without
+# one) so startup doesn't replay it; form= is refused until it is ready
+form_tracker = RollingFormTracker(CURRENT_SEASON, ready=False)
+
+# Per-pitcher Statcast features written by scripts/ingest_statcast.py, published as
+# extra snapshot columns (empty until it has run; the refresher re-reads new runs)
+statcast_features = StatcastFeatures.watch(
+    os.getenv("STATCAST_FEATURES_PATH", os.path.join(STATS_DATA_DIR, f"statcast_{CURRENT_SEASON}.npz"))
+)
+season_stats_repository.publish_columns("statcast", statcast_features)
+
+
+# Rosters are cached per process and invalidated on writes; other workers'
+# writes arrive over LISTEN/NOTIFY (ROSTER_CACHE_SIZE=0 disables the cache)
+ROSTER_CACHE_SIZE = int(os.getenv("ROSTER_CACHE_SIZE", "2048"))
+roster_cache = None
+if ROSTER_CACHE_SIZE > 0:
+    roster_cache = RosterCache(ROSTER_CACHE_SIZE, float(os.getenv("ROSTER_CACHE_TTL_SECONDS", "300")))
+    roster_change_listener = RosterChangeListener(DSN, roster_cache)
+    roster_change_listener.start()
 
 
 # Initialize data access
+transaction_manager = TransactionManager(db)
 user_data_access = UserDataAccess(db)
-team_data_access = TeamDataAccess(db)
-player_data_access = PlayerDataAccess(db)
+team_data_access = TeamDataAccess(db, lambda: season_stats_repository.get().frame, roster_cache)
+player_data_access = PlayerDataAccess(db, roster_cache)
+scoring_profile_data_access = ScoringProfileDataAccess(db)
+# STORE_STATS_IN_DB=1 keeps pitcher_season_stats in sync and reads lineup rosters from it
+pitcher_stats_data_access = PitcherStatsDataAccess(db) if os.getenv("STORE_STATS_IN_DB") == "1" else None
+
+
+# Refresh stats in the background (set STATS_REFRESH_INTERVAL_SECONDS=0 to disable).
+# Players whose stat line changed are re-graded; STORE_STATS_IN_DB=1 also
+# writes the changed rows to pitcher_season_stats
+STATS_REFRESH_INTERVAL_SECONDS = float(os.getenv("STATS_REFRESH_INTERVAL_SECONDS", "21600"))
+if STATS_REFRESH_INTERVAL_SECONDS > 0:
+    stats_refresher = StatsRefresher(
+        season_stats_repository,
+        STATS_REFRESH_INTERVAL_SECONDS,
+        pitcher_stats=pitcher_stats_data_access,
+        regrader=PlayerRegrader(player_data_access),
+        history=stats_history,
+        form_tracker=form_tracker,
+        statcast_features=statcast_features,
+    )
+    stats_refresher.start()
+else:
+    threading.Thread(
+        target=form_tracker.warm_up, args=(stats_history, date.today()), name="form-warm-up", daemon=True
+    ).start()
+
+
+# Built-in and user-defined scoring profiles, compiled once per revision
+scoring_profiles = ScoringProfileRegistry(scoring_profile_data_access)
+
+# Finished lineups / counter-lineups / weakness reports, keyed by roster,
+# profile revision and the roster's pitcher stat versions
+result_cache = ResultCache(int(os.getenv("RESULT_CACHE_SIZE", "4096")))
+
+
+# Pre-built opponent teams for signup/signin (OPPONENT_POOL_TARGET=0 disables the pool)
+OPPONENT_POOL_TARGET = int(os.getenv("OPPONENT_POOL_TARGET", "25"))
+opponent_pool = None
+if OPPONENT_POOL_TARGET > 0:
+    opponent_pool = OpponentTeamPool(
+        team_data_access,
+        low_water=int(os.getenv("OPPONENT_POOL_LOW_WATER", str(OPPONENT_POOL_TARGET // 2))),
+        target=OPPONENT_POOL_TARGET,
+    )
+    opponent_pool.start()
+
+
+# bcrypt runs on its own bounded pool; logins beyond workers + queue get a 503
+password_hasher = PasswordHasher(
+    rounds=int(os.getenv("BCRYPT_ROUNDS", "12")),
+    max_workers=int(os.getenv("PASSWORD_HASH_WORKERS", "2")),
+    max_queue=int(os.getenv("PASSWORD_HASH_QUEUE", "32")),
+)
 
 
 # Register interactors
-signup_interactor = SignupInteractor(user_data_access, team_data_access)
-signin_interactor = SigninInteractor(user_data_access, team_data_access)
-add_player_interactor = AddPlayerInteractor(player_data_access)
-recommend_lineup_interactor = RecommendLineupInteractor(team_data_access)
+signup_interactor = SignupInteractor(user_data_access, team_data_access, transaction_manager, opponent_pool)
+signin_interactor = SigninInteractor(user_data_access, team_data_access, opponent_pool, password_hasher)
+add_player_interactor = AddPlayerInteractor(player_data_access, season_stats_repository)
+import_roster_interactor = ImportRosterInteractor(player_data_access, season_stats_repository)
+recommend_lineup_interactor = RecommendLineupInteractor(
+    team_data_access, season_stats_repository, scoring_profiles, result_cache, stats_history, form_tracker,
+    pitcher_stats_data_access,
+)
+recommend_free_agents_interactor = RecommendFreeAgentsInteractor(team_data_access, season_stats_repository, scoring_profiles)
 
 
 # Register controllers
-signup_controller = SignupController(signup_interactor)
+signup_controller = SignupController(signup_interactor, password_hasher)
 signin_controller = SigninController(signin_interactor, app)
-player_controller = PlayerController(player_data_access)
+player_controller = PlayerController(player_data_access, season_stats_repository)
 add_player_controller = AddPlayerController(add_player_interactor)
+import_roster_controller = ImportRosterController(import_roster_interactor)
 team_controller = TeamController(team_data_access)
 recommend_lineup_controller = RecommendLineupController(recommend_lineup_interactor)
+recommend_free_agents_controller = RecommendFreeAgentsController(recommend_free_agents_interactor)
 
 
 # Register blueprints
 user_blueprint = UserBlueprint(signup_controller, signin_controller)
-player_blueprint = PlayerBlueprint(player_controller, add_player_controller)
-team_blueprint = TeamBlueprint(team_controller, recommend_lineup_controller)
-trade_controller = TradeController(player_data_access)
-opponent_controller = OpponentController(team_data_access)
+player_blueprint = PlayerBlueprint(player_controller, add_player_controller, import_roster_controller)
+team_blueprint = TeamBlueprint(team_controller, recommend_lineup_controller, recommend_free_agents_controller)
+trade_controller = TradeController(player_data_access, season_stats_repository, stats_history)
+opponent_controller = OpponentController(
+    team_data_access, season_stats_repository, scoring_profiles, result_cache, stats_history
+)
+scoring_profile_controller = ScoringProfileController(scoring_profiles)
 
 
 # Register Flask blueprints
@@ -89,9 +225,49 @@ app.register_blueprint(player_blueprint.bp)
 app.register_blueprint(team_blueprint.bp)
 app.register_blueprint(trade_controller.bp)
 app.register_blueprint(opponent_controller.bp)
+app.register_blueprint(scoring_profile_controller.bp)
 
 
 @app.route("/")
 def hello_world():
     return "Hello, API is running!"
 
+
+@app.route("/api/health/db-pool")
+def db_pool_stats():
+    return jsonify(db.stats())
+
+
+@app.route("/api/health/result-cache")
+def result_cache_stats():
+    return jsonify(result_cache.stats())
+
+
+@app.route("/api/health/analysis-cache")
+def analysis_cache_stats():
+    return jsonify(PitcherGradingService.rendered_text.stats())
+
+
+@app.route("/api/health/roster-cache")
+def roster_cache_stats():
+    if roster_cache is None:
+        return jsonify({"enabled": False})
+    return jsonify({"enabled": True, **roster_cache.stats()})
+
+
+@app.route("/api/health/rolling-form")
+def rolling_form_stats():
+    return jsonify(form_tracker.stats())
+
+
+@app.route("/api/health/password-hasher")
+def password_hasher_stats():
+    return jsonify(password_hasher.stats())
+
+
+@app.route("/api/health/opponent-pool")
+def opponent_pool_stats():
+    if opponent_pool is None:
+        return jsonify({"enabled": False})
+    return jsonify({"enabled": True, "size": team_data_access.opponent_pool_size(), **opponent_pool.stats()})
+
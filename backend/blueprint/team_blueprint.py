@@ -1,8 +1,9 @@
 from flask import Blueprint
-from ..controller import TeamController, RecommendLineupController
+from ..controller import TeamController, RecommendLineupController, RecommendFreeAgentsController
 
 class TeamBlueprint:
-    def __init__(self, team_controller: TeamController, recommend_lineup_controller: RecommendLineupController):
+    def __init__(self, team_controller: TeamController, recommend_lineup_controller: RecommendLineupController,
+                 recommend_free_agents_controller: RecommendFreeAgentsController):
         self.bp = Blueprint("teams", __name__)
 
         # Register routes
@@ -10,4 +11,5 @@ class TeamBlueprint:
         self.bp.add_url_rule("/api/delete-team/<int:team_id>", view_func=team_controller.delete_team, methods=["DELETE"])
         self.bp.add_url_rule("/api/team-search/<int:user_id>", view_func=team_controller.get_user_teams, methods=["GET"])
         self.bp.add_url_rule("/api/teams/<int:team_id>/players", view_func=team_controller.get_team_players, methods=["GET"])
-        self.bp.add_url_rule("/api/teams/<int:team_id>/recommend-lineup", view_func=recommend_lineup_controller.recommend_lineup, methods=["GET"])
\ No newline at end of file
+        self.bp.add_url_rule("/api/teams/<int:team_id>/recommend-lineup", view_func=recommend_lineup_controller.recommend_lineup, methods=["GET"])
+        self.bp.add_url_rule("/api/teams/<int:team_id>/recommend-free-agents", view_func=recommend_free_agents_controller.recommend_free_agents, methods=["GET"])
\ No newline at end of file
@@ -6,3 +6,6 @@ from .trade_controller import TradeController
 from .opponent_controller import OpponentController
 from .add_player_controller import AddPlayerController
 from .recommend_lineup_controller import RecommendLineupController
+from .recommend_free_agents_controller import RecommendFreeAgentsController
+from .scoring_profile_controller import ScoringProfileController
+from .import_roster_controller import ImportRosterController
@@ -0,0 +1,11 @@
+from flask import request
+from ..interactors import ImportRosterInteractor
+
+class ImportRosterController:
+    def __init__(self, import_roster_interactor: ImportRosterInteractor):
+        self.import_roster_interactor = import_roster_interactor
+
+    def import_roster(self, team_id):
+        data = request.get_json(silent=True) or {}
+
+        return self.import_roster_interactor.execute(team_id, data.get("players"))
@@ -2,15 +2,25 @@ from flask import Blueprint, request, jsonify
 from ..database.data_access_interface import TeamDataAccessInterface
 from ..services.pitcher_grading_service import PitcherGradingService
 from ..services.pitcher_recomender_service import PitcherRecommenderService
-from pybaseball import pitching_stats
+from ..services.season_stats_repository import SeasonStatsRepository
+from ..services.roster_enricher import RosterEnricher, EnrichedRoster
+from ..services.scoring_profile_registry import ScoringProfileRegistry, UnknownProfileError
+from ..services.result_cache import ResultCache, roster_fingerprint, roster_stats_version
+from ..services.stats_history import SeasonStatsHistory, StatsHistoryUnavailable, parse_as_of, resolve_snapshot
 
 
 class OpponentController:
-    def __init__(self, team_data_access: TeamDataAccessInterface):
+    def __init__(self, team_data_access: TeamDataAccessInterface, stats_repository: SeasonStatsRepository,
+                 scoring_profiles: ScoringProfileRegistry = None, result_cache: ResultCache = None,
+                 stats_history: SeasonStatsHistory = None):
         """
         Controller for opponent team operations
         """
         self.team_data_access = team_data_access
+        self.stats_repository = stats_repository
+        self.scoring_profiles = scoring_profiles or ScoringProfileRegistry()
+        self.result_cache = result_cache or ResultCache()
+        self.stats_history = stats_history
         self.bp = Blueprint("opponent", __name__)
 
         # Register routes
@@ -25,119 +35,86 @@ class OpponentController:
         """
         Analyze opponent team and return only their weaknesses
         """
+        # Optional YYYY-MM-DD: analyze against the stats as they stood that day
+        try:
+            as_of = parse_as_of(request.args.get("as_of"))
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
         try:
             # Get all players on the opponent team
             players = self.team_data_access.get_all_players(opponent_team_id)
             if not players:
                 return jsonify({"error": "No players found for opponent team"}), 404
 
-            # Fetch MLB pitching stats (2025)
-            stats = pitching_stats(2025)
-            stats.columns = [c.strip().lower() for c in stats.columns]
+            snapshot = resolve_snapshot(self.stats_repository, self.stats_history, as_of)
+            key = ("weaknesses", opponent_team_id, roster_fingerprint(players), roster_stats_version(players, snapshot))
+            payload = self.result_cache.get_or_compute(
+                key, lambda: self._build_weaknesses(opponent_team_id, players, snapshot)
+            )
+            return jsonify(payload), 200
 
-            # Analyze each pitcher and extract weaknesses
-            weaknesses_analysis = []
-            total_grade = 0
-            graded_count = 0
+        except StatsHistoryUnavailable as e:
+            return jsonify({"error": str(e)}), 404
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            return jsonify({"error": str(e)}), 500
 
-            for p in players:
-                name = p.get("player_name")
-                match = stats[stats["name"].str.contains(name, case=False, na=False)]
-                
-                if match.empty:
-                    print(f"No stat match found for {name}")
-                    continue
+    def _build_weaknesses(self, opponent_team_id, players, snapshot):
+        # Join the roster against the shared MLB pitching stats snapshot (2025)
+        roster = RosterEnricher.enrich(players, snapshot)
+        for p in roster.unmatched:
+            print(f"No stat match found for {p.get('player_name')}")
 
-                row = match.iloc[0]
-                
-                # Calculate grade
-                pitcher_stats = {
-                    "K%": row.get("k%", 0),
-                    "IP": row.get("ip", 0),
-                    "ERA": row.get("era", 0)
-                }
-                
-                grade = PitcherGradingService.calculate_pitcher_grade(pitcher_stats)
-                total_grade += grade
-                graded_count += 1
-                
-                # Get full analysis
-                full_analysis = PitcherGradingService.analyze_pitcher(pitcher_stats, grade)
-                
-                # Extract only weaknesses from the analysis
-                weaknesses = self._extract_weaknesses(full_analysis, pitcher_stats, grade)
-                
-                weaknesses_analysis.append({
-                    "player_name": name,
-                    "position": p.get("position", "SP"),
-                    "grade": round(grade, 2),
-                    "weaknesses": weaknesses
-                })
+        # Analyze each pitcher and extract weaknesses
+        weaknesses_analysis = []
+        total_grade = 0
+        graded_count = 0
 
-            avg_grade = round(total_grade / graded_count, 2) if graded_count > 0 else 0
+        # Grades, tiers and report text come precomputed for the whole league
+        league = PitcherGradingService.league_grades(snapshot)
 
-            return jsonify({
-                "opponent_team_id": opponent_team_id,
-                "average_grade": avg_grade,
-                "pitchers": weaknesses_analysis
-            }), 200
+        for i, p in enumerate(roster.players):
+            name = p.get("player_name")
+            pos = roster.rows[i]
 
-        except Exception as e:
-            import traceback
-            traceback.print_exc()
-            return jsonify({"error": str(e)}), 500
+            # Look up grade
+            grade = league.grade(pos)
+            total_grade += grade
+            graded_count += 1
 
-    def _extract_weaknesses(self, full_analysis: str, stats: dict, grade: float) -> str:
-        """
-        Extract only weakness-related information from the full analysis
-        """
-        k = stats.get("K%", 0) * 100
-        ip = stats.get("IP", 0)
-        era = stats.get("ERA", 0)
-        
-        weaknesses = []
-        
-        # Determine tier for context
-        if grade >= 80:
-            tier = "Elite"
-        elif grade >= 70:
-            tier = "Top"
-        elif grade >= 60:
-            tier = "Solid"
-        elif grade >= 45:
-            tier = "Replacement"
-        else:
-            tier = "Poor"
-        
-        # Extract weaknesses based on stats
-        if k < 20:
-            weaknesses.append(f"• Low strikeout production ({k:.1f}% K rate) limits fantasy ceiling.")
-        elif k < 24:
-            weaknesses.append(f"• Modest strikeout output ({k:.1f}% K rate) - can be exploited with high-contact hitters.")
-        
-        if ip < 130:
-            weaknesses.append(f"• Light innings load ({ip:.1f} IP) reduces overall fantasy impact.")
-        
-        if era > 4.25:
-            weaknesses.append(f"• High ERA ({era:.2f}) indicates vulnerability to runs - aggressive hitting approach recommended.")
-        elif era > 3.50:
-            weaknesses.append(f"• Inconsistent run prevention (ERA {era:.2f}) - can be exploited in favorable matchups.")
-        
-        # Add strategic recommendations based on weaknesses
-        if len(weaknesses) == 0:
-            weaknesses.append(f"• {tier} tier pitcher with no major exploitable weaknesses - requires disciplined at-bats.")
-        else:
-            if era > 4.00:
-                weaknesses.append("• Strategy: Focus on aggressive hitting to capitalize on poor run prevention.")
-            if k < 22:
-                weaknesses.append("• Strategy: Use contact-oriented hitters to exploit low strikeout rate.")
-        
-        return "\n".join(weaknesses)
+            # Weaknesses report, rendered from the league-wide rule table
+            weaknesses = PitcherGradingService.league_weaknesses(snapshot, pos)
+
+            weaknesses_analysis.append({
+                "player_name": name,
+                "position": p.get("position", "SP"),
+                "grade": round(grade, 2),
+                "weaknesses": weaknesses
+            })
+
+        avg_grade = round(total_grade / graded_count, 2) if graded_count > 0 else 0
+
+        return {
+            "opponent_team_id": opponent_team_id,
+            "average_grade": avg_grade,
+            "pitchers": weaknesses_analysis
+        }
 
     def get_counter_lineup(self, opponent_team_id, user_team_id):
         """
         Recommend a lineup from user's team that exploits opponent's weaknesses
         """
+        normalization = request.args.get("normalization", "roster")
+        if normalization not in PitcherRecommenderService.NORMALIZATION_MODES:
+            modes = ", ".join(PitcherRecommenderService.NORMALIZATION_MODES)
+            return jsonify({"error": f"normalization must be one of: {modes}"}), 400
+        try:
+            as_of = parse_as_of(request.args.get("as_of"))
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
         try:
             # Get opponent weaknesses first
             opponent_players = self.team_data_access.get_all_players(opponent_team_id)
@@ -149,103 +126,99 @@ class OpponentController:
             if not user_players:
                 return jsonify({"error": "No players found for your team"}), 404
 
-            # Fetch MLB pitching stats
-            stats = pitching_stats(2025)
-            stats.columns = [c.strip().lower() for c in stats.columns]
-
-            # Analyze opponent weaknesses
-            opponent_analysis = self._analyze_opponent_weaknesses(opponent_players, stats)
-            
-            # Get profile from query string, default to strategy based on opponent weaknesses
-            profile = request.args.get("profile")
-            if not profile:
-                profile = self._determine_counter_strategy(opponent_analysis)
-
-            # Enrich user's pitchers with stats
-            enriched_pitchers = []
-            for p in user_players:
-                name = p.get("player_name")
-                match = stats[stats["name"].str.contains(name, case=False, na=False)]
-                if match.empty:
-                    continue
-
-                row = match.iloc[0]
-                enriched_pitchers.append({
-                    "name": row["name"],
-                    "team": row.get("team", "Unknown"),
-                    "pitching+": row.get("pitching+", 100),
-                    "stuff+": row.get("stuff+", 100),
-                    "k-bb%": row.get("k-bb%", 0),
-                    "xfip-": row.get("xfip-", 100),
-                    "barrel%": row.get("barrel%", 0),
-                    "hardhit%": row.get("hardhit%", 0),
-                    "gb%": row.get("gb%", 0),
-                    "swstr%": row.get("swstr%", 0),
-                    "wpa/li": row.get("wpa/li", 0),
-                })
-
-            if not enriched_pitchers:
-                return jsonify({"error": "No matching MLB stats found for your team"}), 404
-
-            # Generate lineup recommendation
-            df, explanation = PitcherRecommenderService.recommend_starting_pitchers(
-                enriched_pitchers, 5, profile
+            # An explicit profile is resolved up front so a custom profile's
+            # revision is part of the cache key
+            requested = request.args.get("profile")
+            compiled = self.scoring_profiles.resolve(requested) if requested else None
+
+            snapshot = resolve_snapshot(self.stats_repository, self.stats_history, as_of)
+            key = (
+                "counter-lineup",
+                roster_fingerprint(opponent_players),
+                roster_fingerprint(user_players),
+                compiled.name if compiled is not None else None,
+                normalization,
+                roster_stats_version(opponent_players, snapshot),
+                roster_stats_version(user_players, snapshot, normalization),
             )
-
-            records = df.to_dict(orient="records")
-            formatted = [
-                {
-                    "rank": int(r["rank"]),
-                    "name": r["name"],
-                    "position": "SP",
-                    "score": round(float(r["score"]), 2),
-                }
-                for r in records
-            ]
-
-            # Create enhanced explanation
-            counter_explanation = (
-                f"Counter-Strategy Analysis:\n\n"
-                f"Opponent Weaknesses Identified:\n{opponent_analysis['summary']}\n\n"
-                f"Recommended Strategy: {profile.upper()}\n\n"
-                f"{explanation}\n\n"
-                f"This lineup is optimized to exploit the opponent's vulnerabilities."
-            )
-
-            return jsonify({
-                "lineup": formatted,
-                "explanation": counter_explanation,
-                "strategy": profile,
-                "opponent_weaknesses": opponent_analysis
-            }), 200
-
+            payload = self.result_cache.get(key)
+            if payload is None:
+                payload = self._build_counter_lineup(
+                    opponent_players, user_players, snapshot, requested, compiled, normalization
+                )
+                if payload is None:
+                    return jsonify({"error": "No matching MLB stats found for your team"}), 404
+                self.result_cache.put(key, payload)
+
+            return jsonify(payload), 200
+
+        except UnknownProfileError as e:
+            return jsonify({"error": str(e)}), 400
+        except StatsHistoryUnavailable as e:
+            return jsonify({"error": str(e)}), 404
         except Exception as e:
             import traceback
             traceback.print_exc()
             return jsonify({"error": str(e)}), 500
 
-    def _analyze_opponent_weaknesses(self, opponent_players, stats):
+    def _build_counter_lineup(self, opponent_players, user_players, snapshot, profile, compiled, normalization):
+        """Counter-lineup payload, or None if none of the user's players matched the stats."""
+        # Join both rosters against the shared MLB pitching stats snapshot
+        opponent_roster = RosterEnricher.enrich(opponent_players, snapshot)
+        user_roster = RosterEnricher.enrich(user_players, snapshot)
+
+        # Analyze opponent weaknesses
+        opponent_analysis = self._analyze_opponent_weaknesses(opponent_roster)
+
+        # Default to a strategy based on opponent weaknesses
+        if not profile:
+            profile = self._determine_counter_strategy(opponent_analysis)
+            compiled = self.scoring_profiles.resolve(profile)
+
+        if not len(user_roster):
+            return None
+
+        # Generate lineup recommendation
+        lineup, explanation = PitcherRecommenderService.recommend_lineup(
+            user_roster, snapshot, 5, compiled, normalization
+        )
+
+        formatted = [
+            {
+                "rank": r["rank"],
+                "name": r["name"],
+                "position": "SP",
+                "score": round(r["score"], 2),
+            }
+            for r in lineup
+        ]
+
+        # Create enhanced explanation
+        counter_explanation = (
+            f"Counter-Strategy Analysis:\n\n"
+            f"Opponent Weaknesses Identified:\n{opponent_analysis['summary']}\n\n"
+            f"Recommended Strategy: {profile.upper()}\n\n"
+            f"{explanation}\n\n"
+            f"This lineup is optimized to exploit the opponent's vulnerabilities."
+        )
+
+        return {
+            "lineup": formatted,
+            "explanation": counter_explanation,
+            "strategy": profile,
+            "normalization": normalization,
+            "opponent_weaknesses": opponent_analysis
+        }
+
+    def _analyze_opponent_weaknesses(self, opponent_roster: EnrichedRoster):
         """Analyze opponent team to identify collective weaknesses"""
-        total_k = 0
-        total_era = 0
-        count = 0
-        
-        for p in opponent_players:
-            name = p.get("player_name")
-            match = stats[stats["name"].str.contains(name, case=False, na=False)]
-            if match.empty:
-                continue
-                
-            row = match.iloc[0]
-            total_k += row.get("k%", 0) * 100
-            total_era += row.get("era", 0)
-            count += 1
-        
-        if count == 0:
+        if not len(opponent_roster):
             return {"summary": "Unable to analyze opponent", "avg_k": 0, "avg_era": 0}
         
-        avg_k = total_k / count
-        avg_era = total_era / count
+        k_col = RosterEnricher.GRADING_COLUMNS.index("k%")
+        era_col = RosterEnricher.GRADING_COLUMNS.index("era")
+        avg_k = float(opponent_roster.grading[:, k_col].mean() * 100)
+        avg_era = float(opponent_roster.grading[:, era_col].mean())
         
         weaknesses = []
         if avg_k < 22:
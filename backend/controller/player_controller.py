@@ -1,21 +1,27 @@
 from flask import Blueprint, request, jsonify
 from ..database.data_access_interface import PlayerDataAccessInterface
 from ..database.entities.player_entity import PlayerEntity
-import pybaseball
-from pybaseball import pitching_stats
+import pandas as pd
 import rapidfuzz
 from ..services.pitcher_grading_service import PitcherGradingService
+from ..services.season_stats_repository import SeasonStatsRepository
+from ..services.statcast_features import StatcastAccumulator
 
 
 class PlayerController:
-    def __init__(self, player_data_access: PlayerDataAccessInterface):
+    # Snapshot columns returned by search, mapped to the keys the frontend expects
+    SEARCH_COLUMNS = {"idfg": "IDfg", "name": "Name", "team": "Team", "age": "Age", "w": "W", "l": "L"}
+
+    def __init__(self, player_data_access: PlayerDataAccessInterface, stats_repository: SeasonStatsRepository):
         """
         player_data_access: an instance of a class that implements PlayerDataAccessInterface
+        stats_repository: shared SeasonStatsRepository
         """
         self.player_data_access = player_data_access
-        
-        # Preload all pitcher data (same as before)
-        self.all_pitcher_data = pybaseball.pitching_stats(2025)
+        self.stats_repository = stats_repository
+
+        # Preload pitcher data into the shared repository
+        self.stats_repository.get()
 
     # ----------------------------------------------------
     # SEARCH PITCHER
@@ -25,9 +31,12 @@ class PlayerController:
         if not searched_name:
             return jsonify({"error": "Missing 'name' parameter"}), 400
 
+        snapshot = self.stats_repository.get()
+        all_pitcher_data = snapshot.frame
+
         matches = rapidfuzz.process.extract(
             searched_name,
-            self.all_pitcher_data["Name"],
+            all_pitcher_data["name"],
             score_cutoff=0.7,
             limit=1000
         )
@@ -36,14 +45,22 @@ class PlayerController:
         matched_names = [m[0] for m in matches]
 
         # Filter and then sort according to matched_names order
-        matched_players_data = self.all_pitcher_data[self.all_pitcher_data["Name"].isin(matched_names)].copy()
+        matched_players_data = all_pitcher_data[all_pitcher_data["name"].isin(matched_names)].copy()
         order_map = {name: idx for idx, name in enumerate(matched_names)}
-        matched_players_data["__match_order"] = matched_players_data["Name"].map(order_map)
+        matched_players_data["__match_order"] = matched_players_data["name"].map(order_map)
         matched_players_data = matched_players_data.sort_values("__match_order").drop(columns="__match_order")
 
-        data_as_array = matched_players_data[
-            ["IDfg", "Name", "Team", "Age", "W", "L"]
-        ].to_dict(orient="records")
+        data_as_array = matched_players_data[list(self.SEARCH_COLUMNS)].rename(
+            columns=self.SEARCH_COLUMNS
+        ).to_dict(orient="records")
+
+        # Statcast features, when published on the repository (NaN until an ingest has run)
+        columns = list(StatcastAccumulator.FEATURE_COLUMNS)
+        extra = snapshot.extra_columns()
+        if set(columns) <= set(extra.columns):
+            statcast = extra[columns].iloc[matched_players_data.index]
+            for record, values in zip(data_as_array, statcast.to_dict(orient="records")):
+                record["Statcast"] = {k: (None if pd.isna(v) else round(float(v), 4)) for k, v in values.items()}
 
         return jsonify(data_as_array)
     
@@ -0,0 +1,29 @@
+from flask import request, jsonify
+from ..interactors import RecommendFreeAgentsInteractor
+
+
+class RecommendFreeAgentsController:
+    # Defaults and limits for the query string
+    DEFAULT_ALPHA = 0.4
+    DEFAULT_LIMIT = 10
+    MAX_LIMIT = 50
+
+    def __init__(self, recommend_free_agents_interactor: RecommendFreeAgentsInteractor):
+        self.recommend_free_agents_interactor = recommend_free_agents_interactor
+
+    def recommend_free_agents(self, team_id):
+        profile = request.args.get("profile", "standard")
+
+        try:
+            alpha = float(request.args.get("alpha", self.DEFAULT_ALPHA))
+            limit = int(request.args.get("limit", self.DEFAULT_LIMIT))
+        except ValueError:
+            return jsonify({"error": "alpha must be a number and limit an integer"}), 400
+
+        if not 0.0 <= alpha <= 1.0:
+            return jsonify({"error": "alpha must be between 0 and 1"}), 400
+        if not 1 <= limit <= self.MAX_LIMIT:
+            return jsonify({"error": f"limit must be between 1 and {self.MAX_LIMIT}"}), 400
+
+        # Forward the request to interactor
+        return self.recommend_free_agents_interactor.execute(team_id, profile, alpha, limit)
@@ -8,6 +8,15 @@ class RecommendLineupController:
 
     def recommend_lineup(self, team_id):
         profile = request.args.get("profile", "standard")
+        # "roster" (default) or "league"
+        normalization = request.args.get("normalization", "roster")
+        # Optional YYYY-MM-DD: grade against the stats as they stood that day
+        as_of = request.args.get("as_of")
+        # Optional 7, 14 or 30: score on rolling form over that many days. Only
+        # K-BB% and SwStr% have rolling values (listed in form_features of the
+        # response); the other features stay season figures. 503 until the
+        # form tracker has warmed up after startup
+        form = request.args.get("form")
 
         # Forward the request to interactor
-        return self.recommend_lineup_interactor.execute(team_id, profile)
+        return self.recommend_lineup_interactor.execute(team_id, profile, normalization, as_of, form)
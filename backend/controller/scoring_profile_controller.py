@@ -0,0 +1,103 @@
+from flask import Blueprint, request, jsonify
+from ..services.scoring_profile_registry import ScoringProfileRegistry, DuplicateProfileError
+
+
+class ScoringProfileController:
+    def __init__(self, scoring_profiles: ScoringProfileRegistry):
+        """
+        Controller for user-defined scoring profiles
+        scoring_profiles: shared ScoringProfileRegistry (also used to resolve profiles for lineups)
+        """
+        self.scoring_profiles = scoring_profiles
+        self.bp = Blueprint("scoring_profiles", __name__)
+
+        # Register routes
+        self.bp.add_url_rule("/api/users/<int:user_id>/scoring-profiles",
+                            view_func=self.list_profiles,
+                            methods=["GET"])
+        self.bp.add_url_rule("/api/users/<int:user_id>/scoring-profiles",
+                            view_func=self.create_profile,
+                            methods=["POST"])
+        self.bp.add_url_rule("/api/scoring-profiles/<int:profile_id>",
+                            view_func=self.get_profile,
+                            methods=["GET"])
+        self.bp.add_url_rule("/api/scoring-profiles/<int:profile_id>",
+                            view_func=self.update_profile,
+                            methods=["PUT"])
+        self.bp.add_url_rule("/api/scoring-profiles/<int:profile_id>",
+                            view_func=self.delete_profile,
+                            methods=["DELETE"])
+
+    # ----------------------------------------------------
+    # CREATE PROFILE
+    # ----------------------------------------------------
+    def create_profile(self, user_id):
+        """
+        Body:
+        {
+          "name": "My ace finder",
+          "weights": {"stuff+": 0.5, "k-bb%": 0.3, "xfip-": -0.2},
+          "explanation": "optional text shown with the lineup"
+        }
+        """
+        data = request.get_json(silent=True) or {}
+        try:
+            created = self.scoring_profiles.create(
+                user_id, data.get("name"), data.get("weights"), data.get("explanation")
+            )
+            return jsonify(created), 201
+        except DuplicateProfileError as e:
+            return jsonify({"error": str(e)}), 409
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+    # ----------------------------------------------------
+    # READ PROFILES
+    # ----------------------------------------------------
+    def list_profiles(self, user_id):
+        try:
+            return jsonify({"profiles": self.scoring_profiles.list_for_user(user_id)}), 200
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+    def get_profile(self, profile_id):
+        try:
+            profile = self.scoring_profiles.get(profile_id)
+            if not profile:
+                return jsonify({"error": "Scoring profile not found"}), 404
+            return jsonify(profile), 200
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+    # ----------------------------------------------------
+    # UPDATE PROFILE
+    # ----------------------------------------------------
+    def update_profile(self, profile_id):
+        data = request.get_json(silent=True) or {}
+        try:
+            updated = self.scoring_profiles.update(
+                profile_id, data.get("name"), data.get("weights"), data.get("explanation")
+            )
+            if not updated:
+                return jsonify({"error": "Scoring profile not found"}), 404
+            return jsonify(updated), 200
+        except DuplicateProfileError as e:
+            return jsonify({"error": str(e)}), 409
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+    # ----------------------------------------------------
+    # DELETE PROFILE
+    # ----------------------------------------------------
+    def delete_profile(self, profile_id):
+        try:
+            deleted = self.scoring_profiles.delete(profile_id)
+            if not deleted:
+                return jsonify({"error": "Scoring profile not found"}), 404
+            return jsonify({"message": f"Deleted scoring profile '{profile_id}'"}), 200
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
@@ -1,6 +1,7 @@
 from flask import Flask, request, jsonify
 from ..interactors import SigninInteractor
-import bcrypt, jwt, datetime
+from ..services.password_hasher import HasherBusyError
+import jwt, datetime
 
 
 class SigninController:
@@ -30,5 +31,7 @@ class SigninController:
 
             return jsonify({"token": token}), 200
 
+        except HasherBusyError as e:
+            return jsonify({"error": str(e)}), 503, {"Retry-After": "1"}
         except Exception as e:
             return jsonify({"error": str(e)}), 401
\ No newline at end of file
@@ -1,21 +1,26 @@
 from flask import request, jsonify
 from ..interactors import SignupInteractor
-import bcrypt
+from ..services.password_hasher import PasswordHasher, HasherBusyError
 
 
 class SignupController:
-    def __init__(self, signup_interactor: SignupInteractor):
+    def __init__(self, signup_interactor: SignupInteractor, password_hasher: PasswordHasher = None):
         self.signup_interactor = signup_interactor
+        self.password_hasher = password_hasher or PasswordHasher()
 
     def signup(self):
         data = request.get_json()
         username = data.get("username")
         password = data.get("password")
-        hashed_password = bcrypt.hashpw(password.encode(), bcrypt.gensalt())
 
         try:
+            if not username or not password:
+                raise Exception("Username and password are required.")
+            hashed_password = self.password_hasher.hash(password)
             user_data = self.signup_interactor.signup(username, hashed_password)
             return jsonify(user_data), 201
+        except HasherBusyError as e:
+            return jsonify({"error": str(e)}), 503, {"Retry-After": "1"}
         except Exception as e:
             return jsonify({"error": str(e)}), 400
 
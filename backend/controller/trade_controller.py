@@ -2,62 +2,63 @@ from flask import Blueprint, request, jsonify
 from ..database.data_access_interface import PlayerDataAccessInterface
 from ..services.pitcher_grading_service import PitcherGradingService
 from ..services.pitcher_recomender_service import PitcherRecommenderService
-from pybaseball import pitching_stats
+from ..services.season_stats_repository import SeasonStatsRepository, CURRENT_SEASON
+from ..services.stats_history import SeasonStatsHistory, StatsHistoryUnavailable, parse_as_of, resolve_snapshot
 
 
 class TradeController:
-    def __init__(self, player_data_access: PlayerDataAccessInterface):
+    def __init__(self, player_data_access: PlayerDataAccessInterface, stats_repository: SeasonStatsRepository,
+                 stats_history: SeasonStatsHistory = None):
         self.player_data_access = player_data_access
+        self.stats_repository = stats_repository
+        self.stats_history = stats_history
         self.bp = Blueprint("trade", __name__)
         self.bp.add_url_rule("/api/trade/evaluate", view_func=self.evaluate_trade, methods=["POST"])
 
-        # Cache season stats so we can produce analysis text consistently
-        self.season = 2025
-        # Optional: wrap in try/except so the server still starts if pybaseball breaks
+        self.season = CURRENT_SEASON
+        # Warm the shared stats cache; season_snapshot returns None instead of raising,
+        # so the server still starts if pybaseball breaks
+        _ = self.season_snapshot
+
+    @property
+    def season_snapshot(self):
+        """Shared season stats snapshot or None if it can't be loaded."""
         try:
-            self.season_df = pitching_stats(self.season)  # Name, K%, IP, ERA, ...
+            return self.stats_repository.get(self.season)
         except Exception as e:
             print(f"[TradeController] Failed to load pitching_stats({self.season}): {e}")
-            self.season_df = None
-
-    def _find_stats_by_name(self, name: str):
-        """Return {'K%': float0to1, 'IP': float, 'ERA': float} or None."""
-        if self.season_df is None:
             return None
 
-        df = self.season_df
-        row = df[df["Name"].str.lower() == str(name).strip().lower()]
-        if row.empty:
-            return None
-        return {
-            "K%": float(row.iloc[0]["K%"]),
-            "IP": float(row.iloc[0]["IP"]),
-            "ERA": float(row.iloc[0]["ERA"]),
-        }
+    @property
+    def season_df(self):
+        """Shared season stats frame (name, k%, ip, era, ...) or None if it can't be loaded."""
+        snapshot = self.season_snapshot
+        return snapshot.frame if snapshot is not None else None
 
-    def _grade_player(self, name: str):
+    def _grade_player(self, name: str, snapshot):
         """
-        Compute grade from 2025 stats using your PitcherGradingService.
+        Look up a player's grade in the snapshot's league grades.
         Returns dict with player_name, grade, analysis.
         """
-        stats = self._find_stats_by_name(name)
-        if stats is None:
+        pos = snapshot.index.find(name=name) if snapshot is not None else None
+        if pos is None:
             return {
                 "player_name": name,
                 "grade": 0.0,
                 "analysis": f"No 2025 stats found for {name}.",
             }
 
-        grade = PitcherGradingService.calculate_pitcher_grade(stats)
-        analysis = PitcherGradingService.analyze_pitcher(stats, grade)
+        league = PitcherGradingService.league_grades(snapshot)
+        grade = league.grade(pos)
+        analysis = PitcherGradingService.league_analysis(snapshot, pos)
         return {
             "player_name": name,
             "grade": grade,
             "analysis": analysis,
         }
 
-    def _grade_side(self, names: list[str]):
-        players = [self._grade_player(n) for n in names]
+    def _grade_side(self, names: list[str], snapshot):
+        players = [self._grade_player(n, snapshot) for n in names]
         total = round(sum(float(p.get("grade", 0.0)) for p in players), 2)
         return players, total
 
@@ -68,7 +69,8 @@ class TradeController:
         {
           "sideA": ["Kevin Gausman", "Gerrit Cole"],
           "sideB": ["Zac Gallen"],
-          "profile": "standard" | "strikeout" | "control" | ...
+          "profile": "standard" | "strikeout" | "control" | ...,
+          "as_of": "2025-06-01"   (optional; grade with the stats as they stood that day)
         }
         """
         body = request.get_json(silent=True) or {}
@@ -78,9 +80,21 @@ class TradeController:
 
         if not isinstance(sideA, list) or not isinstance(sideB, list):
             return jsonify({"error": "sideA and sideB must be arrays of names"}), 400
+        try:
+            as_of = parse_as_of(body.get("as_of"))
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
 
-        A_players, A_total = self._grade_side(sideA)
-        B_players, B_total = self._grade_side(sideB)
+        # Grade both sides against the same snapshot, even if a refresh lands mid-request
+        if as_of is None:
+            snapshot = self.season_snapshot
+        else:
+            try:
+                snapshot = resolve_snapshot(self.stats_repository, self.stats_history, as_of, self.season)
+            except StatsHistoryUnavailable as e:
+                return jsonify({"error": str(e)}), 404
+        A_players, A_total = self._grade_side(sideA, snapshot)
+        B_players, B_total = self._grade_side(sideB, snapshot)
 
         diff = round(A_total - B_total, 2)  # >0 means A is sending more value
         denom = max(A_total, B_total, 1e-9)
@@ -1 +1 @@
-from .database import Database
\ No newline at end of file
+from .database import Database, UnitOfWork
\ No newline at end of file
@@ -1,8 +1,22 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import ContextManager, List, Optional
 from .entities.user_entity import UserEntity
 from .entities.team_entity import TeamEntity
 from .entities.player_entity import PlayerEntity
+from .entities.scoring_profile_entity import ScoringProfileEntity
+
+
+# -------------------------
+# Transaction Interface
+# -------------------------
+class TransactionManagerInterface(ABC):
+    @abstractmethod
+    def transaction(self) -> ContextManager:
+        """
+        Context manager that makes every data-access call inside the block
+        one atomic commit, rolled back if the block raises.
+        """
+        pass
 
 
 # -------------------------
@@ -77,6 +91,18 @@ class TeamDataAccessInterface(ABC):
     def get_all_players(self, team_id: int) -> List[dict]:
         pass
 
+    @abstractmethod
+    def rostered_players(self) -> List[dict]:
+        """Distinct (player_name, idfg) of every player on any team, opponents included."""
+        pass
+
+    @abstractmethod
+    def create_many(self, team_entities: List[TeamEntity]) -> List[dict]:
+        """
+        Create several teams in one batch; returns the created rows in input order.
+        """
+        pass
+
     @abstractmethod
     def create_opponent_user_and_team(self) -> dict:
         """
@@ -85,6 +111,26 @@ class TeamDataAccessInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def fill_opponent_pool(self, count: int) -> int:
+        """
+        Create `count` ready-made opponent teams and add them to the opponent pool.
+        Returns the number created.
+        """
+        pass
+
+    @abstractmethod
+    def claim_opponent_team(self) -> Optional[int]:
+        """
+        Atomically remove one team from the opponent pool and return its id,
+        or None if the pool is empty.
+        """
+        pass
+
+    @abstractmethod
+    def opponent_pool_size(self) -> int:
+        pass
+
 
 # -------------------------
 # Player Interface
@@ -94,6 +140,13 @@ class PlayerDataAccessInterface(ABC):
     def create(self, player: PlayerEntity) -> dict:
         pass
 
+    @abstractmethod
+    def create_many(self, players: List[PlayerEntity]) -> List[dict]:
+        """
+        Create several players in one batch; returns the created rows in input order.
+        """
+        pass
+
     @abstractmethod
     def read(self, player_name: str) -> Optional[dict]:
         pass
@@ -102,14 +155,101 @@ class PlayerDataAccessInterface(ABC):
     def update(self, player: PlayerEntity) -> dict:
         pass
 
+    @abstractmethod
+    def backfill_keys(self) -> int:
+        """Fill name_key (and normalize idfg) on rows stored before it existed; returns rows updated."""
+        pass
+
     @abstractmethod
     def delete(self, player_name: str, team_id: int) -> dict:
         pass
 
     # New: get all players for a specific team
+    @abstractmethod
+    def list_by_idfgs(self, idfgs: List[str]) -> List[dict]:
+        """
+        Players on any team whose idfg is in idfgs (id, team_id, player_name, idfg).
+        """
+        pass
+
+    @abstractmethod
+    def update_grades(self, grades: List[tuple]) -> int:
+        """
+        Apply (player_id, team_id, grade, analysis) tuples in one batch.
+        """
+        pass
+
     @abstractmethod
     def list_by_team(self, team_id: int) -> List[dict]:
         """
         Return all players that belong to the given team_id.
         """
         pass
+
+
+# -------------------------
+# Scoring Profile Interface
+# -------------------------
+class ScoringProfileDataAccessInterface(ABC):
+    @abstractmethod
+    def create(self, profile: ScoringProfileEntity) -> dict:
+        """
+        Store a new profile at revision 1 and return the stored row
+        (id, user_id, name, weights, explanation, revision).
+        """
+        pass
+
+    @abstractmethod
+    def read(self, profile_id: int) -> Optional[dict]:
+        pass
+
+    @abstractmethod
+    def revision(self, profile_id: int) -> Optional[int]:
+        """Current revision of a profile (None if it does not exist), without reading its weights."""
+        pass
+
+    @abstractmethod
+    def list_by_user(self, user_id: int) -> List[dict]:
+        pass
+
+    @abstractmethod
+    def update(self, profile: ScoringProfileEntity) -> Optional[dict]:
+        """
+        Replace name, weights and explanation, bump the revision and return
+        the updated row (or None if the profile does not exist).
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, profile_id: int) -> Optional[dict]:
+        pass
+
+
+# -------------------------
+# Pitcher Stats Interface
+# -------------------------
+class PitcherStatsDataAccessInterface(ABC):
+    @abstractmethod
+    def upsert_season(self, season: int, frame):
+        """
+        Store a normalized pitching_stats frame as the season's rows, writing
+        only pitchers whose row changed. Returns the StatsChangeSet applied.
+        """
+        pass
+
+    @abstractmethod
+    def read(self, season: int, idfg: str) -> Optional[dict]:
+        pass
+
+    @abstractmethod
+    def roster_stats(self, team_id: int, season: int) -> List[dict]:
+        """
+        A team's players joined to their season stat rows, including each
+        row's row_hash and updated_at (stat columns are None for players
+        without a match).
+        """
+        pass
+
+    @abstractmethod
+    def seasons(self) -> List[dict]:
+        pass
@@ -1,15 +1,190 @@
-from typing import List, Optional
+from typing import Callable, List, Optional
+import numpy as np
+import pandas as pd
+from psycopg.types.json import Jsonb
 from .database import Database
+from .roster_cache import RosterCache, ROSTER_CHANNEL
+from ..services.pitcher_index import normalize_idfg, normalize_name
+from ..services.stats_delta import StatsChangeSet, diff_hashes, row_hashes
 from .entities.user_entity import UserEntity
 from .entities.team_entity import TeamEntity
 from .entities.player_entity import PlayerEntity
+from .entities.scoring_profile_entity import ScoringProfileEntity
 from .data_access_interface import (
+    TransactionManagerInterface,
     UserDataAccessInterface,
     TeamDataAccessInterface,
     PlayerDataAccessInterface,
+    ScoringProfileDataAccessInterface,
+    PitcherStatsDataAccessInterface,
 )
 
 
+# Column order shared by every players INSERT; callers pass the first seven
+# and stored_player_row() adds name_key
+PLAYER_COLUMNS = ("team_id", "player_name", "mlbid", "idfg", "position", "grade", "analysis", "name_key")
+PLAYER_RETURNING = "id, team_id, player_name, mlbid, idfg, position, grade, analysis"
+# Player batches at least this large are loaded with COPY instead of pipelined INSERTs
+COPY_THRESHOLD = 200
+# Stored as the password of generated opponent users; not a bcrypt hash, so no login matches it
+OPPONENT_PASSWORD = b"!opponent"
+
+
+def player_params(player: PlayerEntity) -> tuple:
+    return (
+        player.get_team_id(),
+        player.get_player_name(),
+        player.get_mlbid(),
+        player.get_idfg(),
+        player.get_position(),
+        player.get_grade(),
+        player.get_analysis()
+    )
+
+
+def stored_player_row(row: tuple) -> tuple:
+    """
+    A (team_id, player_name, mlbid, idfg, position, grade, analysis) row as
+    written: idfg normalized and name_key appended, computed here with the
+    same functions as pitcher_season_stats, so roster_stats() joins stored keys.
+    """
+    team_id, player_name, mlbid, idfg, position, grade, analysis = row
+    return (team_id, player_name, mlbid, normalize_idfg(idfg), position, grade, analysis, normalize_name(player_name))
+
+
+def insert_players(db: Database, rows: List[tuple], returning: bool = True) -> List[dict]:
+    """
+    Insert player rows (PLAYER_COLUMNS order) in one transaction: pipelined
+    executemany for small batches, COPY through a temp table for large ones.
+    """
+    if not rows:
+        return []
+    rows = [stored_player_row(row) for row in rows]
+    if len(rows) < COPY_THRESHOLD:
+        query = f"""
+        INSERT INTO players ({", ".join(PLAYER_COLUMNS)})
+        VALUES ({", ".join(["%s"] * len(PLAYER_COLUMNS))})
+        {"RETURNING " + PLAYER_RETURNING if returning else ""};
+        """
+        return db.execute_many(query, rows, returning=returning)
+
+    columns = ", ".join(PLAYER_COLUMNS)
+    with db.transaction() as conn:
+        with conn.cursor() as cur:
+            cur.execute("""
+            CREATE TEMP TABLE players_import (
+                ord INT,
+                team_id INT,
+                player_name VARCHAR(150),
+                mlbid VARCHAR(50),
+                idfg VARCHAR(50),
+                position VARCHAR(50),
+                grade FLOAT,
+                analysis TEXT,
+                name_key VARCHAR(150)
+            ) ON COMMIT DROP;
+            """)
+            with cur.copy(f"COPY players_import (ord, {columns}) FROM STDIN") as copy:
+                for i, row in enumerate(rows):
+                    copy.write_row((i, *row))
+            cur.execute(f"""
+            INSERT INTO players ({columns})
+            SELECT {columns} FROM players_import ORDER BY ord
+            {"RETURNING " + PLAYER_RETURNING if returning else ""};
+            """)
+            return cur.fetchall() if returning else []
+
+
+def roster_changed(db: Database, cache: Optional[RosterCache], team_ids) -> None:
+    """
+    Drop rosters from this process's cache and tell other workers to do the
+    same (NOTIFY is delivered on commit, so inside a transaction it waits for
+    the write). team_ids=None means every roster.
+    """
+    if cache is None:
+        return
+    if team_ids is None:
+        cache.clear()
+        db.execute("SELECT pg_notify(%s, %s);", (ROSTER_CHANNEL, "*"))
+        return
+    team_ids = sorted({int(t) for t in team_ids if t is not None})
+    for team_id in team_ids:
+        cache.invalidate(team_id)
+    if team_ids:
+        db.execute_many("SELECT pg_notify(%s, %s);", [(ROSTER_CHANNEL, str(t)) for t in team_ids])
+
+
+# Typed pitcher_season_stats columns, in pitcher_stats_rows() tuple order
+PITCHER_STATS_COLUMNS = ("season", "idfg", "name", "name_key", "team", "ip", "era", "k_pct", "stats", "row_hash")
+
+
+def _json_value(value):
+    if isinstance(value, np.generic):
+        value = value.item()
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return None
+    if isinstance(value, (str, int, float, bool)):
+        return value
+    try:
+        if pd.isna(value):
+            return None
+    except (TypeError, ValueError):
+        pass
+    return str(value)
+
+
+def _float_or_none(value) -> Optional[float]:
+    number = pd.to_numeric(value, errors="coerce")
+    return None if pd.isna(number) else float(number)
+
+
+def pitcher_stats_rows(season: int, frame: pd.DataFrame, only=None) -> List[tuple]:
+    """
+    pitcher_season_stats rows (PITCHER_STATS_COLUMNS order) for a normalized
+    stats frame, limited to the IDfgs in `only` if given. Rows without an
+    IDfg can't be keyed and are skipped; if an IDfg repeats, the first row wins.
+    """
+    if "idfg" not in frame.columns or "name" not in frame.columns:
+        raise ValueError("Stats frame needs idfg and name columns to be stored")
+    hashes = row_hashes(frame)
+
+    columns = [str(c) for c in frame.columns]
+    rows, seen = [], set()
+    for values in frame.itertuples(index=False, name=None):
+        record = dict(zip(columns, values))
+        idfg = normalize_idfg(record.get("idfg"))
+        if idfg is None or idfg in seen:
+            continue
+        seen.add(idfg)
+        if only is not None and idfg not in only:
+            continue
+        team = record.get("team")
+        rows.append((
+            season,
+            idfg,
+            str(record.get("name")),
+            normalize_name(record.get("name")),
+            team if isinstance(team, str) else None,
+            _float_or_none(record.get("ip")),
+            _float_or_none(record.get("era")),
+            _float_or_none(record.get("k%")),
+            Jsonb({column: _json_value(value) for column, value in record.items()}),
+            hashes[idfg],
+        ))
+    return rows
+
+
+# -------------------------
+# Transaction SQL Implementation
+# -------------------------
+class TransactionManager(TransactionManagerInterface):
+    def __init__(self, db: Database):
+        self.db = db
+
+    def transaction(self):
+        return self.db.transaction()
+
+
 # -------------------------
 # User SQL Implementation
 # -------------------------
@@ -87,8 +262,15 @@ class UserDataAccess(UserDataAccessInterface):
 # Team SQL Implementation
 # -------------------------
 class TeamDataAccess(TeamDataAccessInterface):
-    def __init__(self, db: Database):
+    def __init__(self, db: Database, stats_frame: Callable[[], pd.DataFrame], roster_cache: RosterCache = None):
+        """
+        stats_frame: returns the current season pitching stats frame ("name", "ip", ...)
+            that opponent rosters are drawn from
+        roster_cache: read-through cache for get_all_players; without it every call queries
+        """
         self.db = db
+        self.stats_frame = stats_frame
+        self.roster_cache = roster_cache
 
     def create(self, team_entity: TeamEntity):
         query = """
@@ -103,6 +285,18 @@ class TeamDataAccess(TeamDataAccessInterface):
         )
         return result
 
+    def create_many(self, team_entities: List[TeamEntity]) -> List[dict]:
+        query = """
+        INSERT INTO teams (user_id, team_name)
+        VALUES (%s, %s)
+        RETURNING id, team_name, user_id;
+        """
+        return self.db.execute_many(
+            query,
+            [(t.get_user_id(), t.get_team_name()) for t in team_entities],
+            returning=True,
+        )
+
     """Get all user's teams"""
     def read(self, user_id: int):
         query = "SELECT * FROM teams WHERE user_id = %s;"
@@ -130,9 +324,19 @@ class TeamDataAccess(TeamDataAccessInterface):
         RETURNING id, team_name;
         """
         result = self.db.execute(query, (team_id,), fetchone=True)
+        roster_changed(self.db, self.roster_cache, [team_id])
         return result
 
     def get_all_players(self, team_id: int):
+        if self.roster_cache is not None:
+            return self.roster_cache.get(team_id, lambda: self._read_players(team_id))
+        return self._read_players(team_id)
+
+    def rostered_players(self) -> List[dict]:
+        query = "SELECT DISTINCT player_name, idfg FROM players;"
+        return self.db.execute(query, fetchall=True)
+
+    def _read_players(self, team_id: int):
         query = """
         SELECT player_name, mlbid, idfg, position, grade, analysis
         FROM players
@@ -142,95 +346,138 @@ class TeamDataAccess(TeamDataAccessInterface):
         return results
 
     def create_opponent_user_and_team(self) -> dict:
-        """Create a new 'Opponent User' with a randomly generated team"""
-        import random
-        from pybaseball import pitching_stats
-        
-        # Generate unique opponent username
-        opponent_username = f"OpponentUser_{random.randint(100000, 999999)}"
-        
-        # Create opponent user
-        user_query = """
-        INSERT INTO users (username, password)
-        VALUES (%s, %s)
-        RETURNING id;
-        """
-        # Use a random password hash since this user won't login
-        import bcrypt
-        random_password = bcrypt.hashpw(b"opponent_password", bcrypt.gensalt())
-        user_row = self.db.execute(user_query, (opponent_username, random_password), fetchone=True)
-        opponent_user_id = user_row.get("id")
-        
-        # Create opponent team
-        team_query = """
-        INSERT INTO teams (user_id, team_name)
-        VALUES (%s, %s)
-        RETURNING id, team_name, user_id;
+        """Create a new 'Opponent User' with a randomly generated team (one commit)"""
+        with self.db.transaction():
+            return self._create_opponents(1)[0]
+
+    def fill_opponent_pool(self, count: int) -> int:
+        """Build `count` opponent teams in one transaction and park them in opponent_pool."""
+        if count <= 0:
+            return 0
+        with self.db.transaction():
+            created = self._create_opponents(count)
+            self.db.execute_many(
+                "INSERT INTO opponent_pool (team_id) VALUES (%s);",
+                [(opponent["opponent_team_id"],) for opponent in created],
+            )
+        return len(created)
+
+    def claim_opponent_team(self) -> Optional[int]:
+        """
+        Take the oldest pooled opponent team, or None if the pool is empty.
+        SKIP LOCKED lets concurrent signups claim different rows without
+        waiting on each other; inside a caller's transaction the claim is
+        undone (the team goes back to the pool) if that transaction rolls back.
         """
-        team_row = self.db.execute(team_query, (opponent_user_id, "Opponent Team"), fetchone=True)
-        opponent_team_id = team_row.get("id")
-        
-        # Fetch pitching stats and randomly select 5 pitchers
-        stats = pitching_stats(2025)
-        stats.columns = [c.strip().lower() for c in stats.columns]
-        
+        query = """
+        DELETE FROM opponent_pool
+        WHERE team_id = (
+            SELECT team_id FROM opponent_pool
+            ORDER BY created_at, team_id
+            LIMIT 1
+            FOR UPDATE SKIP LOCKED
+        )
+        RETURNING team_id;
+        """
+        row = self.db.execute(query, fetchone=True)
+        return row.get("team_id") if row else None
+
+    def opponent_pool_size(self) -> int:
+        row = self.db.execute("SELECT COUNT(*) AS size FROM opponent_pool;", fetchone=True)
+        return row.get("size", 0) if row else 0
+
+    def _create_opponents(self, count: int) -> List[dict]:
+        """Insert `count` opponent users, their teams and 5 random starters each (caller owns the transaction)."""
+        import uuid
+
+        # Opponent users never log in, so they get a sentinel instead of a
+        # bcrypt hash; it can never match a password (see SigninInteractor)
+        usernames = [f"OpponentUser_{uuid.uuid4().hex[:12]}" for _ in range(count)]
+
+        # Use the shared pitching stats snapshot and randomly select 5 pitchers per team
+        stats = self.stats_frame()
+
         # Filter for starters with sufficient innings
         qualified = stats[stats["ip"] >= 50]
         if len(qualified) < 5:
             qualified = stats.head(10)
-        
-        # Randomly select 5 pitchers
-        selected = qualified.sample(n=min(5, len(qualified)))
-        
-        # Add players to the team
-        for _, row in selected.iterrows():
-            player_query = """
-            INSERT INTO players (team_id, player_name, mlbid, idfg, position, grade, analysis)
-            VALUES (%s, %s, %s, %s, %s, %s, %s);
+        selections = [
+            qualified.sample(n=min(5, len(qualified)))["name"].tolist() for _ in range(count)
+        ]
+
+        user_rows = self.db.execute_many(
             """
-            self.db.execute(player_query, (
-                opponent_team_id,
-                row["name"],
-                None,  # mlbid
-                None,  # idfg
-                "SP",  # position
-                None,  # grade (to be calculated)
-                None   # analysis (to be calculated)
-            ), fetchone=False)
-        
-        return {
-            "opponent_user_id": opponent_user_id,
-            "opponent_team_id": opponent_team_id,
-            "opponent_username": opponent_username
-        }
+            INSERT INTO users (username, password)
+            VALUES (%s, %s)
+            RETURNING id;
+            """,
+            [(username, OPPONENT_PASSWORD) for username in usernames],
+            returning=True,
+        )
+        team_rows = self.db.execute_many(
+            """
+            INSERT INTO teams (user_id, team_name)
+            VALUES (%s, %s)
+            RETURNING id, team_name, user_id;
+            """,
+            [(row.get("id"), "Opponent Team") for row in user_rows],
+            returning=True,
+        )
+
+        # Add players to every team in one batch, inside the same transaction
+        insert_players(
+            self.db,
+            [
+                (
+                    team_row.get("id"),
+                    name,
+                    None,  # mlbid
+                    None,  # idfg
+                    "SP",  # position
+                    None,  # grade (to be calculated)
+                    None   # analysis (to be calculated)
+                )
+                for team_row, names in zip(team_rows, selections)
+                for name in names
+            ],
+            returning=False,
+        )
+
+        return [
+            {
+                "opponent_user_id": user_row.get("id"),
+                "opponent_team_id": team_row.get("id"),
+                "opponent_username": username,
+            }
+            for username, user_row, team_row in zip(usernames, user_rows, team_rows)
+        ]
 
 
 # -------------------------
 # Player SQL Implementation
 # -------------------------
 class PlayerDataAccess(PlayerDataAccessInterface):
-    def __init__(self, db: Database):
+    def __init__(self, db: Database, roster_cache: RosterCache = None):
+        """
+        roster_cache: shared with TeamDataAccess; roster writes here invalidate it
+        """
         self.db = db
+        self.roster_cache = roster_cache
 
     def create(self, player: PlayerEntity) -> dict:
-        query = """
-        INSERT INTO players (team_id, player_name, mlbid, idfg, position, grade, analysis)
-        VALUES (%s, %s, %s, %s, %s, %s, %s)
-        RETURNING id, team_id, player_name, mlbid, idfg, position, grade, analysis;
+        query = f"""
+        INSERT INTO players ({", ".join(PLAYER_COLUMNS)})
+        VALUES ({", ".join(["%s"] * len(PLAYER_COLUMNS))})
+        RETURNING {PLAYER_RETURNING};
         """
-        return self.db.execute(
-            query,
-            (
-                player.get_team_id(),
-                player.get_player_name(),
-                player.get_mlbid(),
-                player.get_idfg(),
-                player.get_position(),
-                player.get_grade(),
-                player.get_analysis()
-            ),
-            fetchone=True,
-        )
+        result = self.db.execute(query, stored_player_row(player_params(player)), fetchone=True)
+        roster_changed(self.db, self.roster_cache, [player.get_team_id()])
+        return result
+
+    def create_many(self, players: List[PlayerEntity]) -> List[dict]:
+        rows = insert_players(self.db, [player_params(p) for p in players])
+        roster_changed(self.db, self.roster_cache, [p.get_team_id() for p in players])
+        return rows
 
     def read(self, player_name: str) -> Optional[dict]:
         query = "SELECT * FROM players WHERE player_name = %s;"
@@ -239,20 +486,40 @@ class PlayerDataAccess(PlayerDataAccessInterface):
     def update(self, player: PlayerEntity) -> dict:
         query = """
         UPDATE players
-        SET position = %s, mlbid = %s, idfg = %s
+        SET position = %s, mlbid = %s, idfg = %s, name_key = %s
         WHERE player_name = %s
         RETURNING id, team_id, player_name, mlbid, idfg, position;
         """
-        return self.db.execute(
+        result = self.db.execute(
             query,
             (
                 player.get_position(),
                 player.get_mlbid(),
-                player.get_idfg(),
+                normalize_idfg(player.get_idfg()),
+                normalize_name(player.get_player_name()),
                 player.get_player_name(),
             ),
             fetchone=True,
         )
+        # Matches by name on every team, so any cached roster may be affected
+        roster_changed(self.db, self.roster_cache, None)
+        return result
+
+    def backfill_keys(self) -> int:
+        """
+        Normalize idfg and fill name_key on rows written before players had a
+        name_key column (migration 0009); returns the number of rows updated.
+        """
+        rows = self.db.execute("SELECT id, player_name, idfg FROM players WHERE name_key IS NULL;", fetchall=True)
+        if not rows:
+            return 0
+        query = "UPDATE players SET idfg = %s, name_key = %s WHERE id = %s;"
+        with self.db.transaction():
+            self.db.execute_many(
+                query, [(normalize_idfg(r["idfg"]), normalize_name(r["player_name"]), r["id"]) for r in rows]
+            )
+            roster_changed(self.db, self.roster_cache, None)
+        return len(rows)
 
     def delete(self, player_name: str, team_id: int) -> dict:
         query = """
@@ -261,7 +528,37 @@ class PlayerDataAccess(PlayerDataAccessInterface):
         AND team_id = %s
         RETURNING idfg, team_id;
         """
-        return self.db.execute(query, (player_name, team_id), fetchone=True)
+        result = self.db.execute(query, (player_name, team_id), fetchone=True)
+        roster_changed(self.db, self.roster_cache, [team_id])
+        return result
+
+    def list_by_idfgs(self, idfgs: List[str]) -> List[dict]:
+        """Every rostered player (any team) linked to one of these FanGraphs ids."""
+        if not idfgs:
+            return []
+        query = """
+        SELECT id, team_id, player_name, idfg
+        FROM players
+        WHERE idfg = ANY(%s);
+        """
+        return self.db.execute(query, (list(idfgs),), fetchall=True)
+
+    def update_grades(self, grades: List[tuple]) -> int:
+        """
+        Store new (player_id, team_id, grade, analysis) values in one batch and
+        invalidate the affected rosters. Returns the number of players updated.
+        """
+        if not grades:
+            return 0
+        query = """
+        UPDATE players
+        SET grade = %s, analysis = %s
+        WHERE id = %s;
+        """
+        with self.db.transaction():
+            self.db.execute_many(query, [(grade, analysis, player_id) for player_id, _, grade, analysis in grades])
+            roster_changed(self.db, self.roster_cache, [team_id for _, team_id, _, _ in grades])
+        return len(grades)
 
     # New: list all players for a team
     def list_by_team(self, team_id: int) -> List[dict]:
@@ -271,3 +568,178 @@ class PlayerDataAccess(PlayerDataAccessInterface):
         WHERE team_id = %s;
         """
         return self.db.execute(query, (team_id,), fetchall=True)
+
+
+# -------------------------
+# Scoring Profile SQL Implementation
+# -------------------------
+class ScoringProfileDataAccess(ScoringProfileDataAccessInterface):
+    def __init__(self, db: Database):
+        self.db = db
+
+    def create(self, profile: ScoringProfileEntity) -> dict:
+        query = """
+        INSERT INTO scoring_profiles (user_id, name, weights, explanation)
+        VALUES (%s, %s, %s, %s)
+        RETURNING id, user_id, name, weights, explanation, revision;
+        """
+        return self.db.execute(
+            query,
+            (
+                profile.get_user_id(),
+                profile.get_name(),
+                Jsonb(profile.get_weights()),
+                profile.get_explanation(),
+            ),
+            fetchone=True,
+        )
+
+    def read(self, profile_id: int) -> Optional[dict]:
+        query = """
+        SELECT id, user_id, name, weights, explanation, revision
+        FROM scoring_profiles
+        WHERE id = %s;
+        """
+        return self.db.execute(query, (profile_id,), fetchone=True)
+
+    def revision(self, profile_id: int) -> Optional[int]:
+        query = """
+        SELECT revision
+        FROM scoring_profiles
+        WHERE id = %s;
+        """
+        row = self.db.execute(query, (profile_id,), fetchone=True)
+        return row["revision"] if row else None
+
+    def list_by_user(self, user_id: int) -> List[dict]:
+        query = """
+        SELECT id, user_id, name, weights, explanation, revision
+        FROM scoring_profiles
+        WHERE user_id = %s
+        ORDER BY name;
+        """
+        return self.db.execute(query, (user_id,), fetchall=True)
+
+    def update(self, profile: ScoringProfileEntity) -> Optional[dict]:
+        query = """
+        UPDATE scoring_profiles
+        SET name = %s, weights = %s, explanation = %s,
+            revision = revision + 1, updated_at = NOW()
+        WHERE id = %s
+        RETURNING id, user_id, name, weights, explanation, revision;
+        """
+        return self.db.execute(
+            query,
+            (
+                profile.get_name(),
+                Jsonb(profile.get_weights()),
+                profile.get_explanation(),
+                profile.get_id(),
+            ),
+            fetchone=True,
+        )
+
+    def delete(self, profile_id: int) -> Optional[dict]:
+        query = """
+        DELETE FROM scoring_profiles
+        WHERE id = %s
+        RETURNING id, revision;
+        """
+        return self.db.execute(query, (profile_id,), fetchone=True)
+
+
+# -------------------------
+# Pitcher Stats SQL Implementation
+# -------------------------
+class PitcherStatsDataAccess(PitcherStatsDataAccessInterface):
+    def __init__(self, db: Database):
+        self.db = db
+
+    def upsert_season(self, season: int, frame: pd.DataFrame) -> StatsChangeSet:
+        """
+        Bring a season's rows in line with a normalized pitching_stats frame,
+        in one transaction. Each row's hash is compared with the stored
+        row_hash by IDfg, so only pitchers whose line changed are written
+        (pipelined INSERTs, or COPY through a temp table for big batches) and
+        pitchers no longer in the frame are deleted. Returns the change set.
+        """
+        if "idfg" not in frame.columns or "name" not in frame.columns:
+            raise ValueError("Stats frame needs idfg and name columns to be stored")
+        hashes = row_hashes(frame)
+        if not hashes:
+            raise ValueError(f"No pitchers with an IDfg in the season {season} frame")
+
+        columns = ", ".join(PITCHER_STATS_COLUMNS)
+        upsert = f"""
+        ON CONFLICT (season, idfg) DO UPDATE
+        SET {", ".join(f"{c} = EXCLUDED.{c}" for c in PITCHER_STATS_COLUMNS[2:])}, updated_at = NOW()
+        """
+        with self.db.transaction() as conn:
+            stored = self.db.execute(
+                "SELECT idfg, row_hash FROM pitcher_season_stats WHERE season = %s;", (season,), fetchall=True
+            )
+            changes = diff_hashes(season, {r["idfg"]: r["row_hash"] for r in stored}, hashes)
+            rows = pitcher_stats_rows(season, frame, only=changes.added | changes.changed)
+
+            if len(rows) < COPY_THRESHOLD:
+                self.db.execute_many(
+                    f"INSERT INTO pitcher_season_stats ({columns}) VALUES ({', '.join(['%s'] * len(PITCHER_STATS_COLUMNS))}) {upsert};",
+                    rows,
+                )
+            else:
+                with conn.cursor() as cur:
+                    cur.execute("""
+                    CREATE TEMP TABLE pitcher_stats_import
+                    (LIKE pitcher_season_stats INCLUDING DEFAULTS) ON COMMIT DROP;
+                    """)
+                    with cur.copy(f"COPY pitcher_stats_import ({columns}) FROM STDIN") as copy:
+                        for row in rows:
+                            copy.write_row(row)
+                    cur.execute(f"INSERT INTO pitcher_season_stats ({columns}) SELECT {columns} FROM pitcher_stats_import {upsert};")
+
+            if changes.removed:
+                self.db.execute(
+                    "DELETE FROM pitcher_season_stats WHERE season = %s AND idfg = ANY(%s);",
+                    (season, sorted(changes.removed)),
+                )
+        return changes
+
+    def read(self, season: int, idfg: str) -> Optional[dict]:
+        query = "SELECT * FROM pitcher_season_stats WHERE season = %s AND idfg = %s;"
+        return self.db.execute(query, (season, normalize_idfg(idfg)), fetchone=True)
+
+    def roster_stats(self, team_id: int, season: int) -> List[dict]:
+        """
+        Every player on a team with their season stat row, in one query. Same
+        matching rule as PitcherIndex.find: IDfg when it is known, otherwise
+        normalized name with ties going to the most innings. Both tables
+        store the IDfg and name_key computed in Python on write
+        (normalize_idfg, normalize_name), so the query only compares stored
+        values. Players with no match come back with stat columns set to NULL.
+        """
+        query = """
+        SELECT p.player_name, p.mlbid, p.idfg, p.position, p.grade, p.analysis,
+               s.idfg AS stats_idfg, s.name, s.team, s.ip, s.era, s.k_pct, s.stats,
+               s.row_hash, s.updated_at
+        FROM players p
+        LEFT JOIN LATERAL (
+            SELECT *
+            FROM pitcher_season_stats s
+            WHERE s.season = %s
+            AND (s.idfg = p.idfg OR s.name_key = p.name_key)
+            ORDER BY (s.idfg = p.idfg) IS TRUE DESC, s.ip DESC NULLS LAST, s.idfg
+            LIMIT 1
+        ) s ON TRUE
+        WHERE p.team_id = %s
+        ORDER BY p.id;
+        """
+        return self.db.execute(query, (season, team_id), fetchall=True)
+
+    def seasons(self) -> List[dict]:
+        query = """
+        SELECT season, COUNT(*) AS pitchers, MAX(updated_at) AS updated_at
+        FROM pitcher_season_stats
+        GROUP BY season
+        ORDER BY season;
+        """
+        return self.db.execute(query, fetchall=True)
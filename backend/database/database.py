@@ -1,30 +1,214 @@
-import psycopg
+import threading
+from contextlib import contextmanager
+from typing import List, Tuple
+
 from psycopg.rows import dict_row
+from psycopg_pool import ConnectionPool
+
+
+class UnitOfWork:
+    """
+    Write statements collected while an operation is assembled and sent
+    together: flush() runs them in one transaction, pipelined so they cost a
+    single round trip and a single commit. Use it as a context manager to
+    flush on success and discard everything if the block raises.
+    """
+
+    def __init__(self, db: "Database"):
+        self.db = db
+        self._statements: List[Tuple[str, tuple]] = []
+
+    def register(self, query: str, params=None):
+        self._statements.append((query, params or ()))
+
+    def register_many(self, query: str, params_seq):
+        for params in params_seq:
+            self.register(query, params)
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
+    def flush(self):
+        statements, self._statements = self._statements, []
+        if not statements:
+            return
+        with self.db.transaction() as conn:
+            with conn.pipeline(), conn.cursor() as cur:
+                for query, params in statements:
+                    cur.execute(query, params)
+
+    def __enter__(self) -> "UnitOfWork":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.flush()
+        else:
+            self._statements = []
+        return False
 
 
 class Database:
-    """Handles connection to PostgreSQL using psycopg 3.2"""
+    """
+    Handles pooled connections to PostgreSQL using psycopg 3.2 / psycopg_pool.
 
-    def __init__(self, dsn: str):
+    Connections run in autocommit mode: a lone execute() borrows a connection
+    for one statement and never issues a separate COMMIT, so reads cost one
+    round trip. Multi-statement operations wrap their execute() calls in
+    transaction() to get a single atomic commit. Connections are
+    health-checked when handed out and recycled after max_lifetime seconds.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        min_size: int = 1,
+        max_size: int = 10,
+        timeout: float = 10.0,
+        max_lifetime: float = 3600.0,
+        max_idle: float = 600.0,
+    ):
+        """
+        dsn: PostgreSQL connection string
+        min_size / max_size: connections kept open / allowed at most
+        timeout: seconds to wait for a free connection before PoolTimeout is raised
+        max_lifetime: seconds after which a connection is closed and replaced
+        max_idle: seconds an idle connection above min_size is kept
+        """
+        if min_size < 0 or max_size < max(min_size, 1):
+            raise ValueError("Pool sizes must satisfy 0 <= min_size <= max_size and max_size >= 1")
         self.dsn = dsn
-        self.conn = None
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.max_idle = max_idle
+        self.pool = None
+        self._lock = threading.Lock()
+        # Connection of the transaction open on the current thread, if any
+        self._local = threading.local()
 
-    def connect(self):
-        if not self.conn or self.conn.closed:
-            self.conn = psycopg.connect(self.dsn, row_factory=dict_row)
-        return self.conn
+    def connect(self) -> ConnectionPool:
+        """Open the pool on first use (and again after close())."""
+        with self._lock:
+            if self.pool is None or self.pool.closed:
+                self.pool = ConnectionPool(
+                    self.dsn,
+                    min_size=self.min_size,
+                    max_size=self.max_size,
+                    timeout=self.timeout,
+                    max_lifetime=self.max_lifetime,
+                    max_idle=self.max_idle,
+                    kwargs={"row_factory": dict_row, "autocommit": True},
+                    check=ConnectionPool.check_connection,
+                    name="rostr",
+                    open=False,
+                )
+                # Don't block startup on the database; connections fill in the background
+                self.pool.open(wait=False)
+            return self.pool
 
     def close(self):
-        if self.conn and not self.conn.closed:
-            self.conn.close()
+        with self._lock:
+            if self.pool is not None and not self.pool.closed:
+                self.pool.close()
+            self.pool = None
+
+    @contextmanager
+    def connection(self):
+        """Borrow a pooled (autocommit) connection for the duration of the block."""
+        with self.connect().connection(timeout=self.timeout) as conn:
+            yield conn
+
+    @contextmanager
+    def transaction(self):
+        """
+        Run every execute() on this thread inside the block as one transaction:
+        committed once when the block exits, rolled back if it raises.
+        A transaction() opened inside another one joins the outer transaction.
+        """
+        current = getattr(self._local, "conn", None)
+        if current is not None:
+            yield current
+            return
+
+        with self.connection() as conn:
+            self._local.conn = conn
+            try:
+                with conn.transaction():
+                    yield conn
+            finally:
+                self._local.conn = None
+
+    def in_transaction(self) -> bool:
+        return getattr(self._local, "conn", None) is not None
+
+    def unit_of_work(self) -> UnitOfWork:
+        """Collect write statements and flush them in one pipelined transaction."""
+        return UnitOfWork(self)
 
     def execute(self, query: str, params=None, fetchone=False, fetchall=False):
         """Utility to run SQL safely"""
-        with self.connect().cursor() as cur:
+        current = getattr(self._local, "conn", None)
+        if current is not None:
+            return self._run(current, query, params, fetchone, fetchall)
+        with self.connection() as conn:
+            return self._run(conn, query, params, fetchone, fetchall)
+
+    def execute_many(self, query: str, params_seq, returning: bool = False) -> list:
+        """
+        Run one statement for each params tuple in a single transaction.
+        psycopg pipelines executemany(), so the whole batch costs about one
+        round trip. With returning=True, the first row each statement
+        returned, in input order.
+        """
+        params_seq = list(params_seq)
+        if not params_seq:
+            return []
+        with self.transaction() as conn:
+            with conn.cursor() as cur:
+                cur.executemany(query, params_seq, returning=returning)
+                if not returning:
+                    return []
+                rows = []
+                while True:
+                    rows.append(cur.fetchone())
+                    if not cur.nextset():
+                        break
+                return rows
+
+    @staticmethod
+    def _run(conn, query: str, params, fetchone: bool, fetchall: bool):
+        with conn.cursor() as cur:
             cur.execute(query, params or ())
-            self.conn.commit()
             if fetchone:
                 return cur.fetchone()
             elif fetchall:
                 return cur.fetchall()
-            
\ No newline at end of file
+
+    def stats(self) -> dict:
+        """Pool counters for monitoring: connections in use, waiting requests, wait time."""
+        if self.pool is None or self.pool.closed:
+            return {"open": False, "min_size": self.min_size, "max_size": self.max_size}
+
+        raw = self.pool.get_stats()
+        size = raw.get("pool_size", 0)
+        available = raw.get("pool_available", 0)
+        queued = raw.get("requests_queued", 0)
+        wait_ms = raw.get("requests_wait_ms", 0)
+        return {
+            "open": True,
+            "min_size": raw.get("pool_min", self.min_size),
+            "max_size": raw.get("pool_max", self.max_size),
+            "size": size,
+            "available": available,
+            "in_use": size - available,
+            "waiting": raw.get("requests_waiting", 0),
+            "requests": raw.get("requests_num", 0),
+            "requests_queued": queued,
+            "requests_timed_out": raw.get("requests_errors", 0),
+            "wait_ms_total": wait_ms,
+            "wait_ms_avg": round(wait_ms / queued, 2) if queued else 0.0,
+            "connections_opened": raw.get("connections_num", 0),
+            "connections_lost": raw.get("connections_lost", 0),
+        }
@@ -1,3 +1,4 @@
 from .user_entity import UserEntity
 from .team_entity import TeamEntity
-from .player_entity import PlayerEntity
\ No newline at end of file
+from .player_entity import PlayerEntity
+from .scoring_profile_entity import ScoringProfileEntity
\ No newline at end of file
@@ -0,0 +1,41 @@
+from typing import Dict, Optional
+
+class ScoringProfileEntity:
+    def __init__(self, user_id: int, name: str, weights: Dict[str, float], explanation: Optional[str] = None,
+                 id: Optional[int] = None, revision: int = 1):
+        self.__id = id
+        self.__user_id = user_id
+        self.__name = name
+        self.__weights = weights
+        self.__explanation = explanation
+        self.__revision = revision
+
+    def get_id(self) -> Optional[int]:
+        return self.__id
+
+    def get_user_id(self) -> int:
+        return self.__user_id
+
+    def get_name(self) -> str:
+        return self.__name
+
+    def get_weights(self) -> Dict[str, float]:
+        return self.__weights
+
+    def get_explanation(self) -> Optional[str]:
+        return self.__explanation
+
+    def get_revision(self) -> int:
+        return self.__revision
+
+    def set_id(self, id: Optional[int]) -> None:
+        self.__id = id
+
+    def set_name(self, name: str) -> None:
+        self.__name = name
+
+    def set_weights(self, weights: Dict[str, float]) -> None:
+        self.__weights = weights
+
+    def set_explanation(self, explanation: Optional[str]) -> None:
+        self.__explanation = explanation
@@ -0,0 +1,215 @@
+import hashlib
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .database import Database
+
+
+# Directory holding NNNN_description.sql files
+MIGRATIONS_DIR = Path(__file__).parent / "migrations"
+
+# First-line marker for migrations that must run outside a transaction
+# (e.g. CREATE INDEX CONCURRENTLY)
+NO_TRANSACTION_MARKER = "-- migrate: no-transaction"
+
+
+class MigrationError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    sql: str
+    checksum: str
+    transactional: bool
+
+    @staticmethod
+    def from_file(path: Path) -> "Migration":
+        match = re.fullmatch(r"(\d+)_(\w+)\.sql", path.name)
+        if not match:
+            raise MigrationError(f"Bad migration file name: {path.name} (expected NNNN_description.sql)")
+        sql = path.read_text(encoding="utf-8")
+        return Migration(
+            version=int(match.group(1)),
+            name=match.group(2),
+            sql=sql,
+            checksum=hashlib.sha256(sql.encode("utf-8")).hexdigest(),
+            transactional=not sql.lstrip().startswith(NO_TRANSACTION_MARKER),
+        )
+
+    def statements(self) -> List[str]:
+        """The SQL split into single statements (comments dropped)."""
+        return split_statements(self.sql)
+
+
+# Dollar-quote opening tag: $$ or $name$
+_DOLLAR_TAG = re.compile(r"\$(?:[A-Za-z_][A-Za-z0-9_]*)?\$")
+
+
+def split_statements(sql: str) -> List[str]:
+    """
+    Split SQL on the semicolons that end statements, leaving alone the ones
+    inside string literals, quoted identifiers, dollar-quoted bodies
+    (functions, DO blocks) and comments. Comments are dropped.
+    """
+    statements = []
+    current = []
+    i, n = 0, len(sql)
+    while i < n:
+        c = sql[i]
+        if c == "-" and sql.startswith("--", i):
+            end = sql.find("\n", i)
+            i = n if end < 0 else end
+        elif c == "/" and sql.startswith("/*", i):
+            # Block comments nest in PostgreSQL
+            depth, i = 1, i + 2
+            while i < n and depth:
+                if sql.startswith("/*", i):
+                    depth, i = depth + 1, i + 2
+                elif sql.startswith("*/", i):
+                    depth, i = depth - 1, i + 2
+                else:
+                    i += 1
+            current.append(" ")
+        elif c in "'\"":
+            # A doubled quote is an escaped quote and continues the literal
+            end = i + 1
+            while True:
+                end = sql.find(c, end)
+                if end < 0:
+                    end = n
+                    break
+                if sql.startswith(c * 2, end):
+                    end += 2
+                    continue
+                end += 1
+                break
+            current.append(sql[i:end])
+            i = end
+        elif c == "$" and _DOLLAR_TAG.match(sql, i) and not (current and re.match(r"\w", current[-1][-1:])):
+            tag = _DOLLAR_TAG.match(sql, i).group()
+            end = sql.find(tag, i + len(tag))
+            end = n if end < 0 else end + len(tag)
+            current.append(sql[i:end])
+            i = end
+        elif c == ";":
+            statements.append("".join(current))
+            current = []
+            i += 1
+        else:
+            current.append(c)
+            i += 1
+    statements.append("".join(current))
+    return [stmt.strip() for stmt in statements if stmt.strip()]
+
+
+def load_migrations(directory: Path = MIGRATIONS_DIR) -> List[Migration]:
+    migrations = sorted((Migration.from_file(p) for p in Path(directory).glob("*.sql")), key=lambda m: m.version)
+    versions = [m.version for m in migrations]
+    if len(set(versions)) != len(versions):
+        raise MigrationError(f"Duplicate migration versions in {directory}")
+    return migrations
+
+
+class MigrationRunner:
+    """
+    Applies the numbered SQL files in database/migrations in order and records
+    each one in schema_migrations, so running it again only applies new files.
+
+    A session-level advisory lock serializes concurrent runners (e.g. several
+    app instances starting at once). Each migration runs in its own
+    transaction together with its schema_migrations row, sent as a single
+    execute, unless the file starts with "-- migrate: no-transaction", in
+    which case its statements (see split_statements) run one by one in
+    autocommit mode and the row is written afterwards; such migrations must
+    therefore be safe to re-run.
+    """
+
+    LOCK_KEY = "rostr.schema_migrations"
+
+    def __init__(self, db: Database, directory: Path = MIGRATIONS_DIR):
+        self.db = db
+        self.directory = Path(directory)
+
+    def applied(self) -> Dict[int, dict]:
+        """{version: {name, checksum, applied_at}} for migrations already run."""
+        with self.db.connection() as conn:
+            self._ensure_table(conn)
+            rows = conn.execute(
+                "SELECT version, name, checksum, applied_at FROM schema_migrations ORDER BY version;"
+            ).fetchall()
+        return {row["version"]: row for row in rows}
+
+    def pending(self) -> List[Migration]:
+        applied = self.applied()
+        migrations = load_migrations(self.directory)
+        self._check_checksums(migrations, applied)
+        return [m for m in migrations if m.version not in applied]
+
+    def migrate(self, target: Optional[int] = None) -> List[int]:
+        """Apply pending migrations (up to target, if given); returns the versions applied."""
+        migrations = load_migrations(self.directory)
+        done = []
+        with self.db.connection() as conn:
+            conn.execute("SELECT pg_advisory_lock(hashtext(%s));", (self.LOCK_KEY,))
+            try:
+                self._ensure_table(conn)
+                # Read under the lock: another runner may have just finished
+                rows = conn.execute("SELECT version, name, checksum FROM schema_migrations;").fetchall()
+                applied = {row["version"]: row for row in rows}
+                self._check_checksums(migrations, applied)
+
+                for migration in migrations:
+                    if migration.version in applied:
+                        continue
+                    if target is not None and migration.version > target:
+                        break
+                    print(f"[MigrationRunner] Applying {migration.version:04d}_{migration.name}")
+                    self._apply(conn, migration)
+                    done.append(migration.version)
+            finally:
+                conn.execute("SELECT pg_advisory_unlock(hashtext(%s));", (self.LOCK_KEY,))
+        return done
+
+    # ----------------------------------------------------
+    # INTERNALS
+    # ----------------------------------------------------
+    @staticmethod
+    def _ensure_table(conn):
+        conn.execute("""
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INT PRIMARY KEY,
+            name TEXT NOT NULL,
+            checksum TEXT NOT NULL,
+            applied_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+        );
+        """)
+
+    @staticmethod
+    def _check_checksums(migrations: List[Migration], applied: Dict[int, dict]):
+        for migration in migrations:
+            row = applied.get(migration.version)
+            if row is not None and row["checksum"] != migration.checksum:
+                raise MigrationError(
+                    f"Migration {migration.version:04d}_{migration.name} was edited after it was applied; "
+                    "add a new migration instead"
+                )
+
+    @staticmethod
+    def _apply(conn, migration: Migration):
+        record = "INSERT INTO schema_migrations (version, name, checksum) VALUES (%s, %s, %s);"
+        params = (migration.version, migration.name, migration.checksum)
+        if migration.transactional:
+            # The whole file in one execute: without parameters the server
+            # parses the statements itself
+            with conn.transaction():
+                conn.execute(migration.sql)
+                conn.execute(record, params)
+        else:
+            for statement in migration.statements():
+                conn.execute(statement)
+            conn.execute(record, params)
@@ -0,0 +1,31 @@
+-- Tables from the original schema.sql, safe to run against a database
+-- created before migrations were tracked.
+
+CREATE TABLE IF NOT EXISTS users (
+    id SERIAL PRIMARY KEY,
+    username VARCHAR(100) NOT NULL UNIQUE,
+    password BYTEA NOT NULL,
+    opponent_team_id INT
+);
+
+-- Databases created before opponents existed lack this column
+ALTER TABLE users ADD COLUMN IF NOT EXISTS opponent_team_id INT;
+
+CREATE TABLE IF NOT EXISTS teams (
+    id SERIAL PRIMARY KEY,
+    user_id INT NOT NULL,
+    team_name VARCHAR(150) NOT NULL,
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS players (
+    id SERIAL PRIMARY KEY,
+    team_id INT NOT NULL,
+    player_name VARCHAR(150) NOT NULL,
+    mlbid VARCHAR(50),
+    idfg VARCHAR(50),
+    position VARCHAR(50),
+    grade FLOAT,
+    analysis TEXT,
+    FOREIGN KEY (team_id) REFERENCES teams(id) ON DELETE CASCADE
+);
@@ -0,0 +1,16 @@
+-- migrate: no-transaction
+-- Built CONCURRENTLY so large tables stay writable while the indexes build.
+-- Each index is dropped first: a failed concurrent build leaves an INVALID
+-- index behind that IF NOT EXISTS would otherwise keep.
+
+-- get_all_players / list_by_team
+DROP INDEX CONCURRENTLY IF EXISTS players_team_id_idx;
+CREATE INDEX CONCURRENTLY players_team_id_idx ON players (team_id);
+
+-- PlayerDataAccess.read / update
+DROP INDEX CONCURRENTLY IF EXISTS players_player_name_idx;
+CREATE INDEX CONCURRENTLY players_player_name_idx ON players (player_name);
+
+-- TeamDataAccess.read
+DROP INDEX CONCURRENTLY IF EXISTS teams_user_id_idx;
+CREATE INDEX CONCURRENTLY teams_user_id_idx ON teams (user_id);
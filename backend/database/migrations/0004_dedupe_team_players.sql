@@ -0,0 +1,23 @@
+-- A pitcher may appear on a team only once (names compared case-insensitively).
+-- AddPlayerInteractor already refuses duplicates; remove any that slipped in
+-- earlier, keeping the first row added, so the unique index can be built.
+-- Removed rows are copied to players_duplicates_backup along with the id of
+-- the row that was kept, so they can be inspected or restored by hand.
+CREATE TABLE players_duplicates_backup (
+    LIKE players,
+    kept_player_id INT NOT NULL,
+    removed_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+WITH ranked AS (
+    SELECT id, min(id) OVER (PARTITION BY team_id, lower(player_name)) AS kept_player_id
+    FROM players
+), removed AS (
+    DELETE FROM players p
+    USING ranked r
+    WHERE p.id = r.id
+      AND r.id <> r.kept_player_id
+    RETURNING p.*, r.kept_player_id
+)
+INSERT INTO players_duplicates_backup
+SELECT removed.*, NOW() FROM removed;
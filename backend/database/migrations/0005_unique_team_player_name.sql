@@ -0,0 +1,5 @@
+-- migrate: no-transaction
+-- Dropped first in case an earlier concurrent build failed and left it INVALID.
+DROP INDEX CONCURRENTLY IF EXISTS players_team_id_lower_name_key;
+CREATE UNIQUE INDEX CONCURRENTLY players_team_id_lower_name_key
+    ON players (team_id, lower(player_name));
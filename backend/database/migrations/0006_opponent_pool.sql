@@ -0,0 +1,8 @@
+-- Ready-made opponent teams waiting to be assigned at signup/signin.
+-- A row is deleted when its team is claimed.
+
+CREATE TABLE IF NOT EXISTS opponent_pool (
+    team_id INT PRIMARY KEY,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    FOREIGN KEY (team_id) REFERENCES teams(id) ON DELETE CASCADE
+);
@@ -0,0 +1,22 @@
+-- Season pitching stats shared by every worker, one row per (season, idfg).
+-- name_key is normalize_name(name) from services/pitcher_index.py; the
+-- typed columns are the ones roster queries filter or grade on, everything
+-- else from the normalized pitching_stats row lives in stats.
+
+CREATE TABLE IF NOT EXISTS pitcher_season_stats (
+    season INT NOT NULL,
+    idfg VARCHAR(50) NOT NULL,
+    name VARCHAR(150) NOT NULL,
+    name_key VARCHAR(150) NOT NULL,
+    team VARCHAR(50),
+    ip DOUBLE PRECISION,
+    era DOUBLE PRECISION,
+    k_pct DOUBLE PRECISION,
+    stats JSONB NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (season, idfg)
+);
+
+-- Name lookups resolve ties to the pitcher with the most innings
+CREATE INDEX IF NOT EXISTS pitcher_season_stats_name_key_idx
+    ON pitcher_season_stats (season, name_key, ip DESC);
@@ -0,0 +1,5 @@
+-- Hash of each stored stat row (services/stats_delta.row_hashes), so a
+-- refresh only rewrites pitchers whose line changed. Existing rows start
+-- NULL and are rewritten once on the next ingest.
+
+ALTER TABLE pitcher_season_stats ADD COLUMN IF NOT EXISTS row_hash BIGINT;
@@ -0,0 +1,7 @@
+-- normalize_name(player_name), written by PlayerDataAccess alongside a
+-- normalized idfg, so roster_stats() matches players to
+-- pitcher_season_stats.name_key on stored keys computed the same way.
+-- Rows from before this migration are filled by scripts/migrate.py
+-- (PlayerDataAccess.backfill_keys), since the key is computed in Python.
+
+ALTER TABLE players ADD COLUMN IF NOT EXISTS name_key VARCHAR(150);
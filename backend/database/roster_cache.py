@@ -0,0 +1,145 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+import psycopg
+
+
+# NOTIFY channel carrying the id of a team whose roster changed
+ROSTER_CHANNEL = "roster_changed"
+
+
+class RosterCache:
+    """
+    In-process LRU of team rosters (get_all_players rows) with a TTL.
+
+    Reads go through get(team_id, load): a hit returns a copy of the cached
+    rows, a miss calls load() and keeps the result. Writers call
+    invalidate(team_id) after changing a roster; RosterChangeListener does
+    the same for changes committed by other workers. The TTL bounds how long
+    a missed notification can leave a roster stale.
+
+    A load that overlaps an invalidation of the same team is returned to its
+    caller but not cached, so a slow read can't reinstate a stale roster.
+    """
+
+    def __init__(self, max_entries: int = 2048, ttl_seconds: float = 300.0, clock: Callable[[], float] = time.monotonic):
+        if max_entries < 1 or ttl_seconds <= 0:
+            raise ValueError("max_entries and ttl_seconds must be positive")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()
+        # Bumped by every invalidation; a load only caches if it is unchanged
+        self._generations: Dict[int, int] = {}
+        self._epoch = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, team_id: int, load: Callable[[], List[dict]]) -> List[dict]:
+        key = int(team_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > self._clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._copy(entry[1])
+            self.misses += 1
+            seen = (self._epoch, self._generations.get(key, 0))
+
+        rows = list(load() or [])
+
+        with self._lock:
+            if seen == (self._epoch, self._generations.get(key, 0)):
+                self._entries[key] = (self._clock() + self.ttl_seconds, self._copy(rows))
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return rows
+
+    def invalidate(self, team_id: int):
+        key = int(team_id)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._generations[key] = self._generations.get(key, 0) + 1
+            self.invalidations += 1
+            # Only teams with an in-flight load need their counter kept
+            if len(self._generations) > 4 * self.max_entries:
+                self._generations.clear()
+                self._epoch += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._generations.clear()
+            self._epoch += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+            }
+
+    @staticmethod
+    def _copy(rows: List[dict]) -> List[dict]:
+        return [dict(row) for row in rows]
+
+
+class RosterChangeListener:
+    """
+    Background thread that LISTENs on ROSTER_CHANNEL over its own (unpooled)
+    connection and invalidates the cache for every team id it hears about.
+    Writers send the notification inside their transaction, so it arrives
+    only once the change is committed. After a dropped connection the whole
+    cache is cleared, since notifications may have been missed meanwhile.
+    """
+
+    def __init__(self, dsn: str, cache: RosterCache, reconnect_seconds: float = 5.0):
+        self.dsn = dsn
+        self.cache = cache
+        self.reconnect_seconds = reconnect_seconds
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start the listener thread (no-op if it is already running)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="roster-listener", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """Ask the thread to exit and wait for it."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def handle(self, payload: str):
+        """Invalidate one team, or everything for "*" (or anything unparseable)."""
+        try:
+            self.cache.invalidate(int(payload))
+        except ValueError:
+            self.cache.clear()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                with psycopg.connect(self.dsn, autocommit=True) as conn:
+                    conn.execute(f"LISTEN {ROSTER_CHANNEL};")
+                    self.cache.clear()
+                    while not self._stop.is_set():
+                        for notify in conn.notifies(timeout=1.0):
+                            self.handle(notify.payload)
+            except Exception as e:
+                print(f"[RosterChangeListener] Connection lost, reconnecting: {e}")
+                self._stop.wait(self.reconnect_seconds)
@@ -1,3 +1,8 @@
+-- Schema for a fresh database (docker-entrypoint-initdb). Existing databases
+-- are upgraded with the numbered files in database/migrations:
+--     python -m backend.scripts.migrate
+-- Keep this file in sync when adding a migration.
+
 CREATE TABLE users (
     id SERIAL PRIMARY KEY,
     username VARCHAR(100) NOT NULL UNIQUE,
@@ -23,5 +28,50 @@ CREATE TABLE players (
     position VARCHAR(50),
     grade FLOAT,
     analysis TEXT,
+    name_key VARCHAR(150),
+    FOREIGN KEY (team_id) REFERENCES teams(id) ON DELETE CASCADE
+);
+
+
+CREATE TABLE scoring_profiles (
+    id SERIAL PRIMARY KEY,
+    user_id INT NOT NULL,
+    name VARCHAR(100) NOT NULL,
+    weights JSONB NOT NULL,
+    explanation TEXT,
+    revision INT NOT NULL DEFAULT 1,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    UNIQUE (user_id, name),
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+);
+
+
+CREATE TABLE opponent_pool (
+    team_id INT PRIMARY KEY,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
     FOREIGN KEY (team_id) REFERENCES teams(id) ON DELETE CASCADE
 );
+
+
+CREATE TABLE pitcher_season_stats (
+    season INT NOT NULL,
+    idfg VARCHAR(50) NOT NULL,
+    name VARCHAR(150) NOT NULL,
+    name_key VARCHAR(150) NOT NULL,
+    team VARCHAR(50),
+    ip DOUBLE PRECISION,
+    era DOUBLE PRECISION,
+    k_pct DOUBLE PRECISION,
+    stats JSONB NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    row_hash BIGINT,
+    PRIMARY KEY (season, idfg)
+);
+
+
+CREATE INDEX players_team_id_idx ON players (team_id);
+CREATE INDEX players_player_name_idx ON players (player_name);
+CREATE INDEX teams_user_id_idx ON teams (user_id);
+CREATE UNIQUE INDEX players_team_id_lower_name_key ON players (team_id, lower(player_name));
+CREATE INDEX pitcher_season_stats_name_key_idx ON pitcher_season_stats (season, name_key, ip DESC);
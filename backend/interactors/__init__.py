@@ -1,4 +1,6 @@
 from .signin_interactor import SigninInteractor
 from .signup_interactor import SignupInteractor
 from .add_player_interactor import AddPlayerInteractor
-from .recommend_lineup_interactor import RecommendLineupInteractor
\ No newline at end of file
+from .recommend_lineup_interactor import RecommendLineupInteractor
+from .recommend_free_agents_interactor import RecommendFreeAgentsInteractor
+from .import_roster_interactor import ImportRosterInteractor
@@ -1,16 +1,18 @@
 from flask import jsonify
 from ..database.data_access_interface import PlayerDataAccessInterface
 from ..database.entities.player_entity import PlayerEntity
-from pybaseball import pitching_stats
 from ..services.pitcher_grading_service import PitcherGradingService
+from ..services.season_stats_repository import SeasonStatsRepository
 
 
 class AddPlayerInteractor:
-    def __init__(self, player_data_access: PlayerDataAccessInterface):
+    def __init__(self, player_data_access: PlayerDataAccessInterface, stats_repository: SeasonStatsRepository):
         """
         player_data_access: implements PlayerDataAccessInterface
+        stats_repository: shared SeasonStatsRepository
         """
         self.player_data_access = player_data_access
+        self.stats_repository = stats_repository
 
 
     def execute(self, team_id, player_name, mlbid, idfg, position):
@@ -37,27 +39,18 @@ class AddPlayerInteractor:
                 return jsonify({"error": "Player already exists on this team"}), 409
             
             #Get the pitcher's stats
-            data = pitching_stats(2025)
-            player_data = data[data['Name'].str.lower() == player_name.lower()]
+            snapshot = self.stats_repository.get()
+            pos = snapshot.index.find(name=player_name, idfg=idfg)
 
-            if player_data.empty:
+            if pos is None:
                 return jsonify({"error": f"No stats found for {player_name}"}), 404
             
-            strikeout_rate = float(player_data.iloc[0]['K%'])
-            innings_pitched = float(player_data.iloc[0]['IP'])
-            era = float(player_data.iloc[0]['ERA'])
-
-            stats = {
-                "K%": strikeout_rate,
-                "IP": innings_pitched,
-                "ERA": era
-            }
-
-            # Calculate grade
-            grade = PitcherGradingService.calculate_pitcher_grade(stats)
+            # Grade and tier come precomputed for the whole league
+            league = PitcherGradingService.league_grades(snapshot)
+            grade = league.grade(pos)
 
             #Generate grade analysis
-            analysis = PitcherGradingService.analyze_pitcher(stats, grade)
+            analysis = PitcherGradingService.league_analysis(snapshot, pos)
 
             # Create entity
             player_entity = PlayerEntity(
@@ -0,0 +1,81 @@
+from flask import jsonify
+from ..database.data_access_interface import PlayerDataAccessInterface
+from ..database.entities.player_entity import PlayerEntity
+from ..services.pitcher_grading_service import PitcherGradingService
+from ..services.pitcher_index import normalize_idfg, normalize_name
+from ..services.roster_enricher import RosterEnricher
+from ..services.season_stats_repository import SeasonStatsRepository
+
+
+class ImportRosterInteractor:
+    # Largest roster accepted in one request
+    MAX_PLAYERS = 500
+
+    def __init__(self, player_data_access: PlayerDataAccessInterface, stats_repository: SeasonStatsRepository):
+        """
+        player_data_access: implements PlayerDataAccessInterface
+        stats_repository: shared SeasonStatsRepository
+        """
+        self.player_data_access = player_data_access
+        self.stats_repository = stats_repository
+
+    def execute(self, team_id, players):
+        """
+        Add many pitchers to a team at once.
+        players: [{"player_name": ..., "position": "SP", "idfg": optional, "mlbid": optional}, ...]
+        Pitchers already on the team, repeated in the request or missing from
+        the season stats are skipped and reported; the rest are graded in one
+        vectorized pass and inserted in a single batch.
+        """
+        if not team_id or not isinstance(players, list) or not players:
+            return jsonify({"error": "players must be a non-empty list"}), 400
+        if len(players) > self.MAX_PLAYERS:
+            return jsonify({"error": f"At most {self.MAX_PLAYERS} players can be imported at once"}), 400
+        if not all(isinstance(p, dict) and p.get("player_name") for p in players):
+            return jsonify({"error": "Every player needs a player_name"}), 400
+
+        try:
+            # Drop pitchers already on the team or repeated in this request
+            existing = self.player_data_access.list_by_team(team_id)
+            seen_names = {normalize_name(p.get("player_name")) for p in existing}
+            seen_idfgs = {normalize_idfg(p.get("idfg")) for p in existing} - {None}
+
+            skipped, candidates = [], []
+            for p in players:
+                name_key, idfg_key = normalize_name(p["player_name"]), normalize_idfg(p.get("idfg"))
+                if name_key in seen_names or (idfg_key is not None and idfg_key in seen_idfgs):
+                    skipped.append({"player_name": p["player_name"], "reason": "duplicate"})
+                    continue
+                seen_names.add(name_key)
+                if idfg_key is not None:
+                    seen_idfgs.add(idfg_key)
+                candidates.append(p)
+
+            # Match everyone against the season stats and grade them together
+            snapshot = self.stats_repository.get()
+            roster = RosterEnricher.enrich(candidates, snapshot)
+            skipped.extend({"player_name": p["player_name"], "reason": "no stats found"} for p in roster.unmatched)
+
+            grades = PitcherGradingService.roster_grades(roster, snapshot)
+
+            frame = snapshot.frame
+            stat_idfgs = frame["idfg"].take(roster.rows).tolist() if "idfg" in frame.columns else [None] * len(roster)
+
+            entities = []
+            for i, p in enumerate(roster.players):
+                grade = float(grades[i])
+                entities.append(PlayerEntity(
+                    team_id=team_id,
+                    player_name=p["player_name"],
+                    mlbid=p.get("mlbid"),
+                    idfg=p.get("idfg") or normalize_idfg(stat_idfgs[i]),
+                    position=p.get("position") or "SP",
+                    grade=grade,
+                    analysis=PitcherGradingService.league_analysis(snapshot, roster.rows[i]),
+                ))
+
+            created = self.player_data_access.create_many(entities) if entities else []
+            return jsonify({"created": created, "skipped": skipped}), 201
+
+        except Exception as e:
+            return jsonify({"error": str(e)}), 400
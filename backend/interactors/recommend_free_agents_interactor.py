@@ -0,0 +1,62 @@
+from flask import jsonify
+from ..database.data_access_interface import TeamDataAccessInterface
+from ..services.pitcher_recomender_service import PitcherRecommenderService
+from ..services.season_stats_repository import SeasonStatsRepository
+from ..services.roster_enricher import RosterEnricher
+from ..services.scoring_profile_registry import ScoringProfileRegistry, UnknownProfileError
+
+class RecommendFreeAgentsInteractor:
+    def __init__(self, team_data_access: TeamDataAccessInterface, stats_repository: SeasonStatsRepository,
+                 scoring_profiles: ScoringProfileRegistry = None):
+        """
+        team_data_access: implementation of TeamDataAccessInterface
+        stats_repository: shared SeasonStatsRepository
+        scoring_profiles: shared ScoringProfileRegistry (built-in profiles only if omitted)
+        """
+        self.team_data_access = team_data_access
+        self.stats_repository = stats_repository
+        self.scoring_profiles = scoring_profiles or ScoringProfileRegistry()
+
+    def execute(self, team_id, profile, alpha, top_n):
+        try:
+            # Built-in name or "custom:<id>"
+            compiled = self.scoring_profiles.resolve(profile)
+
+            # Current roster; an empty team simply has nothing to diversify against
+            players = self.team_data_access.get_all_players(team_id)
+
+            snapshot = self.stats_repository.get()
+            roster = RosterEnricher.enrich(players, snapshot)
+            # Pitchers on any team in the league (opponents included) aren't free agents
+            taken = RosterEnricher.enrich(self.team_data_access.rostered_players(), snapshot).rows
+
+            # Score every unrostered pitcher, penalizing look-alikes of this team's players
+            free_agents, explanation = PitcherRecommenderService.recommend_free_agents(
+                roster, snapshot, top_n, compiled, alpha, taken
+            )
+
+            formatted = [
+                {
+                    "rank": r["rank"],
+                    "name": r["name"],
+                    "team": r["team"],
+                    "idfg": r["idfg"],
+                    "score": round(r["score"], 2),
+                    "base_score": round(r["base_score"], 2),
+                    "similarity": round(r["similarity"], 3),
+                }
+                for r in free_agents
+            ]
+
+            return jsonify({
+                "free_agents": formatted,
+                "explanation": explanation,
+                "alpha": alpha
+            }), 200
+
+        except UnknownProfileError as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            return jsonify({"error": str(e)}), 500
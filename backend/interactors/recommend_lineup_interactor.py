@@ -1,77 +1,197 @@
 from flask import jsonify
-from ..database.data_access_interface import TeamDataAccessInterface
+from ..database.data_access_interface import PitcherStatsDataAccessInterface, TeamDataAccessInterface
 from ..services.pitcher_recomender_service import PitcherRecommenderService
-from pybaseball import pitching_stats
+from ..services.season_stats_repository import CURRENT_SEASON, SeasonStatsRepository
+from ..services.roster_enricher import RosterEnricher
+from ..services.scoring_profile_registry import ScoringProfileRegistry, UnknownProfileError
+from ..services.result_cache import ResultCache, roster_fingerprint, roster_stats_version, stats_rows_version
+from ..services.stats_history import SeasonStatsHistory, StatsHistoryUnavailable, parse_as_of, resolve_snapshot
+from ..services.rolling_form import RollingFormTracker
 
 class RecommendLineupInteractor:
-    def __init__(self, team_data_access: TeamDataAccessInterface):
+    def __init__(self, team_data_access: TeamDataAccessInterface, stats_repository: SeasonStatsRepository,
+                 scoring_profiles: ScoringProfileRegistry = None, result_cache: ResultCache = None,
+                 stats_history: SeasonStatsHistory = None, form_tracker: RollingFormTracker = None,
+                 pitcher_stats: PitcherStatsDataAccessInterface = None):
         """
         team_data_access: implementation of TeamDataAccessInterface
+        stats_repository: shared SeasonStatsRepository
+        scoring_profiles: shared ScoringProfileRegistry (built-in profiles only if omitted)
+        result_cache: shared ResultCache for finished lineups
+        stats_history: day-by-day stats history for as_of requests (live stats only if omitted)
+        form_tracker: rolling 7/14/30-day form for form= requests (unavailable if omitted)
+        pitcher_stats: pitcher_season_stats table; when given, roster-normalized lineups on
+            live stats (without form=) join the roster to its stats in one query and
+            never touch the in-memory snapshot
         """
         self.team_data_access = team_data_access
+        self.stats_repository = stats_repository
+        self.scoring_profiles = scoring_profiles or ScoringProfileRegistry()
+        self.result_cache = result_cache or ResultCache()
+        self.stats_history = stats_history
+        self.form_tracker = form_tracker
+        self.pitcher_stats = pitcher_stats
         
-    def execute(self, team_id, profile):
+    def execute(self, team_id, profile, normalization="roster", as_of=None, form=None):
+        if normalization not in PitcherRecommenderService.NORMALIZATION_MODES:
+            modes = ", ".join(PitcherRecommenderService.NORMALIZATION_MODES)
+            return jsonify({"error": f"normalization must be one of: {modes}"}), 400
         try:
-            # Get all players on this team
-            players = self.team_data_access.get_all_players(team_id)
-            if not players:
-                return jsonify({"error": "No players found for this team"}), 404
-
-            # Fetch MLB pitching stats (2025)
-            stats = pitching_stats(2025)
-            stats.columns = [c.strip().lower() for c in stats.columns]
-
-            #For each player, try to find matching MLB stat row
-            enriched_pitchers = []
-            for p in players:
-                name = p.get("player_name")
-                match = stats[stats["name"].str.contains(name, case=False, na=False)]
-                if match.empty:
-                    print(f"No stat match found for {name}")
-                    continue
-
-                row = match.iloc[0]
-                enriched_pitchers.append({
-                    "name": row["name"],
-                    "team": row.get("team", "Unknown"),
-                    "pitching+": row.get("pitching+", 100),
-                    "stuff+": row.get("stuff+", 100),
-                    "k-bb%": row.get("k-bb%", 0),
-                    "xfip-": row.get("xfip-", 100),
-                    "barrel%": row.get("barrel%", 0),
-                    "hardhit%": row.get("hardhit%", 0),
-                    "gb%": row.get("gb%", 0),
-                    "swstr%": row.get("swstr%", 0),
-                    "wpa/li": row.get("wpa/li", 0),
-                })
-
-            # Handle case where none were matched
-            if not enriched_pitchers:
-                return jsonify({"error": "No matching MLB stats found for team players"}), 404
-
-            # Generate lineup recommendation using the selected profile
-            df, explanation = PitcherRecommenderService.recommend_starting_pitchers(enriched_pitchers, 5, profile)
-
-            # Convert DataFrame to list of dicts with consistent key names
-            records = df.to_dict(orient="records")
-
-            # Add 'position' and make sure keys are frontend-friendly
-            formatted = [
-                {
-                    "rank": int(r["rank"]),
-                    "name": r["name"],
-                    "position": "SP", 
-                    "score": round(float(r["score"]), 2),
-                }
-                for r in records
-            ]
-
-            return jsonify({
-                "lineup": formatted,
-                "explanation": explanation
-            }), 200
+            as_of = parse_as_of(as_of)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        form_error = self._check_form(form, normalization, as_of)
+        if form_error:
+            return jsonify({"error": form_error}), 400
+        window = int(form) if form else None
+        if window and not self.form_tracker.ready:
+            return jsonify({"error": "Recent form is still loading, try again shortly"}), 503
 
+        try:
+            # Built-in name or "custom:<id>"; profile=all is handled below
+            compiled = None
+            if profile != PitcherRecommenderService.ALL_PROFILES:
+                compiled = self.scoring_profiles.resolve(profile)
+
+            if self._uses_database(normalization, as_of, window):
+                # Roster and stat rows come from one query, and the key from
+                # those same rows, so it describes exactly what was scored
+                rows = self.pitcher_stats.roster_stats(team_id, CURRENT_SEASON)
+                if not rows:
+                    return jsonify({"error": "No players found for this team"}), 404
+                snapshot = None
+                key = (
+                    "lineup",
+                    roster_fingerprint(rows),
+                    compiled.name if compiled is not None else profile,
+                    normalization,
+                    stats_rows_version(rows),
+                    None,
+                )
+                enrich = lambda: RosterEnricher.from_stats_rows(rows)
+            else:
+                # Get all players on this team
+                players = self.team_data_access.get_all_players(team_id)
+                if not players:
+                    return jsonify({"error": "No players found for this team"}), 404
+
+                # Repeat views of an unchanged roster with the same profile reuse
+                # the finished lineup until one of its pitchers' stats changes.
+                # Historical snapshots get their own stats_version, so as_of
+                # results never share a key with live ones
+                snapshot = resolve_snapshot(self.stats_repository, self.stats_history, as_of)
+                key = (
+                    "lineup",
+                    roster_fingerprint(players),
+                    compiled.name if compiled is not None else profile,
+                    normalization,
+                    roster_stats_version(players, snapshot, normalization),
+                    # Form results change with every tracker update
+                    (window, self.form_tracker.version) if window else None,
+                )
+                # Join the roster against the shared MLB pitching stats snapshot
+                enrich = lambda: RosterEnricher.enrich(players, snapshot)
+
+            payload = self.result_cache.get(key)
+            if payload is None:
+                payload = self._build(enrich(), snapshot, profile, compiled, normalization, window)
+                if payload is None:
+                    return jsonify({"error": "No matching MLB stats found for team players"}), 404
+                self.result_cache.put(key, payload)
+
+            return jsonify(payload), 200
+
+        except UnknownProfileError as e:
+            return jsonify({"error": str(e)}), 400
+        except StatsHistoryUnavailable as e:
+            return jsonify({"error": str(e)}), 404
         except Exception as e:
             import traceback
             traceback.print_exc()
-            return jsonify({"error": str(e)}), 500
\ No newline at end of file
+            return jsonify({"error": str(e)}), 500
+
+    def _check_form(self, form, normalization, as_of):
+        """Error message for an unusable form= option, or None."""
+        if form in (None, ""):
+            return None
+        windows = RollingFormTracker.WINDOWS
+        if str(form) not in {str(w) for w in windows}:
+            return f"form must be one of: {', '.join(map(str, windows))}"
+        if self.form_tracker is None:
+            return "Recent form is not available"
+        if normalization != "roster" or as_of is not None:
+            return "form can only be combined with roster normalization and live stats"
+        return None
+
+    def _uses_database(self, normalization, as_of, window):
+        """
+        Whether to join the roster to pitcher_season_stats in SQL. The database
+        rows are the live stats and carry no snapshot positions, which league
+        normalization and recent form need.
+        """
+        return self.pitcher_stats is not None and normalization == "roster" and as_of is None and not window
+
+    def _build(self, roster, snapshot, profile, compiled, normalization, window=None):
+        """
+        Lineup payload for an enriched roster, or None if no player matched the
+        stats. snapshot is None for rosters built from database rows.
+        """
+        for p in roster.unmatched:
+            print(f"No stat match found for {p.get('player_name')}")
+
+        # Handle case where none were matched
+        if not len(roster):
+            return None
+
+        # form=7|14|30: rank on recent K-BB% and SwStr% instead of season totals
+        # (the only rolling rates among the recommender features, see RollingFormTracker)
+        if window:
+            roster = self.form_tracker.apply(roster, snapshot, window)
+
+        # profile=all: every built-in profile from one scoring pass, so the
+        # client can switch profiles without another request
+        if profile == PitcherRecommenderService.ALL_PROFILES:
+            results = PitcherRecommenderService.recommend_all_profiles(roster, snapshot, 5, normalization)
+            default_lineup, default_explanation = results["standard"]
+            return {
+                "lineup": self._format(default_lineup),
+                "explanation": default_explanation,
+                "profiles": {
+                    name: {"lineup": self._format(lineup), "explanation": explanation}
+                    for name, (lineup, explanation) in results.items()
+                },
+                "normalization": normalization,
+                "form": window,
+                "form_features": self._form_features(window),
+            }
+
+        # Generate lineup recommendation using the selected profile
+        lineup, explanation = PitcherRecommenderService.recommend_lineup(
+            roster, snapshot, 5, compiled, normalization
+        )
+
+        return {
+            "lineup": self._format(lineup),
+            "explanation": explanation,
+            "normalization": normalization,
+            "form": window,
+            "form_features": self._form_features(window),
+        }
+
+    @staticmethod
+    def _form_features(window):
+        """Features that form= replaced with their rolling values (empty without form=)."""
+        return list(RollingFormTracker.FORM_FEATURES) if window else []
+
+    @staticmethod
+    def _format(lineup):
+        # Add 'position' and make sure keys are frontend-friendly
+        return [
+            {
+                "rank": r["rank"],
+                "name": r["name"],
+                "position": "SP",
+                "score": round(r["score"], 2),
+            }
+            for r in lineup
+        ]
@@ -1,11 +1,19 @@
 from ..database.data_access_interface import UserDataAccessInterface, TeamDataAccessInterface
-import bcrypt
+from ..services.opponent_team_pool import OpponentTeamPool
+from ..services.password_hasher import PasswordHasher, HasherBusyError
 
 class SigninInteractor:
 
-    def __init__(self, user_data_access: UserDataAccessInterface, team_data_access: TeamDataAccessInterface):
+    def __init__(self, user_data_access: UserDataAccessInterface, team_data_access: TeamDataAccessInterface,
+                 opponent_pool: OpponentTeamPool = None, password_hasher: PasswordHasher = None):
+        """
+        opponent_pool: hands out pre-built opponent teams; without it one is built on demand
+        password_hasher: bounded bcrypt pool; may raise HasherBusyError when saturated
+        """
         self.user_data_access = user_data_access
         self.team_data_access = team_data_access
+        self.opponent_pool = opponent_pool
+        self.password_hasher = password_hasher or PasswordHasher()
 
     def signin(self, username: str, password: str):
 
@@ -17,18 +25,27 @@ class SigninInteractor:
         if not user_entity:
             raise Exception("Incorrect username or password.")
 
-        password_correct = bcrypt.checkpw(password.encode(), user_entity.get_password())
-
-        if not password_correct:
+        stored_password = user_entity.get_password()
+        if not self.password_hasher.verify(password, stored_password):
             raise Exception("Incorrect username or password.")
-        
+
+        # Upgrade hashes made with an older work factor while we have the password
+        if self.password_hasher.needs_rehash(stored_password):
+            try:
+                self.user_data_access.update(username, self.password_hasher.hash(password))
+            except HasherBusyError:
+                pass  # try again on a later login rather than failing this one
+
+
         # Check if user has an opponent team assigned
         opponent_team_id = user_entity.get_opponent_team_id()
         if not opponent_team_id:
             # Assign a new opponent team
-            opponent_info = self.team_data_access.create_opponent_user_and_team()
-            self.user_data_access.assign_opponent_team(username, opponent_info["opponent_team_id"])
-            opponent_team_id = opponent_info["opponent_team_id"]
+            if self.opponent_pool is not None:
+                opponent_team_id = self.opponent_pool.claim()
+            else:
+                opponent_team_id = self.team_data_access.create_opponent_user_and_team()["opponent_team_id"]
+            self.user_data_access.assign_opponent_team(username, opponent_team_id)
 
         return {
             "username": user_entity.get_username(), 
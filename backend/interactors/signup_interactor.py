@@ -1,10 +1,23 @@
-from ..database.data_access_interface import UserDataAccessInterface, TeamDataAccessInterface
+from contextlib import nullcontext
+from ..database.data_access_interface import (
+    UserDataAccessInterface,
+    TeamDataAccessInterface,
+    TransactionManagerInterface,
+)
+from ..services.opponent_team_pool import OpponentTeamPool
 
 class SignupInteractor:
 
-    def __init__(self, user_data_access: UserDataAccessInterface, team_data_access: TeamDataAccessInterface):
+    def __init__(self, user_data_access: UserDataAccessInterface, team_data_access: TeamDataAccessInterface,
+                 transactions: TransactionManagerInterface = None, opponent_pool: OpponentTeamPool = None):
+        """
+        transactions: groups the signup writes into one commit; without it each write commits on its own
+        opponent_pool: hands out pre-built opponent teams; without it one is built per signup
+        """
         self.user_data_access = user_data_access
         self.team_data_access = team_data_access
+        self.transactions = transactions
+        self.opponent_pool = opponent_pool
 
     def signup(self, username: str, password: str):
 
@@ -15,11 +28,18 @@ class SignupInteractor:
         if existing_user:
             raise Exception("A user with the same username already exists.")
         
-        user_entity = self.user_data_access.create(username, password)
-        
-        # Create and assign an opponent team
-        opponent_info = self.team_data_access.create_opponent_user_and_team()
-        self.user_data_access.assign_opponent_team(username, opponent_info["opponent_team_id"])
+        # User, opponent and assignment commit together, so a failure part-way
+        # never leaves a user without an opponent or an orphan opponent team
+        with self.transactions.transaction() if self.transactions else nullcontext():
+            user_entity = self.user_data_access.create(username, password)
+
+            # Claim (or create) and assign an opponent team; a claim rolls
+            # back with the rest, returning the team to the pool
+            self.user_data_access.assign_opponent_team(username, self._opponent_team_id())
 
         return {"username": user_entity.get_username()}
-    
\ No newline at end of file
+
+    def _opponent_team_id(self):
+        if self.opponent_pool is not None:
+            return self.opponent_pool.claim()
+        return self.team_data_access.create_opponent_user_and_team()["opponent_team_id"]
@@ -5,10 +5,13 @@ from __future__ import annotations
 from dataclasses import dataclass, asdict
 from typing import List, Optional, Dict, Any
 
-import pandas as pd
-
 from ..services.pitcher_grading_service import PitcherGradingService
 from ..services.pitcher_recomender_service import PitcherRecommenderService
+from ..services.season_stats_repository import (
+    SeasonStatsRepository,
+    SeasonStatsSnapshot,
+    CURRENT_SEASON,
+)
 
 
 # ---------- Input / Output / Helper data models ---------- #
@@ -83,50 +86,35 @@ class TradeInteractor:
     - Just: TradeEvaluateInput -> business logic -> TradeEvaluateOutput
     """
 
-    def __init__(self, season_df: Optional[pd.DataFrame], season: int = 2025):
-        self.season_df = season_df
+    def __init__(self, stats_repository: SeasonStatsRepository, season: int = CURRENT_SEASON):
+        self.stats_repository = stats_repository
         self.season = season
 
     # --- internal helpers --- #
 
-    def _find_stats_by_name(self, name: str) -> Optional[Dict[str, float]]:
-        """Return {'K%': float0to1, 'IP': float, 'ERA': float} or None."""
-        if self.season_df is None:
-            return None
-
-        df = self.season_df
-        row = df[df["Name"].str.lower() == str(name).strip().lower()]
-        if row.empty:
-            return None
-
-        return {
-            "K%": float(row.iloc[0]["K%"]),
-            "IP": float(row.iloc[0]["IP"]),
-            "ERA": float(row.iloc[0]["ERA"]),
-        }
-
-    def _grade_player(self, name: str) -> GradedPlayer:
+    def _grade_player(self, name: str, snapshot: SeasonStatsSnapshot) -> GradedPlayer:
         """
-        Compute grade from season stats using PitcherGradingService.
+        Look up a player's grade in the snapshot's league grades.
         """
-        stats = self._find_stats_by_name(name)
-        if stats is None:
+        pos = snapshot.index.find(name=name)
+        if pos is None:
             return GradedPlayer(
                 player_name=name,
                 grade=0.0,
                 analysis=f"No {self.season} stats found for {name}.",
             )
 
-        grade = PitcherGradingService.calculate_pitcher_grade(stats)
-        analysis = PitcherGradingService.analyze_pitcher(stats, grade)
+        league = PitcherGradingService.league_grades(snapshot)
+        grade = league.grade(pos)
+        analysis = PitcherGradingService.league_analysis(snapshot, pos)
         return GradedPlayer(
             player_name=name,
             grade=grade,
             analysis=analysis,
         )
 
-    def _grade_side(self, names: List[str]) -> TradeSideResult:
-        players = [self._grade_player(n) for n in names]
+    def _grade_side(self, names: List[str], snapshot: SeasonStatsSnapshot) -> TradeSideResult:
+        players = [self._grade_player(n, snapshot) for n in names]
         total = round(sum(float(p.grade) for p in players), 2)
         return TradeSideResult(players=players, total_grade=total)
 
@@ -137,9 +125,10 @@ class TradeInteractor:
         Core use case: evaluate a trade between side A and side B.
         """
 
-        # 1) Grade both sides
-        side_a_result = self._grade_side(input_data.side_a)
-        side_b_result = self._grade_side(input_data.side_b)
+        # 1) Grade both sides against one snapshot
+        snapshot = self.stats_repository.get(self.season)
+        side_a_result = self._grade_side(input_data.side_a, snapshot)
+        side_b_result = self._grade_side(input_data.side_b, snapshot)
 
         # 2) Compute diff and fairness
         diff = round(side_a_result.total_grade - side_b_result.total_grade, 2)
@@ -0,0 +1,80 @@
+"""
+Fold pitch-level Statcast data into per-pitcher features (pitch mix, fastball
+velocity and its trend, whiff / contact quality) saved next to the season stats.
+Pitches are streamed a date window (or a file chunk) at a time and never held
+for the whole season. Without --start, picks up the day after the last one
+already folded.
+Usage: python -m backend.scripts.ingest_statcast [--season 2025] [--start 2025-03-27] [--end 2025-09-28]
+       python -m backend.scripts.ingest_statcast --file statcast_2025.csv
+"""
+
+import argparse
+import os
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add parent directory to path so we can import from backend modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dotenv import load_dotenv
+from ..services.season_stats_repository import CURRENT_SEASON
+from ..services.statcast_features import StatcastAccumulator, StatcastIngester
+
+load_dotenv()
+
+DATA_DIR = os.getenv("STATS_DATA_DIR", os.path.join(os.path.dirname(os.path.dirname(__file__)), "data"))
+
+
+def statcast_path(season: int) -> str:
+    return os.path.join(DATA_DIR, f"statcast_{season}.npz")
+
+
+def ingest():
+    parser = argparse.ArgumentParser(description="Stream Statcast pitches into per-pitcher features")
+    parser.add_argument("--season", type=int, default=CURRENT_SEASON)
+    parser.add_argument("--start", type=date.fromisoformat, help="first day to fetch (starts over)")
+    parser.add_argument("--end", type=date.fromisoformat, help="last day to fetch (default: yesterday)")
+    parser.add_argument("--file", help="CSV or Parquet export to read instead of fetching (starts over)")
+    parser.add_argument("--chunk-days", type=int, default=7)
+    parser.add_argument("--chunk-rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    path = statcast_path(args.season)
+    ingester = StatcastIngester(chunk_days=args.chunk_days, chunk_rows=args.chunk_rows)
+
+    try:
+        if args.file:
+            accumulator = StatcastAccumulator(args.season)
+            print(f"[INFO] Reading {args.file}...")
+            chunks = ingester.file_chunks(args.file)
+        else:
+            accumulator = None if args.start else StatcastAccumulator.load(path)
+            if accumulator is None:
+                accumulator = StatcastAccumulator(args.season)
+            start = args.start or (
+                accumulator.last_day + timedelta(days=1) if accumulator.last_day else date(args.season, 3, 1)
+            )
+            end = args.end or min(date.today() - timedelta(days=1), date(args.season, 11, 30))
+            if start > end:
+                print(f"[INFO] Season {args.season} is already folded through {accumulator.last_day}")
+                return 0
+            print(f"[INFO] Fetching Statcast {start} to {end} in {args.chunk_days}-day chunks...")
+            chunks = ingester.fetch_chunks(start, end)
+
+        folded = StatcastIngester.ingest(chunks, accumulator)
+        accumulator.save(path)
+        print(
+            f"[SUCCESS] Season {args.season}: {folded} pitches folded, {len(accumulator)} pitchers, "
+            f"through {accumulator.last_day} -> {path}"
+        )
+        return 0
+
+    except Exception as e:
+        print(f"[ERROR] Statcast ingest failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(ingest())
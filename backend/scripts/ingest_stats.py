@@ -0,0 +1,55 @@
+"""
+Load FanGraphs season pitching stats into the pitcher_season_stats table.
+Safe to re-run: rows are upserted and pitchers no longer listed are removed.
+Usage: python -m backend.scripts.ingest_stats [--season 2025 ...]
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+# Add parent directory to path so we can import from backend modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dotenv import load_dotenv
+from pybaseball import pitching_stats
+from ..database import Database
+from ..database.data_access_postgresql import PitcherStatsDataAccess
+from ..services.season_stats_repository import CURRENT_SEASON, normalize_stats_frame
+
+load_dotenv()
+
+def ingest():
+    parser = argparse.ArgumentParser(description="Upsert season pitching stats into Postgres")
+    parser.add_argument("--season", type=int, action="append", help="season to load (repeatable)")
+    args = parser.parse_args()
+    seasons = args.season or [CURRENT_SEASON]
+
+    DSN = os.getenv("DSN")
+    if not DSN:
+        print("[ERROR] No DSN found in environment variables")
+        return 1
+
+    db = Database(DSN, min_size=0, max_size=1)
+    pitcher_stats = PitcherStatsDataAccess(db)
+
+    try:
+        for season in seasons:
+            print(f"[INFO] Fetching {season} pitching stats...")
+            frame = normalize_stats_frame(pitching_stats(season))
+            changes = pitcher_stats.upsert_season(season, frame)
+            print(f"[SUCCESS] Season {season}: {len(frame)} pitchers, {len(changes)} rows inserted, changed or removed")
+        return 0
+
+    except Exception as e:
+        print(f"[ERROR] Ingest failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    sys.exit(ingest())
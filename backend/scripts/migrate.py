@@ -0,0 +1,70 @@
+"""
+Apply pending database migrations (backend/database/migrations/*.sql).
+Safe to run repeatedly; already-applied migrations are skipped.
+Usage: python -m backend.scripts.migrate [--status] [--target VERSION]
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+# Add parent directory to path so we can import from backend modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dotenv import load_dotenv
+from ..database import Database
+from ..database.data_access_postgresql import PlayerDataAccess
+from ..database.migration_runner import MigrationRunner, load_migrations
+
+load_dotenv()
+
+# Migration that adds players.name_key
+PLAYER_NAME_KEY_MIGRATION = 9
+
+def migrate():
+    parser = argparse.ArgumentParser(description="Apply pending database migrations")
+    parser.add_argument("--status", action="store_true", help="list applied and pending migrations only")
+    parser.add_argument("--target", type=int, help="stop after this migration version")
+    args = parser.parse_args()
+
+    DSN = os.getenv("DSN")
+    if not DSN:
+        print("[ERROR] No DSN found in environment variables")
+        return 1
+
+    db = Database(DSN, min_size=0, max_size=1)
+    runner = MigrationRunner(db)
+
+    try:
+        if args.status:
+            applied = runner.applied()
+            for migration in load_migrations():
+                state = "applied" if migration.version in applied else "pending"
+                print(f"{migration.version:04d}_{migration.name}: {state}")
+            return 0
+
+        versions = runner.migrate(target=args.target)
+        if versions:
+            print(f"\n[DONE] Applied {len(versions)} migration(s): {', '.join(str(v) for v in versions)}")
+        else:
+            print("[INFO] Database is up to date.")
+
+        # name_key is computed in Python, so rows from before 0009 are filled here
+        if args.target is None or args.target >= PLAYER_NAME_KEY_MIGRATION:
+            backfilled = PlayerDataAccess(db).backfill_keys()
+            if backfilled:
+                print(f"[DONE] Filled name_key on {backfilled} player row(s)")
+        return 0
+
+    except Exception as e:
+        print(f"[ERROR] Migration failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    sys.exit(migrate())
@@ -13,6 +13,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from dotenv import load_dotenv
 from ..database import Database
 from ..database.data_access_postgresql import TeamDataAccess
+from ..services.season_stats_repository import SeasonStatsRepository
 
 load_dotenv()
 
@@ -25,7 +26,8 @@ def seed_opponent_team():
         return
     
     db = Database(DSN)
-    team_data_access = TeamDataAccess(db)
+    stats_repository = SeasonStatsRepository()
+    team_data_access = TeamDataAccess(db, lambda: stats_repository.get().frame)
     
     print("[INFO] Starting opponent team seeding...")
     
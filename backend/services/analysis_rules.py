@@ -0,0 +1,172 @@
+import operator
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# Stats a rule can test, in the column order of RuleTable.codes() input;
+# "k" is the strikeout rate as a percentage
+STATS = ("k", "ip", "era")
+
+# operator functions work on floats and on NumPy arrays alike, so one compiled
+# table serves both the single-pitcher and the league-wide evaluation
+_OPS = {">=": operator.ge, ">": operator.gt, "<=": operator.le, "<": operator.lt}
+
+Condition = Tuple[str, str, float]
+
+
+@dataclass(frozen=True)
+class Rule:
+    """
+    One line of a report. Branches are tried in order and the first whose
+    conditions all hold picks the template; otherwise is used when none does
+    (a missing stat fails every condition). A None template adds no line.
+
+    Templates are str.format strings over k, ip, era and tier.
+    """
+    branches: Tuple[Tuple[Tuple[Condition, ...], Optional[str]], ...]
+    otherwise: Optional[str] = None
+
+
+def bucket(stat: str, op: str, branches: Sequence[Tuple[float, Optional[str]]], otherwise: Optional[str] = None) -> Rule:
+    """A rule that buckets a single stat: [(threshold, template), ...] tried in order."""
+    return Rule(tuple((((stat, op, threshold),), template) for threshold, template in branches), otherwise)
+
+
+class RuleTable:
+    """
+    A report compiled from a list of rules.
+
+    codes() evaluates every rule for a whole (pitchers, STATS) matrix at once,
+    giving each pitcher the index of the template each rule picked; render()
+    turns one pitcher's codes into text. evaluate() does both for a single
+    stats dict without going through arrays.
+    """
+
+    def __init__(self, name: str, rules: Sequence[Rule]):
+        self.name = name
+        self.rules = tuple(rules)
+        # Per rule: [[(stat column, op, threshold), ...] per branch]
+        self._conditions = []
+        # Per rule: bound format() of every branch template, then of otherwise (None = no line)
+        self._templates = []
+        for rule in self.rules:
+            compiled = []
+            for conditions, _ in rule.branches:
+                for stat, op, _ in conditions:
+                    if stat not in STATS or op not in _OPS:
+                        raise ValueError(f"Unsupported condition in rule table {name}: {stat} {op}")
+                compiled.append([(STATS.index(stat), _OPS[op], float(t)) for stat, op, t in conditions])
+            self._conditions.append(compiled)
+            templates = [template for _, template in rule.branches] + [rule.otherwise]
+            self._templates.append(tuple(t.format if t is not None else None for t in templates))
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def codes(self, values: np.ndarray) -> np.ndarray:
+        """(pitchers, rules) int8 template index for a (pitchers, STATS) matrix."""
+        values = np.asarray(values, dtype=np.float64)
+        columns = values.T
+        codes = np.empty((len(values), len(self.rules)), dtype=np.int8)
+        for r, branches in enumerate(self._conditions):
+            hits = np.ones((len(values), len(branches)), dtype=bool)
+            for b, conditions in enumerate(branches):
+                for column, op, threshold in conditions:
+                    hits[:, b] &= op(columns[column], threshold)
+            codes[:, r] = np.where(hits.any(axis=1), hits.argmax(axis=1), len(branches)) if branches else 0
+        return codes
+
+    def render(self, codes: Sequence[int], k: float, ip: float, era: float, tier: str) -> str:
+        """The report for one pitcher's row of codes()."""
+        lines = []
+        for templates, code in zip(self._templates, codes):
+            template = templates[code]
+            if template is not None:
+                lines.append(template(k=k, ip=ip, era=era, tier=tier))
+        return "\n".join(lines)
+
+    def evaluate(self, stats: Dict[str, float], tier: str) -> str:
+        """The report for one pitcher's {"K%": 0-1 fraction, "IP", "ERA"} stats."""
+        k = stats.get("K%") * 100
+        ip = stats.get("IP")
+        era = stats.get("ERA")
+        values = (k, ip, era)
+        codes = []
+        for branches in self._conditions:
+            code = len(branches)
+            for b, conditions in enumerate(branches):
+                if all(op(values[column], threshold) for column, op, threshold in conditions):
+                    code = b
+                    break
+            codes.append(code)
+        return self.render(codes, k, ip, era, tier)
+
+
+# Full report shown on rosters and trades
+ANALYSIS_RULES = RuleTable("analysis", [
+    Rule((), "{tier} Tier:"),
+    # Strikeout personality
+    bucket("k", ">=", [
+        (32, "• Carries your strikeout category with elite swing-and-miss skill ({k:.1f}% K rate)."),
+        (28, "• Provides strong strikeout output ({k:.1f}% K rate) and reliably boosts weekly totals."),
+        (24, "• Offers steady strikeout support ({k:.1f}% K rate) without being overpowering."),
+        (20, "• Strikeout production is modest ({k:.1f}% K rate), so pairing him with a high-K arm is beneficial."),
+    ], "• Low strikeout output ({k:.1f}% K rate) limits his fantasy ceiling."),
+    # Innings personality
+    bucket("ip", ">=", [
+        (170, "• High-volume workload ({ip:.1f} IP) provides stability and contributes across all counting stats."),
+        (130, "• Moderate workload ({ip:.1f} IP) gives reliable usage without heavy innings demand."),
+    ], "• Light innings load ({ip:.1f} IP) lowers his week-to-week fantasy impact."),
+    # ERA personality
+    bucket("era", "<=", [
+        (2.50, "• Limits damage exceptionally well (ERA {era:.2f}), anchoring team ratios."),
+        (3.50, "• Manages contact effectively (ERA {era:.2f}), generally providing stable ratios."),
+        (4.25, "• Inconsistent run prevention (ERA {era:.2f}), making matchup selection important."),
+    ], "• High risk to ERA and WHIP (ERA {era:.2f}), requiring careful matchup management."),
+    # Combination profile -> recommendation
+    Rule((
+        # Ace Workhorse
+        ((("k", ">=", 28), ("ip", ">=", 170), ("era", "<=", 3.00)),
+         "Fantasy Recommendation: Start every week without hesitation."),
+        # Strikeout Specialist
+        ((("k", ">=", 30), ("ip", "<", 130)),
+         "Fantasy Recommendation: Great for boosting Ks, but may need innings support."),
+        # Ratio Protector
+        ((("k", "<", 22), ("era", "<", 3.25)),
+         "Fantasy Recommendation: Strong ratios but limited upside in strikeouts."),
+        # Volatile Strikeout Arm
+        ((("k", ">=", 28), ("era", ">=", 4.00)),
+         "Fantasy Recommendation: Useful for Ks but may hurt your ratios; stream based on matchups."),
+        # Contact Manager
+        ((("k", "<", 20), ("era", "<", 3.50)),
+         "Fantasy Recommendation: Low strikeouts but provides solid ratio stability."),
+        # High-Volume Ratio Risk
+        ((("ip", ">=", 160), ("era", ">=", 4.30)),
+         "Fantasy Recommendation: Provides innings but is likely harmful in ERA/WHIP."),
+    ), "Fantasy Recommendation: Contributes steadily without major strengths or weaknesses."),
+])
+
+# Weaknesses-only report for the opponent page
+WEAKNESS_RULES = RuleTable("weaknesses", [
+    bucket("k", "<", [
+        (20, "• Low strikeout production ({k:.1f}% K rate) limits fantasy ceiling."),
+        (24, "• Modest strikeout output ({k:.1f}% K rate) - can be exploited with high-contact hitters."),
+    ]),
+    bucket("ip", "<", [
+        (130, "• Light innings load ({ip:.1f} IP) reduces overall fantasy impact."),
+    ]),
+    bucket("era", ">", [
+        (4.25, "• High ERA ({era:.2f}) indicates vulnerability to runs - aggressive hitting approach recommended."),
+        (3.50, "• Inconsistent run prevention (ERA {era:.2f}) - can be exploited in favorable matchups."),
+    ]),
+    # None of the lines above fired
+    Rule((
+        ((("k", ">=", 24), ("ip", ">=", 130), ("era", "<=", 3.50)),
+         "• {tier} tier pitcher with no major exploitable weaknesses - requires disciplined at-bats."),
+    )),
+    # Strategy lines only appear alongside a weakness, which these thresholds imply
+    bucket("era", ">", [(4.00, "• Strategy: Focus on aggressive hitting to capitalize on poor run prevention.")]),
+    bucket("k", "<", [(22, "• Strategy: Use contact-oriented hitters to exploit low strikeout rate.")]),
+])
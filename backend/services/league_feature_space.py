@@ -0,0 +1,84 @@
+import threading
+from typing import TYPE_CHECKING, Dict
+
+import numpy as np
+import pandas as pd
+
+from .roster_enricher import RosterEnricher
+from .season_stats_repository import SeasonStatsSnapshot
+
+if TYPE_CHECKING:
+    from .pitcher_recomender_service import CompiledProfile
+
+
+class LeagueFeatureSpace:
+    """
+    Recommender features normalized against the whole league instead of one roster.
+
+    Per-feature bounds are robust percentiles over qualified pitchers, computed
+    once per stats snapshot; every pitcher's features are then scaled into
+    [0, 1] against those bounds (values outside are clipped). Because the
+    scale no longer depends on who else is on a roster, a pitcher's score for
+    a profile is fixed for the life of the snapshot and is cached per profile.
+    """
+
+    # Innings needed for a pitcher to count toward the league bounds
+    MIN_QUALIFIED_IP = 20.0
+    # Percentiles used as the league floor and ceiling for each feature
+    BOUND_PERCENTILES = (1.0, 99.0)
+    # Profiles whose league-wide scores are kept per snapshot (oldest dropped first)
+    MAX_CACHED_PROFILES = 64
+
+    def __init__(self, features: np.ndarray, qualified: np.ndarray):
+        """
+        features: (rows, FEATURES) league matrix from RosterEnricher.feature_matrix
+        qualified: boolean mask of rows that define the bounds
+        """
+        basis = features[qualified] if qualified.any() else features
+        if basis.shape[0]:
+            lower, upper = np.percentile(basis, self.BOUND_PERCENTILES, axis=0)
+        else:
+            lower = upper = np.zeros(features.shape[1])
+        span = upper - lower
+        span[span == 0.0] = 1.0
+
+        self.lower = lower
+        self.upper = upper
+        self.qualified = qualified
+        self.normalized = np.clip((features - lower) / span, 0.0, 1.0)
+        # Unit-length rows for cosine similarity (all-zero rows stay zero)
+        norms = np.linalg.norm(self.normalized, axis=1, keepdims=True)
+        norms[norms == 0.0] = 1.0
+        self.unit = self.normalized / norms
+        for array in (self.lower, self.upper, self.qualified, self.normalized, self.unit):
+            array.flags.writeable = False
+
+        self._scores: Dict[str, np.ndarray] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def for_snapshot(snapshot: SeasonStatsSnapshot) -> "LeagueFeatureSpace":
+        """The league space for a snapshot, built on first use and then shared."""
+        return snapshot.derived("league_feature_space", LeagueFeatureSpace._build)
+
+    def profile_scores(self, compiled: "CompiledProfile") -> np.ndarray:
+        """Score of every pitcher in the league for a profile (one matrix-vector product, cached)."""
+        with self._lock:
+            scores = self._scores.get(compiled.name)
+            if scores is None:
+                scores = compiled.score(self.normalized)
+                scores.flags.writeable = False
+                if len(self._scores) >= self.MAX_CACHED_PROFILES:
+                    self._scores.pop(next(iter(self._scores)))
+                self._scores[compiled.name] = scores
+            return scores
+
+    @staticmethod
+    def _build(snapshot: SeasonStatsSnapshot) -> "LeagueFeatureSpace":
+        frame = snapshot.frame
+        if "ip" in frame.columns:
+            ip = pd.to_numeric(frame["ip"], errors="coerce").fillna(0.0).to_numpy()
+            qualified = ip >= LeagueFeatureSpace.MIN_QUALIFIED_IP
+        else:
+            qualified = np.ones(len(frame), dtype=bool)
+        return LeagueFeatureSpace(RosterEnricher.feature_matrix(snapshot), qualified)
@@ -0,0 +1,98 @@
+import threading
+from typing import Optional
+
+from ..database.data_access_interface import TeamDataAccessInterface
+
+
+class OpponentTeamPool:
+    """
+    Keeps a stock of pre-generated opponent teams so signup/signin only has
+    to claim one (a single DELETE ... SKIP LOCKED) instead of sampling stats,
+    hashing a password and inserting a user, a team and five players while
+    the user waits.
+
+    A background thread tops the pool back up to `target` whenever it drops
+    to `low_water` or below: it is woken by every claim and also checks every
+    `interval_seconds`. If the pool is ever empty, claim() builds a team
+    inline as before, so signup never fails for lack of stock.
+    """
+
+    def __init__(
+        self,
+        team_data_access: TeamDataAccessInterface,
+        low_water: int = 10,
+        target: int = 25,
+        batch_size: int = 10,
+        interval_seconds: float = 60.0,
+    ):
+        if not 0 <= low_water < target:
+            raise ValueError("low_water must be >= 0 and below target")
+        if batch_size <= 0 or interval_seconds <= 0:
+            raise ValueError("batch_size and interval_seconds must be positive")
+
+        self.team_data_access = team_data_access
+        self.low_water = low_water
+        self.target = target
+        self.batch_size = batch_size
+        self.interval_seconds = interval_seconds
+        self.claimed = 0
+        self.misses = 0
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def claim(self) -> int:
+        """Id of an opponent team for a new assignment (pooled if possible)."""
+        team_id = self.team_data_access.claim_opponent_team()
+        self._wake.set()
+        if team_id is not None:
+            self.claimed += 1
+            return team_id
+
+        self.misses += 1
+        print("[OpponentTeamPool] Pool empty, building an opponent team inline")
+        return self.team_data_access.create_opponent_user_and_team()["opponent_team_id"]
+
+    def refill(self) -> int:
+        """Top the pool up to target if it is at or below low_water; returns teams created."""
+        size = self.team_data_access.opponent_pool_size()
+        if size > self.low_water:
+            return 0
+
+        created = 0
+        while size + created < self.target:
+            batch = min(self.batch_size, self.target - size - created)
+            added = self.team_data_access.fill_opponent_pool(batch)
+            if not added:
+                break
+            created += added
+        print(f"[OpponentTeamPool] Added {created} opponent teams (pool size {size + created})")
+        return created
+
+    def start(self):
+        """Start the refill thread (no-op if it is already running)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="opponent-pool", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """Ask the thread to exit and wait for it."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def stats(self) -> dict:
+        return {"claimed": self.claimed, "misses": self.misses, "low_water": self.low_water, "target": self.target}
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.refill()
+            except Exception as e:
+                print(f"[OpponentTeamPool] Refill failed, retrying later: {e}")
+            self._wake.wait(self.interval_seconds)
+            self._wake.clear()
@@ -0,0 +1,89 @@
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import bcrypt
+
+
+class HasherBusyError(RuntimeError):
+    """Raised when every hashing worker is busy and the wait queue is full."""
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a small dedicated thread pool instead of the request thread.
+
+    bcrypt releases the GIL while it works, so a few worker threads give real
+    parallelism while capping how many cores a login storm can take from the
+    stats endpoints. At most `max_workers + max_queue` calls are admitted at
+    once; beyond that callers get HasherBusyError straight away (mapped to a
+    503) instead of piling up behind the pool.
+
+    `rounds` is the bcrypt work factor for new hashes; verify() callers can
+    use needs_rehash() to upgrade hashes made with another cost on login.
+    """
+
+    # Cost field of a $2a$/$2b$/$2y$ bcrypt hash
+    _COST = re.compile(rb"^\$2[aby]\$(\d{2})\$")
+
+    def __init__(self, rounds: int = 12, max_workers: int = 2, max_queue: int = 32):
+        if not 4 <= rounds <= 31:
+            raise ValueError("bcrypt rounds must be between 4 and 31")
+        if max_workers < 1 or max_queue < 0:
+            raise ValueError("max_workers must be >= 1 and max_queue >= 0")
+        self.rounds = rounds
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.rejected = 0
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def hash(self, password: str) -> bytes:
+        return self._submit(lambda: bcrypt.hashpw(password.encode(), bcrypt.gensalt(self.rounds)))
+
+    def verify(self, password: str, hashed: bytes) -> bool:
+        """True if password matches; stored values that are not bcrypt hashes never match."""
+        return self._submit(lambda: self._checkpw(password, hashed))
+
+    def needs_rehash(self, hashed: bytes) -> bool:
+        """True for a bcrypt hash made with a work factor other than `rounds`."""
+        match = self._COST.match(bytes(hashed or b""))
+        return match is not None and int(match.group(1)) != self.rounds
+
+    def stats(self) -> dict:
+        return {
+            "rounds": self.rounds,
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "rejected": self.rejected,
+        }
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    @staticmethod
+    def _checkpw(password: str, hashed: bytes) -> bool:
+        try:
+            return bcrypt.checkpw(password.encode(), bytes(hashed))
+        except ValueError:
+            return False
+
+    def _submit(self, work):
+        if not self._slots.acquire(blocking=False):
+            self.rejected += 1
+            raise HasherBusyError("Too many sign-in requests right now, please try again shortly.")
+        try:
+            return self._pool().submit(work).result()
+        finally:
+            self._slots.release()
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="bcrypt")
+            return self._executor
@@ -1,4 +1,102 @@
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import numpy as np
+
+from .analysis_rules import ANALYSIS_RULES, WEAKNESS_RULES, RuleTable
+from .result_cache import ResultCache
+from .roster_enricher import RosterEnricher
+from .season_stats_repository import SeasonStatsSnapshot
+
+
+@dataclass(frozen=True)
+class LeagueGrades:
+    """
+    Grade and tier of every pitcher in a snapshot, aligned with its rows.
+
+    Built once per snapshot by PitcherGradingService.league_grades(); grading
+    a player on a request is then an index into these arrays.
+    """
+    grades: np.ndarray      # (rows,) float64
+    tiers: np.ndarray       # (rows,) int8 index into PitcherGradingService.TIERS
+    grading: np.ndarray     # (rows, RosterEnricher.GRADING_COLUMNS) inputs the grades came from
+
+    def __len__(self) -> int:
+        return len(self.grades)
+
+    def grade(self, pos: int) -> float:
+        return float(self.grades[pos])
+
+    def tier(self, pos: int) -> str:
+        return PitcherGradingService.TIERS[self.tiers[pos]]
+
+    def stats(self, pos: int) -> Dict[str, float]:
+        """Stats dict in the shape analyze_pitcher() expects."""
+        k, ip, era = self.grading[pos]
+        return {"K%": float(k), "IP": float(ip), "ERA": float(era)}
+
+
 class PitcherGradingService:
+    # Tier names from worst to best, and the grade at which each tier above Poor starts
+    TIERS = ("Poor", "Replacement", "Solid", "Top", "Elite")
+    TIER_CUTOFFS = np.array([45.0, 60.0, 70.0, 80.0])
+
+    # Rendered league report text, keyed by (rule table, season, pitcher row version)
+    rendered_text = ResultCache(max_entries=8192)
+
+    @staticmethod
+    def calculate_grades(k_percent, ip, era) -> np.ndarray:
+        """
+        calculate_pitcher_grade() for whole arrays at once (K% as a 0-1 fraction).
+        Pitchers with a missing stat get 0.0, like the scalar version.
+        """
+        k_percent = np.asarray(k_percent, dtype=np.float64)
+        ip = np.asarray(ip, dtype=np.float64)
+        era = np.asarray(era, dtype=np.float64)
+        grades = np.round(150 * k_percent + 0.3 * ip - 10 * era, 2)
+        return np.where(np.isnan(grades), 0.0, grades)
+
+    @staticmethod
+    def tier_codes(grades) -> np.ndarray:
+        """Index into TIERS for every grade (a missing grade is Poor)."""
+        grades = np.asarray(grades, dtype=np.float64)
+        codes = np.searchsorted(PitcherGradingService.TIER_CUTOFFS, grades, side="right")
+        return np.where(np.isnan(grades), 0, codes).astype(np.int8)
+
+    @staticmethod
+    def tier(grade: float) -> str:
+        return PitcherGradingService.TIERS[int(PitcherGradingService.tier_codes(grade))]
+
+    @staticmethod
+    def league_grades(snapshot: SeasonStatsSnapshot) -> LeagueGrades:
+        """Grades and tiers for every pitcher in a snapshot, computed in one pass and shared by every request."""
+        return snapshot.derived("grading.league", PitcherGradingService._build_league_grades)
+
+    @staticmethod
+    def roster_grades(roster, snapshot: Optional[SeasonStatsSnapshot] = None) -> np.ndarray:
+        """
+        Grades aligned with an EnrichedRoster: looked up in league_grades() when
+        the roster was enriched against snapshot, computed from its own grading
+        matrix otherwise (rosters from RosterEnricher.from_stats_rows()).
+        """
+        if snapshot is not None and not (roster.rows.size and roster.rows.min() < 0):
+            return PitcherGradingService.league_grades(snapshot).grades[roster.rows]
+        return PitcherGradingService.calculate_grades(*roster.grading.T)
+
+    @staticmethod
+    def _build_league_grades(snapshot: SeasonStatsSnapshot) -> LeagueGrades:
+        grading = RosterEnricher.grading_matrix(snapshot)
+        columns = RosterEnricher.GRADING_COLUMNS
+        grades = PitcherGradingService.calculate_grades(
+            grading[:, columns.index("k%")],
+            grading[:, columns.index("ip")],
+            grading[:, columns.index("era")],
+        )
+        tiers = PitcherGradingService.tier_codes(grades)
+        grades.flags.writeable = False
+        tiers.flags.writeable = False
+        return LeagueGrades(grades=grades, tiers=tiers, grading=grading)
+
     @staticmethod
     def calculate_pitcher_grade(stats: dict) -> float:
         """
@@ -23,109 +121,37 @@ class PitcherGradingService:
             return 0.0
         
     @staticmethod
-    def analyze_pitcher(stats: dict, grade: float) -> str:
-        k = stats.get("K%")*100
-        ip = stats.get("IP")
-        era = stats.get("ERA")
-
-        # Determine tier
-        if grade >= 80:
-            tier = "Elite"
-        elif grade >= 70:
-            tier = "Top"
-        elif grade >= 60:
-            tier = "Solid"
-        elif grade >= 45:
-            tier = "Replacement"
-        else:
-            tier = "Poor"
-
-        # Build natural-language analysis lines
-        lines = []
-
-        # -------------------------
-        # STRIKEOUT PERSONALITY
-        # -------------------------
-        if k >= 32:
-            lines.append(f"• Carries your strikeout category with elite swing-and-miss skill ({k:.1f}% K rate).")
-        elif k >= 28:
-            lines.append(f"• Provides strong strikeout output ({k:.1f}% K rate) and reliably boosts weekly totals.")
-        elif k >= 24:
-            lines.append(f"• Offers steady strikeout support ({k:.1f}% K rate) without being overpowering.")
-        elif k >= 20:
-            lines.append(f"• Strikeout production is modest ({k:.1f}% K rate), so pairing him with a high-K arm is beneficial.")
-        else:
-            lines.append(f"• Low strikeout output ({k:.1f}% K rate) limits his fantasy ceiling.")
-
-        # -------------------------
-        # INNINGS PERSONALITY
-        # -------------------------
-        if ip >= 170:
-            lines.append(f"• High-volume workload ({ip:.1f} IP) provides stability and contributes across all counting stats.")
-        elif ip >= 130:
-            lines.append(f"• Moderate workload ({ip:.1f} IP) gives reliable usage without heavy innings demand.")
-        else:
-            lines.append(f"• Light innings load ({ip:.1f} IP) lowers his week-to-week fantasy impact.")
-
-        # -------------------------
-        # ERA PERSONALITY
-        # -------------------------
-        if era <= 2.50:
-            lines.append(f"• Limits damage exceptionally well (ERA {era:.2f}), anchoring team ratios.")
-        elif era <= 3.50:
-            lines.append(f"• Manages contact effectively (ERA {era:.2f}), generally providing stable ratios.")
-        elif era <= 4.25:
-            lines.append(f"• Inconsistent run prevention (ERA {era:.2f}), making matchup selection important.")
-        else:
-            lines.append(f"• High risk to ERA and WHIP (ERA {era:.2f}), requiring careful matchup management.")
-
-        # -------------------------
-        # COMBINATION LOGIC
-        # -------------------------
-        profile = None
-        recommendation = None
-
-        # Ace Workhorse
-        if k >= 28 and ip >= 170 and era <= 3.00:
-            profile = "Ace Workhorse"
-            recommendation = "Start every week without hesitation."
-
-        # Strikeout Specialist (high K, low IP)
-        elif k >= 30 and ip < 130:
-            profile = "Strikeout Specialist"
-            recommendation = "Great for boosting Ks, but may need innings support."
-
-        # Ratio Specialist (low ERA, low K)
-        elif k < 22 and era < 3.25:
-            profile = "Ratio Protector"
-            recommendation = "Strong ratios but limited upside in strikeouts."
-
-        # Volatile Strikeout Arm (high K, high ERA)
-        elif k >= 28 and era >= 4.00:
-            profile = "Volatile Strikeout Arm"
-            recommendation = "Useful for Ks but may hurt your ratios; stream based on matchups."
-
-        # Contact Manager (low K, low ERA)
-        elif k < 20 and era < 3.50:
-            profile = "Contact Manager"
-            recommendation = "Low strikeouts but provides solid ratio stability."
-
-        # Volume-Only Arm (high IP, bad ERA)
-        elif ip >= 160 and era >= 4.30:
-            profile = "High-Volume Ratio Risk"
-            recommendation = "Provides innings but is likely harmful in ERA/WHIP."
-
-        # Neutral default
-        else:
-            profile = "Balanced Profile"
-            recommendation = "Contributes steadily without major strengths or weaknesses."
-
-
-        # Summary
-        summary = (
-            f"{tier} Tier:\n"
-            + "\n".join(lines)
-            + f"\nFantasy Recommendation: {recommendation}"
+    def analyze_pitcher(stats: dict, grade: float, tier: Optional[str] = None) -> str:
+        """Natural-language report for one pitcher, from the ANALYSIS_RULES table."""
+        # Determine tier, unless the caller already has it from league_grades()
+        if tier is None:
+            tier = PitcherGradingService.tier(grade)
+        return ANALYSIS_RULES.evaluate(stats, tier)
+
+    @staticmethod
+    def league_analysis(snapshot: SeasonStatsSnapshot, pos: int) -> str:
+        """analyze_pitcher() for the pitcher at a snapshot row, rendered from league-wide rule codes."""
+        return PitcherGradingService._league_text(ANALYSIS_RULES, snapshot, pos)
+
+    @staticmethod
+    def league_weaknesses(snapshot: SeasonStatsSnapshot, pos: int) -> str:
+        """Exploitable weaknesses of the pitcher at a snapshot row (WEAKNESS_RULES)."""
+        return PitcherGradingService._league_text(WEAKNESS_RULES, snapshot, pos)
+
+    @staticmethod
+    def _league_text(table: RuleTable, snapshot: SeasonStatsSnapshot, pos: int) -> str:
+        league = PitcherGradingService.league_grades(snapshot)
+        codes = snapshot.derived(
+            f"grading.rules.{table.name}",
+            lambda s: table.codes(league.grading * np.array([100.0, 1.0, 1.0])),
         )
 
-        return summary
+        def render():
+            k, ip, era = league.grading[pos]
+            return table.render(codes[pos], k * 100, ip, era, league.tier(pos))
+
+        # Hand-built snapshots share version 0, so only repository-issued ones are memoized
+        if not snapshot.stats_version:
+            return render()
+        key = (table.name, snapshot.season, snapshot.row_version(pos))
+        return PitcherGradingService.rendered_text.get_or_compute(key, render)
@@ -0,0 +1,87 @@
+import unicodedata
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def normalize_name(name) -> str:
+    """Case-fold, strip accents and collapse whitespace: 'José  Berríos' -> 'jose berrios'."""
+    if name is None:
+        return ""
+    text = unicodedata.normalize("NFKD", str(name))
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return " ".join(text.casefold().split())
+
+
+def normalize_idfg(idfg) -> Optional[str]:
+    """FanGraphs ids arrive as ints from pybaseball and strings from the players table."""
+    if idfg is None:
+        return None
+    try:
+        if pd.isna(idfg):
+            return None
+    except (TypeError, ValueError):
+        pass
+    text = str(idfg).strip()
+    if not text:
+        return None
+    try:
+        return str(int(float(text)))
+    except ValueError:
+        return text
+
+
+class PitcherIndex:
+    """
+    Hash index from normalized name and IDfg to row positions in a stats frame.
+
+    Built once per SeasonStatsSnapshot so roster lookups are O(1) per player
+    instead of a scan of the whole league. When several rows share a
+    normalized name, they are ordered by innings pitched (most first), then by
+    row position, so the same name always resolves to the same pitcher.
+    """
+
+    def __init__(self, frame: pd.DataFrame):
+        self._by_name: Dict[str, Tuple[int, ...]] = {}
+        self._by_idfg: Dict[str, int] = {}
+
+        if "name" in frame.columns:
+            keys = [normalize_name(n) for n in frame["name"].tolist()]
+            ip = (
+                pd.to_numeric(frame["ip"], errors="coerce").fillna(0.0).to_numpy()
+                if "ip" in frame.columns
+                else np.zeros(len(frame))
+            )
+            # Most innings first, then original row order
+            order = np.lexsort((np.arange(len(frame)), -ip))
+            groups: Dict[str, list] = {}
+            for pos in order.tolist():
+                if keys[pos]:
+                    groups.setdefault(keys[pos], []).append(pos)
+            self._by_name = {key: tuple(positions) for key, positions in groups.items()}
+
+        if "idfg" in frame.columns:
+            for pos, idfg in enumerate(frame["idfg"].tolist()):
+                key = normalize_idfg(idfg)
+                if key is not None:
+                    self._by_idfg.setdefault(key, pos)
+
+    def find(self, name=None, idfg=None) -> Optional[int]:
+        """
+        Row position for a pitcher, or None if there is no match.
+        IDfg wins when it is known; otherwise the name is used.
+        """
+        key = normalize_idfg(idfg)
+        if key is not None and key in self._by_idfg:
+            return self._by_idfg[key]
+
+        positions = self._by_name.get(normalize_name(name))
+        return positions[0] if positions else None
+
+    def find_all(self, name) -> Tuple[int, ...]:
+        """Every row position sharing a normalized name, in resolution order."""
+        return self._by_name.get(normalize_name(name), ())
+
+    def is_ambiguous(self, name) -> bool:
+        return len(self.find_all(name)) > 1
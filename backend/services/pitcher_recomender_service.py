@@ -1,9 +1,48 @@
-from pybaseball import pitching_stats
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
 import pandas as pd
 import numpy as np
-from sklearn.preprocessing import MinMaxScaler 
-from sklearn.metrics.pairwise import cosine_similarity
-import time
+
+from .league_feature_space import LeagueFeatureSpace
+from .pitcher_index import normalize_idfg
+from .roster_enricher import EnrichedRoster
+from .season_stats_repository import SeasonStatsSnapshot
+
+
+@dataclass(frozen=True)
+class CompiledProfile:
+    """
+    A weights dict compiled into vectors over PitcherRecommenderService.FEATURES.
+
+    For min-max normalized features x in [0, 1], the profile score is
+        sum_{w > 0} w * x  +  sum_{w < 0} |w| * (1 - x)
+    which is computed as  x @ weights + offset, where offset = sum |w_neg|.
+    """
+    name: str
+    weights: np.ndarray     # signed weights, one per feature (0.0 if unused)
+    neg_mask: np.ndarray    # features where lower is better
+    offset: float
+    explanation: Optional[str] = None
+
+    def score(self, X01: np.ndarray) -> np.ndarray:
+        """Scores for an (n, features) matrix of normalized values."""
+        return X01 @ self.weights + self.offset
+
+
+@dataclass(frozen=True)
+class CompiledProfileSet:
+    """
+    Several compiled profiles stacked into a (profiles, features) matrix, so a
+    roster is scored under every profile with one matrix multiply.
+    """
+    names: Tuple[str, ...]
+    weights: np.ndarray     # (profiles, features) signed weights
+    offsets: np.ndarray     # (profiles,) sum |w_neg| per profile
+
+    def score(self, X01: np.ndarray) -> np.ndarray:
+        """(n, profiles) scores for an (n, features) matrix of normalized values."""
+        return X01 @ self.weights.T + self.offsets
 
 
 class PitcherRecommenderService:
@@ -131,165 +170,315 @@ class PitcherRecommenderService:
     }
 
 
+    # Feature order shared by every compiled profile and feature matrix
+    FEATURES = tuple(BASE_WEIGHTS)
+
+    # "roster": min-max within the roster being ranked (scores are relative to teammates)
+    # "league": scale against league-wide bounds (scores comparable across teams)
+    NORMALIZATION_MODES = ("roster", "league")
+
+    # profile=all: rank the roster under every built-in profile at once
+    ALL_PROFILES = "all"
+
+    # Candidate rows scored per block in the free-agent similarity pass
+    SIMILARITY_BLOCK_ROWS = 1024
+
+    # ----------------------------------------------------
+    # PROFILE COMPILATION
+    # ----------------------------------------------------
     @staticmethod
-    def norm(df: pd.DataFrame, cols: list):
-        """Normalize selected columns between 0 and 1."""
-        scaler = MinMaxScaler()
-        df[cols] = scaler.fit_transform(df[cols])
-        return df
-     
+    def compile_profile(weights: Dict[str, float], name: str = "custom", explanation: Optional[str] = None) -> CompiledProfile:
+        """
+        Compile a {feature: weight} dict into weight vectors over FEATURES.
+        name must be unique per distinct set of weights: caches of scores
+        (e.g. LeagueFeatureSpace.profile_scores) are keyed by it.
+        """
+        w = np.array(
+            [float(weights.get(f, 0.0)) for f in PitcherRecommenderService.FEATURES],
+            dtype=np.float64,
+        )
+        neg_mask = w < 0
+        w.flags.writeable = False
+        neg_mask.flags.writeable = False
+        return CompiledProfile(
+            name=name,
+            weights=w,
+            neg_mask=neg_mask,
+            offset=float(np.abs(w[neg_mask]).sum()),
+            explanation=explanation,
+        )
+
     @staticmethod
-    def compute_weighted_stats(df: pd.DataFrame, weights: dict):
-        """Compute a weighted score for each pitcher."""
-        scores = np.zeros(len(df))
-        for stat, weight in weights.items():
-            vals = df[stat].values.copy()
-            # For negatively weighted metrics (e.g., xfip-, barrel%), lower is better
-            if weight < 0:
-                vals = np.ones_like(vals, dtype=float) - vals
-            scores += vals * abs(weight)
-        return scores
+    def compile_profile_set(profiles: Sequence[CompiledProfile]) -> CompiledProfileSet:
+        """Stack one or more compiled profiles so they can be scored together."""
+        weights = np.vstack([p.weights for p in profiles])
+        offsets = np.array([p.offset for p in profiles], dtype=np.float64)
+        weights.flags.writeable = False
+        offsets.flags.writeable = False
+        return CompiledProfileSet(names=tuple(p.name for p in profiles), weights=weights, offsets=offsets)
 
     @staticmethod
-    def recommend_starting_pitchers(team_pitchers: list[dict], top_n=5, profile="standard"):
+    def get_profile(profile: Union[str, CompiledProfile]) -> CompiledProfile:
         """
-        Recommend the top N starting pitchers from the user's current roster.
-        The weighting changes based on the selected fantasy manager profile.
+        Compiled weights for a built-in profile, falling back to standard.
+        An already compiled (e.g. user-defined) profile is returned as is.
         """
+        if isinstance(profile, CompiledProfile):
+            return profile
+        compiled = _COMPILED_PROFILES.get(profile)
+        return compiled if compiled is not None else _COMPILED_PROFILES["standard"]
 
-        # Choose profile weights
-        weights = PitcherRecommenderService.PROFILES.get(profile, PitcherRecommenderService.BASE_WEIGHTS)
-
-        # Convert to DataFrame
-        df = pd.DataFrame(team_pitchers)
-        features = list(weights.keys())
+    @staticmethod
+    def get_explanation(profile: Union[str, CompiledProfile]) -> str:
+        if isinstance(profile, CompiledProfile):
+            return profile.explanation or f"You selected the {profile.name} profile."
+        return PitcherRecommenderService.EXPLANATIONS.get(
+            profile,
+            PitcherRecommenderService.EXPLANATIONS["standard"]
+        )
 
-        # Ensure all metrics exist in the DataFrame
-        for f in features:
-            if f not in df.columns:
-                df[f] = 0.0
+    # ----------------------------------------------------
+    # SCORING ENGINE
+    # ----------------------------------------------------
+    @staticmethod
+    def normalize(X: np.ndarray) -> np.ndarray:
+        """
+        Min-max scale each column to [0, 1] (same results as sklearn's MinMaxScaler:
+        NaNs are ignored when finding bounds, and constant columns map to 0).
+        """
+        X = np.asarray(X, dtype=np.float64)
+        if X.shape[0] == 0:
+            return X.copy()
+        lo = np.nanmin(X, axis=0)
+        span = np.nanmax(X, axis=0) - lo
+        span[span == 0.0] = 1.0
+        return (X - lo) / span
 
-        # Normalize within team
-        df = PitcherRecommenderService.norm(df, features)
+    @staticmethod
+    def top_n(scores: np.ndarray, n: int) -> np.ndarray:
+        """
+        Indices of the n highest scores, best first. Ties keep input order.
+        NaN scores (unscored pitchers) are never picked, so fewer than n may
+        come back. Uses a partial partition so only the selected candidates
+        are sorted.
+        """
+        # Left in, a NaN n-th score would make the cutoff NaN and select nothing
+        scored = np.flatnonzero(~np.isnan(scores))
+        values = scores[scored]
+        count = scored.shape[0]
+        if n <= 0 or count == 0:
+            return np.empty(0, dtype=np.int64)
+        if n < count:
+            # Keep every score tied with the n-th best so the cut is deterministic
+            cutoff = -np.partition(-values, n - 1)[n - 1]
+            candidates = np.flatnonzero(values >= cutoff)
+        else:
+            candidates = np.arange(count)
+        order = np.lexsort((candidates, -values[candidates]))[:n]
+        return scored[candidates[order]]
 
-        # Compute weighted score using selected profile
-        df["score"] = PitcherRecommenderService.compute_weighted_stats(df, weights)
+    @staticmethod
+    def build_lineup(scores: np.ndarray, names: Sequence[str], teams: Sequence[str], top_n: int = 5) -> List[dict]:
+        """[{rank, name, team, score}] for the top N scores, best first."""
+        best = PitcherRecommenderService.top_n(scores, top_n)
+        return [
+            {"rank": rank, "name": names[i], "team": teams[i], "score": float(scores[i])}
+            for rank, i in enumerate(best.tolist(), start=1)
+        ]
 
-        # Sort and rank
-        df_sorted = df.sort_values(by="score", ascending=False).head(top_n)
-        df_sorted["rank"] = range(1, len(df_sorted) + 1)
+    @staticmethod
+    def rank_roster(
+        features: np.ndarray,
+        names: Sequence[str],
+        teams: Sequence[str],
+        top_n: int = 5,
+        profile: Union[str, CompiledProfile] = "standard",
+    ) -> Tuple[List[dict], str]:
+        """
+        Recommend the top N starting pitchers from a roster feature matrix
+        (rows aligned with names/teams, columns in FEATURES order), normalizing
+        within the roster. Returns ([{rank, name, team, score}], explanation).
+        """
+        compiled = PitcherRecommenderService.get_profile(profile)
+        scores = compiled.score(PitcherRecommenderService.normalize(features))
+        lineup = PitcherRecommenderService.build_lineup(scores, names, teams, top_n)
+        return lineup, PitcherRecommenderService.get_explanation(profile)
 
-        #Get explanation
-        explanation = PitcherRecommenderService.EXPLANATIONS.get(
-            profile,
-            PitcherRecommenderService.EXPLANATIONS["standard"]
-        )
+    @staticmethod
+    def check_normalization(normalization: str):
+        if normalization not in PitcherRecommenderService.NORMALIZATION_MODES:
+            raise ValueError(f"Unknown normalization mode: {normalization}")
 
-        return df_sorted[["rank", "name", "team", "score"]].reset_index(drop=True), explanation
+    @staticmethod
+    def normalized_features(roster: EnrichedRoster, snapshot: SeasonStatsSnapshot, normalization: str = "roster") -> np.ndarray:
+        """The roster's feature matrix scaled to [0, 1] under a normalization mode."""
+        if normalization == "league":
+            return LeagueFeatureSpace.for_snapshot(snapshot).normalized[PitcherRecommenderService.snapshot_rows(roster)]
+        return PitcherRecommenderService.normalize(roster.features)
 
+    @staticmethod
+    def snapshot_rows(roster: EnrichedRoster) -> np.ndarray:
+        """The roster's snapshot row positions; rosters built from database rows have none."""
+        if roster.rows.size and roster.rows.min() < 0:
+            raise ValueError("League-relative scoring needs a roster enriched against a stats snapshot")
+        return roster.rows
 
-'''
-Alt implementation, works but not sure if faster than above, switch out if needed
-from typing import List, Dict, Optional
+    @staticmethod
+    def score_roster(
+        roster: EnrichedRoster,
+        snapshot: SeasonStatsSnapshot,
+        compiled: CompiledProfile,
+        normalization: str = "roster",
+    ) -> np.ndarray:
+        """
+        Profile scores for an enriched roster. In league mode the scores are a
+        gather from the snapshot's cached league-wide scores for the profile.
+        """
+        if normalization == "league":
+            return LeagueFeatureSpace.for_snapshot(snapshot).profile_scores(compiled)[PitcherRecommenderService.snapshot_rows(roster)]
+        return compiled.score(PitcherRecommenderService.normalize(roster.features))
 
+    @staticmethod
+    def recommend_lineup(
+        roster: EnrichedRoster,
+        snapshot: SeasonStatsSnapshot,
+        top_n: int = 5,
+        profile: Union[str, CompiledProfile] = "standard",
+        normalization: str = "roster",
+    ) -> Tuple[List[dict], str]:
+        """Recommend the top N starting pitchers from an enriched roster."""
+        PitcherRecommenderService.check_normalization(normalization)
+
+        compiled = PitcherRecommenderService.get_profile(profile)
+        scores = PitcherRecommenderService.score_roster(roster, snapshot, compiled, normalization)
+        lineup = PitcherRecommenderService.build_lineup(scores, roster.names, roster.teams, top_n)
+        return lineup, PitcherRecommenderService.get_explanation(profile)
 
-class PitcherRecommenderServiceFast:
-    def __init__(self, weights: Optional[Dict[str, float]] = None):
-        # Your defaults (order preserved)
-        self.WEIGHTS: Dict[str, float] = weights or {
-            "pitching+": 0.30,
-            "stuff+":    0.25,
-            "k-bb%":     0.20,
-            "xfip-":    -0.15,
-            "barrel%":  -0.10,
-            "hardhit%": -0.10,
-            "gb%":       0.05,
-            "swstr%":    0.05,
-            "wpa/li":    0.05,
+    @staticmethod
+    def recommend_all_profiles(
+        roster: EnrichedRoster,
+        snapshot: SeasonStatsSnapshot,
+        top_n: int = 5,
+        normalization: str = "roster",
+    ) -> Dict[str, Tuple[List[dict], str]]:
+        """
+        recommend_lineup() for every built-in profile, keyed by profile name.
+        The roster is normalized once and scored for all profiles in one multiply.
+        """
+        PitcherRecommenderService.check_normalization(normalization)
+
+        X01 = PitcherRecommenderService.normalized_features(roster, snapshot, normalization)
+        scores = _ALL_PROFILES.score(X01)
+        return {
+            name: (
+                PitcherRecommenderService.build_lineup(scores[:, j], roster.names, roster.teams, top_n),
+                PitcherRecommenderService.get_explanation(name),
+            )
+            for j, name in enumerate(_ALL_PROFILES.names)
         }
-        self.FEATURES = tuple(self.WEIGHTS.keys())
-
-        # Precompute weight vectors/masks in float64 to mirror sklearn defaults
-        w = np.array([self.WEIGHTS[f] for f in self.FEATURES], dtype=np.float64)
-        self._pos_mask = (w > 0)
-        self._neg_mask = (w < 0)
-        self._w_pos = w[self._pos_mask]                  # positive weights as-is
-        self._w_neg_abs = np.abs(w[self._neg_mask])      # absolute value for negative weights
-
-        # Fallback if no neg/pos columns (edge cases)
-        if self._w_pos.size == 0:
-            self._w_pos = np.zeros((0,), dtype=np.float64)
-        if self._w_neg_abs.size == 0:
-            self._w_neg_abs = np.zeros((0,), dtype=np.float64)
-
-        self._scaler = MinMaxScaler()  # identical to your original normalization
-
-    def recommend_pitchers(self, current_team: List[Dict], candidates: List[Dict], top_n: int = 5, alpha:  float = 0.4):
-
-        df_team = pd.DataFrame(current_team)
-        df_cand = pd.DataFrame(candidates)
-
-        # Build full matrix in the same column order you used
-        full = pd.concat([df_team, df_cand], ignore_index=True)
-        X = full.loc[:, self.FEATURES].to_numpy(dtype=np.float64, copy=False)
-
-        # --- EXACT normalization parity (sklearn MinMaxScaler) ---
-        X01 = self._scaler.fit_transform(X)
-
-        n_team = len(df_team)
-        F = len(self.FEATURES)
-        X_team01 = X01[:n_team] if n_team else np.empty((0, F), dtype=np.float64)
-        X_cand01 = X01[n_team:]
-
-        # --- EXACT base score math (no constants; same as your loop) ---
-        # sum_{pos} w_pos * x + sum_{neg} |w_neg| * (1 - x)
-        # vectorized split to match the loop behavior precisely
-        base = np.zeros(X_cand01.shape[0], dtype=np.float64)
-        if self._w_pos.size:
-            base += X_cand01[:, self._pos_mask] @ self._w_pos
-        if self._w_neg_abs.size:
-            base += (1.0 - X_cand01[:, self._neg_mask]) @ self._w_neg_abs
-
-        # --- EXACT cosine penalty parity (sklearn cosine_similarity) ---
-        if X_team01.size == 0:
-            penalty = np.zeros(X_cand01.shape[0], dtype=np.float64)
-        else:
-            sim_matrix = cosine_similarity(X_cand01, X_team01)  # same routine as before
-            max_sim = sim_matrix.max(axis=1)
-            penalty = -alpha * max_sim
 
-        final = base + penalty
+    @staticmethod
+    def max_cosine_similarity(
+        candidates: np.ndarray,
+        team: np.ndarray,
+        rows: np.ndarray,
+        block_rows: int = SIMILARITY_BLOCK_ROWS,
+    ) -> np.ndarray:
+        """
+        For each candidate row in rows, the highest cosine similarity to any
+        team row. Both matrices must hold unit-length rows. Candidates are
+        processed block_rows at a time so only a (block_rows, len(team)) slice
+        of the similarity matrix ever exists.
+        """
+        best = np.zeros(rows.shape[0], dtype=np.float64)
+        if team.shape[0] == 0:
+            return best
+        team_t = np.ascontiguousarray(team.T)
+        for start in range(0, rows.shape[0], block_rows):
+            stop = start + block_rows
+            best[start:stop] = (candidates[rows[start:stop]] @ team_t).max(axis=1)
+        return best
 
-        out = df_cand.copy()
-        out["base_score"]  = base
-        out["final_score"] = final
-        return out.sort_values("final_score", ascending=False).head(top_n).reset_index(drop=True)
+    @staticmethod
+    def recommend_free_agents(
+        roster: EnrichedRoster,
+        snapshot: SeasonStatsSnapshot,
+        top_n: int = 10,
+        profile: Union[str, CompiledProfile] = "standard",
+        alpha: float = 0.4,
+        taken: Optional[np.ndarray] = None,
+    ) -> Tuple[List[dict], str]:
+        """
+        Rank every pitcher in the league who is not on the roster, nor among
+        the snapshot rows in taken (pitchers on other teams).
 
-'''
+        final = base - alpha * max cosine similarity to a rostered pitcher, where
+        base is the profile score on league-normalized features, so pitchers who
+        look like someone the team already has are pushed down. Returns
+        ([{rank, name, team, idfg, score, base_score, similarity}], explanation).
+        """
+        space = LeagueFeatureSpace.for_snapshot(snapshot)
+        compiled = PitcherRecommenderService.get_profile(profile)
 
-# Delete after done testing
-current_team = [
-    {"name": "Gerrit Cole", "team": "NYY", "pitching+": 110, "stuff+": 105, "k-bb%": 26, "xfip-": 80, "barrel%": 5.5, "hardhit%": 32, "gb%": 44, "swstr%": 15, "wpa/li": 2.1},
-    {"name": "Framber Valdez", "team": "HOU", "pitching+": 102, "stuff+": 95, "k-bb%": 18, "xfip-": 90, "barrel%": 4.5, "hardhit%": 30, "gb%": 66, "swstr%": 12, "wpa/li": 1.5},
-    {"name": "Tyler Glasnow", "team": "LAD", "pitching+": 115, "stuff+": 112, "k-bb%": 29, "xfip-": 72, "barrel%": 6.0, "hardhit%": 29, "gb%": 38, "swstr%": 17, "wpa/li": 2.8},
-    {"name": "Marcus Stroman", "team": "NYY", "pitching+": 101, "stuff+": 90, "k-bb%": 15, "xfip-": 88, "barrel%": 4.2, "hardhit%": 28, "gb%": 57, "swstr%": 10, "wpa/li": 1.2},
-    {"name": "Logan Webb", "team": "SF", "pitching+": 108, "stuff+": 100, "k-bb%": 21, "xfip-": 83, "barrel%": 4.8, "hardhit%": 33, "gb%": 61, "swstr%": 13, "wpa/li": 1.9}
-]
+        rostered = PitcherRecommenderService.snapshot_rows(roster)
 
-candidates = [
-    {"name": "Tyler Glasnow", "team": "LAD", "pitching+": 115, "stuff+": 112, "k-bb%": 29, "xfip-": 72, "barrel%": 6.0, "hardhit%": 29, "gb%": 38, "swstr%": 17, "wpa/li": 2.8},
-    {"name": "Marcus Stroman", "team": "NYY", "pitching+": 101, "stuff+": 90, "k-bb%": 15, "xfip-": 88, "barrel%": 4.2, "hardhit%": 28, "gb%": 57, "swstr%": 10, "wpa/li": 1.2},
-    {"name": "Logan Webb", "team": "SF", "pitching+": 108, "stuff+": 100, "k-bb%": 21, "xfip-": 83, "barrel%": 4.8, "hardhit%": 33, "gb%": 61, "swstr%": 13, "wpa/li": 1.9}
-]
+        available = np.ones(space.normalized.shape[0], dtype=bool)
+        available[rostered] = False
+        if taken is not None:
+            available[np.asarray(taken, dtype=np.int64)] = False
+        candidates = np.flatnonzero(available)
 
+        base = space.profile_scores(compiled)[candidates]
+        similarity = PitcherRecommenderService.max_cosine_similarity(
+            space.unit, space.unit[rostered], candidates
+        )
+        final = base - alpha * similarity
+
+        best = PitcherRecommenderService.top_n(final, top_n)
+        rows = candidates[best]
+        frame = snapshot.frame
+        names = frame["name"].take(rows).tolist()
+        teams = frame["team"].take(rows).tolist() if "team" in frame.columns else [None] * len(rows)
+        idfgs = frame["idfg"].take(rows).tolist() if "idfg" in frame.columns else [None] * len(rows)
+
+        free_agents = [
+            {
+                "rank": rank,
+                "name": name,
+                "team": team if isinstance(team, str) else "Unknown",
+                "idfg": normalize_idfg(idfg),
+                "score": float(final[i]),
+                "base_score": float(base[i]),
+                "similarity": float(similarity[i]),
+            }
+            for rank, (i, name, team, idfg) in enumerate(zip(best.tolist(), names, teams, idfgs), start=1)
+        ]
+        return free_agents, PitcherRecommenderService.get_explanation(profile)
 
+    @staticmethod
+    def recommend_starting_pitchers(team_pitchers: list[dict], top_n=5, profile="standard"):
+        """
+        Recommend the top N starting pitchers from the user's current roster.
+        The weighting changes based on the selected fantasy manager profile.
+        Record-based wrapper around rank_roster(); metrics missing from the
+        records count as 0.0.
+        """
+        df = pd.DataFrame(team_pitchers)
+        features = (
+            df.reindex(columns=list(PitcherRecommenderService.FEATURES), fill_value=0.0)
+            .to_numpy(dtype=np.float64)
+        )
+        teams = df["team"].tolist() if "team" in df.columns else [None] * len(df)
+
+        lineup, explanation = PitcherRecommenderService.rank_roster(
+            features, df["name"].tolist(), teams, top_n, profile
+        )
+        return pd.DataFrame(lineup, columns=["rank", "name", "team", "score"]), explanation
 
-#start_time = time.perf_counter()
-#rec = PitcherRecommenderService()
-#print(rec.recommend_pitchers(current_team, candidates, top_n=3))
-#end_time = time.perf_counter()
-#print(f"Execution time: {end_time - start_time:.6f} seconds")
 
-rec = PitcherRecommenderService()
-recommendations = rec.recommend_starting_pitchers(current_team)
-# print(recommendations)
\ No newline at end of file
+# Built-in profiles are compiled once at import
+_COMPILED_PROFILES: Dict[str, CompiledProfile] = {
+    name: PitcherRecommenderService.compile_profile(weights, name, PitcherRecommenderService.EXPLANATIONS[name])
+    for name, weights in PitcherRecommenderService.PROFILES.items()
+}
+_ALL_PROFILES = PitcherRecommenderService.compile_profile_set(list(_COMPILED_PROFILES.values()))
@@ -0,0 +1,42 @@
+from ..database.data_access_interface import PlayerDataAccessInterface
+from .pitcher_grading_service import PitcherGradingService
+from .pitcher_index import normalize_idfg
+from .roster_enricher import RosterEnricher
+from .season_stats_repository import SeasonStatsSnapshot
+from .stats_delta import StatsChangeSet
+
+
+class PlayerRegrader:
+    """
+    Recomputes the stored grade and analysis of rostered players whose stat
+    line changed in a refresh, instead of leaving them at whatever they were
+    when the player was added.
+
+    Only players linked by IDfg are found; name-only players keep their
+    stored grade. Pitchers that dropped out of the stats are left alone.
+    """
+
+    def __init__(self, player_data_access: PlayerDataAccessInterface):
+        self.player_data_access = player_data_access
+
+    def regrade(self, snapshot: SeasonStatsSnapshot, changes: StatsChangeSet) -> int:
+        """Update grades for the players affected by a change set; returns how many were updated."""
+        idfgs = sorted(changes.added | changes.changed)
+        if not idfgs:
+            return 0
+
+        players = self.player_data_access.list_by_idfgs(idfgs)
+        roster = RosterEnricher.enrich(
+            [{"player_name": p.get("player_name"), "idfg": normalize_idfg(p.get("idfg")), "row": p} for p in players],
+            snapshot,
+        )
+        if not len(roster):
+            return 0
+
+        grades = PitcherGradingService.roster_grades(roster, snapshot)
+        updates = []
+        for i, p in enumerate(roster.players):
+            grade = float(grades[i])
+            analysis = PitcherGradingService.league_analysis(snapshot, roster.rows[i])
+            updates.append((p["row"]["id"], p["row"]["team_id"], grade, analysis))
+        return self.player_data_access.update_grades(updates)
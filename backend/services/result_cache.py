@@ -0,0 +1,113 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, Iterable, Optional
+
+from .season_stats_repository import SeasonStatsSnapshot
+
+
+def roster_fingerprint(players: Iterable[dict]) -> str:
+    """
+    Order-independent hash of a roster's rows (name, ids, position), so two
+    reads of an unchanged roster give the same key and any add, drop or edit
+    gives a new one.
+    """
+    identities = sorted(
+        "\x1f".join(str(p.get(field) or "") for field in ("player_name", "idfg", "mlbid", "position"))
+        for p in players
+    )
+    return hashlib.sha1("\x1e".join(identities).encode("utf-8")).hexdigest()
+
+
+def roster_stats_version(players: Iterable[dict], snapshot: SeasonStatsSnapshot, normalization: str = "roster") -> str:
+    """
+    Stats part of a result key. League-normalized results depend on the
+    whole league, so they use the snapshot's stats_version. Everything else
+    only depends on the stat rows the roster resolves to, so the token is
+    built from those pitchers' own versions and survives refreshes that
+    didn't touch any of them.
+    """
+    if normalization == "league":
+        return f"v{snapshot.stats_version}"
+    positions = (snapshot.index.find(name=p.get("player_name"), idfg=p.get("idfg")) for p in players)
+    tokens = sorted("-" if pos is None else snapshot.row_version(pos) for pos in positions)
+    return hashlib.sha1("|".join(tokens).encode("utf-8")).hexdigest()
+
+
+def stats_rows_version(rows: Iterable[dict]) -> str:
+    """
+    Stats part of a result key for a roster joined to pitcher_season_stats in
+    SQL (PitcherStatsDataAccess.roster_stats rows). Built from each matched
+    row's IDfg, row_hash and updated_at, so rewriting any of the roster's rows
+    gives a new key; the "db:" prefix keeps it apart from snapshot tokens.
+    """
+    tokens = sorted(
+        "-" if r.get("stats_idfg") is None else f"{r['stats_idfg']}:{r.get('row_hash')}:{r.get('updated_at')}"
+        for r in rows
+    )
+    return "db:" + hashlib.sha1("|".join(tokens).encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    Bounded LRU of computed response payloads (lineups, counter-lineups,
+    weakness reports).
+
+    Keys must capture everything the result depends on: the roster
+    fingerprint, the compiled profile name (which carries a custom profile's
+    revision) and roster_stats_version(). A roster edit, profile update or a
+    refresh that changed one of the roster's pitchers therefore changes the
+    key instead of needing an explicit invalidation; stale entries simply age
+    out of the LRU.
+    Cached payloads are shared between callers and must not be mutated.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, object]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[object]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: object):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], object]) -> object:
+        """Cached value for key, computing and storing it on a miss (None results are not stored)."""
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            if value is not None:
+                self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
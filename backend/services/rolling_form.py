@@ -0,0 +1,260 @@
+import dataclasses
+import threading
+from datetime import date, timedelta
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .pitcher_index import normalize_idfg
+from .roster_enricher import EnrichedRoster, RosterEnricher
+from .season_stats_repository import SeasonStatsSnapshot
+from .stats_history import SeasonStatsHistory
+
+
+def innings_to_outs(ip: np.ndarray) -> np.ndarray:
+    """Baseball-notation innings (6.1 = 6 1/3) to outs recorded."""
+    ip = np.nan_to_num(np.asarray(ip, dtype=np.float64))
+    whole = np.floor(ip)
+    return whole * 3 + np.round((ip - whole) * 10)
+
+
+class RollingFormTracker:
+    """
+    Rolling 7/14/30-day pitching form for one season, maintained incrementally.
+
+    update(day, frame) takes the season-to-date stats as they stand on a day.
+    Each pitcher's change since the previous day (batters faced, strikeouts,
+    walks, earned runs, outs, pitches, swinging strikes) goes into a 30-slot
+    ring buffer, and a running sum per window is adjusted by the day that
+    enters and the day that falls out of it, so no window is ever re-summed.
+    Updating the same day again replaces that day's increment. A pitcher
+    first seen after the first update counts their whole season-to-date line
+    on the day they appear.
+
+    From the window sums come rolling K%, BB%, K-BB%, ERA and SwStr% (rates()).
+    feature_matrix() swaps the rolling K-BB% and SwStr% into a snapshot's
+    recommender features for pitchers with at least MIN_BATTERS_FACED in the
+    window; everyone else keeps their season values. Those two are the only
+    rates that are recommender FEATURES: K% and BB% reach the lineup score
+    through K-BB%, and ERA only feeds grades, which lineups don't rank on.
+    The other features (Stuff+, xFIP-, batted-ball rates, ...) are published
+    as season figures only and have no daily counts to roll up.
+
+    A tracker built with ready=False is filled in by warm_up(), typically on
+    a background thread; callers check ready before serving form from it.
+    """
+
+    WINDOWS = (7, 14, 30)
+    # Counting stats accumulated per day
+    COMPONENTS = ("tbf", "so", "bb", "er", "outs", "pitches", "swstr")
+    # Recommender features replaced by their rolling versions
+    FORM_FEATURES = ("k-bb%", "swstr%")
+    # Sample needed in a window before its rates replace the season ones
+    MIN_BATTERS_FACED = 15
+
+    def __init__(self, season: int, ready: bool = True):
+        """
+        season: the season tracked
+        ready: False for a tracker warm_up() has yet to fill from history
+        """
+        self.season = season
+        self.day: Optional[date] = None
+        # Bumped on every update; part of the cache key of everything derived from the sums
+        self.version = 0
+        self._slots = max(self.WINDOWS)
+        self._index: Dict[str, int] = {}
+        # (pitchers, slots, components) daily increments and {window: (pitchers, components)} sums
+        self._ring = np.zeros((0, self._slots, len(self.COMPONENTS)))
+        self._sums = {w: np.zeros((0, len(self.COMPONENTS))) for w in self.WINDOWS}
+        # Season totals at the end of the previous day and as of the latest update
+        self._base = np.zeros((0, len(self.COMPONENTS)))
+        self._latest = np.zeros((0, len(self.COMPONENTS)))
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        if ready:
+            self._ready.set()
+
+    @classmethod
+    def from_history(cls, history: SeasonStatsHistory, season: int, day: date) -> "RollingFormTracker":
+        """A tracker warmed up from the recorded days in the longest window up to day."""
+        tracker = cls(season, ready=False)
+        tracker.warm_up(history, day)
+        return tracker
+
+    @property
+    def ready(self) -> bool:
+        """False while warm_up() is still replaying history."""
+        return self._ready.is_set()
+
+    def warm_up(self, history: SeasonStatsHistory, day: date):
+        """
+        Replay the recorded days in the longest window up to day, then mark
+        the tracker ready. It is marked ready even if the history can't be
+        read; the tracker then builds up from live updates alone.
+        """
+        try:
+            start = day - timedelta(days=max(self.WINDOWS))
+            days = history.days(self.season)
+            recorded = [d for d in days if start <= d <= day]
+            # The last day before the window gives the baseline its first increment is measured from
+            earlier = [d for d in days if d < start]
+            for d in earlier[-1:] + recorded:
+                frame = history.frame_as_of(self.season, d)
+                if frame is not None:
+                    self.update(d, frame)
+        finally:
+            self._ready.set()
+
+    # ----------------------------------------------------
+    # UPDATES
+    # ----------------------------------------------------
+    def update(self, day: date, frame: pd.DataFrame):
+        """Fold in the season-to-date stats as of day (days must not go backwards)."""
+        ids, totals = self._totals(frame)
+        with self._lock:
+            if self.day is not None and day < self.day:
+                raise ValueError(f"Form tracker is already at {self.day.isoformat()}")
+            rows = self._rows(ids)
+
+            if self.day is None:
+                # Nothing to measure the first day against: it only sets the baseline
+                self._latest[rows] = totals
+                self._base = self._latest.copy()
+                self.day = day
+                self.version += 1
+                return
+
+            for offset in range(1, (day - self.day).days + 1):
+                self._advance(self.day + timedelta(days=offset))
+
+            # Today's increment, replacing any earlier update for the same day
+            latest = self._latest.copy()
+            latest[rows] = totals
+            increment = latest - self._base
+            change = increment - self._ring[:, self._slot(day)]
+            self._ring[:, self._slot(day)] = increment
+            for w in self.WINDOWS:
+                self._sums[w] += change
+            self._latest = latest
+            self.day = day
+            self.version += 1
+
+    def _advance(self, day: date):
+        """Move to a new day: drop the increments leaving each window and clear the new slot."""
+        self._base = self._latest.copy()
+        for w in self.WINDOWS:
+            self._sums[w] -= self._ring[:, self._slot(day - timedelta(days=w))]
+        self._ring[:, self._slot(day)] = 0.0
+
+    def _slot(self, day: date) -> int:
+        return day.toordinal() % self._slots
+
+    def _rows(self, ids) -> np.ndarray:
+        """Row of every IDfg, growing the arrays for pitchers seen for the first time."""
+        new = [i for i in dict.fromkeys(ids) if i not in self._index]
+        if new:
+            for i in new:
+                self._index[i] = len(self._index)
+            grow = len(self._index) - self._base.shape[0]
+            self._ring = np.concatenate([self._ring, np.zeros((grow,) + self._ring.shape[1:])])
+            for w in self.WINDOWS:
+                self._sums[w] = np.concatenate([self._sums[w], np.zeros((grow, len(self.COMPONENTS)))])
+            self._base = np.concatenate([self._base, np.zeros((grow, len(self.COMPONENTS)))])
+            self._latest = np.concatenate([self._latest, np.zeros((grow, len(self.COMPONENTS)))])
+        return np.fromiter((self._index[i] for i in ids), dtype=np.intp, count=len(ids))
+
+    @classmethod
+    def _totals(cls, frame: pd.DataFrame) -> Tuple[list, np.ndarray]:
+        """(IDfgs, (pitchers, COMPONENTS) season totals) for rows with an IDfg, first row per IDfg."""
+        if "idfg" not in frame.columns:
+            return [], np.zeros((0, len(cls.COMPONENTS)))
+        keys = frame["idfg"].map(normalize_idfg)
+        keep = (keys.notna() & ~keys.duplicated()).to_numpy()
+        frame = frame[keep]
+
+        def column(name):
+            if name not in frame.columns:
+                return np.zeros(len(frame))
+            return pd.to_numeric(frame[name], errors="coerce").fillna(0.0).to_numpy(dtype=np.float64)
+
+        pitches = column("pitches")
+        totals = np.column_stack([
+            column("tbf"),
+            column("so"),
+            column("bb"),
+            column("er"),
+            innings_to_outs(column("ip")),
+            pitches,
+            # FanGraphs only publishes the rate; the count is recovered from it
+            np.round(column("swstr%") * pitches),
+        ])
+        return keys[keep].tolist(), totals
+
+    # ----------------------------------------------------
+    # READS
+    # ----------------------------------------------------
+    def rates(self, window: int) -> pd.DataFrame:
+        """Rolling rates over a window: idfg, tbf, ip, k%, bb%, k-bb%, era, swstr% (NaN without a sample)."""
+        if window not in self.WINDOWS:
+            raise ValueError(f"form window must be one of: {', '.join(map(str, self.WINDOWS))}")
+        with self._lock:
+            ids = list(self._index)
+            sums = self._sums[window].copy()
+
+        tbf, so, bb, er, outs, pitches, swstr = sums.T
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return pd.DataFrame({
+                "idfg": ids,
+                "tbf": tbf,
+                "ip": outs // 3 + (outs % 3) / 10,
+                "k%": np.where(tbf > 0, so / tbf, np.nan),
+                "bb%": np.where(tbf > 0, bb / tbf, np.nan),
+                "k-bb%": np.where(tbf > 0, (so - bb) / tbf, np.nan),
+                "era": np.where(outs > 0, 27.0 * er / outs, np.nan),
+                "swstr%": np.where(pitches > 0, swstr / pitches, np.nan),
+            })
+
+    def feature_matrix(self, snapshot: SeasonStatsSnapshot, window: int) -> np.ndarray:
+        """The snapshot's league feature matrix with rolling form swapped in (rebuilt when the tracker moves on)."""
+        # One entry per window, replaced on a new tracker version, so updates don't pile up on the snapshot
+        return snapshot.derived_latest(
+            f"rolling_form.{self.season}.{window}",
+            self.version,
+            lambda s: self._build_matrix(s, window),
+        )
+
+    def apply(self, roster: EnrichedRoster, snapshot: SeasonStatsSnapshot, window: int) -> EnrichedRoster:
+        """The roster with its features taken from feature_matrix()."""
+        if roster.rows.size and roster.rows.min() < 0:
+            raise ValueError("Recent form needs a roster enriched against a stats snapshot")
+        matrix = self.feature_matrix(snapshot, window)
+        return dataclasses.replace(roster, features=np.ascontiguousarray(matrix[roster.rows]))
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "season": self.season,
+                "day": self.day.isoformat() if self.day else None,
+                "pitchers": len(self._index),
+                "version": self.version,
+                "ready": self.ready,
+            }
+
+    def _build_matrix(self, snapshot: SeasonStatsSnapshot, window: int) -> np.ndarray:
+        matrix = RosterEnricher.feature_matrix(snapshot).copy()
+        frame = snapshot.frame
+        if "idfg" in frame.columns and len(frame):
+            rates = self.rates(window)
+            positions = pd.Index(rates["idfg"]).get_indexer(frame["idfg"].map(normalize_idfg))
+            found = positions >= 0
+            sample = np.zeros(len(frame))
+            sample[found] = rates["tbf"].to_numpy()[positions[found]]
+            qualified = np.flatnonzero(sample >= self.MIN_BATTERS_FACED)
+            for feature in self.FORM_FEATURES:
+                values = rates[feature].to_numpy()[positions[qualified]]
+                j = RosterEnricher.FEATURES.index(feature)
+                keep = ~np.isnan(values)
+                matrix[qualified[keep], j] = values[keep]
+        matrix.flags.writeable = False
+        return matrix
@@ -0,0 +1,149 @@
+from dataclasses import dataclass
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from .season_stats_repository import SeasonStatsSnapshot
+
+
+@dataclass(frozen=True)
+class EnrichedRoster:
+    """
+    A roster joined against a stats snapshot.
+
+    Row i of every array belongs to players[i]. Players with no stat row are
+    listed in unmatched and appear nowhere else.
+    """
+    players: List[dict]
+    rows: np.ndarray        # snapshot row positions, int64
+    names: List[str]        # stat-line names ("name" column)
+    teams: List[str]
+    features: np.ndarray    # (n, len(RosterEnricher.FEATURES)) float64
+    grading: np.ndarray     # (n, len(RosterEnricher.GRADING_COLUMNS)) float64
+    unmatched: List[dict]
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    def grading_stats(self, i: int) -> Dict[str, float]:
+        """Stats dict in the shape PitcherGradingService expects."""
+        k, ip, era = self.grading[i]
+        return {"K%": float(k), "IP": float(ip), "ERA": float(era)}
+
+    def to_pitcher_dicts(self) -> List[dict]:
+        """Per-pitcher feature dicts, for callers that still take records."""
+        return [
+            {"name": name, "team": team, **dict(zip(RosterEnricher.FEATURES, values.tolist()))}
+            for name, team, values in zip(self.names, self.teams, self.features)
+        ]
+
+
+class RosterEnricher:
+    """
+    Turns team_data_access.get_all_players() rows into aligned stat arrays.
+
+    The league-wide feature and grading matrices are built once per snapshot
+    (missing columns and NaNs replaced by the defaults below); enriching a
+    roster is then one index lookup per player and a single fancy-index gather.
+    """
+
+    # Recommender features, in PitcherRecommenderService weight order, with the
+    # value used when a stat is missing for a pitcher
+    FEATURE_DEFAULTS = {
+        "pitching+": 100.0,
+        "stuff+": 100.0,
+        "k-bb%": 0.0,
+        "xfip-": 100.0,
+        "barrel%": 0.0,
+        "hardhit%": 0.0,
+        "gb%": 0.0,
+        "swstr%": 0.0,
+        "wpa/li": 0.0,
+    }
+    FEATURES = tuple(FEATURE_DEFAULTS)
+
+    # Inputs to PitcherGradingService
+    GRADING_COLUMNS = ("k%", "ip", "era")
+
+    @staticmethod
+    def feature_matrix(snapshot: SeasonStatsSnapshot) -> np.ndarray:
+        """League-wide (rows, features) float64 matrix, shared by every request on a snapshot."""
+        return snapshot.derived(
+            "roster_enricher.features",
+            lambda s: RosterEnricher._matrix(s.frame, RosterEnricher.FEATURE_DEFAULTS),
+        )
+
+    @staticmethod
+    def grading_matrix(snapshot: SeasonStatsSnapshot) -> np.ndarray:
+        """League-wide (rows, [k%, ip, era]) float64 matrix."""
+        return snapshot.derived(
+            "roster_enricher.grading",
+            lambda s: RosterEnricher._matrix(s.frame, dict.fromkeys(RosterEnricher.GRADING_COLUMNS, 0.0)),
+        )
+
+    @staticmethod
+    def enrich(players: List[dict], snapshot: SeasonStatsSnapshot) -> EnrichedRoster:
+        """Join a roster against a snapshot by IDfg, falling back to normalized name."""
+        matched, positions, unmatched = [], [], []
+        for p in players:
+            pos = snapshot.index.find(name=p.get("player_name"), idfg=p.get("idfg"))
+            if pos is None:
+                unmatched.append(p)
+            else:
+                matched.append(p)
+                positions.append(pos)
+
+        rows = np.asarray(positions, dtype=np.int64)
+        frame = snapshot.frame
+        names = frame["name"].take(rows).tolist()
+        if "team" in frame.columns:
+            teams = [t if isinstance(t, str) else "Unknown" for t in frame["team"].take(rows).tolist()]
+        else:
+            teams = ["Unknown"] * len(rows)
+
+        return EnrichedRoster(
+            players=matched,
+            rows=rows,
+            names=names,
+            teams=teams,
+            features=np.ascontiguousarray(RosterEnricher.feature_matrix(snapshot)[rows]),
+            grading=np.ascontiguousarray(RosterEnricher.grading_matrix(snapshot)[rows]),
+            unmatched=unmatched,
+        )
+
+    @staticmethod
+    def from_stats_rows(rows: List[dict]) -> EnrichedRoster:
+        """
+        Build a roster from PitcherStatsDataAccess.roster_stats() rows (players
+        already joined to their stats in SQL) without a league snapshot in
+        memory. Such a roster has no snapshot positions (rows is all -1), so it
+        supports roster-normalized scoring and grading but not league mode.
+        """
+        matched = [r for r in rows if r.get("stats_idfg") is not None]
+        unmatched = [r for r in rows if r.get("stats_idfg") is None]
+        stats = pd.DataFrame([r.get("stats") or {} for r in matched])
+        for column, key in (("ip", "ip"), ("era", "era"), ("k%", "k_pct")):
+            stats[column] = [r.get(key) for r in matched]
+
+        return EnrichedRoster(
+            players=matched,
+            rows=np.full(len(matched), -1, dtype=np.int64),
+            names=[r.get("name") for r in matched],
+            teams=[t if isinstance(t, str) else "Unknown" for t in (r.get("team") for r in matched)],
+            features=RosterEnricher._matrix(stats, RosterEnricher.FEATURE_DEFAULTS),
+            grading=RosterEnricher._matrix(stats, dict.fromkeys(RosterEnricher.GRADING_COLUMNS, 0.0)),
+            unmatched=unmatched,
+        )
+
+    @staticmethod
+    def _matrix(frame: pd.DataFrame, defaults: Dict[str, float]) -> np.ndarray:
+        matrix = np.empty((len(frame), len(defaults)), dtype=np.float64)
+        for j, (col, default) in enumerate(defaults.items()):
+            if col in frame.columns:
+                values = pd.to_numeric(frame[col], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+                matrix[:, j] = np.where(np.isnan(values), default, values)
+            else:
+                matrix[:, j] = default
+        matrix.flags.writeable = False
+        return matrix
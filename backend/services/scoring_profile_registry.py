@@ -0,0 +1,232 @@
+import math
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from ..database.data_access_interface import ScoringProfileDataAccessInterface
+from ..database.entities.scoring_profile_entity import ScoringProfileEntity
+from .pitcher_recomender_service import CompiledProfile, PitcherRecommenderService
+
+
+class UnknownProfileError(LookupError):
+    """A profile selector that names neither a built-in nor a stored profile."""
+
+
+class DuplicateProfileError(ValueError):
+    """A user already has a profile with this name."""
+
+
+class ScoringProfileRegistry:
+    """
+    Resolves profile selectors to compiled weight vectors.
+
+    Built-in profiles are selected by name ("standard", "strikeout", ...);
+    user-defined profiles live in the scoring_profiles table and are selected
+    as "custom:<id>". A stored profile is validated when it is written and
+    compiled once per (id, revision): lineup calls reuse the cached
+    CompiledProfile instead of re-reading and re-parsing the weights.
+
+    Every lookup checks the stored revision (a primary-key read of one
+    integer), so an edit or delete made through another worker's registry is
+    seen on the next request; editing or deleting through this registry also
+    evicts its entries right away.
+    """
+
+    CUSTOM_PREFIX = "custom:"
+    # Largest absolute weight accepted for a single feature
+    MAX_WEIGHT = 1.0
+    MAX_NAME_LENGTH = 100
+    MAX_EXPLANATION_LENGTH = 2000
+    # Compiled custom profiles kept in memory (least recently used dropped first)
+    MAX_CACHED = 1024
+
+    def __init__(self, profile_data_access: Optional[ScoringProfileDataAccessInterface] = None):
+        """
+        profile_data_access: store for user-defined profiles; without one only
+        the built-in profiles can be resolved
+        """
+        self.profile_data_access = profile_data_access
+        self._lock = threading.Lock()
+        self._compiled: "OrderedDict[Tuple[int, int], CompiledProfile]" = OrderedDict()
+        self._revisions: Dict[int, int] = {}
+
+    # ----------------------------------------------------
+    # RESOLUTION
+    # ----------------------------------------------------
+    def resolve(self, profile: str) -> CompiledProfile:
+        """CompiledProfile for a selector; raises UnknownProfileError if there is none."""
+        if profile in PitcherRecommenderService.PROFILES:
+            return PitcherRecommenderService.get_profile(profile)
+
+        profile_id = self.parse_selector(profile)
+        if profile_id is None:
+            raise UnknownProfileError(f"Unknown scoring profile: {profile}")
+        return self.compiled(profile_id)
+
+    def parse_selector(self, profile: str) -> Optional[int]:
+        """The profile id in a "custom:<id>" selector, or None."""
+        if not isinstance(profile, str) or not profile.startswith(self.CUSTOM_PREFIX):
+            return None
+        try:
+            return int(profile[len(self.CUSTOM_PREFIX):])
+        except ValueError:
+            return None
+
+    def compiled(self, profile_id: int) -> CompiledProfile:
+        """Compiled weights for a stored profile, from cache while its stored revision is unchanged."""
+        if self.profile_data_access is None:
+            raise UnknownProfileError(f"Unknown scoring profile: {self.CUSTOM_PREFIX}{profile_id}")
+
+        revision = self.profile_data_access.revision(profile_id)
+        if revision is not None:
+            with self._lock:
+                compiled = self._compiled.get((profile_id, revision))
+                if compiled is not None:
+                    self._compiled.move_to_end((profile_id, revision))
+                    return compiled
+
+        row = self.profile_data_access.read(profile_id) if revision is not None else None
+        if not row:
+            # Deleted, possibly by another worker
+            self.evict(profile_id)
+            raise UnknownProfileError(f"Unknown scoring profile: {self.CUSTOM_PREFIX}{profile_id}")
+        return self._cache(row)
+
+    def evict(self, profile_id: int):
+        """Drop every cached revision of a profile."""
+        with self._lock:
+            self._revisions.pop(profile_id, None)
+            for key in [k for k in self._compiled if k[0] == profile_id]:
+                del self._compiled[key]
+
+    # ----------------------------------------------------
+    # CRUD
+    # ----------------------------------------------------
+    def create(self, user_id: int, name: str, weights: dict, explanation: Optional[str] = None) -> dict:
+        name, weights, explanation = self.validate(name, weights, explanation)
+        if any(p["name"] == name for p in self.profile_data_access.list_by_user(user_id)):
+            raise DuplicateProfileError(f"A profile named '{name}' already exists")
+
+        row = self.profile_data_access.create(ScoringProfileEntity(user_id, name, weights, explanation))
+        self._cache(row)
+        return self.to_dict(row)
+
+    def get(self, profile_id: int) -> Optional[dict]:
+        row = self.profile_data_access.read(profile_id)
+        return self.to_dict(row) if row else None
+
+    def list_for_user(self, user_id: int) -> List[dict]:
+        return [self.to_dict(row) for row in self.profile_data_access.list_by_user(user_id)]
+
+    def update(self, profile_id: int, name: Optional[str] = None, weights: Optional[dict] = None,
+               explanation: Optional[str] = None) -> Optional[dict]:
+        """Change any of name / weights / explanation; returns None if the profile is gone."""
+        current = self.profile_data_access.read(profile_id)
+        if not current:
+            return None
+
+        name, weights, explanation = self.validate(
+            current["name"] if name is None else name,
+            current["weights"] if weights is None else weights,
+            current["explanation"] if explanation is None else explanation,
+        )
+        if name != current["name"] and any(
+            p["name"] == name for p in self.profile_data_access.list_by_user(current["user_id"])
+        ):
+            raise DuplicateProfileError(f"A profile named '{name}' already exists")
+
+        self.evict(profile_id)
+        row = self.profile_data_access.update(
+            ScoringProfileEntity(current["user_id"], name, weights, explanation, id=profile_id)
+        )
+        if not row:
+            return None
+        self._cache(row)
+        return self.to_dict(row)
+
+    def delete(self, profile_id: int) -> Optional[dict]:
+        self.evict(profile_id)
+        return self.profile_data_access.delete(profile_id)
+
+    # ----------------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------------
+    @staticmethod
+    def validate(name, weights, explanation=None) -> Tuple[str, Dict[str, float], Optional[str]]:
+        """Return cleaned (name, weights, explanation) or raise ValueError."""
+        if not isinstance(name, str) or not name.strip():
+            raise ValueError("name is required")
+        name = name.strip()
+        if len(name) > ScoringProfileRegistry.MAX_NAME_LENGTH:
+            raise ValueError(f"name must be at most {ScoringProfileRegistry.MAX_NAME_LENGTH} characters")
+
+        if not isinstance(weights, dict) or not weights:
+            raise ValueError("weights must be a non-empty object of feature: weight")
+
+        features = PitcherRecommenderService.FEATURES
+        cleaned = {}
+        for key, value in weights.items():
+            feature = str(key).strip().lower()
+            if feature not in features:
+                raise ValueError(f"Unknown feature '{key}'. Allowed: {', '.join(features)}")
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+                raise ValueError(f"Weight for '{feature}' must be a finite number")
+            if abs(value) > ScoringProfileRegistry.MAX_WEIGHT:
+                raise ValueError(f"Weight for '{feature}' must be between -{ScoringProfileRegistry.MAX_WEIGHT} and {ScoringProfileRegistry.MAX_WEIGHT}")
+            cleaned[feature] = float(value)
+
+        if not any(cleaned.values()):
+            raise ValueError("At least one weight must be non-zero")
+
+        if explanation is not None:
+            if not isinstance(explanation, str):
+                raise ValueError("explanation must be a string")
+            explanation = explanation.strip() or None
+            if explanation and len(explanation) > ScoringProfileRegistry.MAX_EXPLANATION_LENGTH:
+                raise ValueError(f"explanation must be at most {ScoringProfileRegistry.MAX_EXPLANATION_LENGTH} characters")
+
+        # Keep FEATURES order so stored weights read like the built-in profiles
+        ordered = {f: cleaned[f] for f in features if f in cleaned}
+        return name, ordered, explanation
+
+    # ----------------------------------------------------
+    # INTERNALS
+    # ----------------------------------------------------
+    def to_dict(self, row: dict) -> dict:
+        return {
+            "id": row["id"],
+            "user_id": row["user_id"],
+            "name": row["name"],
+            "weights": row["weights"],
+            "explanation": row["explanation"],
+            "revision": row["revision"],
+            "profile": f"{self.CUSTOM_PREFIX}{row['id']}",
+        }
+
+    def _cache(self, row: dict) -> CompiledProfile:
+        """Compile a stored row and make it the cached revision for its id."""
+        profile_id, revision = row["id"], row["revision"]
+        weights = row["weights"]
+        explanation = row["explanation"] or (
+            f"You selected your custom profile \"{row['name']}\", which weights "
+            + ", ".join(f"{feature} {weight:+.2f}" for feature, weight in weights.items())
+            + "."
+        )
+        # The name carries the revision so per-snapshot score caches never mix revisions
+        compiled = PitcherRecommenderService.compile_profile(
+            weights, f"{self.CUSTOM_PREFIX}{profile_id}@r{revision}", explanation
+        )
+
+        with self._lock:
+            known = self._revisions.get(profile_id)
+            if known is not None and known > revision:
+                # A newer revision was cached while we were reading
+                return compiled
+            for key in [k for k in self._compiled if k[0] == profile_id]:
+                del self._compiled[key]
+            self._revisions[profile_id] = revision
+            self._compiled[(profile_id, revision)] = compiled
+            while len(self._compiled) > self.MAX_CACHED:
+                (old_id, _), _ = self._compiled.popitem(last=False)
+                self._revisions.pop(old_id, None)
+        return compiled
@@ -0,0 +1,312 @@
+import itertools
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Mapping, Optional
+
+import pandas as pd
+from pybaseball import pitching_stats
+
+from .pitcher_index import PitcherIndex, normalize_idfg
+from .season_stats_store import SeasonStatsStore
+from .stats_delta import StatsChangeSet, diff_frames
+
+
+# Season every endpoint grades and recommends against
+CURRENT_SEASON = 2025
+
+
+def normalize_stats_frame(raw: pd.DataFrame) -> pd.DataFrame:
+    """Return a copy of a pitching_stats frame with stripped, lower-cased column names."""
+    frame = raw.copy()
+    frame.columns = [str(c).strip().lower() for c in frame.columns]
+    return frame.reset_index(drop=True)
+
+
+@dataclass(frozen=True)
+class SeasonStatsSnapshot:
+    """
+    One season of FanGraphs pitching stats, shared by every request.
+    The frame has normalized column names ("name", "k%", "ip", "era", ...)
+    and must be treated as read-only: callers filter or copy, never mutate.
+
+    stats_version increases every time the repository swaps in new data, so a
+    request that grabbed a snapshot keeps a consistent view even if a refresh
+    lands halfway through it.
+
+    Structures derived from the frame (lookup indexes, feature matrices, ...)
+    are built once per snapshot through derived() and shared by every request.
+
+    A snapshot swapped in by refresh() records what changed since the one it
+    replaced (changes), and every pitcher carries the stats_version in which
+    its row last changed (pitcher_version), so results that only depend on a
+    few pitchers can outlive a refresh that didn't touch them.
+
+    Other sources (Statcast features, ...) publish extra per-pitcher columns
+    through the repository; extra_columns() and column() read them aligned
+    with the frame's rows.
+    """
+    season: int
+    frame: pd.DataFrame
+    stats_version: int = 0
+    fingerprint: Optional[str] = None
+    changes: Optional[StatsChangeSet] = None
+    # Version of every pitcher not listed in pitcher_versions
+    base_version: int = 0
+    pitcher_versions: Mapping[str, int] = field(default_factory=dict)
+    # {name: source} published on the repository; a source has a revision and for_snapshot(snapshot)
+    column_sources: Mapping[str, Any] = field(default_factory=dict, repr=False, compare=False)
+    _derived: Dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # Re-entrant: one derived structure may be built from another
+    _derived_lock: threading.RLock = field(default_factory=threading.RLock, init=False, repr=False, compare=False)
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def derived(self, key: str, build: Callable[["SeasonStatsSnapshot"], Any]) -> Any:
+        """Return build(self), computing it only the first time key is requested."""
+        with self._derived_lock:
+            if key not in self._derived:
+                self._derived[key] = build(self)
+            return self._derived[key]
+
+    def derived_latest(self, key: str, version: Hashable, build: Callable[["SeasonStatsSnapshot"], Any]) -> Any:
+        """
+        Like derived(), for structures that also depend on something outside the
+        snapshot: one entry per key, rebuilt and replaced when version changes.
+        """
+        with self._derived_lock:
+            entry = self._derived.get(key)
+            if entry is None or entry[0] != version:
+                entry = (version, build(self))
+                self._derived[key] = entry
+            return entry[1]
+
+    def extra_columns(self) -> pd.DataFrame:
+        """Published extra columns, one row per frame row in the same order (rebuilt when a source changes)."""
+        sources = list(self.column_sources.values())
+        return self.derived_latest(
+            "extra_columns",
+            tuple((id(source), source.revision) for source in sources),
+            lambda s: pd.concat([source.for_snapshot(s) for source in sources], axis=1)
+            if sources else pd.DataFrame(index=pd.RangeIndex(len(s))),
+        )
+
+    def column(self, name: str) -> Optional[pd.Series]:
+        """A frame column or a published extra column, or None if neither has it."""
+        if name in self.frame.columns:
+            return self.frame[name]
+        extra = self.extra_columns()
+        return extra[name] if name in extra.columns else None
+
+    @property
+    def index(self) -> PitcherIndex:
+        """Name / IDfg lookup index for this snapshot."""
+        return self.derived("index", lambda snapshot: PitcherIndex(snapshot.frame))
+
+    def row_version(self, pos: int) -> str:
+        """Version token for the pitcher at a row: "<idfg>:<version>" (row position if there is no IDfg)."""
+        idfgs = self.derived(
+            "idfgs",
+            lambda s: [normalize_idfg(i) for i in s.frame["idfg"].tolist()] if "idfg" in s.frame.columns else None,
+        )
+        idfg = idfgs[pos] if idfgs is not None else None
+        if idfg is None:
+            return f"@{pos}:{self.stats_version}"
+        return f"{idfg}:{self.pitcher_versions.get(idfg, self.base_version)}"
+
+
+class _PendingLoad:
+    """A fetch in progress that other callers for the same season wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.snapshot: Optional[SeasonStatsSnapshot] = None
+        self.error: Optional[BaseException] = None
+
+
+class SeasonStatsRepository:
+    """
+    Process-wide cache of season pitching stats.
+
+    Each season is fetched once and the same snapshot is handed to every caller.
+    Concurrent requests for a season that is not loaded yet share a single fetch
+    (single-flight); if that fetch fails, nothing is cached and the next call retries.
+
+    With a SeasonStatsStore attached, a season already on disk is memory-mapped
+    instead of fetched, and freshly fetched seasons are written back to it.
+
+    refresh() re-fetches a season off the request path and atomically swaps in a
+    new snapshot if the data validated and actually changed.
+    """
+
+    # Columns a refreshed frame must have before it may replace the live snapshot
+    REQUIRED_COLUMNS = ("name", "ip")
+    # A refresh that loses more than half the league is treated as a bad fetch
+    MIN_RETAINED_FRACTION = 0.5
+
+    def __init__(
+        self,
+        loader: Callable[[int], pd.DataFrame] = pitching_stats,
+        store: Optional[SeasonStatsStore] = None,
+    ):
+        """
+        loader: season -> raw pitching stats frame (defaults to pybaseball.pitching_stats)
+        store: optional on-disk snapshot store used for warm starts
+        """
+        self.loader = loader
+        self.store = store
+        self._lock = threading.Lock()
+        self._versions = itertools.count(1)
+        # Extra per-pitcher columns shared by every snapshot, see publish_columns()
+        self.column_sources: Dict[str, Any] = {}
+        self._snapshots: Dict[int, SeasonStatsSnapshot] = {}
+        self._pending: Dict[int, _PendingLoad] = {}
+
+    def get(self, season: int = CURRENT_SEASON) -> SeasonStatsSnapshot:
+        """Return the snapshot for a season, loading it on first use."""
+        with self._lock:
+            snapshot = self._snapshots.get(season)
+            if snapshot is not None:
+                return snapshot
+
+            pending = self._pending.get(season)
+            is_leader = pending is None
+            if is_leader:
+                pending = self._pending[season] = _PendingLoad()
+
+        if not is_leader:
+            pending.done.wait()
+            if pending.error is not None:
+                raise pending.error
+            return pending.snapshot
+
+        try:
+            snapshot = self._install(self._load(season))
+            pending.snapshot = snapshot
+            return snapshot
+        except BaseException as e:
+            pending.error = e
+            raise
+        finally:
+            with self._lock:
+                self._pending.pop(season, None)
+            pending.done.set()
+
+    def peek(self, season: int = CURRENT_SEASON) -> Optional[SeasonStatsSnapshot]:
+        """Return the cached snapshot for a season without triggering a load."""
+        with self._lock:
+            return self._snapshots.get(season)
+
+    def publish_columns(self, name: str, source):
+        """
+        Make a source's per-pitcher columns available on every snapshot, current
+        and future. source needs a revision that changes with its data and
+        for_snapshot(snapshot) returning a frame aligned with snapshot rows.
+        """
+        self.column_sources[name] = source
+
+    def next_version(self) -> int:
+        """
+        Reserve a stats_version for a snapshot built outside the repository
+        (e.g. a historical one), so result cache keys never collide with a
+        live snapshot's.
+        """
+        return next(self._versions)
+
+    def refresh(self, season: int = CURRENT_SEASON) -> bool:
+        """
+        Fetch a season again and swap it in if it is valid and different.
+        Returns True if a new snapshot went live. Raises if the fetch or
+        validation fails, in which case the current snapshot keeps serving.
+        """
+        frame = normalize_stats_frame(self.loader(season))
+        # One read of the live snapshot: validation, the no-change check and
+        # the diff must all compare against the same one
+        with self._lock:
+            current = self._snapshots.get(season)
+        self.validate(frame, current)
+
+        fingerprint = SeasonStatsStore.fingerprint(frame)
+        if current is not None and current.fingerprint == fingerprint:
+            return False
+
+        changes = diff_frames(season, current.frame if current is not None else None, frame)
+        self._persist(season, frame, fingerprint)
+        self._install(self._snapshot(season, frame, fingerprint, previous=current, changes=changes))
+        return True
+
+    def validate(self, frame: pd.DataFrame, current: Optional[SeasonStatsSnapshot] = None):
+        """Raise ValueError if a freshly fetched frame is not fit to replace the current one."""
+        missing = [c for c in self.REQUIRED_COLUMNS if c not in frame.columns]
+        if missing:
+            raise ValueError(f"Stats frame is missing columns: {', '.join(missing)}")
+        if frame.empty:
+            raise ValueError("Stats frame is empty")
+        if current is not None and len(frame) < self.MIN_RETAINED_FRACTION * len(current):
+            raise ValueError(
+                f"Stats frame shrank from {len(current)} to {len(frame)} rows"
+            )
+
+    # ----------------------------------------------------
+    # INTERNALS
+    # ----------------------------------------------------
+    def _load(self, season: int) -> SeasonStatsSnapshot:
+        if self.store is not None:
+            stored = self.store.load(season)
+            if stored is not None:
+                frame, fingerprint = stored
+                return self._snapshot(season, frame, fingerprint)
+
+        frame = normalize_stats_frame(self.loader(season))
+        fingerprint = SeasonStatsStore.fingerprint(frame)
+        self._persist(season, frame, fingerprint)
+        return self._snapshot(season, frame, fingerprint)
+
+    def _snapshot(
+        self,
+        season: int,
+        frame: pd.DataFrame,
+        fingerprint: Optional[str],
+        previous: Optional[SeasonStatsSnapshot] = None,
+        changes: Optional[StatsChangeSet] = None,
+    ) -> SeasonStatsSnapshot:
+        stats_version = self.next_version()
+        if previous is not None and changes is not None and not changes.full:
+            # Only the pitchers in the change set move to the new version
+            base_version = previous.base_version
+            pitcher_versions = dict(previous.pitcher_versions)
+            pitcher_versions.update(dict.fromkeys(changes.affected, stats_version))
+        else:
+            base_version, pitcher_versions = stats_version, {}
+
+        snapshot = SeasonStatsSnapshot(
+            season=season,
+            frame=frame,
+            stats_version=stats_version,
+            fingerprint=fingerprint,
+            changes=changes,
+            base_version=base_version,
+            pitcher_versions=pitcher_versions,
+            column_sources=self.column_sources,
+        )
+        # Build the lookup index here, off the request path when refreshing
+        snapshot.index
+        return snapshot
+
+    def _install(self, snapshot: SeasonStatsSnapshot) -> SeasonStatsSnapshot:
+        """Make a snapshot live unless a newer one won the race; return whichever is live."""
+        with self._lock:
+            current = self._snapshots.get(snapshot.season)
+            if current is not None and current.stats_version > snapshot.stats_version:
+                return current
+            self._snapshots[snapshot.season] = snapshot
+            return snapshot
+
+    def _persist(self, season: int, frame: pd.DataFrame, fingerprint: str):
+        """Write a fetched frame to the store; a disk problem never fails the request."""
+        if self.store is None:
+            return
+        try:
+            self.store.save(season, frame, fingerprint)
+        except OSError as e:
+            print(f"[SeasonStatsRepository] Failed to persist season {season}: {e}")
@@ -0,0 +1,190 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class SeasonStatsStore:
+    """
+    On-disk columnar copy of normalized season stats.
+
+    Each season lives in its own directory with one NumPy .npy file per column
+    and a manifest describing them:
+
+        <data_dir>/pitching_stats_2025/
+            CURRENT                  -> name of the live version directory
+            v1-<fingerprint>/
+                manifest.json
+                0000.npy, 0001.npy, ...
+
+    Numeric columns are memory-mapped on load, so a warm start costs only the
+    page faults of the columns a request touches. The manifest records each
+    column's dtype, and columns stored in a different one (nullable Int64 /
+    boolean, kept as float with NaN) are converted back, so a reloaded frame
+    hashes the same as the one that was saved. A new version directory is
+    written only when the frame's content fingerprint changes, and it is made
+    live by atomically replacing CURRENT.
+    """
+
+    # Bump when the on-disk layout changes; older versions are ignored and rebuilt
+    FORMAT_VERSION = 2
+
+    def __init__(self, data_dir: str):
+        self.data_dir = Path(data_dir)
+
+    # ----------------------------------------------------
+    # PUBLIC API
+    # ----------------------------------------------------
+    @staticmethod
+    def fingerprint(frame: pd.DataFrame) -> str:
+        """Content hash of a frame: column names, dtypes and values."""
+        digest = hashlib.sha256()
+        for name, dtype in frame.dtypes.items():
+            digest.update(f"{name}:{dtype};".encode())
+        digest.update(pd.util.hash_pandas_object(frame, index=False).to_numpy().tobytes())
+        return digest.hexdigest()
+
+    def load(self, season: int) -> Optional[Tuple[pd.DataFrame, str]]:
+        """Return (frame, fingerprint) for a stored season, or None if there is no usable copy."""
+        version_dir = self._current_version_dir(season)
+        if version_dir is None:
+            return None
+
+        try:
+            manifest = json.loads((version_dir / "manifest.json").read_text())
+            if manifest.get("format_version") != self.FORMAT_VERSION:
+                return None
+
+            columns = {}
+            for i, col in enumerate(manifest["columns"]):
+                columns[col["name"]] = self._read_column(version_dir, i, col)
+            frame = pd.DataFrame(columns, copy=False)
+            for col in manifest["columns"]:
+                # Only converted (and copied) when stored differently from the original
+                if str(frame[col["name"]].dtype) != col["dtype"]:
+                    frame[col["name"]] = frame[col["name"]].astype(col["dtype"])
+            return frame, manifest["fingerprint"]
+
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"[SeasonStatsStore] Ignoring unreadable snapshot in {version_dir}: {e}")
+            return None
+
+    def save(self, season: int, frame: pd.DataFrame, fingerprint: Optional[str] = None) -> bool:
+        """
+        Persist a normalized season frame.
+        Returns False without writing when the stored copy already has the same content.
+        """
+        fingerprint = fingerprint or self.fingerprint(frame)
+        version_name = f"v{self.FORMAT_VERSION}-{fingerprint[:16]}"
+
+        season_dir = self._season_dir(season)
+        current = self._current_version_dir(season)
+        if current is not None and current.name == version_name:
+            return False
+
+        season_dir.mkdir(parents=True, exist_ok=True)
+        version_dir = season_dir / version_name
+        if not version_dir.exists():
+            self._write_version(season_dir, version_dir, season, frame, fingerprint)
+
+        self._write_pointer(season_dir, version_name)
+        self._remove_stale_versions(season_dir, keep={version_name, current.name if current else None})
+        return True
+
+    # ----------------------------------------------------
+    # LAYOUT HELPERS
+    # ----------------------------------------------------
+    def _season_dir(self, season: int) -> Path:
+        return self.data_dir / f"pitching_stats_{season}"
+
+    def _current_version_dir(self, season: int) -> Optional[Path]:
+        pointer = self._season_dir(season) / "CURRENT"
+        try:
+            version_name = pointer.read_text().strip()
+        except OSError:
+            return None
+        version_dir = pointer.parent / version_name
+        return version_dir if version_dir.is_dir() else None
+
+    def _write_version(self, season_dir: Path, version_dir: Path, season: int, frame: pd.DataFrame, fingerprint: str):
+        # Build in a scratch directory next to the target so the final rename is atomic
+        scratch = Path(tempfile.mkdtemp(prefix=".building-", dir=season_dir))
+        try:
+            columns = []
+            for i, name in enumerate(frame.columns):
+                columns.append(self._write_column(scratch, i, name, frame[name]))
+
+            manifest = {
+                "format_version": self.FORMAT_VERSION,
+                "season": season,
+                "fingerprint": fingerprint,
+                "rows": len(frame),
+                "columns": columns,
+            }
+            (scratch / "manifest.json").write_text(json.dumps(manifest, indent=2))
+            try:
+                os.replace(scratch, version_dir)
+            except OSError:
+                # Another worker published the same version first
+                if not version_dir.is_dir():
+                    raise
+                shutil.rmtree(scratch, ignore_errors=True)
+        except BaseException:
+            shutil.rmtree(scratch, ignore_errors=True)
+            raise
+
+    @staticmethod
+    def _write_pointer(season_dir: Path, version_name: str):
+        fd, tmp_path = tempfile.mkstemp(prefix=".CURRENT-", dir=season_dir)
+        with os.fdopen(fd, "w") as f:
+            f.write(version_name)
+        os.replace(tmp_path, season_dir / "CURRENT")
+
+    @staticmethod
+    def _remove_stale_versions(season_dir: Path, keep: set):
+        # Keep the previous version too, since other workers may still have it memory-mapped.
+        # Dot-directories are builds in progress, possibly by another worker.
+        for child in season_dir.iterdir():
+            if child.is_dir() and not child.name.startswith(".") and child.name not in keep:
+                shutil.rmtree(child, ignore_errors=True)
+
+    # ----------------------------------------------------
+    # COLUMN ENCODING
+    # ----------------------------------------------------
+    @staticmethod
+    def _write_column(directory: Path, i: int, name, series: pd.Series) -> dict:
+        """Write one column as .npy (plus a null mask for text) and return its manifest entry."""
+        if pd.api.types.is_bool_dtype(series) or pd.api.types.is_numeric_dtype(series):
+            if isinstance(series.dtype, np.dtype):
+                values = series.to_numpy()
+            else:
+                # Nullable extension dtypes (Int64, Float64, boolean) become float with NaN
+                values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+            np.save(directory / f"{i:04d}.npy", values, allow_pickle=False)
+            return {"name": name, "kind": "numeric", "dtype": str(series.dtype)}
+
+        # Everything else is stored as fixed-width unicode, which np.load can memory-map
+        nulls = series.isna().to_numpy()
+        text = series.astype(object).where(~nulls, "").astype(str).to_numpy(dtype=str)
+        np.save(directory / f"{i:04d}.npy", text, allow_pickle=False)
+        if nulls.any():
+            np.save(directory / f"{i:04d}.nulls.npy", nulls, allow_pickle=False)
+        return {"name": name, "kind": "text", "has_nulls": bool(nulls.any()), "dtype": str(series.dtype)}
+
+    @staticmethod
+    def _read_column(directory: Path, i: int, col: dict):
+        values = np.load(directory / f"{i:04d}.npy", mmap_mode="r", allow_pickle=False)
+        if col["kind"] == "numeric":
+            return values
+
+        text = pd.Series(values.astype(object))
+        if col.get("has_nulls"):
+            nulls = np.load(directory / f"{i:04d}.nulls.npy", allow_pickle=False)
+            text = text.mask(nulls, None)
+        return text.to_numpy()
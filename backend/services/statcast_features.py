@@ -0,0 +1,386 @@
+import json
+import os
+import tempfile
+import threading
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .season_stats_repository import SeasonStatsSnapshot
+
+
+def statcast_name(name) -> str:
+    """Statcast's "Last, First" player_name as "First Last"."""
+    text = str(name or "").strip()
+    if "," in text:
+        last, first = text.split(",", 1)
+        return f"{first.strip()} {last.strip()}"
+    return text
+
+
+class StatcastAccumulator:
+    """
+    Per-pitcher aggregates of pitch-level Statcast data for one season.
+
+    fold(chunk) adds a batch of pitches (any slice of the season, in date
+    order) with one grouped sum per aggregate; the pitches themselves are
+    not kept. Fastball velocity is also kept per day in a TREND_DAYS ring so
+    the recent average can be compared to the season one.
+
+    features() turns the sums into one row per pitcher (MLBAM id and name)
+    with the FEATURE_COLUMNS. State is saved to / loaded from a small .npz
+    so a daily job only has to fold in the new dates.
+    """
+
+    # Statcast columns read from every chunk
+    COLUMNS = ("game_date", "pitcher", "player_name", "pitch_type", "release_speed",
+               "description", "type", "launch_speed", "launch_speed_angle")
+    SWINGING_STRIKES = ("swinging_strike", "swinging_strike_blocked")
+    FASTBALLS = ("FF", "FA", "SI", "FC")
+    # Pitch mix groups reported as sc_mix_<group>
+    PITCH_GROUPS = {
+        "ff": ("FF", "FA"),
+        "si": ("SI",),
+        "fc": ("FC",),
+        "sl": ("SL", "ST", "SV"),
+        "cu": ("CU", "KC", "CS"),
+        "ch": ("CH", "FS", "FO", "SC"),
+    }
+    # Exit velocity that counts as hard hit
+    HARD_HIT_MPH = 95.0
+    # launch_speed_angle code for a barrel
+    BARREL_CODE = 6
+    TREND_DAYS = 14
+
+    SUMS = ("pitches", "swstr", "bip", "hardhit", "barrels", "fb_pitches", "fb_velo") + tuple(
+        f"mix_{group}" for group in PITCH_GROUPS
+    )
+    FEATURE_COLUMNS = (
+        "sc_pitches", "sc_swstr%", "sc_hardhit%", "sc_barrel%",
+        "sc_fb_velo", f"sc_fb_velo_{TREND_DAYS}d", "sc_fb_velo_trend",
+    ) + tuple(f"sc_mix_{group}" for group in PITCH_GROUPS)
+
+    def __init__(self, season: int):
+        self.season = season
+        self.last_day: Optional[date] = None
+        self.rows_folded = 0
+        self._index: Dict[int, int] = {}
+        self._names: List[str] = []
+        self._sums = np.zeros((0, len(self.SUMS)))
+        # (pitchers, TREND_DAYS, [velo sum, pitches]) and the day (ordinal) each slot holds
+        self._trend = np.zeros((0, self.TREND_DAYS, 2))
+        self._trend_days = np.zeros(self.TREND_DAYS, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    # ----------------------------------------------------
+    # FOLDING
+    # ----------------------------------------------------
+    def fold(self, chunk: pd.DataFrame) -> int:
+        """Add a batch of pitches; returns how many rows were used."""
+        chunk = chunk[pd.to_numeric(chunk["pitcher"], errors="coerce").notna()]
+        if chunk.empty:
+            return 0
+
+        ids = pd.to_numeric(chunk["pitcher"]).to_numpy(dtype=np.int64)
+        unique_ids, inverse = np.unique(ids, return_inverse=True)
+        names = chunk["player_name"].groupby(ids).last() if "player_name" in chunk.columns else None
+        rows = self._rows(unique_ids, names)[inverse]
+
+        pitch_type = chunk["pitch_type"].fillna("").astype(str).to_numpy()
+        description = chunk["description"].fillna("").astype(str).to_numpy()
+        in_play = (chunk["type"].fillna("").astype(str) == "X").to_numpy()
+        launch_speed = pd.to_numeric(chunk["launch_speed"], errors="coerce").to_numpy(dtype=np.float64)
+        launch_code = pd.to_numeric(chunk["launch_speed_angle"], errors="coerce").to_numpy(dtype=np.float64)
+        velo = pd.to_numeric(chunk["release_speed"], errors="coerce").to_numpy(dtype=np.float64)
+        fastball = np.isin(pitch_type, self.FASTBALLS) & ~np.isnan(velo)
+
+        contributions = [
+            np.ones(len(chunk)),
+            np.isin(description, self.SWINGING_STRIKES),
+            in_play,
+            in_play & (launch_speed >= self.HARD_HIT_MPH),
+            in_play & (launch_code == self.BARREL_CODE),
+            fastball,
+            np.where(fastball, velo, 0.0),
+        ] + [np.isin(pitch_type, types) for types in self.PITCH_GROUPS.values()]
+        for j, values in enumerate(contributions):
+            self._sums[:, j] += np.bincount(rows, weights=np.asarray(values, dtype=np.float64), minlength=len(self))
+
+        days = pd.to_datetime(chunk["game_date"]).dt.date.map(date.toordinal).to_numpy(dtype=np.int64)
+        self._fold_trend(rows[fastball], days[fastball], velo[fastball])
+
+        last = date.fromordinal(int(days.max()))
+        self.last_day = last if self.last_day is None else max(self.last_day, last)
+        self.rows_folded += len(chunk)
+        return len(chunk)
+
+    def _fold_trend(self, rows: np.ndarray, days: np.ndarray, velo: np.ndarray):
+        slots = days % self.TREND_DAYS
+        for day in np.unique(days).tolist():
+            slot = day % self.TREND_DAYS
+            if self._trend_days[slot] < day:
+                # The slot held a day that has left the trend window
+                self._trend[:, slot] = 0.0
+                self._trend_days[slot] = day
+        # Days older than what their slot now holds are outside the window
+        current = self._trend_days[slots] == days
+        np.add.at(self._trend, (rows[current], slots[current], 0), velo[current])
+        np.add.at(self._trend, (rows[current], slots[current], 1), 1.0)
+
+    def _rows(self, ids: np.ndarray, names: Optional[pd.Series]) -> np.ndarray:
+        new = [int(i) for i in ids.tolist() if int(i) not in self._index]
+        for i in new:
+            self._index[i] = len(self._names)
+            self._names.append("")
+        if new:
+            self._sums = np.concatenate([self._sums, np.zeros((len(new), len(self.SUMS)))])
+            self._trend = np.concatenate([self._trend, np.zeros((len(new), self.TREND_DAYS, 2))])
+        rows = np.fromiter((self._index[int(i)] for i in ids.tolist()), dtype=np.intp, count=len(ids))
+        if names is not None:
+            for i, name in names.items():
+                if isinstance(name, str) and name:
+                    self._names[self._index[int(i)]] = statcast_name(name)
+        return rows
+
+    # ----------------------------------------------------
+    # OUTPUT
+    # ----------------------------------------------------
+    def features(self) -> pd.DataFrame:
+        """One row per pitcher (by MLBAM id): mlbam, name and FEATURE_COLUMNS (NaN where there is no sample)."""
+        sums = {name: self._sums[:, j] for j, name in enumerate(self.SUMS)}
+        recent = np.zeros((len(self), 2))
+        if self.last_day is not None:
+            window = self._trend_days > self.last_day.toordinal() - self.TREND_DAYS
+            recent = self._trend[:, window].sum(axis=1)
+
+        def ratio(num, den):
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return np.where(den > 0, num / den, np.nan)
+
+        season_velo = ratio(sums["fb_velo"], sums["fb_pitches"])
+        recent_velo = ratio(recent[:, 0], recent[:, 1])
+        columns = {
+            "mlbam": list(self._index),
+            "name": list(self._names),
+            "sc_pitches": sums["pitches"],
+            "sc_swstr%": ratio(sums["swstr"], sums["pitches"]),
+            "sc_hardhit%": ratio(sums["hardhit"], sums["bip"]),
+            "sc_barrel%": ratio(sums["barrels"], sums["bip"]),
+            "sc_fb_velo": season_velo,
+            f"sc_fb_velo_{self.TREND_DAYS}d": recent_velo,
+            "sc_fb_velo_trend": recent_velo - season_velo,
+        }
+        for group in self.PITCH_GROUPS:
+            columns[f"sc_mix_{group}"] = ratio(sums[f"mix_{group}"], sums["pitches"])
+        return pd.DataFrame(columns).sort_values("mlbam", ignore_index=True)
+
+    def save(self, path: str):
+        """Write the accumulator state atomically."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        meta = {
+            "season": self.season,
+            "last_day": self.last_day.isoformat() if self.last_day else None,
+            "rows_folded": self.rows_folded,
+            "sums": list(self.SUMS),
+        }
+        fd, tmp_path = tempfile.mkstemp(prefix=".statcast-", suffix=".npz", dir=path.parent)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez_compressed(
+                    f,
+                    meta=np.array(json.dumps(meta)),
+                    ids=np.array(list(self._index), dtype=np.int64),
+                    names=np.array(self._names, dtype=str),
+                    sums=self._sums,
+                    trend=self._trend,
+                    trend_days=self._trend_days,
+                )
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    @classmethod
+    def load(cls, path: str) -> Optional["StatcastAccumulator"]:
+        """Accumulator saved by save(), or None if the file is missing or from another layout."""
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                meta = json.loads(str(data["meta"]))
+                if meta["sums"] != list(cls.SUMS):
+                    return None
+                accumulator = cls(meta["season"])
+                accumulator._index = {int(i): n for n, i in enumerate(data["ids"].tolist())}
+                accumulator._names = data["names"].tolist()
+                accumulator._sums = data["sums"]
+                accumulator._trend = data["trend"]
+                accumulator._trend_days = data["trend_days"]
+        except (OSError, KeyError, ValueError):
+            return None
+        accumulator.last_day = date.fromisoformat(meta["last_day"]) if meta["last_day"] else None
+        accumulator.rows_folded = meta["rows_folded"]
+        return accumulator
+
+
+class StatcastIngester:
+    """
+    Streams pitch-level Statcast data into a StatcastAccumulator, one bounded
+    chunk at a time: date windows of chunk_days from pybaseball's statcast(),
+    or chunk_rows rows from a local CSV / Parquet export. Only the columns the
+    accumulator reads are kept, and each chunk is dropped once it is folded,
+    so memory stays at one chunk however long the season is.
+    """
+
+    def __init__(self, fetch: Optional[Callable[..., pd.DataFrame]] = None, chunk_days: int = 7,
+                 chunk_rows: int = 100_000):
+        """
+        fetch: (start_dt, end_dt) -> pitch frame (defaults to pybaseball.statcast)
+        chunk_days: days per fetch
+        chunk_rows: rows per chunk when reading a file
+        """
+        if chunk_days < 1 or chunk_rows < 1:
+            raise ValueError("chunk_days and chunk_rows must be positive")
+        self.fetch = fetch
+        self.chunk_days = chunk_days
+        self.chunk_rows = chunk_rows
+
+    def fetch_chunks(self, start: date, end: date) -> Iterator[pd.DataFrame]:
+        """Pitches from start to end (inclusive), chunk_days at a time."""
+        fetch = self.fetch
+        if fetch is None:
+            from pybaseball import statcast
+            fetch = statcast
+        day = start
+        while day <= end:
+            stop = min(day + timedelta(days=self.chunk_days - 1), end)
+            frame = fetch(day.isoformat(), stop.isoformat())
+            if frame is not None and len(frame):
+                yield self._columns(frame)
+            day = stop + timedelta(days=1)
+
+    def file_chunks(self, path: str) -> Iterator[pd.DataFrame]:
+        """Pitches from a CSV or Parquet export, chunk_rows at a time."""
+        wanted = set(StatcastAccumulator.COLUMNS)
+        if str(path).endswith(".parquet"):
+            try:
+                import pyarrow.parquet as pq
+            except ImportError:
+                raise RuntimeError("Reading Parquet needs pyarrow installed") from None
+            parquet = pq.ParquetFile(path)
+            columns = [c for c in parquet.schema_arrow.names if c in wanted]
+            for batch in parquet.iter_batches(batch_size=self.chunk_rows, columns=columns):
+                yield self._columns(batch.to_pandas())
+        else:
+            for chunk in pd.read_csv(path, usecols=lambda c: c in wanted, chunksize=self.chunk_rows):
+                yield self._columns(chunk)
+
+    @staticmethod
+    def ingest(chunks: Iterable[pd.DataFrame], accumulator: StatcastAccumulator) -> int:
+        """Fold every chunk into the accumulator; returns the number of pitches folded."""
+        return sum(accumulator.fold(chunk) for chunk in chunks)
+
+    @staticmethod
+    def _columns(frame: pd.DataFrame) -> pd.DataFrame:
+        missing = [c for c in ("game_date", "pitcher") if c not in frame.columns]
+        if missing:
+            raise ValueError(f"Statcast data is missing columns: {', '.join(missing)}")
+        return frame.reindex(columns=list(StatcastAccumulator.COLUMNS))
+
+
+class StatcastFeatures:
+    """
+    Published Statcast features, read next to a stats snapshot.
+
+    for_snapshot() returns a frame with one row per snapshot row (same
+    order) and the FEATURE_COLUMNS, matched by name since Statcast and
+    FanGraphs use different player ids; unmatched pitchers get NaN. It is
+    built once per snapshot and revision of the features.
+
+    Published on a SeasonStatsRepository (publish_columns), the columns are
+    available on every snapshot through snapshot.column(). Features watched
+    from a file pick up a new ingest run on reload().
+    """
+
+    def __init__(self, features: Optional[pd.DataFrame] = None, version: str = "", path: Optional[str] = None):
+        """
+        features: StatcastAccumulator.features() (empty if omitted)
+        version: identifies this set of features (e.g. the last day folded)
+        path: file written by scripts/ingest_statcast.py that reload() re-reads
+        """
+        if features is None:
+            features = pd.DataFrame(columns=["mlbam", "name", *StatcastAccumulator.FEATURE_COLUMNS])
+        self.features = features
+        self.version = version
+        self.path = path
+        # Bumped whenever new features are loaded; part of every cache key built from them
+        self.revision = 1
+        self._stamp = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: str) -> Optional["StatcastFeatures"]:
+        """Features from path, or None if there is no readable file there."""
+        features = cls(path=path)
+        return features if features.reload() else None
+
+    @classmethod
+    def watch(cls, path: str) -> "StatcastFeatures":
+        """Features from path, empty until the file exists; reload() picks up later runs."""
+        features = cls(path=path)
+        features.reload()
+        return features
+
+    def reload(self) -> bool:
+        """Re-read path if the file changed since it was last read; True if new features were loaded."""
+        if self.path is None:
+            return False
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return False
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp == self._stamp:
+            return False
+
+        accumulator = StatcastAccumulator.load(self.path)
+        if accumulator is None:
+            return False
+        features = accumulator.features()
+        with self._lock:
+            self.features = features
+            self.version = accumulator.last_day.isoformat() if accumulator.last_day else ""
+            self.revision += 1
+            self._stamp = stamp
+        return True
+
+    def for_snapshot(self, snapshot: SeasonStatsSnapshot) -> pd.DataFrame:
+        with self._lock:
+            features, revision = self.features, self.revision
+        return snapshot.derived_latest(
+            f"statcast_features.{id(self)}", revision, lambda s: self._align(s, features)
+        )
+
+    @staticmethod
+    def _align(snapshot: SeasonStatsSnapshot, features: pd.DataFrame) -> pd.DataFrame:
+        positions = np.full(len(snapshot), -1, dtype=np.intp)
+        # Most pitches first, so a shared name resolves to the regular
+        order = np.argsort(-features["sc_pitches"].to_numpy(dtype=np.float64), kind="stable")
+        names = features["name"].tolist()
+        for i in order.tolist():
+            pos = snapshot.index.find(name=names[i])
+            if pos is not None and positions[pos] < 0:
+                positions[pos] = i
+
+        values = features[list(StatcastAccumulator.FEATURE_COLUMNS)].to_numpy(dtype=np.float64)
+        aligned = np.full((len(snapshot), values.shape[1]), np.nan)
+        found = positions >= 0
+        aligned[found] = values[positions[found]]
+        return pd.DataFrame(aligned, columns=list(StatcastAccumulator.FEATURE_COLUMNS))
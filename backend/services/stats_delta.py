@@ -0,0 +1,94 @@
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Optional
+
+import numpy as np
+import pandas as pd
+
+from .pitcher_index import normalize_idfg
+
+
+@dataclass(frozen=True)
+class StatsChangeSet:
+    """
+    Pitchers (by normalized IDfg) whose stat line differs between two
+    versions of a season. full=True means the frames could not be compared
+    row by row (no idfg column, or the column set changed), so every pitcher
+    must be treated as changed.
+    """
+    season: int
+    added: FrozenSet[str] = frozenset()
+    changed: FrozenSet[str] = frozenset()
+    removed: FrozenSet[str] = frozenset()
+    full: bool = False
+
+    @property
+    def affected(self) -> FrozenSet[str]:
+        return self.added | self.changed | self.removed
+
+    def __len__(self) -> int:
+        return len(self.affected)
+
+    def __bool__(self) -> bool:
+        return self.full or bool(self.affected)
+
+    def merged(self, other: "StatsChangeSet") -> "StatsChangeSet":
+        """Pitchers affected by either change set (e.g. two refreshes in a row)."""
+        return StatsChangeSet(
+            self.season,
+            added=self.added | other.added,
+            changed=self.changed | other.changed,
+            removed=self.removed | other.removed,
+            full=self.full or other.full,
+        )
+
+    def summary(self) -> dict:
+        return {
+            "season": self.season,
+            "added": len(self.added),
+            "changed": len(self.changed),
+            "removed": len(self.removed),
+            "full": self.full,
+        }
+
+
+def row_hashes(frame: pd.DataFrame) -> Dict[str, int]:
+    """
+    {normalized idfg: signed 64-bit hash of the row}, hashed over the columns
+    in sorted order so column order does not matter. Rows without an IDfg
+    are left out; if an IDfg repeats, the first row wins.
+    """
+    if "idfg" not in frame.columns or frame.empty:
+        return {}
+    columns = sorted(frame.columns, key=str)
+    hashes = pd.util.hash_pandas_object(frame[columns], index=False).to_numpy(dtype=np.uint64).view(np.int64)
+    result: Dict[str, int] = {}
+    for idfg, value in zip(frame["idfg"].tolist(), hashes.tolist()):
+        key = normalize_idfg(idfg)
+        if key is not None:
+            result.setdefault(key, value)
+    return result
+
+
+def diff_hashes(season: int, old: Dict[str, int], new: Dict[str, int]) -> StatsChangeSet:
+    return StatsChangeSet(
+        season=season,
+        added=frozenset(new.keys() - old.keys()),
+        changed=frozenset(k for k in new.keys() & old.keys() if new[k] != old[k]),
+        removed=frozenset(old.keys() - new.keys()),
+    )
+
+
+def diff_frames(season: int, old: Optional[pd.DataFrame], new: pd.DataFrame) -> StatsChangeSet:
+    """Change set turning old into new (everything is "added" when there is no old frame)."""
+    new_hashes = row_hashes(new)
+    if old is None:
+        return StatsChangeSet(season, added=frozenset(new_hashes), full="idfg" not in new.columns)
+    old_hashes = row_hashes(old)
+    if "idfg" not in new.columns or "idfg" not in old.columns or set(old.columns) != set(new.columns):
+        return StatsChangeSet(
+            season,
+            changed=frozenset(new_hashes),
+            removed=frozenset(old_hashes.keys() - new_hashes.keys()),
+            full=True,
+        )
+    return diff_hashes(season, old_hashes, new_hashes)
@@ -0,0 +1,377 @@
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .pitcher_index import normalize_idfg
+from .season_stats_repository import CURRENT_SEASON, SeasonStatsRepository, SeasonStatsSnapshot
+from .stats_delta import StatsChangeSet, diff_frames
+
+
+class StatsHistoryUnavailable(LookupError):
+    """Raised when no stats were recorded on or before a requested as-of date."""
+
+
+def parse_as_of(value) -> Optional[date]:
+    """Parse an as_of request value (YYYY-MM-DD); empty means "live". Raises ValueError otherwise."""
+    if value is None or str(value).strip() == "":
+        return None
+    try:
+        return date.fromisoformat(str(value).strip())
+    except ValueError:
+        raise ValueError("as_of must be a date in YYYY-MM-DD format") from None
+
+
+def resolve_snapshot(
+    repository: SeasonStatsRepository,
+    history: Optional["SeasonStatsHistory"],
+    as_of: Optional[date],
+    season: int = CURRENT_SEASON,
+) -> SeasonStatsSnapshot:
+    """
+    Snapshot a request should use: the live one when as_of is empty, today or
+    later, otherwise the season as it stood at the end of as_of.
+    Raises StatsHistoryUnavailable when there is nothing recorded that early.
+    """
+    if as_of is None or as_of >= date.today():
+        return repository.get(season)
+    snapshot = history.snapshot(season, as_of) if history is not None else None
+    if snapshot is None:
+        raise StatsHistoryUnavailable(f"No {season} stats recorded on or before {as_of.isoformat()}")
+    return snapshot
+
+
+@dataclass(frozen=True)
+class _ChunkFile:
+    day: date
+    keyframe: bool
+    path: Path
+
+
+class SeasonStatsHistory:
+    """
+    Day-by-day history of season stats, for answering "as of" questions
+    without keeping a full copy of the season per day.
+
+    Every recorded day is one compressed .npz chunk:
+
+        <data_dir>/stats_history_2025/
+            2025-04-01.key.npz       full frame (keyframe)
+            2025-04-02.delta.npz     only the pitchers that changed that day
+            ...
+
+    A delta chunk holds, for the added/changed pitchers only, the change in
+    every integer (counting) column as int32 plus the new values of the
+    float and text columns, and the IDfgs of pitchers that dropped out.
+    A keyframe is written on the first day, whenever the column set changes
+    and every keyframe_interval_days, which bounds how many deltas an as-of
+    lookup has to replay.
+
+    snapshot(season, as_of) replays the latest keyframe on or before as_of
+    and the deltas after it with vectorized adds/assignments, and keeps the
+    most recent results in a small LRU. Only pitchers with an IDfg are kept.
+    """
+
+    # Bump when the chunk layout changes; chunks with another version are ignored
+    FORMAT_VERSION = 1
+    KEYFRAME_SUFFIX = ".key.npz"
+    DELTA_SUFFIX = ".delta.npz"
+
+    def __init__(
+        self,
+        data_dir: str,
+        repository: SeasonStatsRepository,
+        keyframe_interval_days: int = 28,
+        max_snapshots: int = 8,
+    ):
+        """
+        data_dir: directory the per-season history directories live in
+        repository: live stats repository (historical snapshots take their stats_version from it)
+        keyframe_interval_days: write a full frame at least this often
+        max_snapshots: materialized as-of snapshots kept in memory
+        """
+        if keyframe_interval_days < 1 or max_snapshots < 1:
+            raise ValueError("keyframe_interval_days and max_snapshots must be positive")
+        self.data_dir = Path(data_dir)
+        self.repository = repository
+        self.keyframe_interval_days = keyframe_interval_days
+        self.max_snapshots = max_snapshots
+        self._lock = threading.RLock()
+        self._snapshots: "OrderedDict[tuple, SeasonStatsSnapshot]" = OrderedDict()
+
+    # ----------------------------------------------------
+    # PUBLIC API
+    # ----------------------------------------------------
+    def days(self, season: int) -> List[date]:
+        """Recorded days of a season, oldest first."""
+        return [f.day for f in self._files(season)]
+
+    def record(self, season: int, day: date, frame: pd.DataFrame) -> StatsChangeSet:
+        """
+        Record a season's stats as they stand at the end of day, replacing
+        anything already recorded for that day. Returns the change against
+        the previous recorded day; nothing is written when it is empty.
+        Days must be recorded in order.
+        """
+        frame = self._keyed(frame)
+        schema = self._schema(frame)
+        with self._lock:
+            files = self._files(season)
+            if files and files[-1].day > day:
+                raise ValueError(f"Season {season} already has history after {day.isoformat()}")
+
+            prior = [f for f in files if f.day < day]
+            replayed = self._replay(prior)
+            previous, previous_schema, keyframe_day = replayed if replayed is not None else (None, None, None)
+            changes = diff_frames(season, previous, frame)
+
+            write_keyframe = (
+                previous is None
+                or changes.full
+                or previous_schema != schema
+                or (day - keyframe_day).days >= self.keyframe_interval_days
+            )
+
+            self._remove_day(season, day)
+            if write_keyframe:
+                self._write_chunk(season, day, schema, True, self._encode(frame, schema))
+            elif changes:
+                self._write_chunk(season, day, schema, False, self._encode_delta(frame, previous, schema, changes))
+
+            # Anything materialized from this season may have been built on the replaced day
+            for key in [k for k in self._snapshots if k[0] == season]:
+                del self._snapshots[key]
+        return changes
+
+    def frame_as_of(self, season: int, as_of: date) -> Optional[pd.DataFrame]:
+        """The season's stats frame at the end of as_of, or None if nothing was recorded by then."""
+        replayed = self._replay([f for f in self._files(season) if f.day <= as_of])
+        return replayed[0] if replayed is not None else None
+
+    def snapshot(self, season: int, as_of: date) -> Optional[SeasonStatsSnapshot]:
+        """SeasonStatsSnapshot of the season at the end of as_of, or None if nothing was recorded by then."""
+        with self._lock:
+            files = self._from_keyframe([f for f in self._files(season) if f.day <= as_of])
+            if not files:
+                return None
+            # Every as_of between two recorded days shares one snapshot
+            key = (season, tuple(f.path.name for f in files))
+            snapshot = self._snapshots.get(key)
+            if snapshot is not None:
+                self._snapshots.move_to_end(key)
+                return snapshot
+
+            frame, _, _ = self._replay(files)
+            stats_version = self.repository.next_version()
+            snapshot = SeasonStatsSnapshot(
+                season=season, frame=frame, stats_version=stats_version, base_version=stats_version,
+                column_sources=self.repository.column_sources,
+            )
+            snapshot.index
+            self._snapshots[key] = snapshot
+            while len(self._snapshots) > self.max_snapshots:
+                self._snapshots.popitem(last=False)
+            return snapshot
+
+    # ----------------------------------------------------
+    # LAYOUT HELPERS
+    # ----------------------------------------------------
+    def _season_dir(self, season: int) -> Path:
+        return self.data_dir / f"stats_history_{season}"
+
+    def _files(self, season: int) -> List[_ChunkFile]:
+        season_dir = self._season_dir(season)
+        if not season_dir.is_dir():
+            return []
+        files = []
+        for path in season_dir.iterdir():
+            for suffix, keyframe in ((self.KEYFRAME_SUFFIX, True), (self.DELTA_SUFFIX, False)):
+                if path.name.endswith(suffix) and not path.name.startswith("."):
+                    try:
+                        files.append(_ChunkFile(date.fromisoformat(path.name[: -len(suffix)]), keyframe, path))
+                    except ValueError:
+                        pass
+        return sorted(files, key=lambda f: f.day)
+
+    @staticmethod
+    def _from_keyframe(files: List[_ChunkFile]) -> List[_ChunkFile]:
+        """The latest keyframe in files and the deltas after it ([] without a keyframe)."""
+        for i in range(len(files) - 1, -1, -1):
+            if files[i].keyframe:
+                return files[i:]
+        return []
+
+    def _remove_day(self, season: int, day: date):
+        for suffix in (self.KEYFRAME_SUFFIX, self.DELTA_SUFFIX):
+            try:
+                (self._season_dir(season) / f"{day.isoformat()}{suffix}").unlink()
+            except FileNotFoundError:
+                pass
+
+    def _write_chunk(self, season: int, day: date, schema: dict, keyframe: bool, arrays: Dict[str, np.ndarray]):
+        season_dir = self._season_dir(season)
+        season_dir.mkdir(parents=True, exist_ok=True)
+        manifest = {"format_version": self.FORMAT_VERSION, "season": season, "day": day.isoformat(), "schema": schema}
+        suffix = self.KEYFRAME_SUFFIX if keyframe else self.DELTA_SUFFIX
+
+        # Write next to the target so the final rename is atomic
+        fd, tmp_path = tempfile.mkstemp(prefix=".chunk-", suffix=".npz", dir=season_dir)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez_compressed(f, manifest=np.array(json.dumps(manifest)), **arrays)
+            os.replace(tmp_path, season_dir / f"{day.isoformat()}{suffix}")
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    # ----------------------------------------------------
+    # ENCODING
+    # ----------------------------------------------------
+    @staticmethod
+    def _keyed(frame: pd.DataFrame) -> pd.DataFrame:
+        """Rows with a usable IDfg, first occurrence of each."""
+        if "idfg" not in frame.columns:
+            raise ValueError("Stats history needs an idfg column")
+        keys = frame["idfg"].map(normalize_idfg)
+        keep = keys.notna() & ~keys.duplicated()
+        return frame[keep.to_numpy()].reset_index(drop=True)
+
+    @staticmethod
+    def _schema(frame: pd.DataFrame) -> dict:
+        """Column order and how each column is encoded (counting / values / text) with its dtype."""
+        counting, values, text = [], [], []
+        for name in frame.columns:
+            if name == "idfg":
+                continue
+            series = frame[name]
+            if pd.api.types.is_integer_dtype(series) and isinstance(series.dtype, np.dtype):
+                counting.append(name)
+            elif pd.api.types.is_bool_dtype(series) or pd.api.types.is_numeric_dtype(series):
+                values.append(name)
+            else:
+                text.append(name)
+        idfg = frame["idfg"]
+        return {
+            "columns": [str(c) for c in frame.columns],
+            "counting": counting,
+            "values": values,
+            "text": text,
+            "dtypes": {name: str(frame[name].dtype) for name in counting + values},
+            "idfg_dtype": str(idfg.dtype) if pd.api.types.is_numeric_dtype(idfg) else None,
+        }
+
+    @staticmethod
+    def _encode(rows: pd.DataFrame, schema: dict, counting: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """Chunk arrays for rows; counting overrides the counting column values (used for deltas)."""
+        if counting is None:
+            counting = rows[schema["counting"]].to_numpy(dtype=np.int64).reshape(len(rows), -1)
+        # int32 keeps chunks small; fall back to int64 for anything that doesn't fit
+        if counting.size == 0 or np.abs(counting).max() < 2 ** 31:
+            counting = counting.astype(np.int32)
+
+        text = rows[schema["text"]]
+        nulls = text.isna().to_numpy(dtype=bool).reshape(len(rows), -1)
+        text = text.astype(object).where(~nulls, "").to_numpy(dtype=str).reshape(len(rows), -1)
+        return {
+            "idfg": np.array([normalize_idfg(i) for i in rows["idfg"].tolist()], dtype=str),
+            "counting": counting,
+            "values": rows[schema["values"]].to_numpy(dtype=np.float64).reshape(len(rows), -1),
+            "text": text,
+            "text_nulls": nulls,
+            "removed": np.array([], dtype=str),
+        }
+
+    def _encode_delta(self, frame: pd.DataFrame, previous: pd.DataFrame, schema: dict, changes: StatsChangeSet):
+        keys = frame["idfg"].map(normalize_idfg)
+        rows = frame[keys.isin(changes.added | changes.changed).to_numpy()]
+
+        # Counting columns are stored as the change since the previous day; pitchers
+        # missing from the previous day (new or coming back) are stored as absolute counts
+        counting = rows[schema["counting"]].to_numpy(dtype=np.int64, copy=True).reshape(len(rows), -1)
+        previous_pos = {k: i for i, k in enumerate(previous["idfg"].map(normalize_idfg).tolist())}
+        previous_counting = previous[schema["counting"]].to_numpy(dtype=np.int64).reshape(len(previous), -1)
+        changed = [(i, previous_pos[k]) for i, k in enumerate(rows["idfg"].map(normalize_idfg).tolist()) if k in previous_pos]
+        if changed:
+            at, prev_at = map(list, zip(*changed))
+            counting[at] -= previous_counting[prev_at]
+
+        arrays = self._encode(rows, schema, counting)
+        arrays["removed"] = np.array(sorted(changes.removed), dtype=str)
+        return arrays
+
+    # ----------------------------------------------------
+    # REPLAY
+    # ----------------------------------------------------
+    def _load_chunk(self, chunk: _ChunkFile) -> Tuple[dict, Dict[str, np.ndarray]]:
+        with np.load(chunk.path, allow_pickle=False) as data:
+            arrays = {name: data[name] for name in data.files}
+        manifest = json.loads(str(arrays.pop("manifest")))
+        if manifest.get("format_version") != self.FORMAT_VERSION:
+            raise ValueError(f"Unsupported stats history chunk {chunk.path}")
+        return manifest, arrays
+
+    def _replay(self, files: List[_ChunkFile]) -> Optional[Tuple[pd.DataFrame, dict, date]]:
+        """(frame, schema, keyframe day) after applying files from their latest keyframe, or None."""
+        files = self._from_keyframe(files)
+        if not files:
+            return None
+        loaded = [self._load_chunk(f) for f in files]
+        schema = loaded[0][0]["schema"]
+        chunks = [arrays for _, arrays in loaded]
+
+        # One row per pitcher ever seen since the keyframe, in order of first appearance
+        ids: List[str] = []
+        index: Dict[str, int] = {}
+        for chunk in chunks:
+            for idfg in chunk["idfg"].tolist():
+                if idfg not in index:
+                    index[idfg] = len(ids)
+                    ids.append(idfg)
+
+        n = len(ids)
+        counting = np.zeros((n, len(schema["counting"])), dtype=np.int64)
+        values = np.full((n, len(schema["values"])), np.nan)
+        text = np.full((n, len(schema["text"])), None, dtype=object)
+        present = np.zeros(n, dtype=bool)
+
+        for chunk in chunks:
+            pos = np.fromiter((index[i] for i in chunk["idfg"].tolist()), dtype=np.intp, count=len(chunk["idfg"]))
+            # A keyframe holds absolute counts (and starts from zeros), a delta the change
+            counting[pos] += chunk["counting"]
+            values[pos] = chunk["values"]
+            chunk_text = chunk["text"].astype(object)
+            chunk_text[chunk["text_nulls"]] = None
+            text[pos] = chunk_text
+            present[pos] = True
+            removed = [index[i] for i in chunk["removed"].tolist() if i in index]
+            present[removed] = False
+            # A pitcher who comes back later is stored as absolute counts, so start them over
+            counting[removed] = 0
+            values[removed] = np.nan
+            text[removed] = None
+
+        keep = np.flatnonzero(present)
+        data = {}
+        for name in schema["columns"]:
+            if name == "idfg":
+                column = pd.Series(np.array(ids, dtype=object)[keep])
+                data[name] = column.astype(schema["idfg_dtype"]) if schema["idfg_dtype"] else column
+            elif name in schema["dtypes"] and name in schema["counting"]:
+                data[name] = counting[keep, schema["counting"].index(name)].astype(schema["dtypes"][name])
+            elif name in schema["dtypes"]:
+                data[name] = values[keep, schema["values"].index(name)].astype(schema["dtypes"][name])
+            else:
+                data[name] = text[keep, schema["text"].index(name)]
+        frame = pd.DataFrame(data, columns=schema["columns"])
+        return frame, schema, files[0].day
@@ -0,0 +1,173 @@
+import threading
+from datetime import date
+from typing import Dict, Iterable, Optional, Set
+
+from .season_stats_repository import SeasonStatsRepository, CURRENT_SEASON
+from .player_regrader import PlayerRegrader
+from .stats_history import SeasonStatsHistory
+from .rolling_form import RollingFormTracker
+from .statcast_features import StatcastFeatures
+from .stats_delta import StatsChangeSet
+from ..database.data_access_interface import PitcherStatsDataAccessInterface
+
+
+class StatsRefresher:
+    """
+    Background thread that periodically re-fetches season stats.
+
+    Each tick calls SeasonStatsRepository.refresh() for every configured season.
+    Requests never wait on it: they keep reading the live snapshot until a new,
+    validated one is swapped in, and a failed refresh leaves the last good
+    snapshot in place until the next tick.
+
+    Each swap carries the set of pitchers whose line changed. With
+    pitcher_stats set, only those rows are rewritten in pitcher_season_stats;
+    with a regrader, only players linked to those pitchers are re-graded.
+    Cached results are keyed by per-pitcher versions, so they expire for the
+    affected rosters alone. Both steps run after the swap: if one fails, the
+    new snapshot stays live and the step is retried on every later tick
+    (against the then-live snapshot) until it succeeds.
+
+    With a history attached, every successful tick records the live frame
+    as today's entry, so as-of requests can go back to any refreshed day.
+    A form tracker is fed the same frame for its season (a tracker that isn't
+    ready is first warmed up from the history when the thread starts), and watched
+    Statcast features are re-read when scripts/ingest_statcast.py has
+    written a new file.
+    """
+
+    def __init__(
+        self,
+        repository: SeasonStatsRepository,
+        interval_seconds: float,
+        seasons: Iterable[int] = (CURRENT_SEASON,),
+        pitcher_stats: Optional[PitcherStatsDataAccessInterface] = None,
+        regrader: Optional[PlayerRegrader] = None,
+        history: Optional[SeasonStatsHistory] = None,
+        form_tracker: Optional[RollingFormTracker] = None,
+        statcast_features: Optional[StatcastFeatures] = None,
+    ):
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds must be positive")
+
+        self.repository = repository
+        self.interval_seconds = interval_seconds
+        self.seasons = tuple(seasons)
+        self.pitcher_stats = pitcher_stats
+        self.regrader = regrader
+        self.history = history
+        self.form_tracker = form_tracker
+        self.statcast_features = statcast_features
+        # Seasons whose pitcher_season_stats write, or re-grade, hasn't succeeded yet
+        self._pending_sync: Set[int] = set()
+        self._pending_regrade: Dict[int, StatsChangeSet] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start the refresher thread (no-op if it is already running)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="stats-refresher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """Ask the thread to exit and wait for it."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def run_once(self) -> dict:
+        """Refresh every season once; returns {season: True/False/error message}."""
+        results = {}
+        for season in self.seasons:
+            try:
+                swapped = self.repository.refresh(season)
+                results[season] = swapped
+            except Exception as e:
+                swapped = False
+                results[season] = str(e)
+                print(f"[StatsRefresher] Refresh of season {season} failed, keeping last good snapshot: {e}")
+
+            snapshot = self.repository.peek(season)
+            if swapped:
+                changes = snapshot.changes
+                print(
+                    f"[StatsRefresher] Season {season} refreshed to stats_version {snapshot.stats_version} "
+                    f"({changes.summary() if changes is not None else 'initial load'})"
+                )
+                if self.pitcher_stats is not None:
+                    self._pending_sync.add(season)
+                if self.regrader is not None and changes:
+                    pending = self._pending_regrade.get(season)
+                    self._pending_regrade[season] = changes if pending is None else pending.merged(changes)
+            # Retried even when this tick's fetch failed: the live snapshot is what they need
+            if snapshot is not None:
+                self._sync(season, snapshot)
+                self._regrade(season, snapshot)
+            if not isinstance(results[season], str):
+                self._track(season)
+        if self.statcast_features is not None:
+            try:
+                if self.statcast_features.reload():
+                    print(f"[StatsRefresher] Loaded Statcast features through {self.statcast_features.version}")
+            except Exception as e:
+                print(f"[StatsRefresher] Reloading Statcast features failed, keeping the loaded ones: {e}")
+        return results
+
+    def _sync(self, season: int, snapshot):
+        """Write the live snapshot to pitcher_season_stats if a swap hasn't been stored yet."""
+        if season not in self._pending_sync:
+            return
+        try:
+            stored = self.pitcher_stats.upsert_season(season, snapshot.frame)
+        except Exception as e:
+            print(f"[StatsRefresher] Storing season {season} in pitcher_season_stats failed, retrying next tick: {e}")
+            return
+        self._pending_sync.discard(season)
+        print(f"[StatsRefresher] Stored season {season} in pitcher_season_stats ({len(stored)} rows changed)")
+
+    def _regrade(self, season: int, snapshot):
+        """Re-grade players affected by swaps whose re-grade hasn't succeeded yet."""
+        changes = self._pending_regrade.get(season)
+        if changes is None:
+            return
+        try:
+            regraded = self.regrader.regrade(snapshot, changes)
+        except Exception as e:
+            print(f"[StatsRefresher] Re-grading season {season} players failed, retrying next tick: {e}")
+            return
+        del self._pending_regrade[season]
+        print(f"[StatsRefresher] Re-graded {regraded} rostered players")
+
+    def _track(self, season: int):
+        """Feed the live snapshot to the history and form tracker; their failures don't touch the snapshot."""
+        if self.history is not None:
+            try:
+                recorded = self.history.record(season, date.today(), self.repository.get(season).frame)
+                if recorded:
+                    print(f"[StatsRefresher] Recorded season {season} history ({recorded.summary()})")
+            except Exception as e:
+                print(f"[StatsRefresher] Recording season {season} history failed: {e}")
+        if self.form_tracker is not None and self.form_tracker.season == season:
+            try:
+                self.form_tracker.update(date.today(), self.repository.get(season).frame)
+            except Exception as e:
+                print(f"[StatsRefresher] Updating season {season} rolling form failed: {e}")
+
+    def _run(self):
+        self._warm_up()
+        while not self._stop.wait(self.interval_seconds):
+            self.run_once()
+
+    def _warm_up(self):
+        """Fill a form tracker that isn't ready yet from the history, off the startup path."""
+        if self.form_tracker is None or self.form_tracker.ready or self.history is None:
+            return
+        try:
+            self.form_tracker.warm_up(self.history, date.today())
+            print(f"[StatsRefresher] Rolling form warmed up through {self.form_tracker.day}")
+        except Exception as e:
+            print(f"[StatsRefresher] Warming up rolling form failed, building it from live updates: {e}")
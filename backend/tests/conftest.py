@@ -1,4 +1,5 @@
 import types
+import numpy as np
 import pandas as pd
 import pytest
 from flask import Flask
@@ -82,44 +83,45 @@ def mock_team_data_access():
     return MockTeamDA()
 
 @pytest.fixture
-def app_with_opponent_blueprint(monkeypatch, mock_team_data_access, mock_stats_df):
-    from backend.controller.opponent_controller import OpponentController
+def stats_repository(mock_stats_df):
+    from backend.services.season_stats_repository import SeasonStatsRepository
+
+    # Repository whose loader returns our dataframe instead of calling pybaseball
+    return SeasonStatsRepository(loader=lambda season: mock_stats_df.copy())
 
-    # Monkeypatch pybaseball.pitching_stats to return our dataframe
-    def fake_pitching_stats(year):
-        df = mock_stats_df.copy()
-        # The controller lowercases columns; emulate original names already as needed
-        return df
-    monkeypatch.setattr("backend.controller.opponent_controller.pitching_stats", fake_pitching_stats)
+@pytest.fixture
+def app_with_opponent_blueprint(monkeypatch, mock_team_data_access, stats_repository):
+    from backend.controller.opponent_controller import OpponentController
 
     # Monkeypatch PitcherRecommenderService to produce deterministic output
-    def fake_recommend(pitchers, n, profile):
-        # Create a small DataFrame consistent with controller expectations
+    def fake_recommend_lineup(roster, snapshot, n, profile, normalization):
+        # Create a small lineup consistent with controller expectations
         return (
-            pd.DataFrame([
-                {"rank": 1, "name": pitchers[0]["name"], "score": 92.345},
-                {"rank": 2, "name": pitchers[1]["name"], "score": 84.123},
-            ]),
-            f"Profile {profile}: Selected top {n} pitchers to counter weaknesses."
+            [
+                {"rank": 1, "name": roster.names[0], "team": roster.teams[0], "score": 92.345},
+                {"rank": 2, "name": roster.names[1], "team": roster.teams[1], "score": 84.123},
+            ],
+            f"Profile {profile.name}: Selected top {n} pitchers to counter weaknesses."
         )
     monkeypatch.setattr(
-        "backend.controller.opponent_controller.PitcherRecommenderService.recommend_starting_pitchers",
-        staticmethod(fake_recommend),
+        "backend.controller.opponent_controller.PitcherRecommenderService.recommend_lineup",
+        staticmethod(fake_recommend_lineup),
     )
 
     # Also stabilize PitcherGradingService to avoid flakiness in weaknesses tests
-    class FakeGradingService:
-        @staticmethod
-        def calculate_pitcher_grade(stats):
-            # Simple grade based on K and ERA
-            return max(0.0, min(100.0, (stats.get("K%", 0) * 100) - (stats.get("ERA", 0) - 3.5) * 10))
+    from backend.services.pitcher_grading_service import LeagueGrades, PitcherGradingService
+    from backend.services.roster_enricher import RosterEnricher
 
+    class FakeGradingService(PitcherGradingService):
         @staticmethod
-        def analyze_pitcher(stats, grade):
-            return f"Grade {grade:.1f} analysis based on stats."
+        def league_grades(snapshot):
+            # Simple grade based on K and ERA
+            grading = RosterEnricher.grading_matrix(snapshot)
+            grades = np.clip(grading[:, 0] * 100 - (grading[:, 2] - 3.5) * 10, 0.0, 100.0)
+            return LeagueGrades(grades=grades, tiers=PitcherGradingService.tier_codes(grades), grading=grading)
     monkeypatch.setattr("backend.controller.opponent_controller.PitcherGradingService", FakeGradingService)
 
-    controller = OpponentController(team_data_access=mock_team_data_access)
+    controller = OpponentController(team_data_access=mock_team_data_access, stats_repository=stats_repository)
     app = Flask(__name__)
     app.register_blueprint(controller.bp)
     app.testing = True
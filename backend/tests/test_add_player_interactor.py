@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import MagicMock, patch
 from flask import Flask
 from backend.interactors.add_player_interactor import AddPlayerInteractor
+from backend.services.season_stats_repository import SeasonStatsRepository
 from backend.database.entities.player_entity import PlayerEntity
 
 
@@ -23,8 +24,14 @@ def mock_player_data():
 
 
 @pytest.fixture
-def interactor(mock_player_data):
-    return AddPlayerInteractor(player_data_access=mock_player_data)
+def mock_pitching_stats():
+    """Stand-in for pybaseball.pitching_stats used by the stats repository."""
+    return MagicMock()
+
+
+@pytest.fixture
+def interactor(mock_player_data, mock_pitching_stats):
+    return AddPlayerInteractor(player_data_access=mock_player_data, stats_repository=SeasonStatsRepository(loader=mock_pitching_stats))
 
 
 # ---------------------------------------------------------
@@ -82,7 +89,6 @@ def test_duplicate_player(app, interactor, mock_player_data):
 # ---------------------------------------------------------
 # TEST 3 — No MLB stat match
 # ---------------------------------------------------------
-@patch("backend.interactors.add_player_interactor.pitching_stats")
 def test_no_mlb_stats(mock_pitching_stats, app, interactor, mock_player_data):
     mock_player_data.list_by_team.return_value = []
 
@@ -111,7 +117,6 @@ def test_no_mlb_stats(mock_pitching_stats, app, interactor, mock_player_data):
 # ---------------------------------------------------------
 # TEST 4 — Successful add
 # ---------------------------------------------------------
-@patch("backend.interactors.add_player_interactor.pitching_stats")
 @patch("backend.interactors.add_player_interactor.PitcherGradingService")
 def test_successful_add(mock_grading, mock_pitching_stats, app, interactor, mock_player_data):
     mock_player_data.list_by_team.return_value = []
@@ -128,8 +133,8 @@ def test_successful_add(mock_grading, mock_pitching_stats, app, interactor, mock
     )
 
     # Grade service mock
-    mock_grading.calculate_pitcher_grade.return_value = 92.5
-    mock_grading.analyze_pitcher.return_value = "Elite strikeout ability."
+    mock_grading.league_grades.return_value.grade.return_value = 92.5
+    mock_grading.league_analysis.return_value = "Elite strikeout ability."
 
     # Mock DB create → should return dict
     mock_player_data.create.return_value = {
@@ -153,13 +158,15 @@ def test_successful_add(mock_grading, mock_pitching_stats, app, interactor, mock
 
     assert status == 201
     assert response.json["player_name"] == "Gerrit Cole"
+    entity = mock_player_data.create.call_args[0][0]
+    assert entity.get_grade() == 92.5
+    assert entity.get_analysis() == "Elite strikeout ability."
     assert response.json["grade"] == 92.5
 
 
 # ---------------------------------------------------------
 # TEST 5 — Exception inside execution → returns 400
 # ---------------------------------------------------------
-@patch("backend.interactors.add_player_interactor.pitching_stats")
 def test_exception_handling(mock_pitching_stats, app, interactor, mock_player_data):
     mock_player_data.list_by_team.return_value = []
 
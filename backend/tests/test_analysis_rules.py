@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.services.analysis_rules import ANALYSIS_RULES, WEAKNESS_RULES, RuleTable, bucket
+from backend.services.pitcher_grading_service import PitcherGradingService
+from backend.services.result_cache import ResultCache
+from backend.services.season_stats_repository import SeasonStatsRepository
+
+
+ACE = {"K%": 0.33, "IP": 190.0, "ERA": 2.40}
+SHAKY = {"K%": 0.19, "IP": 110.0, "ERA": 4.60}
+
+
+def test_analysis_report():
+    text = ANALYSIS_RULES.evaluate(ACE, "Elite")
+
+    assert text.split("\n") == [
+        "Elite Tier:",
+        "• Carries your strikeout category with elite swing-and-miss skill (33.0% K rate).",
+        "• High-volume workload (190.0 IP) provides stability and contributes across all counting stats.",
+        "• Limits damage exceptionally well (ERA 2.40), anchoring team ratios.",
+        "Fantasy Recommendation: Start every week without hesitation.",
+    ]
+
+
+def test_weakness_report():
+    assert WEAKNESS_RULES.evaluate(ACE, "Elite") == \
+        "• Elite tier pitcher with no major exploitable weaknesses - requires disciplined at-bats."
+    assert WEAKNESS_RULES.evaluate(SHAKY, "Poor").split("\n") == [
+        "• Low strikeout production (19.0% K rate) limits fantasy ceiling.",
+        "• Light innings load (110.0 IP) reduces overall fantasy impact.",
+        "• High ERA (4.60) indicates vulnerability to runs - aggressive hitting approach recommended.",
+        "• Strategy: Focus on aggressive hitting to capitalize on poor run prevention.",
+        "• Strategy: Use contact-oriented hitters to exploit low strikeout rate.",
+    ]
+
+
+def test_vectorized_codes_match_single_evaluation():
+    rng = np.random.default_rng(3)
+    # Exact thresholds plus random values in between
+    k = rng.choice([15.0, 20.0, 22.0, 24.0, 28.0, 30.0, 32.0, *rng.uniform(10, 40, 8)], 500)
+    ip = rng.choice([100.0, 130.0, 160.0, 170.0, *rng.uniform(20, 220, 8)], 500)
+    era = rng.choice([2.5, 3.0, 3.25, 3.5, 4.0, 4.25, 4.3, *rng.uniform(1, 7, 8)], 500)
+
+    for table in (ANALYSIS_RULES, WEAKNESS_RULES):
+        codes = table.codes(np.column_stack([k, ip, era]))
+        assert codes.shape == (500, len(table))
+        for i in range(500):
+            stats = {"K%": k[i] / 100, "IP": ip[i], "ERA": era[i]}
+            assert table.render(codes[i], k[i], ip[i], era[i], "Solid") == table.evaluate(stats, "Solid")
+
+
+def test_missing_stat_falls_through():
+    table = RuleTable("t", [bucket("era", "<=", [(3.0, "good"), (4.0, "fine")], "bad"), bucket("ip", "<", [(100, "light")])])
+
+    assert table.codes(np.array([[0.0, 50.0, np.nan]])).tolist() == [[2, 0]]
+    assert table.evaluate({"K%": 0.2, "IP": 150.0, "ERA": np.nan}, "Poor") == "bad"
+
+
+def test_unknown_condition_rejected():
+    with pytest.raises(ValueError):
+        RuleTable("t", [bucket("whip", "<", [(1.0, "x")])])
+
+
+def test_league_text_is_memoized_per_pitcher_version(monkeypatch):
+    monkeypatch.setattr(PitcherGradingService, "rendered_text", ResultCache(max_entries=2))
+    frame = pd.DataFrame({
+        "idfg": [1, 2, 3],
+        "name": ["Ace", "Shaky", "Other"],
+        "k%": [0.33, 0.19, 0.25],
+        "ip": [190.0, 110.0, 150.0],
+        "era": [2.40, 4.60, 3.40],
+    })
+    frames = iter([frame, frame.assign(era=[2.40, 4.60, 3.90])])
+    repo = SeasonStatsRepository(loader=lambda season: next(frames))
+    snapshot = repo.get(2025)
+
+    text = PitcherGradingService.league_analysis(snapshot, 0)
+    assert text == PitcherGradingService.analyze_pitcher(ACE, PitcherGradingService.league_grades(snapshot).grade(0))
+    assert PitcherGradingService.league_analysis(snapshot, 0) is text
+
+    # A refresh that only touched Other keeps Ace's rendered report
+    repo.refresh(2025)
+    refreshed = repo.get(2025)
+    assert PitcherGradingService.league_analysis(refreshed, 0) is text
+    assert "ERA 3.90" in PitcherGradingService.league_analysis(refreshed, 2)
+    assert PitcherGradingService.league_weaknesses(refreshed, 1).startswith("• Low strikeout production")
+    # Bounded: the oldest report was evicted
+    assert PitcherGradingService.rendered_text.stats()["entries"] == 2
@@ -0,0 +1,168 @@
+from contextlib import contextmanager
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.database import database as database_module
+from backend.database.database import Database
+
+
+class FakePool:
+    """psycopg_pool.ConnectionPool stand-in that hands out MagicMock connections."""
+
+    instances = []
+
+    def __init__(self, dsn, **kwargs):
+        self.dsn = dsn
+        self.kwargs = kwargs
+        self.closed = True
+        self.cursor = MagicMock()
+        self.cursor.fetchone.return_value = {"id": 1}
+        self.cursor.fetchall.return_value = [{"id": 1}, {"id": 2}]
+        self.borrowed = []
+        FakePool.instances.append(self)
+
+    check_connection = staticmethod(lambda conn: None)
+
+    def open(self, wait=True):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+    @contextmanager
+    def connection(self, timeout=None):
+        conn = MagicMock()
+        conn.cursor.return_value.__enter__.return_value = self.cursor
+        self.borrowed.append((conn, timeout))
+        yield conn
+
+    def get_stats(self):
+        return {
+            "pool_min": 2, "pool_max": 8, "pool_size": 5, "pool_available": 2,
+            "requests_waiting": 1, "requests_num": 40, "requests_queued": 4,
+            "requests_wait_ms": 30, "requests_errors": 1, "connections_num": 6,
+        }
+
+
+@pytest.fixture
+def db(monkeypatch):
+    FakePool.instances = []
+    monkeypatch.setattr(database_module, "ConnectionPool", FakePool)
+    return Database("postgresql://test", min_size=2, max_size=8, timeout=3.0, max_lifetime=60.0)
+
+
+def test_pool_is_configured_and_opened_lazily(db):
+    assert FakePool.instances == []
+
+    pool = db.connect()
+
+    assert db.connect() is pool
+    assert not pool.closed
+    assert pool.kwargs["min_size"] == 2
+    assert pool.kwargs["max_size"] == 8
+    assert pool.kwargs["timeout"] == 3.0
+    assert pool.kwargs["max_lifetime"] == 60.0
+    assert pool.kwargs["check"] is FakePool.check_connection
+    # Lone statements autocommit instead of paying for a COMMIT round trip
+    assert pool.kwargs["kwargs"]["autocommit"] is True
+
+
+def test_execute_keeps_fetch_contract(db):
+    assert db.execute("SELECT 1", fetchone=True) == {"id": 1}
+    assert db.execute("SELECT 1", fetchall=True) == [{"id": 1}, {"id": 2}]
+    assert db.execute("DELETE FROM t WHERE id = %s", (1,)) is None
+
+    pool = FakePool.instances[0]
+    pool.cursor.execute.assert_called_with("DELETE FROM t WHERE id = %s", (1,))
+    # One pooled connection per statement, acquired with the configured timeout
+    assert [timeout for _, timeout in pool.borrowed] == [3.0, 3.0, 3.0]
+
+
+def test_close_then_reconnect_builds_a_new_pool(db):
+    first = db.connect()
+    db.close()
+
+    assert first.closed
+    assert db.connect() is not first
+
+
+def test_stats(db):
+    assert db.stats()["open"] is False
+
+    db.connect()
+    stats = db.stats()
+
+    assert stats["in_use"] == 3
+    assert stats["waiting"] == 1
+    assert stats["wait_ms_avg"] == 7.5
+    assert stats["requests_timed_out"] == 1
+
+
+def test_invalid_sizes_rejected():
+    with pytest.raises(ValueError):
+        Database("postgresql://test", min_size=5, max_size=2)
+
+
+def test_transaction_runs_statements_on_one_connection(db):
+    with db.transaction() as conn:
+        assert db.in_transaction()
+        db.execute("INSERT 1")
+        with db.transaction() as inner:
+            assert inner is conn
+            db.execute("INSERT 2", fetchone=True)
+
+    pool = FakePool.instances[0]
+    assert len(pool.borrowed) == 1
+    conn.transaction.assert_called_once()
+    conn.transaction.return_value.__exit__.assert_called_once()
+    assert not db.in_transaction()
+
+
+def test_transaction_rolls_back_and_releases_on_error(db):
+    with pytest.raises(RuntimeError):
+        with db.transaction() as conn:
+            db.execute("INSERT 1")
+            raise RuntimeError("boom")
+
+    exc_type = conn.transaction.return_value.__exit__.call_args.args[0]
+    assert exc_type is RuntimeError
+    assert not db.in_transaction()
+    # Next statement borrows a fresh connection
+    db.execute("SELECT 1", fetchone=True)
+    assert len(FakePool.instances[0].borrowed) == 2
+
+
+def test_unit_of_work_flushes_in_one_pipelined_transaction(db):
+    with db.unit_of_work() as uow:
+        uow.register("INSERT a", (1,))
+        uow.register_many("INSERT b", [(2,), (3,)])
+        assert len(uow) == 3
+
+    pool = FakePool.instances[0]
+    conn, _ = pool.borrowed[0]
+    assert len(pool.borrowed) == 1
+    conn.pipeline.assert_called_once()
+    assert [c.args for c in pool.cursor.execute.call_args_list] == [("INSERT a", (1,)), ("INSERT b", (2,)), ("INSERT b", (3,))]
+
+
+def test_unit_of_work_discards_on_error(db):
+    with pytest.raises(ValueError):
+        with db.unit_of_work() as uow:
+            uow.register("INSERT a", (1,))
+            raise ValueError
+
+    assert FakePool.instances == []
+
+
+def test_execute_many_returns_one_row_per_statement(db):
+    db.connect()
+    cursor = FakePool.instances[0].cursor
+    cursor.fetchone.side_effect = [{"id": 1}, {"id": 2}, {"id": 3}]
+    cursor.nextset.side_effect = [True, True, None]
+
+    rows = db.execute_many("INSERT x RETURNING id", [(1,), (2,), (3,)], returning=True)
+
+    assert rows == [{"id": 1}, {"id": 2}, {"id": 3}]
+    cursor.executemany.assert_called_once_with("INSERT x RETURNING id", [(1,), (2,), (3,)], returning=True)
+    assert db.execute_many("INSERT x", []) == []
@@ -0,0 +1,94 @@
+import pytest
+from unittest.mock import MagicMock
+from flask import Flask
+from backend.interactors.import_roster_interactor import ImportRosterInteractor
+from backend.services.pitcher_grading_service import PitcherGradingService
+from backend.services.season_stats_repository import SeasonStatsRepository
+
+
+@pytest.fixture
+def app():
+    """Creates a minimal Flask app for testing."""
+    app = Flask(__name__)
+    app.config["TESTING"] = True
+    return app
+
+
+@pytest.fixture
+def mock_player_data():
+    """Mocked PlayerDataAccessInterface that echoes created players back."""
+    mock = MagicMock()
+    mock.list_by_team.return_value = [{"player_name": "Chris Sale", "idfg": "10603"}]
+    mock.create_many.side_effect = lambda entities: [
+        {"player_name": e.get_player_name(), "idfg": e.get_idfg(), "grade": e.get_grade(), "position": e.get_position()}
+        for e in entities
+    ]
+    return mock
+
+
+@pytest.fixture
+def interactor(mock_player_data, mock_stats_df):
+    stats = mock_stats_df.assign(idfg=[101, 102, 103])
+    return ImportRosterInteractor(mock_player_data, SeasonStatsRepository(loader=lambda season: stats))
+
+
+# ------------------------------------------
+# TEST 1 — Matched pitchers are graded and inserted in one batch
+# ------------------------------------------
+def test_import_grades_and_batches(app, interactor, mock_player_data):
+    players = [
+        {"player_name": "User Starter A", "position": "RP"},
+        {"player_name": "Opp Starter One"},
+        {"player_name": "chris sale"},           # already on the team
+        {"player_name": "user starter a"},       # repeated in the request
+        {"player_name": "Nobody Special"},       # no stats
+    ]
+
+    with app.app_context():
+        response, status = interactor.execute(1, players)
+
+    assert status == 201
+    mock_player_data.create_many.assert_called_once()
+    created = response.json["created"]
+    assert [p["player_name"] for p in created] == ["User Starter A", "Opp Starter One"]
+    assert created[0]["position"] == "RP"
+    assert created[1]["position"] == "SP"
+    assert created[0]["idfg"] == "102"
+    assert created[0]["grade"] == PitcherGradingService.calculate_pitcher_grade({"K%": 0.27, "IP": 160, "ERA": 3.50})
+    assert response.json["skipped"] == [
+        {"player_name": "chris sale", "reason": "duplicate"},
+        {"player_name": "user starter a", "reason": "duplicate"},
+        {"player_name": "Nobody Special", "reason": "no stats found"},
+    ]
+
+
+# ------------------------------------------
+# TEST 2 — Nothing to insert skips the write
+# ------------------------------------------
+def test_import_nothing_new(app, interactor, mock_player_data):
+    with app.app_context():
+        response, status = interactor.execute(1, [{"player_name": "Chris Sale"}])
+
+    assert status == 201
+    assert response.json["created"] == []
+    mock_player_data.create_many.assert_not_called()
+
+
+# ------------------------------------------
+# TEST 3 — Bad payloads → 400
+# ------------------------------------------
+@pytest.mark.parametrize("players", [None, [], "Chris Sale", [{"position": "SP"}]])
+def test_import_rejects_bad_payload(app, interactor, players):
+    with app.app_context():
+        response, status = interactor.execute(1, players)
+
+    assert status == 400
+
+
+def test_import_rejects_oversized_roster(app, interactor):
+    players = [{"player_name": f"P{i}"} for i in range(ImportRosterInteractor.MAX_PLAYERS + 1)]
+
+    with app.app_context():
+        response, status = interactor.execute(1, players)
+
+    assert status == 400
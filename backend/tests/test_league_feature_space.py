@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.services.league_feature_space import LeagueFeatureSpace
+from backend.services.pitcher_recomender_service import PitcherRecommenderService
+from backend.services.roster_enricher import RosterEnricher
+from backend.services.season_stats_repository import SeasonStatsRepository
+
+
+FEATURES = list(RosterEnricher.FEATURES)
+
+
+@pytest.fixture
+def league():
+    rng = np.random.default_rng(11)
+    frame = pd.DataFrame(rng.uniform(0, 150, size=(40, len(FEATURES))), columns=FEATURES)
+    frame.insert(0, "name", [f"Arm {i}" for i in range(40)])
+    frame["team"] = ["T%d" % (i % 4) for i in range(40)]
+    frame["ip"] = np.linspace(5, 200, 40)
+    return frame
+
+
+@pytest.fixture
+def snapshot(league):
+    return SeasonStatsRepository(loader=lambda season: league).get(2025)
+
+
+def test_bounds_come_from_qualified_pitchers(snapshot, league):
+    space = LeagueFeatureSpace.for_snapshot(snapshot)
+
+    qualified = league[league["ip"] >= LeagueFeatureSpace.MIN_QUALIFIED_IP][FEATURES].to_numpy()
+    lower, upper = np.percentile(qualified, LeagueFeatureSpace.BOUND_PERCENTILES, axis=0)
+    np.testing.assert_allclose(space.lower, lower)
+    np.testing.assert_allclose(space.upper, upper)
+    assert space.normalized.min() >= 0.0 and space.normalized.max() <= 1.0
+    assert not space.normalized.flags.writeable
+
+
+def test_space_is_built_once_per_snapshot(snapshot):
+    assert LeagueFeatureSpace.for_snapshot(snapshot) is LeagueFeatureSpace.for_snapshot(snapshot)
+
+
+def test_profile_scores_are_cached(snapshot):
+    space = LeagueFeatureSpace.for_snapshot(snapshot)
+    compiled = PitcherRecommenderService.get_profile("strikeout")
+
+    scores = space.profile_scores(compiled)
+
+    assert scores is space.profile_scores(compiled)
+    np.testing.assert_allclose(scores, compiled.score(space.normalized))
+
+
+def test_league_score_does_not_depend_on_teammates(snapshot):
+    first = RosterEnricher.enrich([{"player_name": n} for n in ("Arm 10", "Arm 11", "Arm 12")], snapshot)
+    second = RosterEnricher.enrich([{"player_name": n} for n in ("Arm 10", "Arm 30", "Arm 31")], snapshot)
+
+    def score_of(roster, normalization):
+        lineup, _ = PitcherRecommenderService.recommend_lineup(roster, snapshot, 5, "standard", normalization)
+        return {r["name"]: r["score"] for r in lineup}["Arm 10"]
+
+    assert score_of(first, "league") == score_of(second, "league")
+    assert score_of(first, "roster") != score_of(second, "roster")
+
+
+def test_unknown_normalization_raises(snapshot):
+    roster = RosterEnricher.enrich([{"player_name": "Arm 10"}], snapshot)
+
+    with pytest.raises(ValueError):
+        PitcherRecommenderService.recommend_lineup(roster, snapshot, 5, "standard", "galaxy")
+
+
+def test_constant_feature_does_not_divide_by_zero():
+    features = np.ones((3, 2))
+
+    space = LeagueFeatureSpace(features, np.array([True, True, False]))
+
+    np.testing.assert_allclose(space.normalized, np.zeros((3, 2)))
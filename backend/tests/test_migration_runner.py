@@ -0,0 +1,144 @@
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+from backend.database.migration_runner import (
+    MIGRATIONS_DIR,
+    Migration,
+    MigrationError,
+    MigrationRunner,
+    load_migrations,
+    split_statements,
+)
+
+
+class FakeConnection:
+    """Records executed SQL; schema_migrations rows live in a dict."""
+
+    def __init__(self):
+        self.executed = []
+        self.rows = {}
+        self.transactions = 0
+        self.in_transaction = False
+
+    def execute(self, query, params=None):
+        self.executed.append((query.strip(), self.in_transaction))
+        if query.startswith("INSERT INTO schema_migrations"):
+            version, name, checksum = params
+            self.rows[version] = {"version": version, "name": name, "checksum": checksum, "applied_at": None}
+        return self
+
+    def fetchall(self):
+        return list(self.rows.values())
+
+    @contextmanager
+    def transaction(self):
+        self.transactions += 1
+        self.in_transaction = True
+        try:
+            yield
+        finally:
+            self.in_transaction = False
+
+
+class FakeDatabase:
+    def __init__(self):
+        self.conn = FakeConnection()
+
+    @contextmanager
+    def connection(self):
+        yield self.conn
+
+
+def write(directory: Path, filename: str, sql: str) -> Path:
+    path = directory / filename
+    path.write_text(sql, encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def migrations(tmp_path):
+    write(tmp_path, "0002_second.sql", "-- migrate: no-transaction\nCREATE INDEX CONCURRENTLY b ON t (b);\n")
+    write(tmp_path, "0001_first.sql", "-- create t\nCREATE TABLE t (a INT);\nALTER TABLE t ADD COLUMN b INT;\n")
+    return tmp_path
+
+
+def test_files_load_in_version_order(migrations):
+    loaded = load_migrations(migrations)
+
+    assert [(m.version, m.name, m.transactional) for m in loaded] == [(1, "first", True), (2, "second", False)]
+    assert loaded[0].statements() == ["CREATE TABLE t (a INT)", "ALTER TABLE t ADD COLUMN b INT"]
+
+
+def test_semicolons_inside_quotes_and_bodies_are_kept():
+    sql = """
+    -- a comment; with a semicolon
+    INSERT INTO t VALUES ('a;b', 'it''s; fine');
+    CREATE FUNCTION f() RETURNS INT AS $body$ BEGIN RETURN 1; END; $body$ LANGUAGE plpgsql;
+    DO $$ BEGIN PERFORM 1; END $$;
+    /* block; /* nested; */ comment */ SELECT "odd;name" FROM t
+    """
+
+    assert split_statements(sql) == [
+        "INSERT INTO t VALUES ('a;b', 'it''s; fine')",
+        "CREATE FUNCTION f() RETURNS INT AS $body$ BEGIN RETURN 1; END; $body$ LANGUAGE plpgsql",
+        "DO $$ BEGIN PERFORM 1; END $$",
+        'SELECT "odd;name" FROM t',
+    ]
+
+
+def test_bad_file_name_and_duplicate_versions_are_rejected(tmp_path):
+    with pytest.raises(MigrationError):
+        Migration.from_file(write(tmp_path, "first.sql", "SELECT 1;"))
+
+    (tmp_path / "first.sql").unlink()
+    write(tmp_path, "0001_a.sql", "SELECT 1;")
+    write(tmp_path, "0001_b.sql", "SELECT 2;")
+    with pytest.raises(MigrationError):
+        load_migrations(tmp_path)
+
+
+def test_migrate_applies_pending_once(migrations):
+    db = FakeDatabase()
+    runner = MigrationRunner(db, migrations)
+
+    assert runner.migrate() == [1, 2]
+    assert runner.migrate() == []
+
+    executed = db.conn.executed
+    # A transactional file is sent whole; a no-transaction one statement by statement
+    assert ("-- create t\nCREATE TABLE t (a INT);\nALTER TABLE t ADD COLUMN b INT;", True) in executed
+    assert ("CREATE INDEX CONCURRENTLY b ON t (b)", False) in executed
+    assert db.conn.transactions == 1
+    assert sorted(db.conn.rows) == [1, 2]
+    assert executed[0][0].startswith("SELECT pg_advisory_lock")
+    assert executed[-1][0].startswith("SELECT pg_advisory_unlock")
+
+
+def test_migrate_stops_at_target(migrations):
+    db = FakeDatabase()
+
+    assert MigrationRunner(db, migrations).migrate(target=1) == [1]
+    assert [m.version for m in MigrationRunner(db, migrations).pending()] == [2]
+
+
+def test_edited_migration_is_refused(migrations):
+    db = FakeDatabase()
+    MigrationRunner(db, migrations).migrate()
+    write(migrations, "0001_first.sql", "CREATE TABLE t (a BIGINT);\n")
+
+    with pytest.raises(MigrationError):
+        MigrationRunner(db, migrations).migrate()
+
+
+def test_shipped_migrations_load():
+    loaded = load_migrations(MIGRATIONS_DIR)
+
+    assert [m.version for m in loaded] == list(range(1, len(loaded) + 1))
+    unique = next(m for m in loaded if "UNIQUE INDEX" in m.sql)
+    assert not unique.transactional
+    assert "lower(player_name)" in unique.sql
+    dedupe = next(m for m in loaded if "DELETE FROM players" in m.sql)
+    assert dedupe.version < unique.version
+    assert "INSERT INTO players_duplicates_backup" in dedupe.sql
@@ -46,7 +46,7 @@ def test_get_counter_lineup_error_no_user_players(app_with_opponent_blueprint):
     data = resp.get_json()
     assert data["error"] == "No players found for your team"
 
-def test_get_counter_lineup_error_no_matching_stats(app_with_opponent_blueprint, monkeypatch):
+def test_get_counter_lineup_error_no_matching_stats(app_with_opponent_blueprint, stats_repository, monkeypatch):
     client = app_with_opponent_blueprint.test_client()
 
     # Override stats to include opponent but exclude user players so enrichment fails
@@ -58,7 +58,7 @@ def test_get_counter_lineup_error_no_matching_stats(app_with_opponent_blueprint,
             "ip": 120,
             "era": 4.40,
         }])
-    monkeypatch.setattr("backend.controller.opponent_controller.pitching_stats", stats_only_opponent)
+    monkeypatch.setattr(stats_repository, "loader", stats_only_opponent)
 
     resp = client.get("/api/opponent/1/counter-lineup/2")
     assert resp.status_code == 404
@@ -77,4 +77,27 @@ def test_get_opponent_weaknesses_basic(app_with_opponent_blueprint):
     p = data["pitchers"][0]
     assert "player_name" in p and "weaknesses" in p
     # Weaknesses text should include bullets from the extractor logic
-    assert "•" in p["weaknesses"]
\ No newline at end of file
+    assert "•" in p["weaknesses"]
+
+
+def test_repeat_counter_lineup_and_weaknesses_are_cached(app_with_opponent_blueprint, monkeypatch):
+    client = app_with_opponent_blueprint.test_client()
+    from backend.services.roster_enricher import RosterEnricher
+
+    calls = []
+    real_enrich = RosterEnricher.enrich
+
+    def counting_enrich(players, snapshot):
+        calls.append(len(players))
+        return real_enrich(players, snapshot)
+
+    monkeypatch.setattr(RosterEnricher, "enrich", staticmethod(counting_enrich))
+
+    first = client.get("/api/opponent/1/counter-lineup/2").get_json()
+    second = client.get("/api/opponent/1/counter-lineup/2").get_json()
+    client.get("/api/opponent/1/weaknesses")
+    client.get("/api/opponent/1/weaknesses")
+
+    assert first == second
+    # two enrichments for the counter-lineup, one for the weaknesses report
+    assert len(calls) == 3
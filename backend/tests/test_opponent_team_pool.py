@@ -0,0 +1,89 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.interactors.signin_interactor import SigninInteractor
+from backend.interactors.signup_interactor import SignupInteractor
+from backend.services.opponent_team_pool import OpponentTeamPool
+
+
+class FakeTeams:
+    """In-memory opponent pool with the TeamDataAccess pool methods."""
+
+    def __init__(self, pooled=()):
+        self.pool = list(pooled)
+        self.next_id = 100
+        self.inline = 0
+        self.batches = []
+
+    def claim_opponent_team(self):
+        return self.pool.pop(0) if self.pool else None
+
+    def opponent_pool_size(self):
+        return len(self.pool)
+
+    def fill_opponent_pool(self, count):
+        self.batches.append(count)
+        for _ in range(count):
+            self.pool.append(self.next_id)
+            self.next_id += 1
+        return count
+
+    def create_opponent_user_and_team(self):
+        self.inline += 1
+        return {"opponent_team_id": -1}
+
+
+def test_claim_takes_pooled_team():
+    teams = FakeTeams(pooled=[7, 8])
+    pool = OpponentTeamPool(teams, low_water=1, target=4)
+
+    assert pool.claim() == 7
+    assert teams.inline == 0
+    assert pool.stats()["claimed"] == 1
+
+
+def test_empty_pool_builds_inline():
+    teams = FakeTeams()
+    pool = OpponentTeamPool(teams, low_water=1, target=4)
+
+    assert pool.claim() == -1
+    assert teams.inline == 1
+    assert pool.stats()["misses"] == 1
+
+
+def test_refill_tops_up_only_at_low_water():
+    teams = FakeTeams(pooled=[1, 2, 3])
+    pool = OpponentTeamPool(teams, low_water=2, target=7, batch_size=3)
+
+    assert pool.refill() == 0
+
+    teams.claim_opponent_team()
+    assert pool.refill() == 5
+    assert teams.batches == [3, 2]
+    assert teams.opponent_pool_size() == 7
+
+
+def test_invalid_thresholds_are_rejected():
+    with pytest.raises(ValueError):
+        OpponentTeamPool(FakeTeams(), low_water=5, target=5)
+
+
+def test_signup_claims_from_pool():
+    teams = FakeTeams(pooled=[42])
+    users = MagicMock()
+    users.read.return_value = None
+
+    SignupInteractor(users, MagicMock(), opponent_pool=OpponentTeamPool(teams, low_water=0, target=2)).signup("alice", "pw")
+
+    users.assign_opponent_team.assert_called_once_with("alice", 42)
+
+
+def test_signin_rejects_sentinel_password():
+    user = MagicMock()
+    user.get_password.return_value = b"!opponent"
+    users = MagicMock()
+    users.read.return_value = user
+
+    with pytest.raises(Exception, match="Incorrect username or password"):
+        SigninInteractor(users, MagicMock()).signin("OpponentUser_1", "anything")
@@ -0,0 +1,66 @@
+import threading
+from unittest.mock import MagicMock
+
+import bcrypt
+import pytest
+
+from backend.interactors.signin_interactor import SigninInteractor
+from backend.services.password_hasher import HasherBusyError, PasswordHasher
+
+
+@pytest.fixture
+def hasher():
+    hasher = PasswordHasher(rounds=4, max_workers=1, max_queue=0)
+    yield hasher
+    hasher.shutdown()
+
+
+def test_hash_and_verify(hasher):
+    hashed = hasher.hash("secret")
+
+    assert hashed.startswith(b"$2b$04$")
+    assert hasher.verify("secret", hashed)
+    assert not hasher.verify("wrong", hashed)
+    assert not hasher.verify("secret", b"!opponent")
+
+
+def test_needs_rehash_compares_work_factor(hasher):
+    assert not hasher.needs_rehash(bcrypt.hashpw(b"pw", bcrypt.gensalt(4)))
+    assert hasher.needs_rehash(bcrypt.hashpw(b"pw", bcrypt.gensalt(5)))
+    assert not hasher.needs_rehash(b"!opponent")
+
+
+def test_saturated_pool_rejects_immediately(hasher, monkeypatch):
+    started, release = threading.Event(), threading.Event()
+
+    def slow_checkpw(password, hashed):
+        started.set()
+        release.wait(5)
+        return True
+
+    monkeypatch.setattr(bcrypt, "checkpw", slow_checkpw)
+    worker = threading.Thread(target=hasher.verify, args=("pw", b"$2b$04$x"))
+    worker.start()
+    started.wait(5)
+
+    try:
+        with pytest.raises(HasherBusyError):
+            hasher.verify("pw", b"$2b$04$x")
+        assert hasher.stats()["rejected"] == 1
+    finally:
+        release.set()
+        worker.join()
+
+
+def test_signin_rehashes_old_work_factor(hasher):
+    user = MagicMock()
+    user.get_password.return_value = bcrypt.hashpw(b"pw", bcrypt.gensalt(5))
+    user.get_opponent_team_id.return_value = 3
+    users = MagicMock()
+    users.read.return_value = user
+
+    SigninInteractor(users, MagicMock(), password_hasher=hasher).signin("alice", "pw")
+
+    username, new_hash = users.update.call_args.args
+    assert username == "alice"
+    assert new_hash.startswith(b"$2b$04$") and bcrypt.checkpw(b"pw", new_hash)
@@ -0,0 +1,74 @@
+import numpy as np
+
+from backend.services.pitcher_grading_service import PitcherGradingService
+
+
+def test_vectorized_grades_match_scalar_formula():
+    rng = np.random.default_rng(1)
+    k, ip, era = rng.uniform(0.1, 0.4, 50), rng.uniform(10, 210, 50), rng.uniform(1.5, 7.0, 50)
+
+    grades = PitcherGradingService.calculate_grades(k, ip, era)
+
+    expected = [
+        PitcherGradingService.calculate_pitcher_grade({"K%": a, "IP": b, "ERA": c})
+        for a, b, c in zip(k, ip, era)
+    ]
+    np.testing.assert_allclose(grades, expected, atol=1e-9)
+
+
+def test_missing_stats_grade_zero():
+    grades = PitcherGradingService.calculate_grades([0.3, np.nan], [150.0, 150.0], [3.0, 3.0])
+
+    assert grades[1] == 0.0
+    assert grades[0] == PitcherGradingService.calculate_pitcher_grade({"K%": 0.3, "IP": 150.0, "ERA": 3.0})
+
+
+def make_snapshot():
+    import pandas as pd
+    from backend.services.season_stats_repository import SeasonStatsSnapshot
+
+    return SeasonStatsSnapshot(season=2025, frame=pd.DataFrame({
+        "name": ["Ace", "Good", "Okay", "Fringe", "Bad", "No ERA"],
+        "k%": [0.34, 0.30, 0.25, 0.22, 0.15, 0.30],
+        "ip": [190.0, 160.0, 150.0, 120.0, 80.0, 100.0],
+        "era": [2.4, 3.3, 3.0, 4.0, 5.5, np.nan],
+    }))
+
+
+def test_tiers_match_thresholds():
+    grades = [80.0, 79.99, 70.0, 60.0, 45.0, 44.99, -5.0, np.nan]
+
+    tiers = [PitcherGradingService.TIERS[c] for c in PitcherGradingService.tier_codes(grades)]
+
+    assert tiers == ["Elite", "Top", "Top", "Solid", "Replacement", "Poor", "Poor", "Poor"]
+    assert PitcherGradingService.tier(72.5) == "Top"
+
+
+def test_league_grades_match_per_player_grading():
+    snapshot = make_snapshot()
+
+    league = PitcherGradingService.league_grades(snapshot)
+
+    assert len(league) == 6
+    for pos in range(5):
+        stats = league.stats(pos)
+        grade = PitcherGradingService.calculate_pitcher_grade(stats)
+        assert league.grade(pos) == grade
+        assert league.tier(pos) == PitcherGradingService.tier(grade)
+        assert PitcherGradingService.analyze_pitcher(stats, grade, league.tier(pos)) == \
+            PitcherGradingService.analyze_pitcher(stats, grade)
+    # A missing ERA counts as 0, like everywhere else the grading matrix is used
+    assert league.stats(5)["ERA"] == 0.0
+    assert PitcherGradingService.league_grades(snapshot) is league
+    assert not league.grades.flags.writeable
+
+
+def test_roster_grades_look_up_or_compute():
+    from backend.services.roster_enricher import RosterEnricher
+
+    snapshot = make_snapshot()
+    roster = RosterEnricher.enrich([{"player_name": "Okay"}, {"player_name": "Ace"}], snapshot)
+    league = PitcherGradingService.league_grades(snapshot)
+
+    np.testing.assert_array_equal(PitcherGradingService.roster_grades(roster, snapshot), league.grades[[2, 0]])
+    np.testing.assert_array_equal(PitcherGradingService.roster_grades(roster), league.grades[[2, 0]])
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.services.pitcher_index import PitcherIndex, normalize_idfg, normalize_name
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({
+        "idfg": [19361, 13125, 14168, 22000],
+        "name": ["José Berríos", "Gerrit Cole", "Will Smith", "Will  Smith"],
+        "ip": [185.0, 200.0, 55.0, 70.0],
+    })
+
+
+def test_normalize_name_folds_case_accents_and_spaces():
+    assert normalize_name("  José   BERRÍOS ") == "jose berrios"
+    assert normalize_name(None) == ""
+
+
+def test_normalize_idfg_accepts_ints_and_strings():
+    assert normalize_idfg(13125) == "13125"
+    assert normalize_idfg("13125") == "13125"
+    assert normalize_idfg(13125.0) == "13125"
+    assert normalize_idfg(None) is None
+    assert normalize_idfg(np.nan) is None
+    assert normalize_idfg("") is None
+
+
+def test_find_by_name_ignores_case_and_accents(frame):
+    index = PitcherIndex(frame)
+
+    assert index.find(name="jose berrios") == 0
+    assert index.find(name="GERRIT COLE") == 1
+    assert index.find(name="Nobody") is None
+
+
+def test_idfg_wins_over_name(frame):
+    index = PitcherIndex(frame)
+
+    assert index.find(name="Gerrit Cole", idfg="19361") == 0
+    # Unknown id falls back to the name
+    assert index.find(name="Gerrit Cole", idfg="99999") == 1
+
+
+def test_ambiguous_names_resolve_to_most_innings(frame):
+    index = PitcherIndex(frame)
+
+    assert index.is_ambiguous("will smith")
+    assert index.find_all("Will Smith") == (3, 2)
+    assert index.find(name="Will Smith") == 3
+
+
+def test_frame_without_optional_columns():
+    index = PitcherIndex(pd.DataFrame({"name": ["Only Name"]}))
+
+    assert index.find(name="only name") == 0
+    assert index.find(idfg=1) is None
@@ -0,0 +1,151 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.services.pitcher_recomender_service import PitcherRecommenderService
+
+
+FEATURES = list(PitcherRecommenderService.FEATURES)
+
+
+def reference_scores(df: pd.DataFrame, weights: dict) -> np.ndarray:
+    """The original DataFrame + per-weight loop scoring, kept here as the parity oracle."""
+    df = df.copy()
+    cols = list(weights)
+    lo = df[cols].min()
+    span = (df[cols].max() - lo).replace(0.0, 1.0)
+    df[cols] = (df[cols] - lo) / span
+
+    scores = np.zeros(len(df))
+    for stat, weight in weights.items():
+        vals = df[stat].values.copy()
+        if weight < 0:
+            vals = np.ones_like(vals, dtype=float) - vals
+        scores += vals * abs(weight)
+    return scores
+
+
+@pytest.fixture
+def roster():
+    rng = np.random.default_rng(7)
+    data = rng.uniform(0, 150, size=(12, len(FEATURES)))
+    df = pd.DataFrame(data, columns=FEATURES)
+    df.insert(0, "name", [f"Pitcher {i}" for i in range(12)])
+    df.insert(1, "team", ["TST"] * 12)
+    return df
+
+
+@pytest.mark.parametrize("profile", list(PitcherRecommenderService.PROFILES))
+def test_scores_match_original_algorithm(roster, profile):
+    weights = PitcherRecommenderService.PROFILES[profile]
+    compiled = PitcherRecommenderService.get_profile(profile)
+
+    X01 = PitcherRecommenderService.normalize(roster[FEATURES].to_numpy())
+    np.testing.assert_allclose(compiled.score(X01), reference_scores(roster, weights), rtol=0, atol=1e-12)
+
+
+@pytest.mark.parametrize("profile", list(PitcherRecommenderService.PROFILES))
+def test_ranking_matches_original_algorithm(roster, profile):
+    expected = reference_scores(roster, PitcherRecommenderService.PROFILES[profile])
+    expected_names = roster.assign(score=expected).sort_values("score", ascending=False)["name"].head(5).tolist()
+
+    lineup, explanation = PitcherRecommenderService.rank_roster(
+        roster[FEATURES].to_numpy(), roster["name"].tolist(), roster["team"].tolist(), 5, profile
+    )
+
+    assert [r["name"] for r in lineup] == expected_names
+    assert [r["rank"] for r in lineup] == [1, 2, 3, 4, 5]
+    assert explanation == PitcherRecommenderService.EXPLANATIONS[profile]
+
+
+def test_normalize_constant_column_maps_to_zero():
+    X = np.array([[1.0, 5.0], [3.0, 5.0], [2.0, 5.0]])
+
+    X01 = PitcherRecommenderService.normalize(X)
+
+    np.testing.assert_allclose(X01[:, 0], [0.0, 1.0, 0.5])
+    np.testing.assert_allclose(X01[:, 1], [0.0, 0.0, 0.0])
+
+
+def test_top_n_orders_best_first_and_keeps_ties_stable():
+    scores = np.array([0.5, 0.9, 0.5, 0.1, 0.9])
+
+    assert PitcherRecommenderService.top_n(scores, 3).tolist() == [1, 4, 0]
+    assert PitcherRecommenderService.top_n(scores, 10).tolist() == [1, 4, 0, 2, 3]
+    assert PitcherRecommenderService.top_n(scores, 0).tolist() == []
+
+
+def test_top_n_skips_unscored_pitchers():
+    nan = np.nan
+
+    assert PitcherRecommenderService.top_n(np.array([nan, nan, 1.0]), 2).tolist() == [2]
+    assert PitcherRecommenderService.top_n(np.array([nan, 2.0, nan, 3.0, 2.0]), 2).tolist() == [3, 1]
+    assert PitcherRecommenderService.top_n(np.array([nan, nan]), 1).tolist() == []
+
+
+def test_unknown_profile_falls_back_to_standard():
+    assert PitcherRecommenderService.get_profile("nope") is PitcherRecommenderService.get_profile("standard")
+
+
+def test_record_api_defaults_missing_metrics(roster):
+    records = roster[["name", "team", "pitching+", "stuff+"]].to_dict(orient="records")
+
+    df, _ = PitcherRecommenderService.recommend_starting_pitchers(records, 3, "standard")
+
+    assert list(df.columns) == ["rank", "name", "team", "score"]
+    assert df["rank"].tolist() == [1, 2, 3]
+
+
+def test_blocked_similarity_matches_full_cosine_matrix():
+    rng = np.random.default_rng(5)
+    unit = rng.uniform(0, 1, size=(50, len(FEATURES)))
+    unit /= np.linalg.norm(unit, axis=1, keepdims=True)
+    team, candidates = unit[:4], np.arange(4, 50)
+
+    blocked = PitcherRecommenderService.max_cosine_similarity(unit, team, candidates, block_rows=7)
+
+    np.testing.assert_allclose(blocked, (unit[candidates] @ team.T).max(axis=1))
+
+
+def test_free_agent_penalty_pushes_down_lookalikes():
+    features = list(PitcherRecommenderService.FEATURES)
+    star = np.full(len(features), 140.0)
+    frame = pd.DataFrame([star, star * 0.99, star * 0.5, star * 0.2], columns=features)
+    # Twin of the rostered star vs a different but slightly weaker shape
+    frame.iloc[2] = np.linspace(150, 20, len(features))
+    frame.insert(0, "name", ["Star", "Twin", "Different", "Filler"])
+    frame["ip"] = 100.0
+
+    from backend.services.roster_enricher import RosterEnricher
+    from backend.services.season_stats_repository import SeasonStatsRepository
+
+    snapshot = SeasonStatsRepository(loader=lambda season: frame).get(2025)
+    roster = RosterEnricher.enrich([{"player_name": "Star"}], snapshot)
+
+    no_penalty, _ = PitcherRecommenderService.recommend_free_agents(roster, snapshot, 3, "standard", alpha=0.0)
+    penalized, _ = PitcherRecommenderService.recommend_free_agents(roster, snapshot, 3, "standard", alpha=1.0)
+
+    assert "Star" not in [r["name"] for r in no_penalty]
+    twin = next(r for r in penalized if r["name"] == "Twin")
+    assert twin["similarity"] == pytest.approx(1.0)
+    assert twin["score"] == pytest.approx(twin["base_score"] - 1.0)
+
+
+@pytest.mark.parametrize("normalization", PitcherRecommenderService.NORMALIZATION_MODES)
+def test_all_profiles_match_one_profile_at_a_time(roster, normalization):
+    from backend.services.roster_enricher import RosterEnricher
+    from backend.services.season_stats_repository import SeasonStatsRepository
+
+    snapshot = SeasonStatsRepository(loader=lambda season: roster.assign(ip=100.0)).get(2025)
+    enriched = RosterEnricher.enrich([{"player_name": n} for n in roster["name"]], snapshot)
+
+    results = PitcherRecommenderService.recommend_all_profiles(enriched, snapshot, 5, normalization)
+
+    assert list(results) == list(PitcherRecommenderService.PROFILES)
+    for profile, (lineup, explanation) in results.items():
+        expected, expected_explanation = PitcherRecommenderService.recommend_lineup(
+            enriched, snapshot, 5, profile, normalization
+        )
+        assert [r["name"] for r in lineup] == [r["name"] for r in expected]
+        np.testing.assert_allclose([r["score"] for r in lineup], [r["score"] for r in expected], atol=1e-12)
+        assert explanation == expected_explanation
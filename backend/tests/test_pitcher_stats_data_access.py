@@ -0,0 +1,97 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.database.data_access_postgresql import (
+    PitcherStatsDataAccess,
+    PlayerDataAccess,
+    pitcher_stats_rows,
+    stored_player_row,
+)
+from backend.services.pitcher_recomender_service import PitcherRecommenderService
+from backend.services.roster_enricher import RosterEnricher
+from backend.services.season_stats_repository import SeasonStatsRepository
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({
+        "idfg": [101, 102.0, None, 101],
+        "name": ["José  Berríos", "Chris Sale", "No Id", "Duplicate"],
+        "team": ["TOR", np.nan, "NYY", "TOR"],
+        "ip": [180.0, 170.5, 12.0, 1.0],
+        "era": [3.9, np.nan, 5.0, 9.0],
+        "k%": [0.22, 0.31, 0.15, 0.1],
+        "stuff+": [101, 120, 90, 80],
+    })
+
+
+def test_rows_are_keyed_and_json_safe(frame):
+    rows = pitcher_stats_rows(2025, frame)
+
+    assert [(r[1], r[2], r[3]) for r in rows] == [
+        ("101", "José  Berríos", "jose berrios"),
+        ("102", "Chris Sale", "chris sale"),
+    ]
+    sale = rows[1]
+    assert sale[4] is None and sale[6] is None and sale[7] == 0.31
+    assert sale[8].obj["era"] is None and sale[8].obj["stuff+"] == 120
+
+
+def test_rows_need_idfg():
+    with pytest.raises(ValueError):
+        pitcher_stats_rows(2025, pd.DataFrame({"name": ["A"]}))
+
+
+def test_roster_stats_is_one_query():
+    db = MagicMock()
+
+    PitcherStatsDataAccess(db).roster_stats(7, 2025)
+
+    db.execute.assert_called_once()
+    query, params = db.execute.call_args.args
+    assert "JOIN LATERAL" in query and params == (2025, 7)
+    # Stored keys on both sides, nothing normalized in SQL
+    assert "s.name_key = p.name_key" in query and "unaccent" not in query
+
+
+def test_player_rows_store_the_same_keys_as_stats_rows(frame):
+    stats = pitcher_stats_rows(2025, frame.iloc[:1])[0]
+    # Case-folding beyond lower() (ß -> ss) and accents both match
+    row = stored_player_row((7, "JOSÉ  BERRÍOS", None, 101.0, "SP", None, None))
+
+    assert row[3] == stats[1] == "101"
+    assert row[-1] == stats[3] == "jose berrios"
+    assert stored_player_row((7, "Straße", None, None, "SP", None, None))[-1] == "strasse"
+
+
+def test_backfill_fills_missing_keys():
+    db = MagicMock()
+    db.execute.return_value = [{"id": 3, "player_name": "José Berríos", "idfg": " 101 "}]
+
+    assert PlayerDataAccess(db).backfill_keys() == 1
+    query, params = db.execute_many.call_args_list[0].args
+    assert query.startswith("UPDATE players") and params == [("101", "jose berrios", 3)]
+
+
+def test_database_roster_matches_snapshot_roster(frame):
+    snapshot = SeasonStatsRepository(loader=lambda season: frame.iloc[:2]).get(2025)
+    players = [{"player_name": "Jose Berrios", "idfg": None}, {"player_name": "Chris Sale", "idfg": "102"}]
+    joined = [
+        {**p, "stats_idfg": row[1], "name": row[2], "team": row[4], "ip": row[5], "era": row[6],
+         "k_pct": row[7], "stats": row[8].obj}
+        for p, row in zip(players, pitcher_stats_rows(2025, frame.iloc[:2]))
+    ]
+    joined.append({"player_name": "Nobody", "stats_idfg": None})
+
+    from_db = RosterEnricher.from_stats_rows(joined)
+    from_snapshot = RosterEnricher.enrich(players, snapshot)
+
+    np.testing.assert_allclose(from_db.features, from_snapshot.features)
+    np.testing.assert_allclose(from_db.grading, from_snapshot.grading)
+    assert from_db.names == from_snapshot.names
+    assert [p["player_name"] for p in from_db.unmatched] == ["Nobody"]
+    with pytest.raises(ValueError):
+        PitcherRecommenderService.recommend_lineup(from_db, snapshot, 5, "standard", "league")
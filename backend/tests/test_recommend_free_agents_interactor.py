@@ -0,0 +1,114 @@
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock
+from flask import Flask
+from backend.interactors.recommend_free_agents_interactor import RecommendFreeAgentsInteractor
+from backend.services.roster_enricher import RosterEnricher
+from backend.services.season_stats_repository import SeasonStatsRepository
+
+
+@pytest.fixture
+def app():
+    """Creates a minimal Flask app for testing."""
+    app = Flask(__name__)
+    app.config["TESTING"] = True
+    return app
+
+
+@pytest.fixture
+def mock_team_data():
+    """Mocked TeamDataAccessInterface."""
+    team_data = MagicMock()
+    team_data.rostered_players.return_value = []
+    return team_data
+
+
+@pytest.fixture
+def league():
+    rng = np.random.default_rng(3)
+    features = list(RosterEnricher.FEATURES)
+    frame = pd.DataFrame(rng.uniform(0, 150, size=(30, len(features))), columns=features)
+    frame.insert(0, "name", [f"Arm {i}" for i in range(30)])
+    frame.insert(1, "idfg", list(range(1000, 1030)))
+    frame["team"] = ["FA"] * 30
+    frame["ip"] = 100.0
+    return frame
+
+
+@pytest.fixture
+def interactor(mock_team_data, league):
+    return RecommendFreeAgentsInteractor(
+        team_data_access=mock_team_data,
+        stats_repository=SeasonStatsRepository(loader=lambda season: league),
+    )
+
+
+# ------------------------------------------
+# TEST 1 — Rostered pitchers are never recommended
+# ------------------------------------------
+def test_excludes_rostered_pitchers(app, interactor, mock_team_data):
+    mock_team_data.get_all_players.return_value = [
+        {"player_name": f"Arm {i}"} for i in range(0, 30, 2)
+    ]
+
+    with app.app_context():
+        response, status = interactor.execute(1, "standard", 0.4, 50)
+
+    assert status == 200
+    names = [r["name"] for r in response.json["free_agents"]]
+    assert len(names) == 15
+    assert all(int(n.split()[1]) % 2 == 1 for n in names)
+    assert [r["rank"] for r in response.json["free_agents"]] == list(range(1, 16))
+
+
+# ------------------------------------------
+# TEST 1b — Pitchers on other teams (opponents included) are never recommended
+# ------------------------------------------
+def test_excludes_pitchers_on_other_teams(app, interactor, mock_team_data):
+    mock_team_data.get_all_players.return_value = [{"player_name": "Arm 0"}]
+    # Everyone rostered anywhere in the league, this team included
+    mock_team_data.rostered_players.return_value = [
+        {"player_name": "Arm 0", "idfg": "1000"},
+        {"player_name": "Arm 1", "idfg": None},
+        {"player_name": "Someone Else", "idfg": "1002"},
+    ]
+
+    with app.app_context():
+        response, status = interactor.execute(1, "standard", 0.4, 50)
+
+    assert status == 200
+    names = {r["name"] for r in response.json["free_agents"]}
+    assert len(names) == 27
+    assert not names & {"Arm 0", "Arm 1", "Arm 2"}
+
+
+# ------------------------------------------
+# TEST 2 — Empty team: no penalty, whole league is available
+# ------------------------------------------
+def test_empty_team_has_no_penalty(app, interactor, mock_team_data):
+    mock_team_data.get_all_players.return_value = []
+
+    with app.app_context():
+        response, status = interactor.execute(1, "standard", 0.4, 5)
+
+    assert status == 200
+    rows = response.json["free_agents"]
+    assert len(rows) == 5
+    assert all(r["similarity"] == 0 and r["score"] == r["base_score"] for r in rows)
+    assert rows[0]["idfg"].startswith("10")
+
+
+# ------------------------------------------
+# TEST 3 — Service raises an exception → returns 500
+# ------------------------------------------
+def test_exception_handling(app, mock_team_data):
+    mock_team_data.get_all_players.return_value = []
+    loader = MagicMock(side_effect=Exception("API error"))
+    interactor = RecommendFreeAgentsInteractor(mock_team_data, SeasonStatsRepository(loader=loader))
+
+    with app.app_context():
+        response, status = interactor.execute(1, "standard", 0.4, 5)
+
+    assert status == 500
+    assert "API error" in response.json["error"]
@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import MagicMock, patch
 from flask import Flask
 from backend.interactors.recommend_lineup_interactor import RecommendLineupInteractor
+from backend.services.season_stats_repository import SeasonStatsRepository
 
 
 @pytest.fixture
@@ -24,8 +25,14 @@ def mock_team_data():
 
 
 @pytest.fixture
-def interactor(mock_team_data):
-    return RecommendLineupInteractor(team_data_access=mock_team_data)
+def mock_pitching_stats():
+    """Stand-in for pybaseball.pitching_stats used by the stats repository."""
+    return MagicMock()
+
+
+@pytest.fixture
+def interactor(mock_team_data, mock_pitching_stats):
+    return RecommendLineupInteractor(team_data_access=mock_team_data, stats_repository=SeasonStatsRepository(loader=mock_pitching_stats))
 
 
 # ------------------------------------------
@@ -44,7 +51,6 @@ def test_no_players_found(app, client, interactor, mock_team_data):
 # ------------------------------------------
 # TEST 2 — No MLB stat match for any player
 # ------------------------------------------
-@patch("backend.interactors.recommend_lineup_interactor.pitching_stats")
 def test_no_mlb_stats_match(mock_pitching_stats, app, interactor, mock_team_data):
     # Team has players
     mock_team_data.get_all_players.return_value = [
@@ -67,8 +73,7 @@ def test_no_mlb_stats_match(mock_pitching_stats, app, interactor, mock_team_data
 # ------------------------------------------
 # TEST 3 — Successful recommendation
 # ------------------------------------------
-@patch("backend.interactors.recommend_lineup_interactor.pitching_stats")
-@patch("backend.interactors.recommend_lineup_interactor.PitcherRecommenderService")
+@patch("backend.interactors.recommend_lineup_interactor.PitcherRecommenderService.recommend_lineup")
 def test_success_recommendation(mock_recommender, mock_pitching_stats, app, interactor, mock_team_data):
     # Team players
     mock_team_data.get_all_players.return_value = [
@@ -93,10 +98,8 @@ def test_success_recommendation(mock_recommender, mock_pitching_stats, app, inte
     )
 
     # Mock recommender output
-    import pandas as pd
-    result_df = pd.DataFrame([{"rank": 1, "name": "Jacob deGrom", "score": 1.88}])
-    mock_recommender.recommend_starting_pitchers.return_value = (
-        result_df,
+    mock_recommender.return_value = (
+        [{"rank": 1, "name": "Jacob deGrom", "team": "NYM", "score": 1.88}],
         "standard strategy selected",
     )
 
@@ -113,8 +116,7 @@ def test_success_recommendation(mock_recommender, mock_pitching_stats, app, inte
 # ------------------------------------------
 # TEST 4 — Some players match, some don't
 # ------------------------------------------
-@patch("backend.interactors.recommend_lineup_interactor.pitching_stats")
-@patch("backend.interactors.recommend_lineup_interactor.PitcherRecommenderService")
+@patch("backend.interactors.recommend_lineup_interactor.PitcherRecommenderService.recommend_lineup")
 def test_partial_player_match(mock_recommender, mock_pitching_stats, app, interactor, mock_team_data):
     mock_team_data.get_all_players.return_value = [
         {"player_name": "Jacob deGrom"},
@@ -125,9 +127,10 @@ def test_partial_player_match(mock_recommender, mock_pitching_stats, app, intera
         {"name": ["Jacob deGrom"], "pitching+": [120]}
     )
 
-    import pandas as pd
-    result_df = pd.DataFrame([{"rank": 1, "name": "Jacob deGrom", "score": 1.88}])
-    mock_recommender.recommend_starting_pitchers.return_value = (result_df, "standard strategy selected")
+    mock_recommender.return_value = (
+        [{"rank": 1, "name": "Jacob deGrom", "team": "Unknown", "score": 1.88}],
+        "standard strategy selected",
+    )
 
     with app.app_context():
         response, status = interactor.execute(1, "standard")
@@ -139,7 +142,6 @@ def test_partial_player_match(mock_recommender, mock_pitching_stats, app, intera
 # ------------------------------------------
 # TEST 5 — Service raises an exception → returns 500
 # ------------------------------------------
-@patch("backend.interactors.recommend_lineup_interactor.pitching_stats")
 def test_exception_handling(mock_pitching_stats, app, interactor, mock_team_data):
     mock_team_data.get_all_players.return_value = [{"player_name": "Pitcher"}]
 
@@ -151,3 +153,221 @@ def test_exception_handling(mock_pitching_stats, app, interactor, mock_team_data
 
     assert status == 500
     assert "API error" in response.json["error"]
+
+
+# ------------------------------------------
+# TEST 6 — League normalization is forwarded and echoed back
+# ------------------------------------------
+@patch("backend.interactors.recommend_lineup_interactor.PitcherRecommenderService.recommend_lineup")
+def test_league_normalization_forwarded(mock_recommender, mock_pitching_stats, app, interactor, mock_team_data):
+    mock_team_data.get_all_players.return_value = [{"player_name": "Jacob deGrom"}]
+    mock_pitching_stats.return_value = __import__("pandas").DataFrame(
+        {"name": ["Jacob deGrom"], "pitching+": [120]}
+    )
+    mock_recommender.return_value = (
+        [{"rank": 1, "name": "Jacob deGrom", "team": "Unknown", "score": 1.88}],
+        "standard strategy selected",
+    )
+
+    with app.app_context():
+        response, status = interactor.execute(1, "standard", "league")
+
+    assert status == 200
+    assert response.json["normalization"] == "league"
+    assert mock_recommender.call_args.args[4] == "league"
+
+
+# ------------------------------------------
+# TEST 7 — Unknown normalization mode → 400
+# ------------------------------------------
+def test_unknown_normalization_rejected(app, interactor, mock_team_data):
+    with app.app_context():
+        response, status = interactor.execute(1, "standard", "galaxy")
+
+    assert status == 400
+    assert "normalization" in response.json["error"]
+    mock_team_data.get_all_players.assert_not_called()
+
+
+# ------------------------------------------
+# TEST 8 — profile=all returns every profile from one request
+# ------------------------------------------
+def test_all_profiles(mock_pitching_stats, app, interactor, mock_team_data):
+    mock_team_data.get_all_players.return_value = [
+        {"player_name": "Jacob deGrom"},
+        {"player_name": "Chris Sale"},
+    ]
+    mock_pitching_stats.return_value = __import__("pandas").DataFrame(
+        {"name": ["Jacob deGrom", "Chris Sale"], "pitching+": [120, 110], "gb%": [40, 50]}
+    )
+
+    with app.app_context():
+        response, status = interactor.execute(1, "all")
+
+    assert status == 200
+    profiles = response.json["profiles"]
+    assert set(profiles) == {"standard", "strikeout", "control", "groundball", "clutch", "sabermetrics"}
+    assert response.json["lineup"] == profiles["standard"]["lineup"]
+    assert profiles["groundball"]["lineup"][0]["position"] == "SP"
+
+
+# ------------------------------------------
+# TEST 9 — Unknown profile → 400 instead of silently using standard
+# ------------------------------------------
+def test_unknown_profile_rejected(app, interactor, mock_team_data):
+    with app.app_context():
+        response, status = interactor.execute(1, "galaxy-brain")
+
+    assert status == 400
+    assert "Unknown scoring profile" in response.json["error"]
+    mock_team_data.get_all_players.assert_not_called()
+
+
+# ------------------------------------------
+# TEST 9 — Repeat views are served from the result cache
+# ------------------------------------------
+@patch("backend.interactors.recommend_lineup_interactor.PitcherRecommenderService.recommend_lineup")
+def test_repeat_view_is_cached(mock_recommender, mock_pitching_stats, app, interactor, mock_team_data):
+    mock_team_data.get_all_players.return_value = [{"player_name": "Jacob deGrom"}]
+    mock_pitching_stats.return_value = __import__("pandas").DataFrame(
+        {"name": ["Jacob deGrom", "Chris Sale"], "pitching+": [120, 110]}
+    )
+    mock_recommender.return_value = (
+        [{"rank": 1, "name": "Jacob deGrom", "team": "Unknown", "score": 1.88}],
+        "standard strategy selected",
+    )
+
+    with app.app_context():
+        first, _ = interactor.execute(1, "standard")
+        second, status = interactor.execute(1, "standard")
+        interactor.execute(1, "strikeout")
+        mock_team_data.get_all_players.return_value.append({"player_name": "Chris Sale"})
+        interactor.execute(1, "standard")
+
+    assert status == 200
+    assert second.json == first.json
+    assert mock_recommender.call_count == 3
+    assert interactor.result_cache.stats()["hits"] == 1
+
+
+# ------------------------------------------
+# TEST 10 — Malformed as_of → 400, dates before any history → 404
+# ------------------------------------------
+def test_as_of_validation(app, interactor, mock_team_data):
+    mock_team_data.get_all_players.return_value = [{"player_name": "Jacob deGrom"}]
+
+    with app.app_context():
+        bad_response, bad_status = interactor.execute(1, "standard", "roster", "last tuesday")
+        missing_response, missing_status = interactor.execute(1, "standard", "roster", "2001-04-01")
+
+    assert bad_status == 400
+    assert "as_of" in bad_response.json["error"]
+    assert missing_status == 404
+    assert "2001-04-01" in missing_response.json["error"]
+
+
+# ------------------------------------------
+# TEST 11 — form=N ranks on rolling form; bad windows → 400
+# ------------------------------------------
+def test_form_window_ranks_on_recent_form(app, mock_team_data):
+    from datetime import date, timedelta
+    import pandas as pd
+    from backend.services.rolling_form import RollingFormTracker
+
+    def line(days, so_per_day):
+        return pd.DataFrame({
+            "idfg": [1, 2], "name": ["Ace Slumping", "Steady Eddie"],
+            "tbf": [27 * days, 27 * days], "so": [so_per_day[0] * days, so_per_day[1] * days],
+            "bb": [2 * days, 2 * days], "er": [2 * days, 2 * days], "ip": [6.0 * days, 6.0 * days],
+            "k-bb%": [0.30, 0.10],
+        })
+
+    season = line(20, (10, 5))
+    tracker = RollingFormTracker(2025)
+    start = date(2025, 5, 1)
+    tracker.update(start, season)
+    # The ace stops striking anyone out over the last week
+    for n in range(1, 8):
+        recent = season.assign(so=[season["so"][0] + 2 * n, season["so"][1] + 8 * n], tbf=season["tbf"] + 27 * n)
+        tracker.update(start + timedelta(days=n), recent)
+
+    mock_team_data.get_all_players.return_value = [{"player_name": "Ace Slumping"}, {"player_name": "Steady Eddie"}]
+    repo = SeasonStatsRepository(loader=lambda s: recent)
+    interactor = RecommendLineupInteractor(mock_team_data, repo, form_tracker=tracker)
+
+    with app.app_context():
+        season_response, _ = interactor.execute(1, "strikeout")
+        form_response, status = interactor.execute(1, "strikeout", form="7")
+        bad_response, bad_status = interactor.execute(1, "strikeout", form="5")
+        league_response, league_status = interactor.execute(1, "strikeout", "league", form="7")
+
+    assert season_response.json["lineup"][0]["name"] == "Ace Slumping"
+    assert status == 200
+    assert form_response.json["form"] == 7
+    assert form_response.json["lineup"][0]["name"] == "Steady Eddie"
+    assert form_response.json["form_features"] == ["k-bb%", "swstr%"]
+    assert season_response.json["form_features"] == []
+    assert bad_status == 400 and "form" in bad_response.json["error"]
+    assert league_status == 400
+
+
+
+def test_form_is_refused_until_the_tracker_is_warm(app, mock_team_data):
+    from backend.services.rolling_form import RollingFormTracker
+
+    mock_team_data.get_all_players.return_value = [{"player_name": "Jacob deGrom"}]
+    tracker = RollingFormTracker(2025, ready=False)
+    interactor = RecommendLineupInteractor(mock_team_data, SeasonStatsRepository(), form_tracker=tracker)
+
+    with app.app_context():
+        response, status = interactor.execute(1, "standard", form="7")
+
+    assert status == 503 and "loading" in response.json["error"]
+    mock_team_data.get_all_players.assert_not_called()
+
+
+def test_database_stats_used_for_roster_lineups(app, mock_team_data):
+    """With pitcher_stats wired in, the roster is joined to its stats in SQL instead of in memory."""
+    import pandas as pd
+    from backend.services.season_stats_repository import CURRENT_SEASON
+
+    players = [{"player_name": "Jacob deGrom"}, {"player_name": "Max Fried"}, {"player_name": "Nobody"}]
+    mock_team_data.get_all_players.return_value = players
+    repo = SeasonStatsRepository(loader=lambda season: pd.DataFrame({
+        "idfg": [1, 2], "name": ["Jacob deGrom", "Max Fried"], "stuff+": [100, 100], "ip": [100.0, 100.0],
+    }))
+    pitcher_stats = MagicMock()
+    rows = [
+        {**players[0], "stats_idfg": "1", "name": "Jacob deGrom", "team": "TEX", "ip": 100.0, "era": 3.0,
+         "k_pct": 0.3, "stats": {"stuff+": 90}, "row_hash": 11, "updated_at": "t1"},
+        {**players[1], "stats_idfg": "2", "name": "Max Fried", "team": "NYY", "ip": 100.0, "era": 3.0,
+         "k_pct": 0.3, "stats": {"stuff+": 140}, "row_hash": 22, "updated_at": "t1"},
+        {**players[2], "stats_idfg": None},
+    ]
+    pitcher_stats.roster_stats.return_value = rows
+    interactor = RecommendLineupInteractor(mock_team_data, repo, pitcher_stats=pitcher_stats)
+
+    with app.app_context():
+        response, status = interactor.execute(3, "standard")
+        cached_response, _ = interactor.execute(3, "standard")
+        # A rewritten stat row gives a new key
+        pitcher_stats.roster_stats.return_value = [
+            {**rows[0], "stats": {"stuff+": 160}, "row_hash": 12, "updated_at": "t2"}, rows[1], rows[2],
+        ]
+        updated_response, _ = interactor.execute(3, "standard")
+
+    assert status == 200
+    pitcher_stats.roster_stats.assert_called_with(3, CURRENT_SEASON)
+    assert response.json["lineup"][0]["name"] == "Max Fried"
+    assert cached_response.json == response.json
+    assert updated_response.json["lineup"][0]["name"] == "Jacob deGrom"
+    # Neither the roster read nor the in-memory snapshot was touched
+    mock_team_data.get_all_players.assert_not_called()
+    assert repo.peek() is None
+
+    with app.app_context():
+        league_response, league_status = interactor.execute(3, "standard", "league")
+
+    # League normalization needs snapshot rows, so it stays on the in-memory join
+    assert league_status == 200
+    assert pitcher_stats.roster_stats.call_count == 3
@@ -0,0 +1,30 @@
+from backend.services.result_cache import ResultCache, roster_fingerprint
+
+
+def test_fingerprint_ignores_order_but_not_content():
+    a = {"player_name": "A", "idfg": "1", "position": "SP"}
+    b = {"player_name": "B", "idfg": "2", "position": "SP"}
+
+    assert roster_fingerprint([a, b]) == roster_fingerprint([b, a])
+    assert roster_fingerprint([a, b]) != roster_fingerprint([a])
+    assert roster_fingerprint([a]) != roster_fingerprint([dict(a, position="RP")])
+
+
+def test_lru_eviction_and_counters():
+    cache = ResultCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)  # evicts "b"
+
+    assert cache.get("b") is None
+    assert cache.get_or_compute("b", lambda: 4) == 4
+    assert cache.get_or_compute("b", lambda: 5) == 4
+    assert cache.stats() == {"entries": 2, "max_entries": 2, "hits": 2, "misses": 2, "hit_rate": 0.5}
+
+
+def test_none_results_are_not_stored():
+    cache = ResultCache()
+
+    assert cache.get_or_compute("k", lambda: None) is None
+    assert cache.stats()["entries"] == 0
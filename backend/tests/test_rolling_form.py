@@ -0,0 +1,157 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.services.roster_enricher import RosterEnricher
+from backend.services.rolling_form import RollingFormTracker, innings_to_outs
+from backend.services.season_stats_repository import SeasonStatsRepository, SeasonStatsSnapshot
+from backend.services.stats_history import SeasonStatsHistory
+
+
+DAY = date(2025, 5, 1)
+
+
+def season_to_date(days, daily=(27, 9, 2, 3, 6.0, 100, 0.12)):
+    """One pitcher's season line after `days` identical outings (tbf, so, bb, er, ip, pitches, swstr%)."""
+    tbf, so, bb, er, ip, pitches, swstr = daily
+    return pd.DataFrame({
+        "idfg": [1001],
+        "name": ["Gerrit Cole"],
+        "tbf": [tbf * days],
+        "so": [so * days],
+        "bb": [bb * days],
+        "er": [er * days],
+        "ip": [ip * days],
+        "pitches": [pitches * days],
+        "swstr%": [swstr],
+    })
+
+
+def feed(tracker, days, start=DAY):
+    for n in range(days + 1):
+        tracker.update(start + timedelta(days=n), season_to_date(n))
+
+
+def test_innings_to_outs():
+    np.testing.assert_array_equal(innings_to_outs([6.0, 6.1, 6.2, np.nan]), [18, 19, 20, 0])
+
+
+def test_windows_hold_only_their_days():
+    tracker = RollingFormTracker(2025)
+    feed(tracker, 40)
+
+    for window in RollingFormTracker.WINDOWS:
+        rates = tracker.rates(window).set_index("idfg").loc["1001"]
+        assert rates["tbf"] == 27 * window
+        assert rates["k%"] == pytest.approx(9 / 27)
+        assert rates["k-bb%"] == pytest.approx(7 / 27)
+        assert rates["era"] == pytest.approx(4.5)
+        assert rates["swstr%"] == pytest.approx(0.12)
+
+
+def test_bad_week_shows_up_in_short_windows_only():
+    tracker = RollingFormTracker(2025)
+    feed(tracker, 30)
+    line = season_to_date(30)
+    for n in range(1, 8):
+        line = line.assign(tbf=line["tbf"] + 25, so=line["so"] + 2, bb=line["bb"] + 4, er=line["er"] + 6, ip=line["ip"] + 4.0)
+        tracker.update(DAY + timedelta(days=30 + n), line)
+
+    week = tracker.rates(7).set_index("idfg").loc["1001"]
+    month = tracker.rates(30).set_index("idfg").loc["1001"]
+    assert week["k-bb%"] == pytest.approx(-2 / 25)
+    assert week["era"] == pytest.approx(13.5)
+    assert month["era"] < week["era"]
+
+
+def test_same_day_update_replaces_the_increment():
+    tracker = RollingFormTracker(2025)
+    tracker.update(DAY, season_to_date(0))
+    tracker.update(DAY + timedelta(days=1), season_to_date(1))
+    tracker.update(DAY + timedelta(days=1), season_to_date(2))
+
+    assert tracker.rates(7).set_index("idfg").loc["1001", "tbf"] == 54
+
+
+def test_gaps_expire_old_days():
+    tracker = RollingFormTracker(2025)
+    feed(tracker, 3)
+    tracker.update(DAY + timedelta(days=40), season_to_date(3))
+
+    rates = tracker.rates(30)
+    assert rates["tbf"].tolist() == [0]
+    assert np.isnan(rates["k%"].iloc[0])
+
+
+def test_days_must_not_go_backwards():
+    tracker = RollingFormTracker(2025)
+    tracker.update(DAY, season_to_date(1))
+
+    with pytest.raises(ValueError):
+        tracker.update(DAY - timedelta(days=1), season_to_date(1))
+
+
+def test_unknown_window_rejected():
+    with pytest.raises(ValueError):
+        RollingFormTracker(2025).rates(10)
+
+
+def test_feature_matrix_swaps_in_form_for_qualified_pitchers():
+    tracker = RollingFormTracker(2025)
+    feed(tracker, 10)
+    frame = pd.concat([season_to_date(10), season_to_date(10).assign(idfg=[2002], name=["Zac Gallen"])])
+    frame = frame.assign(**{"k-bb%": [0.30, 0.20]}).reset_index(drop=True)
+    snapshot = SeasonStatsSnapshot(season=2025, frame=frame)
+
+    matrix = tracker.feature_matrix(snapshot, 7)
+
+    kbb = RosterEnricher.FEATURES.index("k-bb%")
+    assert matrix[0, kbb] == pytest.approx(7 / 27)
+    # No form sample for Gallen: season value kept
+    assert matrix[1, kbb] == pytest.approx(0.20)
+    assert tracker.feature_matrix(snapshot, 7) is matrix
+
+    roster = tracker.apply(RosterEnricher.enrich([{"player_name": "Gerrit Cole"}], snapshot), snapshot, 7)
+    assert roster.features[0, kbb] == pytest.approx(7 / 27)
+
+
+def test_feature_matrix_replaces_its_entry_on_update():
+    tracker = RollingFormTracker(2025)
+    feed(tracker, 10)
+    snapshot = SeasonStatsSnapshot(season=2025, frame=season_to_date(10).assign(**{"k-bb%": [0.30]}))
+    before = tracker.feature_matrix(snapshot, 7)
+    entries = len(snapshot._derived)
+
+    for n in range(11, 16):
+        tracker.update(DAY + timedelta(days=n), season_to_date(n))
+        after = tracker.feature_matrix(snapshot, 7)
+
+    assert after is not before
+    assert len(snapshot._derived) == entries
+
+
+def test_from_history_replays_recorded_days(tmp_path):
+    history = SeasonStatsHistory(str(tmp_path), SeasonStatsRepository(loader=lambda season: None))
+    for n in range(10):
+        history.record(2025, DAY + timedelta(days=n), season_to_date(n))
+
+    tracker = RollingFormTracker.from_history(history, 2025, DAY + timedelta(days=9))
+
+    assert tracker.day == DAY + timedelta(days=9)
+    assert tracker.rates(7).set_index("idfg").loc["1001", "tbf"] == 27 * 7
+    assert tracker.ready
+
+
+def test_warm_up_marks_the_tracker_ready_even_if_history_fails():
+    class BrokenHistory:
+        def days(self, season):
+            raise OSError("history unreadable")
+
+    tracker = RollingFormTracker(2025, ready=False)
+    assert not tracker.ready and not tracker.stats()["ready"]
+
+    with pytest.raises(OSError):
+        tracker.warm_up(BrokenHistory(), DAY)
+    assert tracker.ready
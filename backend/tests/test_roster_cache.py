@@ -0,0 +1,89 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.database.data_access_postgresql import PlayerDataAccess, TeamDataAccess
+from backend.database.entities.player_entity import PlayerEntity
+from backend.database.roster_cache import ROSTER_CHANNEL, RosterCache, RosterChangeListener
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def cache(clock):
+    return RosterCache(max_entries=2, ttl_seconds=10.0, clock=clock)
+
+
+def test_hit_returns_copy_without_loading(cache):
+    load = MagicMock(return_value=[{"player_name": "A"}])
+
+    first = cache.get(1, load)
+    first[0]["player_name"] = "mutated"
+    second = cache.get(1, load)
+
+    assert second == [{"player_name": "A"}]
+    assert load.call_count == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_entries_expire_and_evict_least_recently_used(cache, clock):
+    load = MagicMock(return_value=[])
+    cache.get(1, load)
+    cache.get(2, load)
+    cache.get(1, load)
+    cache.get(3, load)  # evicts team 2
+
+    cache.get(2, load)
+    assert load.call_count == 4
+
+    clock.now = 11.0
+    cache.get(1, load)
+    assert load.call_count == 5
+
+
+def test_invalidation_during_load_is_not_cached(cache):
+    def load():
+        cache.invalidate(1)
+        return [{"player_name": "stale"}]
+
+    assert cache.get(1, load) == [{"player_name": "stale"}]
+    assert cache.get(1, lambda: [{"player_name": "fresh"}]) == [{"player_name": "fresh"}]
+
+
+def test_listener_payloads(cache):
+    listener = RosterChangeListener("postgresql://unused", cache)
+    cache.get(1, lambda: [])
+    cache.get(2, lambda: [])
+
+    listener.handle("1")
+    assert cache.stats()["entries"] == 1
+    listener.handle("*")
+    assert cache.stats()["entries"] == 0
+
+
+def test_roster_writes_invalidate_and_notify(cache):
+    db = MagicMock()
+    db.execute.return_value = [{"player_name": "A"}]
+    teams = TeamDataAccess(db, MagicMock(), cache)
+    players = PlayerDataAccess(db, cache)
+
+    teams.get_all_players(5)
+    teams.get_all_players(5)
+    assert db.execute.call_count == 1
+
+    players.create(PlayerEntity(5, "B", None, None, "SP", None, None))
+
+    db.execute_many.assert_called_once_with("SELECT pg_notify(%s, %s);", [(ROSTER_CHANNEL, "5")])
+    teams.get_all_players(5)
+    assert cache.stats()["misses"] == 2
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.services.roster_enricher import RosterEnricher
+from backend.services.season_stats_repository import SeasonStatsRepository
+
+
+@pytest.fixture
+def snapshot(mock_stats_df):
+    return SeasonStatsRepository(loader=lambda season: mock_stats_df).get(2025)
+
+
+def test_enrich_aligns_features_with_players(snapshot):
+    players = [
+        {"player_name": "User Starter B", "position": "SP"},
+        {"player_name": "user starter a", "position": "RP"},
+    ]
+
+    roster = RosterEnricher.enrich(players, snapshot)
+
+    assert len(roster) == 2
+    assert roster.names == ["User Starter B", "User Starter A"]
+    assert roster.teams == ["USR", "USR"]
+    assert [p["position"] for p in roster.players] == ["SP", "RP"]
+    assert roster.features.shape == (2, len(RosterEnricher.FEATURES))
+    assert roster.features.dtype == np.float64
+    assert roster.features.flags["C_CONTIGUOUS"]
+    assert roster.features[0, RosterEnricher.FEATURES.index("stuff+")] == 100
+    assert roster.grading_stats(1) == {"K%": 0.27, "IP": 160.0, "ERA": 3.50}
+
+
+def test_unmatched_players_are_reported_separately(snapshot):
+    players = [{"player_name": "Nobody"}, {"player_name": "Opp Starter One"}]
+
+    roster = RosterEnricher.enrich(players, snapshot)
+
+    assert roster.names == ["Opp Starter One"]
+    assert roster.unmatched == [{"player_name": "Nobody"}]
+
+
+def test_empty_roster(snapshot):
+    roster = RosterEnricher.enrich([{"player_name": "Nobody"}], snapshot)
+
+    assert len(roster) == 0
+    assert roster.features.shape == (0, len(RosterEnricher.FEATURES))
+    assert roster.to_pitcher_dicts() == []
+
+
+def test_missing_columns_and_nans_use_defaults():
+    frame = pd.DataFrame({"name": ["Sparse Arm"], "stuff+": [np.nan], "gb%": [48.0]})
+    snapshot = SeasonStatsRepository(loader=lambda season: frame).get(2025)
+
+    roster = RosterEnricher.enrich([{"player_name": "Sparse Arm"}], snapshot)
+    record = roster.to_pitcher_dicts()[0]
+
+    assert record["team"] == "Unknown"
+    assert record["stuff+"] == 100.0
+    assert record["pitching+"] == 100.0
+    assert record["xfip-"] == 100.0
+    assert record["gb%"] == 48.0
+    assert record["k-bb%"] == 0.0
+
+
+def test_league_matrix_is_built_once_per_snapshot(snapshot):
+    first = RosterEnricher.feature_matrix(snapshot)
+
+    assert RosterEnricher.feature_matrix(snapshot) is first
+    assert not first.flags.writeable
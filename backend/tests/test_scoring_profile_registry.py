@@ -0,0 +1,212 @@
+import numpy as np
+import pytest
+from flask import Flask
+
+from backend.controller.scoring_profile_controller import ScoringProfileController
+from backend.database.data_access_interface import ScoringProfileDataAccessInterface
+from backend.services.pitcher_recomender_service import PitcherRecommenderService
+from backend.services.scoring_profile_registry import (
+    DuplicateProfileError,
+    ScoringProfileRegistry,
+    UnknownProfileError,
+)
+
+
+class InMemoryProfiles(ScoringProfileDataAccessInterface):
+    """scoring_profiles table stand-in that counts reads."""
+
+    def __init__(self):
+        self.rows = {}
+        self.reads = 0
+        self._next_id = 1
+
+    def create(self, profile):
+        row = {
+            "id": self._next_id,
+            "user_id": profile.get_user_id(),
+            "name": profile.get_name(),
+            "weights": dict(profile.get_weights()),
+            "explanation": profile.get_explanation(),
+            "revision": 1,
+        }
+        self.rows[row["id"]] = row
+        self._next_id += 1
+        return dict(row)
+
+    def read(self, profile_id):
+        self.reads += 1
+        row = self.rows.get(profile_id)
+        return dict(row) if row else None
+
+    def revision(self, profile_id):
+        row = self.rows.get(profile_id)
+        return row["revision"] if row else None
+
+    def list_by_user(self, user_id):
+        return [dict(r) for r in self.rows.values() if r["user_id"] == user_id]
+
+    def update(self, profile):
+        row = self.rows.get(profile.get_id())
+        if not row:
+            return None
+        row.update(
+            name=profile.get_name(),
+            weights=dict(profile.get_weights()),
+            explanation=profile.get_explanation(),
+            revision=row["revision"] + 1,
+        )
+        return dict(row)
+
+    def delete(self, profile_id):
+        row = self.rows.pop(profile_id, None)
+        return {"id": row["id"], "revision": row["revision"]} if row else None
+
+
+@pytest.fixture
+def store():
+    return InMemoryProfiles()
+
+
+@pytest.fixture
+def registry(store):
+    return ScoringProfileRegistry(store)
+
+
+def test_builtin_profiles_resolve_without_a_store():
+    compiled = ScoringProfileRegistry().resolve("strikeout")
+
+    assert compiled is PitcherRecommenderService.get_profile("strikeout")
+    assert compiled.explanation == PitcherRecommenderService.EXPLANATIONS["strikeout"]
+
+
+@pytest.mark.parametrize("selector", ["nope", "custom:abc", "custom:99", "all"])
+def test_unknown_selectors_raise(registry, selector):
+    with pytest.raises(UnknownProfileError):
+        registry.resolve(selector)
+
+
+def test_custom_profile_is_compiled_once(registry, store):
+    created = registry.create(7, " Aces ", {"Stuff+": 0.6, "xfip-": -0.4})
+
+    assert created["name"] == "Aces"
+    assert created["weights"] == {"stuff+": 0.6, "xfip-": -0.4}
+    assert created["profile"] == f"custom:{created['id']}"
+
+    first = registry.resolve(created["profile"])
+    second = registry.resolve(created["profile"])
+
+    assert first is second
+    assert store.reads == 0
+    expected = PitcherRecommenderService.compile_profile({"stuff+": 0.6, "xfip-": -0.4})
+    np.testing.assert_array_equal(first.weights, expected.weights)
+    assert first.offset == pytest.approx(0.4)
+
+
+def test_cold_cache_reads_store_once(store):
+    profile_id = ScoringProfileRegistry(store).create(7, "Aces", {"stuff+": 1.0})["id"]
+    registry = ScoringProfileRegistry(store)
+
+    registry.resolve(f"custom:{profile_id}")
+    registry.resolve(f"custom:{profile_id}")
+
+    assert store.reads == 1
+
+
+def test_update_bumps_revision_and_evicts(registry):
+    created = registry.create(7, "Aces", {"stuff+": 1.0})
+    before = registry.resolve(created["profile"])
+
+    updated = registry.update(created["id"], weights={"gb%": 0.5})
+    after = registry.resolve(created["profile"])
+
+    assert updated["revision"] == 2
+    assert updated["name"] == "Aces"
+    assert after is not before
+    assert after.name != before.name
+    assert after.weights[PitcherRecommenderService.FEATURES.index("gb%")] == 0.5
+
+
+def test_delete_evicts(registry):
+    created = registry.create(7, "Aces", {"stuff+": 1.0})
+    registry.resolve(created["profile"])
+
+    assert registry.delete(created["id"])
+    with pytest.raises(UnknownProfileError):
+        registry.resolve(created["profile"])
+
+
+def test_changes_through_another_registry_are_seen(store):
+    # Two workers sharing one database
+    mine, theirs = ScoringProfileRegistry(store), ScoringProfileRegistry(store)
+    created = mine.create(7, "Aces", {"stuff+": 1.0})
+    before = theirs.resolve(created["profile"])
+
+    mine.update(created["id"], weights={"gb%": 0.5})
+    after = theirs.resolve(created["profile"])
+
+    assert after.name != before.name
+    assert after.weights[PitcherRecommenderService.FEATURES.index("gb%")] == 0.5
+    assert theirs.resolve(created["profile"]) is after
+
+    mine.delete(created["id"])
+    with pytest.raises(UnknownProfileError):
+        theirs.resolve(created["profile"])
+
+
+def test_duplicate_name_rejected(registry):
+    registry.create(7, "Aces", {"stuff+": 1.0})
+
+    with pytest.raises(DuplicateProfileError):
+        registry.create(7, "Aces", {"gb%": 1.0})
+    assert registry.create(8, "Aces", {"gb%": 1.0})["user_id"] == 8
+
+
+@pytest.mark.parametrize(
+    "name, weights",
+    [
+        ("", {"stuff+": 1.0}),
+        ("x", {}),
+        ("x", ["stuff+"]),
+        ("x", {"velocity": 1.0}),
+        ("x", {"stuff+": "high"}),
+        ("x", {"stuff+": True}),
+        ("x", {"stuff+": float("nan")}),
+        ("x", {"stuff+": 2.5}),
+        ("x", {"stuff+": 0.0}),
+    ],
+)
+def test_validation(name, weights):
+    with pytest.raises(ValueError):
+        ScoringProfileRegistry.validate(name, weights)
+
+
+# ------------------------------------------
+# Endpoints
+# ------------------------------------------
+@pytest.fixture
+def client(registry):
+    app = Flask(__name__)
+    app.config["TESTING"] = True
+    app.register_blueprint(ScoringProfileController(registry).bp)
+    return app.test_client()
+
+
+def test_crud_endpoints(client):
+    resp = client.post("/api/users/3/scoring-profiles", json={"name": "K hunter", "weights": {"k-bb%": 0.8}})
+    assert resp.status_code == 201
+    profile_id = resp.get_json()["id"]
+
+    assert client.post("/api/users/3/scoring-profiles", json={"name": "K hunter", "weights": {"gb%": 1}}).status_code == 409
+    assert client.post("/api/users/3/scoring-profiles", json={"name": "Bad", "weights": {"era": 1}}).status_code == 400
+
+    listed = client.get("/api/users/3/scoring-profiles").get_json()["profiles"]
+    assert [p["name"] for p in listed] == ["K hunter"]
+
+    resp = client.put(f"/api/scoring-profiles/{profile_id}", json={"explanation": "Strikeouts only."})
+    assert resp.status_code == 200
+    assert resp.get_json()["revision"] == 2
+    assert client.get(f"/api/scoring-profiles/{profile_id}").get_json()["explanation"] == "Strikeouts only."
+
+    assert client.delete(f"/api/scoring-profiles/{profile_id}").status_code == 200
+    assert client.get(f"/api/scoring-profiles/{profile_id}").status_code == 404
+    assert client.put(f"/api/scoring-profiles/{profile_id}", json={"name": "x"}).status_code == 404
@@ -0,0 +1,123 @@
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from backend.services.season_stats_repository import SeasonStatsRepository
+
+
+@pytest.fixture
+def raw_df():
+    return pd.DataFrame({
+        " Name ": ["Gerrit Cole", "Zac Gallen"],
+        "K%": [0.30, 0.25],
+        "IP": [200.0, 180.0],
+        "ERA": [2.50, 3.50],
+    })
+
+
+def test_normalizes_columns(raw_df):
+    repo = SeasonStatsRepository(loader=lambda season: raw_df)
+
+    snapshot = repo.get(2025)
+
+    assert snapshot.season == 2025
+    assert list(snapshot.frame.columns) == ["name", "k%", "ip", "era"]
+    # The loader's frame is left untouched
+    assert " Name " in raw_df.columns
+
+
+def test_loads_each_season_once(raw_df):
+    calls = []
+
+    def loader(season):
+        calls.append(season)
+        return raw_df
+
+    repo = SeasonStatsRepository(loader=loader)
+
+    first = repo.get(2025)
+    second = repo.get(2025)
+    repo.get(2024)
+
+    assert first is second
+    assert calls == [2025, 2024]
+
+
+def test_concurrent_callers_share_one_fetch(raw_df):
+    calls = []
+    release = threading.Event()
+
+    def slow_loader(season):
+        calls.append(season)
+        release.wait(timeout=5)
+        return raw_df
+
+    repo = SeasonStatsRepository(loader=slow_loader)
+    results = []
+
+    threads = [threading.Thread(target=lambda: results.append(repo.get(2025))) for _ in range(8)]
+    for t in threads:
+        t.start()
+    time.sleep(0.05)
+    release.set()
+    for t in threads:
+        t.join(timeout=5)
+
+    assert calls == [2025]
+    assert len(results) == 8
+    assert all(r is results[0] for r in results)
+
+
+def test_failed_load_is_not_cached(raw_df):
+    attempts = []
+
+    def flaky_loader(season):
+        attempts.append(season)
+        if len(attempts) == 1:
+            raise RuntimeError("pybaseball down")
+        return raw_df
+
+    repo = SeasonStatsRepository(loader=flaky_loader)
+
+    with pytest.raises(RuntimeError):
+        repo.get(2025)
+    assert repo.peek(2025) is None
+
+    assert len(repo.get(2025)) == 2
+    assert len(attempts) == 2
+
+
+def test_refresh_swaps_in_new_version(raw_df):
+    frames = [raw_df, raw_df.assign(IP=[201.0, 181.0])]
+    repo = SeasonStatsRepository(loader=lambda season: frames.pop(0))
+
+    before = repo.get(2025)
+    assert repo.refresh(2025) is True
+    after = repo.get(2025)
+
+    assert after.stats_version > before.stats_version
+    assert list(after.frame["ip"]) == [201.0, 181.0]
+    # A request still holding the old snapshot keeps its consistent view
+    assert list(before.frame["ip"]) == [200.0, 180.0]
+
+
+def test_refresh_without_changes_keeps_version(raw_df):
+    repo = SeasonStatsRepository(loader=lambda season: raw_df)
+
+    before = repo.get(2025)
+
+    assert repo.refresh(2025) is False
+    assert repo.get(2025) is before
+
+
+def test_invalid_refresh_keeps_last_good_snapshot(raw_df):
+    frames = [raw_df, raw_df.head(0)]
+    repo = SeasonStatsRepository(loader=lambda season: frames.pop(0))
+
+    before = repo.get(2025)
+    with pytest.raises(ValueError):
+        repo.refresh(2025)
+
+    assert repo.get(2025) is before
@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.services.season_stats_repository import SeasonStatsRepository, normalize_stats_frame
+from backend.services.season_stats_store import SeasonStatsStore
+
+
+@pytest.fixture
+def frame():
+    return normalize_stats_frame(pd.DataFrame({
+        "IDfg": [1001, 1002, 1003],
+        "Name": ["Gerrit Cole", "Zac Gallen", "José Berríos"],
+        "Team": ["NYY", None, "TOR"],
+        "K%": [0.30, 0.25, 0.22],
+        "IP": [200.0, 180.0, np.nan],
+    }))
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SeasonStatsStore(str(tmp_path))
+
+
+def test_load_missing_season_returns_none(store):
+    assert store.load(2025) is None
+
+
+def test_round_trip_preserves_values(store, frame):
+    assert store.save(2025, frame) is True
+
+    loaded, fingerprint = store.load(2025)
+
+    assert fingerprint == SeasonStatsStore.fingerprint(frame)
+    assert list(loaded.columns) == list(frame.columns)
+    assert list(loaded["name"]) == list(frame["name"])
+    assert loaded["team"].isna().tolist() == [False, True, False]
+    np.testing.assert_array_equal(loaded["idfg"].to_numpy(), frame["idfg"].to_numpy())
+    np.testing.assert_allclose(loaded["ip"].to_numpy(), frame["ip"].to_numpy(), equal_nan=True)
+
+
+def test_numeric_columns_are_memory_mapped(store, frame):
+    store.save(2025, frame)
+
+    loaded, _ = store.load(2025)
+
+    assert isinstance(loaded["k%"].values, np.memmap)
+
+
+def test_unchanged_frame_is_not_rewritten(store, frame):
+    assert store.save(2025, frame) is True
+    assert store.save(2025, frame.copy()) is False
+
+    changed = frame.copy()
+    changed.loc[0, "ip"] = 201.0
+    assert store.save(2025, changed) is True
+    loaded, _ = store.load(2025)
+    assert loaded["ip"].iloc[0] == 201.0
+
+
+def test_repository_warm_starts_from_store(store, frame):
+    calls = []
+
+    def loader(season):
+        calls.append(season)
+        return frame
+
+    SeasonStatsRepository(loader=loader, store=store).get(2025)
+    # A fresh process with the same data directory never calls the loader
+    snapshot = SeasonStatsRepository(loader=loader, store=store).get(2025)
+
+    assert calls == [2025]
+    assert list(snapshot.frame["name"]) == list(frame["name"])
+
+
+def test_nullable_columns_keep_their_dtype(store):
+    frame = normalize_stats_frame(pd.DataFrame({
+        "IDfg": [1001, 1002],
+        "Name": ["Gerrit Cole", "Zac Gallen"],
+        "W": pd.array([12, None], dtype="Int64"),
+        "IP": [200.0, 180.0],
+    }))
+    store.save(2025, frame)
+
+    loaded, _ = store.load(2025)
+
+    assert loaded.dtypes.to_dict() == frame.dtypes.to_dict()
+    assert SeasonStatsStore.fingerprint(loaded) == SeasonStatsStore.fingerprint(frame)
+
+    # The first refresh after a restart only reports the pitcher that changed
+    changed = frame.copy()
+    changed.loc[1, "ip"] = 186.0
+    repo = SeasonStatsRepository(loader=lambda season: changed, store=store)
+    repo.get(2025)
+    assert repo.refresh(2025) is True
+    assert repo.get(2025).changes.changed == {"1002"}
@@ -63,3 +63,19 @@ def test_signup_success(interactor, user_data_access, team_data_access):
     user_data_access.assign_opponent_team.assert_called_once_with(
         "alice", "team123"
     )
+
+
+def test_signup_writes_share_one_transaction(user_data_access, team_data_access):
+    user_data_access.read.return_value = None
+    team_data_access.create_opponent_user_and_team.return_value = {"opponent_team_id": 7}
+    transactions = MagicMock()
+    events = []
+    transactions.transaction.return_value.__enter__.side_effect = lambda: events.append("begin")
+    transactions.transaction.return_value.__exit__.side_effect = lambda *exc: events.append("commit")
+    user_data_access.create.side_effect = lambda *a: events.append("create") or MagicMock()
+    user_data_access.assign_opponent_team.side_effect = lambda *a: events.append("assign")
+
+    SignupInteractor(user_data_access, team_data_access, transactions).signup("alice", "pass123")
+
+    assert events == ["begin", "create", "assign", "commit"]
+    transactions.transaction.assert_called_once()
@@ -0,0 +1,156 @@
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.services.season_stats_repository import SeasonStatsRepository, SeasonStatsSnapshot
+from backend.services.statcast_features import (
+    StatcastAccumulator,
+    StatcastFeatures,
+    StatcastIngester,
+    statcast_name,
+)
+
+
+FIXTURE = Path(__file__).parent / "fixtures" / "statcast_sample.csv"
+
+
+def fold_fixture(chunk_rows=25):
+    accumulator = StatcastAccumulator(2025)
+    ingester = StatcastIngester(chunk_rows=chunk_rows)
+    StatcastIngester.ingest(ingester.file_chunks(str(FIXTURE)), accumulator)
+    return accumulator
+
+
+def by_name(accumulator):
+    return accumulator.features().set_index("name")
+
+
+def test_statcast_name():
+    assert statcast_name("Cole, Gerrit") == "Gerrit Cole"
+    assert statcast_name("Shohei Ohtani") == "Shohei Ohtani"
+
+
+def test_file_is_read_in_bounded_chunks():
+    chunks = list(StatcastIngester(chunk_rows=25).file_chunks(str(FIXTURE)))
+
+    assert max(len(c) for c in chunks) == 25
+    assert sum(len(c) for c in chunks) == 180
+    # Only the columns the accumulator needs are kept
+    assert list(chunks[0].columns) == list(StatcastAccumulator.COLUMNS)
+
+
+def test_chunking_does_not_change_the_result():
+    pd.testing.assert_frame_equal(fold_fixture(7).features(), fold_fixture(1000).features())
+
+
+def test_aggregates():
+    accumulator = fold_fixture()
+    cole = by_name(accumulator).loc["Gerrit Cole"]
+
+    assert accumulator.last_day == date(2025, 4, 28)
+    assert cole["sc_pitches"] == 60
+    assert cole["sc_swstr%"] == pytest.approx(10 / 60)
+    assert cole["sc_mix_ff"] == pytest.approx(1 / 3)
+    assert cole["sc_hardhit%"] == pytest.approx(0.5)
+    assert cole["sc_barrel%"] == pytest.approx(0.15)
+    assert cole["sc_fb_velo"] == pytest.approx(96.6)
+
+
+def test_velocity_trend_uses_the_last_two_weeks():
+    features = by_name(fold_fixture())
+
+    # Cole lost a tick over the last four outings; Gallen held steady
+    assert features.loc["Gerrit Cole", "sc_fb_velo_14d"] == pytest.approx(96.2)
+    assert features.loc["Gerrit Cole", "sc_fb_velo_trend"] == pytest.approx(-0.4)
+    assert features.loc["Zac Gallen", "sc_fb_velo_trend"] == pytest.approx(0.0)
+
+
+def test_fetch_chunks_walks_date_windows():
+    calls = []
+    pitches = pd.read_csv(FIXTURE)
+
+    def fetch(start_dt, end_dt):
+        calls.append((start_dt, end_dt))
+        days = pitches["game_date"]
+        return pitches[(days >= start_dt) & (days <= end_dt)]
+
+    accumulator = StatcastAccumulator(2025)
+    folded = StatcastIngester.ingest(
+        StatcastIngester(fetch, chunk_days=10).fetch_chunks(date(2025, 4, 1), date(2025, 4, 28)), accumulator
+    )
+
+    assert calls == [("2025-04-01", "2025-04-10"), ("2025-04-11", "2025-04-20"), ("2025-04-21", "2025-04-28")]
+    assert folded == 180
+    pd.testing.assert_frame_equal(accumulator.features(), fold_fixture().features())
+
+
+def test_missing_columns_rejected():
+    with pytest.raises(ValueError):
+        list(StatcastIngester(lambda a, b: pd.DataFrame({"pitcher": [1]})).fetch_chunks(date(2025, 4, 1), date(2025, 4, 1)))
+
+
+def test_save_and_load_round_trip(tmp_path):
+    accumulator = fold_fixture()
+    path = tmp_path / "statcast_2025.npz"
+
+    accumulator.save(str(path))
+    loaded = StatcastAccumulator.load(str(path))
+
+    assert loaded.last_day == accumulator.last_day
+    assert loaded.rows_folded == 180
+    pd.testing.assert_frame_equal(loaded.features(), accumulator.features())
+    assert StatcastAccumulator.load(str(tmp_path / "missing.npz")) is None
+
+
+def test_features_align_with_snapshot_rows(tmp_path):
+    path = tmp_path / "statcast_2025.npz"
+    fold_fixture().save(str(path))
+    features = StatcastFeatures.load(str(path))
+    snapshot = SeasonStatsSnapshot(season=2025, frame=pd.DataFrame({
+        "name": ["Zac Gallen", "Nobody Known", "Jose Berrios"],
+        "ip": [180.0, 10.0, 170.0],
+    }))
+
+    aligned = features.for_snapshot(snapshot)
+
+    assert features.version == "2025-04-28"
+    assert list(aligned.columns) == list(StatcastAccumulator.FEATURE_COLUMNS)
+    assert aligned["sc_fb_velo"].tolist()[0] == pytest.approx(94.0)
+    assert np.isnan(aligned["sc_fb_velo"].tolist()[1])
+    # Accents don't matter for the name match
+    assert aligned["sc_fb_velo"].tolist()[2] == pytest.approx(93.5)
+    assert features.for_snapshot(snapshot) is aligned
+
+
+def test_watched_features_reload_a_new_ingest_run(tmp_path):
+    path = tmp_path / "statcast_2025.npz"
+    features = StatcastFeatures.watch(str(path))
+    snapshot = SeasonStatsSnapshot(season=2025, frame=pd.DataFrame({"name": ["Zac Gallen"], "ip": [180.0]}))
+
+    # Nothing ingested yet: the columns are there, all NaN
+    assert np.isnan(features.for_snapshot(snapshot)["sc_fb_velo"].tolist()[0])
+
+    fold_fixture().save(str(path))
+    assert features.reload()
+    assert not features.reload()
+    assert features.version == "2025-04-28"
+    assert features.for_snapshot(snapshot)["sc_fb_velo"].tolist()[0] == pytest.approx(94.0)
+
+
+def test_published_features_are_snapshot_columns(tmp_path):
+    path = tmp_path / "statcast_2025.npz"
+    fold_fixture().save(str(path))
+    repo = SeasonStatsRepository(loader=lambda season: pd.DataFrame({
+        "IDfg": [1, 2], "Name": ["Zac Gallen", "Nobody Known"], "IP": [180.0, 10.0],
+    }))
+    repo.publish_columns("statcast", StatcastFeatures.watch(str(path)))
+
+    snapshot = repo.get(2025)
+
+    assert snapshot.column("sc_fb_velo").tolist()[0] == pytest.approx(94.0)
+    assert np.isnan(snapshot.column("sc_fb_velo").tolist()[1])
+    assert snapshot.column("not_a_column") is None
+    assert snapshot.extra_columns() is snapshot.extra_columns()
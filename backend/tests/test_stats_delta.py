@@ -0,0 +1,84 @@
+from unittest.mock import MagicMock
+
+import pandas as pd
+
+from backend.database.data_access_postgresql import PitcherStatsDataAccess
+from backend.services.player_regrader import PlayerRegrader
+from backend.services.result_cache import roster_stats_version
+from backend.services.season_stats_repository import SeasonStatsRepository
+from backend.services.stats_delta import diff_frames, row_hashes
+
+
+def frame(**era):
+    names = {"1": "Arm One", "2": "Arm Two", "3": "Arm Three"}
+    rows = [
+        {"idfg": int(i), "name": names[i], "ip": 100.0, "k%": 0.25, "era": era.get(f"e{i}", 3.5)}
+        for i in sorted(names)
+        if f"e{i}" not in era or era[f"e{i}"] is not None
+    ]
+    return pd.DataFrame(rows)
+
+
+def test_diff_finds_added_changed_and_removed():
+    old = frame(e3=None)
+    new = frame(e1=4.0, e2=None)
+
+    changes = diff_frames(2025, old, new)
+
+    assert (changes.added, changes.changed, changes.removed) == ({"3"}, {"1"}, {"2"})
+    assert not changes.full
+    assert not diff_frames(2025, old, old.copy())
+
+
+def test_hash_ignores_column_order_and_new_columns_force_full_diff():
+    old = frame()
+
+    assert row_hashes(old) == row_hashes(old[list(reversed(old.columns))])
+    assert diff_frames(2025, old, old.assign(extra=1)).full
+
+
+def test_refresh_only_moves_changed_pitchers_to_the_new_version():
+    repo = SeasonStatsRepository(loader=lambda season: frame())
+    before = repo.get(2025)
+    one, two = [{"player_name": "Arm One"}], [{"player_name": "Arm Two", "idfg": "2"}]
+    keys = (roster_stats_version(one, before), roster_stats_version(two, before))
+
+    repo.loader = lambda season: frame(e1=5.0)
+    assert repo.refresh(2025)
+    after = repo.peek(2025)
+
+    assert after.changes.changed == {"1"}
+    assert roster_stats_version(one, after) != keys[0]
+    assert roster_stats_version(two, after) == keys[1]
+    assert roster_stats_version(two, after, "league") != roster_stats_version(two, before, "league")
+
+
+def test_upsert_writes_only_changed_rows():
+    db = MagicMock()
+    db.transaction.return_value.__enter__.return_value = MagicMock()
+    current = frame(e1=4.0)
+    stored = row_hashes(frame())
+    db.execute.return_value = [{"idfg": k, "row_hash": v} for k, v in stored.items()] + [{"idfg": "9", "row_hash": 1}]
+
+    changes = PitcherStatsDataAccess(db).upsert_season(2025, current)
+
+    assert (changes.changed, changes.removed) == ({"1"}, {"9"})
+    written = db.execute_many.call_args.args[1]
+    assert [row[1] for row in written] == ["1"]
+    delete_query, params = db.execute.call_args.args
+    assert delete_query.startswith("DELETE") and params == (2025, ["9"])
+
+
+def test_regrader_updates_only_affected_players():
+    repo = SeasonStatsRepository(loader=lambda season: frame(e1=2.0))
+    snapshot = repo.get(2025)
+    players = MagicMock()
+    players.list_by_idfgs.return_value = [{"id": 11, "team_id": 4, "player_name": "Arm One", "idfg": "1"}]
+    players.update_grades.side_effect = len
+
+    changes = diff_frames(2025, frame(), snapshot.frame)
+    assert PlayerRegrader(players).regrade(snapshot, changes) == 1
+
+    players.list_by_idfgs.assert_called_once_with(["1"])
+    ((player_id, team_id, grade, analysis),) = players.update_grades.call_args.args[0]
+    assert (player_id, team_id) == (11, 4) and grade > 0 and analysis
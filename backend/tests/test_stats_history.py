@@ -0,0 +1,193 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.services.season_stats_repository import SeasonStatsRepository, normalize_stats_frame
+from backend.services.stats_delta import diff_frames
+from backend.services.stats_history import (
+    SeasonStatsHistory,
+    StatsHistoryUnavailable,
+    parse_as_of,
+    resolve_snapshot,
+)
+
+
+DAY = date(2025, 4, 1)
+
+
+def make_frame(rows):
+    return normalize_stats_frame(pd.DataFrame(rows, columns=["IDfg", "Name", "Team", "W", "SO", "IP", "ERA"]))
+
+
+@pytest.fixture
+def opening_day():
+    return make_frame([
+        (1001, "Gerrit Cole", "NYY", 1, 8, 6.0, 1.50),
+        (1002, "Zac Gallen", None, 0, 5, 5.0, 3.60),
+        (1003, "José Berríos", "TOR", 0, 3, 4.0, np.nan),
+    ])
+
+
+@pytest.fixture
+def day_two():
+    return make_frame([
+        (1001, "Gerrit Cole", "NYY", 2, 15, 12.0, 1.50),
+        (1002, "Zac Gallen", None, 0, 5, 5.0, 3.60),
+        (1004, "Chris Sale", "ATL", 1, 9, 6.0, 0.00),
+    ])
+
+
+@pytest.fixture
+def repo():
+    return SeasonStatsRepository(loader=lambda season: None)
+
+
+@pytest.fixture
+def history(tmp_path, repo):
+    return SeasonStatsHistory(str(tmp_path), repo)
+
+
+def chunk_names(history, season=2025):
+    return sorted(p.name for p in history._season_dir(season).iterdir())
+
+
+def test_first_day_is_a_keyframe_and_round_trips(history, opening_day):
+    history.record(2025, DAY, opening_day)
+
+    frame = history.frame_as_of(2025, DAY)
+
+    assert chunk_names(history) == ["2025-04-01.key.npz"]
+    assert list(frame.columns) == list(opening_day.columns)
+    assert frame["team"].isna().tolist() == [False, True, False]
+    assert frame["w"].dtype == np.int64
+    assert not diff_frames(2025, frame, opening_day)
+
+
+def test_following_days_store_only_changed_pitchers(history, opening_day, day_two):
+    history.record(2025, DAY, opening_day)
+
+    changes = history.record(2025, DAY + timedelta(days=1), day_two)
+
+    assert changes.added == {"1004"} and changes.changed == {"1001"} and changes.removed == {"1003"}
+    assert chunk_names(history) == ["2025-04-01.key.npz", "2025-04-02.delta.npz"]
+    with np.load(history._season_dir(2025) / "2025-04-02.delta.npz") as chunk:
+        assert chunk["idfg"].tolist() == ["1001", "1004"]
+        assert chunk["counting"].dtype == np.int32
+        # Counting stats are stored as the day's change
+        assert chunk["counting"].tolist() == [[1, 7], [1, 9]]
+        assert chunk["removed"].tolist() == ["1003"]
+
+
+def test_as_of_replays_deltas(history, opening_day, day_two):
+    history.record(2025, DAY, opening_day)
+    history.record(2025, DAY + timedelta(days=1), day_two)
+
+    assert not diff_frames(2025, history.frame_as_of(2025, DAY), opening_day)
+    assert not diff_frames(2025, history.frame_as_of(2025, DAY + timedelta(days=10)), day_two)
+    assert history.frame_as_of(2025, DAY - timedelta(days=1)) is None
+
+
+def test_pitcher_removed_and_re_added_replays_absolute_counts(history, opening_day, day_two):
+    history.record(2025, DAY, opening_day)
+    history.record(2025, DAY + timedelta(days=1), day_two)
+    back = pd.concat([day_two, make_frame([(1003, "José Berríos", "TOR", 1, 6, 9.0, 3.00)])], ignore_index=True)
+
+    history.record(2025, DAY + timedelta(days=2), back)
+
+    frame = history.frame_as_of(2025, DAY + timedelta(days=2))
+    berrios = frame.set_index("name").loc["José Berríos"]
+    # Not added on top of the line from before the pitcher was dropped (w 0, so 3)
+    assert berrios["w"] == 1 and berrios["so"] == 6
+    assert not diff_frames(2025, frame, back)
+
+
+def test_frame_without_text_columns_round_trips(tmp_path):
+    history = SeasonStatsHistory(str(tmp_path), SeasonStatsRepository(loader=lambda season: None))
+    frame = pd.DataFrame({"idfg": [1001, 1002], "so": [8, 5], "ip": [6.0, 5.0]})
+
+    history.record(2025, DAY, frame)
+    history.record(2025, DAY + timedelta(days=1), frame.assign(so=[9, 5]))
+
+    assert history.frame_as_of(2025, DAY + timedelta(days=1))["so"].tolist() == [9, 5]
+
+
+def test_unchanged_day_writes_nothing(history, opening_day):
+    history.record(2025, DAY, opening_day)
+
+    changes = history.record(2025, DAY + timedelta(days=1), opening_day)
+
+    assert not changes
+    assert chunk_names(history) == ["2025-04-01.key.npz"]
+
+
+def test_same_day_is_replaced(history, opening_day, day_two):
+    history.record(2025, DAY, opening_day)
+    history.record(2025, DAY + timedelta(days=1), day_two)
+
+    history.record(2025, DAY + timedelta(days=1), opening_day)
+
+    assert chunk_names(history) == ["2025-04-01.key.npz"]
+    assert not diff_frames(2025, history.frame_as_of(2025, DAY + timedelta(days=1)), opening_day)
+
+
+def test_days_must_be_recorded_in_order(history, opening_day):
+    history.record(2025, DAY, opening_day)
+
+    with pytest.raises(ValueError):
+        history.record(2025, DAY - timedelta(days=1), opening_day)
+
+
+def test_keyframe_interval_and_column_changes_start_a_new_keyframe(tmp_path, repo, opening_day, day_two):
+    history = SeasonStatsHistory(str(tmp_path), repo, keyframe_interval_days=2)
+    history.record(2025, DAY, opening_day)
+    history.record(2025, DAY + timedelta(days=1), day_two)
+    history.record(2025, DAY + timedelta(days=2), opening_day)
+    history.record(2025, DAY + timedelta(days=3), day_two.assign(fip=3.1))
+
+    assert chunk_names(history) == [
+        "2025-04-01.key.npz",
+        "2025-04-02.delta.npz",
+        "2025-04-03.key.npz",
+        "2025-04-04.key.npz",
+    ]
+    assert "fip" in history.frame_as_of(2025, DAY + timedelta(days=3)).columns
+
+
+def test_snapshot_is_shared_between_dates_with_the_same_chunks(history, repo, opening_day, day_two):
+    history.record(2025, DAY, opening_day)
+    history.record(2025, DAY + timedelta(days=5), day_two)
+
+    first = history.snapshot(2025, DAY + timedelta(days=1))
+    again = history.snapshot(2025, DAY + timedelta(days=4))
+    later = history.snapshot(2025, DAY + timedelta(days=5))
+
+    assert again is first
+    assert later is not first
+    assert first.index.find(name="José Berríos") is not None
+    assert later.index.find(name="José Berríos") is None
+    # Versions come from the live repository so result cache keys never collide
+    assert len({first.stats_version, later.stats_version, repo.next_version()}) == 3
+
+
+def test_resolve_snapshot(history, opening_day):
+    live = make_frame([(1001, "Gerrit Cole", "NYY", 9, 99, 60.0, 2.00)])
+    repo = SeasonStatsRepository(loader=lambda season: live)
+    history.record(2025, DAY, opening_day)
+
+    assert resolve_snapshot(repo, history, None) is repo.get()
+    assert resolve_snapshot(repo, history, date.today()) is repo.get()
+    assert len(resolve_snapshot(repo, history, DAY, season=2025)) == 3
+    with pytest.raises(StatsHistoryUnavailable):
+        resolve_snapshot(repo, history, DAY - timedelta(days=1), season=2025)
+    with pytest.raises(StatsHistoryUnavailable):
+        resolve_snapshot(repo, None, DAY, season=2025)
+
+
+def test_parse_as_of():
+    assert parse_as_of(None) is None
+    assert parse_as_of("") is None
+    assert parse_as_of("2025-06-01") == date(2025, 6, 1)
+    with pytest.raises(ValueError):
+        parse_as_of("June 1st")
@@ -0,0 +1,208 @@
+import threading
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from backend.services.season_stats_repository import SeasonStatsRepository
+from backend.services.stats_delta import StatsChangeSet
+from backend.services.stats_refresher import StatsRefresher
+
+
+def make_frame(ip):
+    return pd.DataFrame({"Name": ["Gerrit Cole"], "IP": [ip]})
+
+
+def test_run_once_reports_each_season():
+    repo = SeasonStatsRepository(loader=lambda season: make_frame(float(season)))
+    refresher = StatsRefresher(repo, interval_seconds=60, seasons=(2024, 2025))
+
+    assert refresher.run_once() == {2024: True, 2025: True}
+    assert refresher.run_once() == {2024: False, 2025: False}
+
+
+def test_failed_refresh_keeps_serving_last_good_snapshot():
+    calls = []
+
+    def loader(season):
+        calls.append(season)
+        if len(calls) > 1:
+            raise RuntimeError("pybaseball down")
+        return make_frame(100.0)
+
+    repo = SeasonStatsRepository(loader=loader)
+    snapshot = repo.get(2025)
+    refresher = StatsRefresher(repo, interval_seconds=60)
+
+    results = refresher.run_once()
+
+    assert "pybaseball down" in results[2025]
+    assert repo.get(2025) is snapshot
+
+
+def test_background_thread_refreshes_until_stopped():
+    refreshed = threading.Event()
+    ips = iter(range(1, 1000))
+
+    def loader(season):
+        if repo.peek(season) is not None:
+            refreshed.set()
+        return make_frame(float(next(ips)))
+
+    repo = SeasonStatsRepository(loader=loader)
+    repo.get(2025)
+    refresher = StatsRefresher(repo, interval_seconds=0.01)
+
+    refresher.start()
+    assert refreshed.wait(timeout=5)
+    refresher.stop(timeout=5)
+
+    assert repo.get(2025).stats_version > 1
+
+
+def test_interval_must_be_positive():
+    with pytest.raises(ValueError):
+        StatsRefresher(SeasonStatsRepository(loader=make_frame), interval_seconds=0)
+
+
+def test_refreshed_season_is_stored_in_database():
+    repo = SeasonStatsRepository(loader=lambda season: make_frame(150.0))
+    repo.get(2025)
+    repo.loader = lambda season: make_frame(160.0)
+    pitcher_stats = MagicMock()
+    pitcher_stats.upsert_season.return_value = StatsChangeSet(2025, changed=frozenset({"1"}))
+
+    StatsRefresher(repo, 60, seasons=[2025], pitcher_stats=pitcher_stats).run_once()
+
+    season, frame = pitcher_stats.upsert_season.call_args.args
+    assert season == 2025 and frame["ip"].tolist() == [160.0]
+
+
+def test_each_tick_records_history(tmp_path):
+    from datetime import date
+    from backend.services.stats_history import SeasonStatsHistory
+
+    frame = pd.DataFrame({"IDfg": [1001], "Name": ["Gerrit Cole"], "IP": [150.0]})
+    repo = SeasonStatsRepository(loader=lambda season: frame)
+    history = SeasonStatsHistory(str(tmp_path), repo)
+
+    StatsRefresher(repo, 60, seasons=[2025], history=history).run_once()
+
+    assert history.days(2025) == [date.today()]
+    assert history.frame_as_of(2025, date.today())["ip"].tolist() == [150.0]
+
+
+def test_each_tick_feeds_the_form_tracker():
+    from datetime import date
+    from backend.services.rolling_form import RollingFormTracker
+
+    repo = SeasonStatsRepository(loader=lambda season: pd.DataFrame({"IDfg": [1001], "Name": ["Gerrit Cole"], "IP": [150.0]}))
+    tracker = RollingFormTracker(2025)
+
+    StatsRefresher(repo, 60, seasons=[2024, 2025], form_tracker=tracker).run_once()
+
+    assert tracker.day == date.today() and tracker.version == 1
+
+
+def test_each_tick_reloads_statcast_features():
+    from backend.services.statcast_features import StatcastFeatures
+
+    repo = SeasonStatsRepository(loader=lambda season: make_frame(150.0))
+    features = MagicMock(spec=StatcastFeatures)
+    features.reload.side_effect = [True, OSError("disk gone")]
+    features.version = "2025-04-28"
+    refresher = StatsRefresher(repo, 60, seasons=[2025], statcast_features=features)
+
+    refresher.run_once()
+    # A failed reload doesn't fail the tick
+    assert refresher.run_once() == {2025: False}
+    assert features.reload.call_count == 2
+
+
+def test_history_failure_is_reported_apart_from_the_refresh(capsys):
+    repo = SeasonStatsRepository(loader=lambda season: make_frame(150.0))
+    history = MagicMock()
+    history.record.side_effect = OSError("disk full")
+    tracker = MagicMock(season=2025)
+
+    results = StatsRefresher(repo, 60, seasons=[2025], history=history, form_tracker=tracker).run_once()
+
+    out = capsys.readouterr().out
+    assert results == {2025: True}
+    assert "Recording season 2025 history failed: disk full" in out
+    assert "keeping last good snapshot" not in out
+    # The form tracker is still fed
+    tracker.update.assert_called_once()
+
+
+def test_failed_database_write_is_retried_without_losing_the_swap(capsys):
+    from datetime import date
+    from backend.services.rolling_form import RollingFormTracker
+
+    frames = iter([make_frame(100.0), make_frame(110.0), make_frame(110.0)])
+    repo = SeasonStatsRepository(loader=lambda season: next(frames))
+    repo.get(2025)
+    pitcher_stats = MagicMock()
+    pitcher_stats.upsert_season.side_effect = [RuntimeError("database down"), []]
+    tracker = RollingFormTracker(2025)
+    refresher = StatsRefresher(repo, 60, seasons=[2025], pitcher_stats=pitcher_stats, form_tracker=tracker)
+
+    assert refresher.run_once() == {2025: True}
+    out = capsys.readouterr().out
+    assert "Storing season 2025 in pitcher_season_stats failed, retrying next tick: database down" in out
+    assert "keeping last good snapshot" not in out
+    # The new snapshot is live and the day's form was still recorded
+    assert repo.get(2025).frame["ip"].tolist() == [110.0]
+    assert tracker.day == date.today()
+
+    # Nothing changed upstream, but the write is retried with the live frame
+    assert refresher.run_once() == {2025: False}
+    assert pitcher_stats.upsert_season.call_count == 2
+    assert pitcher_stats.upsert_season.call_args.args[1] is repo.get(2025).frame
+    refresher.run_once()
+    assert pitcher_stats.upsert_season.call_count == 2
+
+
+def test_failed_regrade_is_retried_with_every_pending_change():
+    frames = iter([
+        pd.DataFrame({"IDfg": [1, 2], "Name": ["A", "B"], "IP": [10.0, 20.0]}),
+        pd.DataFrame({"IDfg": [1, 2], "Name": ["A", "B"], "IP": [11.0, 20.0]}),
+        pd.DataFrame({"IDfg": [1, 2], "Name": ["A", "B"], "IP": [11.0, 21.0]}),
+    ])
+    repo = SeasonStatsRepository(loader=lambda season: next(frames))
+    repo.get(2025)
+    regrader = MagicMock()
+    regrader.regrade.side_effect = [RuntimeError("database down"), 2]
+    refresher = StatsRefresher(repo, 60, seasons=[2025], regrader=regrader)
+
+    refresher.run_once()
+    refresher.run_once()
+
+    snapshot, changes = regrader.regrade.call_args.args
+    assert snapshot is repo.get(2025)
+    assert changes.changed == {"1", "2"}
+
+
+def test_thread_warms_up_the_form_tracker_before_its_first_tick(tmp_path):
+    from datetime import date, timedelta
+    from backend.services.rolling_form import RollingFormTracker
+    from backend.services.stats_history import SeasonStatsHistory
+
+    repo = SeasonStatsRepository(loader=lambda season: make_frame(150.0))
+    history = SeasonStatsHistory(str(tmp_path), repo)
+    history.record(2025, date.today() - timedelta(days=1), pd.DataFrame({"idfg": [1001], "name": ["Gerrit Cole"], "ip": [140.0]}))
+    tracker = RollingFormTracker(2025, ready=False)
+    refresher = StatsRefresher(repo, 3600, seasons=[2025], history=history, form_tracker=tracker)
+
+    refresher.start()
+    try:
+        for _ in range(100):
+            if tracker.ready:
+                break
+            threading.Event().wait(0.05)
+    finally:
+        refresher.stop(timeout=5)
+
+    assert tracker.ready
+    assert tracker.day == date.today() - timedelta(days=1)
+
@@ -1,9 +1,11 @@
 import pytest
+import numpy as np
 import pandas as pd
 from unittest.mock import MagicMock, patch
 from flask import Flask
 
 from backend.controller.trade_controller import TradeController
+from backend.services.season_stats_repository import SeasonStatsRepository
 
 
 # -------------------------------------------------------------------------
@@ -29,17 +31,21 @@ def mock_player_dao():
 
 
 @pytest.fixture
-def app(mock_player_dao, mock_df):
+def stats_repository(mock_df):
+    """Shared stats repository whose loader returns our fake DataFrame."""
+    return SeasonStatsRepository(loader=lambda season: mock_df)
+
+
+@pytest.fixture
+def app(mock_player_dao, stats_repository):
     """
     Creates a Flask app and registers the TradeController.
-    We patch pitching_stats so controller loads our fake DataFrame.
+    The controller reads stats from our fake repository.
     """
     app = Flask(__name__)
 
-    with patch("backend.controller.trade_controller.pitching_stats") as mock_stats:
-        mock_stats.return_value = mock_df
-        controller = TradeController(player_data_access=mock_player_dao)
-        app.register_blueprint(controller.bp)
+    controller = TradeController(player_data_access=mock_player_dao, stats_repository=stats_repository)
+    app.register_blueprint(controller.bp)
 
     return app
 
@@ -54,16 +60,23 @@ def client(app):
 # TESTS — INITIALIZATION
 # -------------------------------------------------------------------------
 
-def test_trade_controller_initializes_with_mocked_stats(mock_player_dao, mock_df):
+def test_trade_controller_initializes_with_mocked_stats(mock_player_dao, stats_repository):
     """Controller should successfully load the fake stats DataFrame."""
-    with patch("backend.controller.trade_controller.pitching_stats") as mock_stats:
-        mock_stats.return_value = mock_df
+    controller = TradeController(mock_player_dao, stats_repository)
+
+    assert controller.season_df is not None
+    assert len(controller.season_df) == 3
+    assert "Gerrit Cole" in list(controller.season_df["name"])
+
+
+def test_trade_controller_starts_when_stats_unavailable(mock_player_dao):
+    """A failing stats load should not prevent the controller from starting."""
+    def broken_loader(season):
+        raise RuntimeError("pybaseball down")
 
-        controller = TradeController(mock_player_dao)
+    controller = TradeController(mock_player_dao, SeasonStatsRepository(loader=broken_loader))
 
-        assert controller.season_df is not None
-        assert len(controller.season_df) == 3
-        assert "Gerrit Cole" in list(controller.season_df["Name"])
+    assert controller.season_df is None
 
 
 # -------------------------------------------------------------------------
@@ -77,13 +90,12 @@ def test_evaluate_trade_side_a_wins(client):
     """
 
     # Mock grading so we get deterministic output
-    with patch("backend.services.pitcher_grading_service.PitcherGradingService.calculate_pitcher_grade") as mock_grade, \
+    with patch("backend.services.pitcher_grading_service.PitcherGradingService.calculate_grades") as mock_grade, \
          patch("backend.services.pitcher_grading_service.PitcherGradingService.analyze_pitcher") as mock_analyze:
 
-        def grade_effect(stats):
-            if stats["K%"] == 0.30: return 20.0   # Cole
-            if stats["K%"] == 0.10: return 5.0    # Scrub
-            return 0.0
+        def grade_effect(k, ip, era):
+            # Cole 20, Scrub 5, everyone else 0
+            return np.select([k == 0.30, k == 0.10], [20.0, 5.0], 0.0)
 
         mock_grade.side_effect = grade_effect
         mock_analyze.return_value = "Great pitcher"
@@ -107,8 +119,8 @@ def test_evaluate_trade_side_a_wins(client):
 def test_evaluate_trade_even(client):
     """Both sides return the same grade → should be perfectly fair."""
 
-    with patch("backend.services.pitcher_grading_service.PitcherGradingService.calculate_pitcher_grade") as mock_grade:
-        mock_grade.return_value = 10.0
+    with patch("backend.services.pitcher_grading_service.PitcherGradingService.calculate_grades") as mock_grade:
+        mock_grade.side_effect = lambda k, ip, era: np.full(len(k), 10.0)
 
         payload = {"sideA": ["Gerrit Cole"], "sideB": ["Gerrit Cole"]}
 
@@ -196,3 +208,27 @@ def test_full_integration_real_grading(client):
     assert "sideB" in data
     assert "winner" in data
     assert "fairness_pct" in data
+
+
+def test_evaluate_trade_as_of_uses_recorded_history(mock_player_dao, stats_repository, tmp_path):
+    """as_of grades against the stats recorded for that day instead of the live ones."""
+    from datetime import date
+    from backend.services.stats_history import SeasonStatsHistory
+
+    history = SeasonStatsHistory(str(tmp_path), stats_repository)
+    history.record(2025, date(2025, 4, 1), pd.DataFrame({
+        "idfg": [1, 2], "name": ["Gerrit Cole", "Zac Gallen"],
+        "k%": [0.10, 0.35], "ip": [10.0, 12.0], "era": [9.00, 1.00],
+    }))
+    app = Flask(__name__)
+    app.register_blueprint(TradeController(mock_player_dao, stats_repository, history).bp)
+    client = app.test_client()
+    payload = {"sideA": ["Gerrit Cole"], "sideB": ["Zac Gallen"]}
+
+    live = client.post("/api/trade/evaluate", json=payload).get_json()
+    then = client.post("/api/trade/evaluate", json={**payload, "as_of": "2025-04-15"}).get_json()
+
+    assert live["winner"] == "Other Team"
+    assert then["winner"] == "Your Team"
+    assert client.post("/api/trade/evaluate", json={**payload, "as_of": "2025-03-01"}).status_code == 404
+    assert client.post("/api/trade/evaluate", json={**payload, "as_of": "soon"}).status_code == 400